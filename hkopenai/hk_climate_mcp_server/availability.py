@@ -0,0 +1,344 @@
+"""
+Dataset Availability - Discovery and caching of HKO data coverage.
+
+This module works out which years each HKO dataset (and each station of
+per-station datasets) actually has data for, by probing the open data API.
+The discovered coverage is persisted in the cache directory and consulted by
+the validation layer so out-of-range requests are rejected locally.
+"""
+
+import functools
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List, Optional
+
+
+from .cache import get_cache_dir
+from .json_codec import fetch_json_data
+from .ratelimit import HKO_RATE_LIMITER
+from .stations import VALID_TEMPERATURE_STATIONS, VALID_TIDE_STATIONS
+
+OPENDATA_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+
+# Datasets covered by discovery
+TEMPERATURE_DATASETS = ("CLMTEMP", "CLMMAXT", "CLMMINT")
+TIDE_DATASETS = ("HHOT", "HLT")
+ASTRONOMICAL_DATASETS = ("SRS", "MRS")
+DISCOVERABLE_DATASETS = TEMPERATURE_DATASETS + TIDE_DATASETS + ASTRONOMICAL_DATASETS
+
+# Key used for datasets that are not per station
+ALL_STATIONS = "*"
+
+# Earliest year probed for tide and astronomical datasets
+PROBE_FIRST_YEAR = 2000
+
+# Discovered coverage older than this is refreshed when the catalog is requested
+MAX_CATALOG_AGE = timedelta(days=7)
+
+DISCOVERY_WORKERS = 4
+
+# Environment variable that lets the server discover stale coverage by itself
+DISCOVERY_ENV = "HK_CLIMATE_MCP_DISCOVER_COVERAGE"
+
+
+def background_discovery_enabled() -> bool:
+    """
+    Check whether the server may discover stale coverage without being asked.
+
+    Discovery fetches the full history of every temperature station, so it
+    only runs in the background when HK_CLIMATE_MCP_DISCOVER_COVERAGE is set
+    to 1, true or yes; get_dataset_catalog starts it either way.
+    """
+    return os.environ.get(DISCOVERY_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def is_no_data(result: Any) -> bool:
+    """
+    Check whether an HKO response means the requested data does not exist.
+
+    Empty documents, empty data arrays and HTTP 4xx answers are treated as
+    "no data". Network failures, HTTP 5xx answers and bodies that could not
+    be parsed may be transient and are not.
+
+    Args:
+        result: Value returned by fetch_json_data
+
+    Returns:
+        bool: True if the response is a definitive "no data" answer
+    """
+    if not isinstance(result, dict) or not result:
+        return True
+    if "data" in result and not result["data"]:
+        return True
+    error = result.get("error")
+    if isinstance(error, str):
+        return error.startswith("HTTP error occurred") and "Status code: 4" in error
+    return False
+
+
+class DiscoveryError(Exception):
+    """Raised when a probe fails for a transient reason."""
+
+
+# Returned for stations whose discovery failed
+_FAILED = object()
+
+
+def _fetch(params: Dict[str, Any]) -> Dict[str, Any]:
+    HKO_RATE_LIMITER.acquire()
+    result = fetch_json_data(OPENDATA_URL, params=params, encoding="utf-8-sig")
+    # Bodies that could not be parsed may be error pages, so only definitive
+    # "no data" answers are recorded as no coverage
+    if not is_no_data(result) and "error" in result:
+        raise DiscoveryError(result["error"])
+    return result
+
+
+def _discover_temperature_years(data_type: str, station: str) -> Optional[List[int]]:
+    """Get the first and last year of a station's full temperature history."""
+    result = _fetch(
+        {"dataType": data_type, "lang": "en", "rformat": "json", "station": station}
+    )
+    if is_no_data(result):
+        return None
+    years = [int(row[0]) for row in result["data"] if row and str(row[0]).isdigit()]
+    return [min(years), max(years)] if years else None
+
+
+def _probe_years(has_data: Callable[[int], bool], last_year: int) -> Optional[List[int]]:
+    """
+    Find the contiguous block of years with data, starting near the current year.
+
+    Args:
+        has_data: Probe returning whether a year has data
+        last_year: Latest year worth probing
+
+    Returns:
+        [first_year, last_year] of the block, or None if no year has data
+    """
+    start = min(datetime.now().year, last_year)
+    found = next(
+        (
+            year
+            for year in dict.fromkeys(
+                [start] + list(range(last_year, PROBE_FIRST_YEAR - 1, -1))
+            )
+            if has_data(year)
+        ),
+        None,
+    )
+    if found is None:
+        return None
+    first = last = found
+    while first - 1 >= PROBE_FIRST_YEAR and has_data(first - 1):
+        first -= 1
+    while last + 1 <= last_year and has_data(last + 1):
+        last += 1
+    return [first, last]
+
+
+def _discover_probed_years(
+    data_type: str, station: Optional[str]
+) -> Optional[List[int]]:
+    """Probe a tide or astronomical dataset one small request per year."""
+
+    def has_data(year: int) -> bool:
+        params = {
+            "dataType": data_type,
+            "lang": "en",
+            "rformat": "json",
+            "year": year,
+            "month": "1",
+            "day": "1",
+        }
+        if station:
+            params["station"] = station
+        return not is_no_data(_fetch(params))
+
+    return _probe_years(has_data, datetime.now().year + 2)
+
+
+def _try_probe(
+    probe: Callable[[str, Optional[str]], Optional[List[int]]],
+    data_type: str,
+    station: Optional[str],
+) -> Any:
+    """Run a probe, or return _FAILED if it fails for a transient reason."""
+    try:
+        return probe(data_type, station)
+    except DiscoveryError:
+        return _FAILED
+
+
+class AvailabilityCatalog:
+    """Persisted per-dataset, per-station coverage discovered from HKO."""
+
+    def __init__(self, filename: str = "availability.json"):
+        """
+        Args:
+            filename: Name of the catalog file within the cache directory
+        """
+        self._filename = filename
+        self._lock = threading.Lock()
+        self._loaded_from: Optional[str] = None
+        self._datasets: Dict[str, Dict[str, List[int]]] = {}
+        self._update_time: Dict[str, str] = {}
+        self._job: Optional[threading.Thread] = None
+
+    def _path(self) -> str:
+        return os.path.join(get_cache_dir(), self._filename)
+
+    def _ensure_loaded(self) -> None:
+        path = self._path()
+        if self._loaded_from == path:
+            return
+        self._loaded_from = path
+        self._datasets, self._update_time = {}, {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            self._datasets = stored.get("datasets", {})
+            self._update_time = stored.get("updateTime", {})
+        except (OSError, ValueError):
+            pass
+
+    def _save(self) -> None:
+        path = self._path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"datasets": self._datasets, "updateTime": self._update_time}, f
+                )
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def year_range(self, data_type: str, station: Optional[str] = None) -> Optional[tuple]:
+        """
+        Get the discovered years of a dataset.
+
+        Args:
+            data_type: HKO dataType code
+            station: Station code for per-station datasets
+
+        Returns:
+            Tuple of (first_year, last_year), (None, None) if discovery found
+            no data at all, or None if the dataset has not been discovered
+        """
+        with self._lock:
+            self._ensure_loaded()
+            stations = self._datasets.get(data_type)
+            if stations is None:
+                return None
+            key = station if station else ALL_STATIONS
+            if key not in stations:
+                return None
+            years = stations[key]
+            return tuple(years) if years else (None, None)
+
+    def discovered_year(self, data_type: str) -> Optional[int]:
+        """Get the year in which a dataset was last discovered, if ever."""
+        with self._lock:
+            self._ensure_loaded()
+            update_time = self._update_time.get(data_type)
+        return int(update_time[:4]) if update_time else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a copy of all discovered coverage and the job status."""
+        with self._lock:
+            self._ensure_loaded()
+            return {
+                "datasets": {dt: dict(s) for dt, s in self._datasets.items()},
+                "updateTime": dict(self._update_time),
+                "discoveryRunning": self.is_running(),
+            }
+
+    def is_stale(self, data_type: str) -> bool:
+        """Check whether a dataset has never been discovered or is out of date."""
+        with self._lock:
+            self._ensure_loaded()
+            update_time = self._update_time.get(data_type)
+        if not update_time:
+            return True
+        return datetime.now() - datetime.fromisoformat(update_time) > MAX_CATALOG_AGE
+
+    def is_running(self) -> bool:
+        """Check whether a discovery job is in progress."""
+        return self._job is not None and self._job.is_alive()
+
+    def discover(self, data_types: Optional[List[str]] = None) -> None:
+        """
+        Probe HKO for the coverage of the given datasets and persist it.
+
+        Stations whose probes fail for transient reasons keep their previous
+        coverage, and their dataset stays stale so that it is discovered
+        again the next time stale datasets are.
+
+        Args:
+            data_types: Datasets to discover (default: all discoverable datasets)
+        """
+        for data_type in data_types or DISCOVERABLE_DATASETS:
+            if data_type in TEMPERATURE_DATASETS:
+                stations = list(VALID_TEMPERATURE_STATIONS["en"])
+                probe = _discover_temperature_years
+            elif data_type in TIDE_DATASETS:
+                stations = list(VALID_TIDE_STATIONS["en"])
+                probe = _discover_probed_years
+            elif data_type in ASTRONOMICAL_DATASETS:
+                stations = [None]
+                probe = _discover_probed_years
+            else:
+                continue
+            try_probe = functools.partial(_try_probe, probe, data_type)
+            with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
+                ranges = list(executor.map(try_probe, stations))
+            found = {
+                station or ALL_STATIONS: years
+                for station, years in zip(stations, ranges)
+                if years is not _FAILED
+            }
+            if not found:
+                continue
+            with self._lock:
+                self._ensure_loaded()
+                self._datasets[data_type] = {
+                    **self._datasets.get(data_type, {}),
+                    **found,
+                }
+                if len(found) == len(stations):
+                    self._update_time[data_type] = datetime.now().isoformat(
+                        timespec="seconds"
+                    )
+                self._save()
+
+    def start_discovery(self, data_types: Optional[List[str]] = None) -> bool:
+        """
+        Run discover() in a background thread unless a job is already running.
+
+        Args:
+            data_types: Datasets to discover (default: all discoverable datasets)
+
+        Returns:
+            bool: True if a new job was started
+        """
+        with self._lock:
+            if self.is_running():
+                return False
+            self._job = threading.Thread(
+                target=self.discover,
+                args=(data_types,),
+                name="hko-availability-discovery",
+                daemon=True,
+            )
+            self._job.start()
+            return True
+
+
+# Catalog shared by the validation layer and the catalog tool
+AVAILABILITY = AvailabilityCatalog()
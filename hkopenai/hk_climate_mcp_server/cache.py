@@ -0,0 +1,93 @@
+"""
+Cache Utilities - Local caching of HKO API responses.
+
+This module provides a write-once persistent cache for HKO data that never
+changes once published (for example radiation reports for past dates). Entries
+are stored as JSON files under a local cache directory.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+# Environment variable overriding the default cache directory
+CACHE_DIR_ENV = "HK_CLIMATE_MCP_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    """
+    Get the root directory used for persistent caches.
+
+    Returns:
+        Path: Value of HK_CLIMATE_MCP_CACHE_DIR if set, otherwise
+              ~/.cache/hk_climate_mcp_server
+    """
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured:
+        return Path(configured)
+    return Path.home() / ".cache" / "hk_climate_mcp_server"
+
+
+class PersistentCache:
+    """
+    Write-once JSON cache for immutable upstream responses.
+
+    Entries are never overwritten or expired, so only data that cannot change
+    upstream (e.g. reports for dates in the past) should be stored here.
+    """
+
+    def __init__(self, namespace: str):
+        """
+        Args:
+            namespace: Sub-directory of the cache directory holding the entries
+        """
+        self.namespace = namespace
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key)
+        return get_cache_dir() / self.namespace / f"{safe_key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached dict, or None if the key is not cached or unreadable
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store an entry if it is not cached yet.
+
+        The file is written atomically so concurrent readers never see a
+        partial entry. Failures to write are ignored; the cache is best effort.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable dict to store
+        """
+        path = self._path(key)
+        with self._lock:
+            if path.exists():
+                return
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f, ensure_ascii=False)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass
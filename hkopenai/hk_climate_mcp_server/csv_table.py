@@ -0,0 +1,320 @@
+"""
+CSV Tables - Compact column storage of large opendata.php tables.
+
+opendata.php serves CLMTEMP, CLMMAXT, CLMMINT, HHOT and HLT as CSV as well as
+JSON (rformat=csv). CSV is smaller on the wire and can be read line by line,
+so this module streams the response through a CSV reader straight into
+columns: numbers go into arrays of doubles, other values into lists sharing
+one string object per distinct value. A year of hourly tides then takes a few
+hundred kilobytes instead of a list of lists of strings, and rows are only
+built again for the page being returned. Values read back as the text HKO
+sent, so pages are the same as those cut from HKO's JSON.
+"""
+
+import codecs
+import csv
+import functools
+import itertools
+import logging
+import math
+import re
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Union
+
+import requests
+
+from .json_codec import request_error
+
+logger = logging.getLogger(__name__)
+
+OPENDATA_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+
+# Seconds to wait for HKO when streaming a table
+STREAM_TIMEOUT = 30
+
+# Values HKO uses for missing data
+MISSING_VALUES = frozenset({"", "***", "-", "N/A"})
+
+# Decimal numbers that a double holds exactly enough to be written back as
+# the same text; integers with a leading zero such as months ('06') and
+# times ('0530') are kept as text
+_NUMBER = re.compile(r"-?(0|[1-9]\d{0,8})(\.\d{1,6})?")
+
+# Any number, as found in every data row of HKO's tables (years, days, ...)
+_NUMERIC = re.compile(r"\s*-?\d+(\.\d+)?\s*")
+
+_MISSING = float("nan")
+
+# Rows parsed before they are converted into columns together
+BATCH_ROWS = 1024
+
+# Bytes of a body holding nothing but blanks and a UTF-8 BOM
+_BLANK = b" \t\r\n\xef\xbb\xbf"
+
+
+@functools.lru_cache(maxsize=None)
+def _numbers(decimals: int) -> Pattern[str]:
+    """Match a column of numbers with as many decimals, joined by newlines."""
+    number = r"-?(0|[1-9]\d{0,8})" + (rf"\.\d{{{decimals}}}" if decimals else "")
+    return re.compile(rf"{number}(\n{number})*")
+
+
+def _decimals(number: str) -> int:
+    """Get the number of decimals written in a number."""
+    point = number.find(".")
+    return 0 if point < 0 else len(number) - point - 1
+
+
+def _check_value(value: Any) -> None:
+    """Check that a value of a parsed JSON row is a string, number or null."""
+    if value is not None and (
+        not isinstance(value, (str, int, float)) or isinstance(value, bool)
+    ):
+        raise ValueError(f"A row holds {value!r}, which is not a string or number.")
+
+
+class _NumberColumn:
+    """Numbers written with the same decimals, and one kind of missing value."""
+
+    __slots__ = ("values", "decimals", "missing")
+
+    def __init__(self, size: int = 0):
+        self.values = array("d", [_MISSING]) * size
+        # Decided by the first number; until then the column holds no number
+        self.decimals: Optional[int] = None
+        # Text of the missing values
+        self.missing: Optional[str] = None
+
+    def get(self, index: int) -> Any:
+        value = self.values[index]
+        if math.isnan(value):
+            return self.missing
+        return f"{value:.{self.decimals}f}"
+
+
+class _TextColumn:
+    __slots__ = ("values",)
+
+    def __init__(self, values: Optional[List[Any]] = None):
+        self.values = values if values is not None else []
+
+    def get(self, index: int) -> Any:
+        return self.values[index]
+
+
+class CompactTable:
+    """A table of rows stored column by column."""
+
+    def __init__(self, fields: Iterable[str]):
+        """
+        Args:
+            fields: Column names
+        """
+        self.fields = list(fields)
+        # Columns hold numbers until they meet a value written back otherwise
+        self._columns: List[Any] = [_NumberColumn() for _ in self.fields]
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _to_text(self, index: int) -> _TextColumn:
+        """Turn a number column that met another value into a text column."""
+        column = self._columns[index]
+        if isinstance(column, _TextColumn):
+            return column
+        texts = [column.get(i) for i in range(self._rows)]
+        text_column = self._columns[index] = _TextColumn(texts)
+        return text_column
+
+    def append(self, values: List[str]) -> None:
+        """
+        Add a row of CSV values.
+
+        Args:
+            values: One text value per field
+        """
+        self.extend([values])
+
+    def extend(self, rows: List[List[str]]) -> None:
+        """
+        Add rows of CSV values.
+
+        Rows are converted a column at a time, which lets whole columns of
+        numbers go through float() and into their array without a Python
+        loop per value.
+
+        Args:
+            rows: Rows of one text value per field; numbers and None, as in
+                  parsed JSON rows, are taken too and kept as they are
+
+        Raises:
+            ValueError: If a row holds another kind of value
+        """
+        if not rows:
+            return
+        for index, values in enumerate(zip(*rows)):
+            try:
+                texts = list(map(str.strip, values))
+            except TypeError:
+                for value in values:
+                    _check_value(value)
+                self._to_text(index).values.extend(values)
+                continue
+            column = self._columns[index]
+            if isinstance(column, _NumberColumn):
+                present = [t for t in texts if t not in MISSING_VALUES]
+                missing = {t for t in texts if t in MISSING_VALUES}
+                if column.missing is not None:
+                    missing.add(column.missing)
+                if present and column.decimals is None:
+                    if _NUMBER.fullmatch(present[0]):
+                        column.decimals = _decimals(present[0])
+                if len(missing) <= 1 and (
+                    not present
+                    or column.decimals is not None
+                    and _numbers(column.decimals).fullmatch("\n".join(present))
+                ):
+                    if missing:
+                        column.missing = missing.pop()
+                    if len(present) == len(texts):
+                        column.values.extend(map(float, texts))
+                    else:
+                        column.values.extend(
+                            [
+                                _MISSING if t in MISSING_VALUES else float(t)
+                                for t in texts
+                            ]
+                        )
+                    continue
+                column = self._to_text(index)
+            column.values.extend(map(sys.intern, texts))
+        self._rows += len(rows)
+
+    def nbytes(self) -> int:
+        """Estimate the memory held by the table's values, in bytes."""
+        size = 0
+        for column in self._columns:
+            if isinstance(column, _NumberColumn):
+                size += column.values.itemsize * len(column.values)
+            else:
+                # Equal texts share one interned string
+                distinct = {id(value): value for value in column.values}
+                size += sys.getsizeof(column.values)
+                size += sum(map(sys.getsizeof, distinct.values()))
+        return size
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> List[List[Any]]:
+        """
+        Build rows of the table.
+
+        Args:
+            start: First row
+            stop: Row after the last one, defaults to the end of the table
+
+        Returns:
+            List of rows of the values as they were added
+        """
+        stop = self._rows if stop is None else min(stop, self._rows)
+        columns = self._columns
+        return [[column.get(i) for column in columns] for i in range(start, stop)]
+
+    def to_document(self) -> Dict[str, Any]:
+        """Get the table as a {fields, data} document."""
+        return {"fields": list(self.fields), "data": self.rows()}
+
+
+def parse_csv(lines: Iterable[str]) -> Optional[CompactTable]:
+    """
+    Parse CSV lines into a compact table.
+
+    HKO's CSV files start with one or more title lines before the header,
+    which may be padded with commas to the width of the table, and end with
+    notes. Every data row holds numbers while titles and headers do not, so
+    the header is the last line without numbers before the first row with
+    numbers of the same width. After that, lines of another width or
+    without numbers are skipped.
+
+    Args:
+        lines: Text lines of the CSV document
+
+    Returns:
+        The table, or None if there is no header
+    """
+    table = None
+    header: Optional[List[str]] = None
+    batch: List[List[str]] = []
+    width = -1
+    for values in csv.reader(lines):
+        has_number = any(map(_NUMERIC.fullmatch, values))
+        if table is not None:
+            if len(values) == width and has_number:
+                batch.append(values)
+                if len(batch) == BATCH_ROWS:
+                    table.extend(batch)
+                    batch = []
+        elif not has_number:
+            if "".join(values).strip():
+                header = values
+        elif header is not None and len(header) == len(values):
+            table = CompactTable(v.strip() for v in header)
+            width = len(values)
+            batch.append(values)
+    if table is not None:
+        table.extend(batch)
+    return table
+
+
+def _decode_lines(chunks: Iterable[bytes], encoding: str) -> Iterator[str]:
+    """Decode a byte stream line by line, whatever the chunk boundaries."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def fetch_csv_table(
+    params: Dict[str, Any], encoding: str = "utf-8-sig"
+) -> Union[CompactTable, Dict[str, Any], None]:
+    """
+    Fetch an opendata.php table as CSV into a compact table.
+
+    Args:
+        params: Query parameters of the JSON request; rformat is replaced
+        encoding: Text encoding of the response
+
+    Returns:
+        The table; an error message if the request failed, or a document with
+        no data if HKO answered with an empty body; or None if the body could
+        not be read as a table, in which case the caller should fall back to
+        JSON
+    """
+    try:
+        with requests.get(
+            OPENDATA_URL,
+            params={**params, "rformat": "csv"},
+            timeout=STREAM_TIMEOUT,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            chunks = iter(response.iter_content(chunk_size=65536))
+            first = next((chunk for chunk in chunks if chunk.strip(_BLANK)), None)
+            if first is None:
+                # HKO answers with an empty body when there is no data
+                return {"fields": [], "data": []}
+            lines = _decode_lines(itertools.chain([first], chunks), encoding)
+            table = parse_csv(lines)
+    except requests.exceptions.RequestException as e:
+        return request_error(e)
+    except (UnicodeError, csv.Error) as e:
+        logger.warning("Reading %s as CSV failed: %s", params.get("dataType"), e)
+        return None
+    if table is None or not len(table):
+        return None
+    return table
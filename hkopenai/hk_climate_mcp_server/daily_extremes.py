@@ -0,0 +1,189 @@
+"""
+Daily Extremes - Running maximum and minimum observations of the current HKT day.
+
+This module keeps, for every station, the highest and lowest temperature and
+humidity seen in the current weather reports (rhrread) since midnight Hong
+Kong Time. Each report updates the extremes in constant time per station, and
+they start over at the first report of a new day. The state is saved to the
+cache directory after each change, so a restarted server continues the day.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import get_cache_dir
+from .observations import HKT, WeatherSnapshot, record_timestamp
+from .scheduler import SCHEDULER
+
+logger = logging.getLogger(__name__)
+
+# Language of the reports recorded; stations are named in this language
+EXTREMES_LANG = "en"
+
+# Elements tracked -> unit of their values
+ELEMENTS: Dict[str, str] = {"temperature": "C", "humidity": "percent"}
+
+_STATE_FILE = "daily_extremes.json"
+
+
+def hkt_date(timestamp: Optional[float] = None) -> str:
+    """Get the HKT date (YYYYMMDD) of an epoch time, defaulting to now."""
+    if timestamp is None:
+        return datetime.now(HKT).strftime("%Y%m%d")
+    return datetime.fromtimestamp(timestamp, HKT).strftime("%Y%m%d")
+
+
+class DailyExtremes:
+    """Thread-safe running extremes per station for one HKT day."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: File the state is saved to, defaults to daily_extremes.json
+                  in the cache directory
+        """
+        self._path = path
+        self._date = ""
+        # element -> lower-case station name -> {place, max, maxTime, min, minTime}
+        self._extremes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """File the state is saved to."""
+        if self._path is not None:
+            return self._path
+        return get_cache_dir() / _STATE_FILE
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self._date = str(state["date"])
+            self._extremes = {
+                element: dict(state["extremes"].get(element, {}))
+                for element in ELEMENTS
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._date, self._extremes = "", {}
+
+    def _save(self) -> None:
+        """Write the state atomically; failures are logged and ignored."""
+        path = self.path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"date": self._date, "extremes": self._extremes}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Saving daily extremes failed: %s", e)
+
+    def update(self, snapshot: Any) -> int:
+        """
+        Update the extremes from a current weather report.
+
+        Readings of an earlier day than the current one are ignored; the
+        first reading of a later day starts the extremes over.
+
+        Args:
+            snapshot: Parsed rhrread report
+
+        Returns:
+            int: Number of station extremes that changed
+        """
+        if not isinstance(snapshot, WeatherSnapshot):
+            return 0
+        sections = (
+            ("temperature", snapshot.temperature, snapshot.temperature_record_time),
+            ("humidity", snapshot.humidity, snapshot.humidity_record_time),
+        )
+        changed = 0
+        with self._lock:
+            self._load()
+            for element, index, record_time in sections:
+                timestamp = record_timestamp(record_time)
+                if timestamp is None:
+                    continue
+                day = hkt_date(timestamp)
+                if day < self._date:
+                    continue
+                if day > self._date:
+                    self._date, self._extremes = day, {}
+                stations = self._extremes.setdefault(element, {})
+                for reading in index.readings:
+                    if not isinstance(reading.value, (int, float)):
+                        continue
+                    key = reading.place.lower()
+                    extremes = stations.get(key)
+                    if extremes is None:
+                        stations[key] = {
+                            "place": reading.place,
+                            "max": reading.value,
+                            "maxTime": record_time,
+                            "min": reading.value,
+                            "minTime": record_time,
+                        }
+                    elif reading.value > extremes["max"]:
+                        extremes.update(max=reading.value, maxTime=record_time)
+                    elif reading.value < extremes["min"]:
+                        extremes.update(min=reading.value, minTime=record_time)
+                    else:
+                        continue
+                    changed += 1
+            if changed:
+                self._save()
+        return changed
+
+    def get(self, place: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get today's extremes of one station or all stations.
+
+        Args:
+            place: Station name, ignoring case, or None for all stations
+
+        Returns:
+            Dict containing date and, per element, the station's
+            {place, max, maxTime, min, minTime} (None if not reported today),
+            or a list of those of all stations when no place is given
+        """
+        today = hkt_date()
+        with self._lock:
+            self._load()
+            extremes = self._extremes if self._date == today else {}
+            result: Dict[str, Any] = {"date": today}
+            for element in ELEMENTS:
+                stations = extremes.get(element, {})
+                if place is None:
+                    result[element] = [dict(e) for e in stations.values()]
+                else:
+                    entry = stations.get(place.strip().lower())
+                    result[element] = dict(entry) if entry is not None else None
+            return result
+
+    def clear(self) -> None:
+        """Forget the in-memory state; it is reloaded from the file when next used."""
+        with self._lock:
+            self._date, self._extremes, self._loaded = "", {}, False
+
+
+# Extremes updated by the polling scheduler
+DAILY_EXTREMES = DailyExtremes()
+
+
+def _update(document: Any, lang: str) -> None:
+    if lang == EXTREMES_LANG:
+        DAILY_EXTREMES.update(document)
+
+
+SCHEDULER.add_listener("rhrread", _update)
@@ -0,0 +1,204 @@
+"""
+Feed Registry - Shared fetching and caching of HKO real-time feeds.
+
+This module describes each HKO real-time feed (dataType). A feed is fetched
+at most once per language within its freshness window, even when several
+tools ask for it concurrently, and the parsed document is shared by every
+tool that derives its output from that feed. When the feed was fetched as raw
+bytes, the bytes are kept for tools serving it unchanged, and are parsed only
+when a tool first reads the document.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from .frozen import freeze
+from .json_codec import decode_json
+from .observations import get_snapshot
+from .passthrough import RawJson
+
+WEATHER_URL = "https://data.weather.gov.hk/weatherAPI/opendata/weather.php"
+OPENDATA_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+
+
+def _parse_rhrread(data: Dict[str, Any], lang: str) -> Any:
+    return get_snapshot(data, lang)
+
+
+def _parse_document(data: Dict[str, Any], lang: str) -> Any:
+    return freeze(data)
+
+
+class FeedSpec(NamedTuple):
+    """Static description of an HKO real-time feed."""
+
+    description: str
+    # Seconds a fetched document is reused before asking HKO again
+    max_age: float
+    url: str = WEATHER_URL
+    # Parser turning the raw JSON response into the shared, immutable document
+    parser: Callable[[Dict[str, Any], str], Any] = _parse_document
+
+
+FEEDS: Dict[str, FeedSpec] = {
+    "rhrread": FeedSpec("current weather report", 60, parser=_parse_rhrread),
+    "warnsum": FeedSpec("weather warning summary", 60),
+    "warningInfo": FeedSpec("detailed weather warning information", 60),
+    "swt": FeedSpec("special weather tips", 60),
+    "flw": FeedSpec("local weather forecast", 300),
+    "fnd": FeedSpec("9-day weather forecast", 600),
+    "LTMV": FeedSpec("10-minute mean visibility", 300, url=OPENDATA_URL),
+    "LHL": FeedSpec("lightning count", 300, url=OPENDATA_URL),
+}
+
+def feed_url(data_type: str, lang: str) -> str:
+    """
+    Get the request URL of a feed.
+
+    Args:
+        data_type: HKO dataType code, e.g. 'rhrread'
+        lang: Language code (en/tc/sc)
+
+    Returns:
+        str: Full request URL
+    """
+    spec = FEEDS[data_type]
+    url = f"{spec.url}?dataType={data_type}&lang={lang}"
+    return url + "&rformat=json" if spec.url == OPENDATA_URL else url
+
+
+class FeedRegistry:
+    """Thread-safe cache of parsed feed documents, one per feed and language."""
+
+    def __init__(self):
+        self._entries: Dict[tuple, tuple] = {}
+        self._fetch_locks: Dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, key: tuple) -> Optional[tuple]:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > FEEDS[key[0]].max_age:
+            return None
+        return entry
+
+    def _document(self, key: tuple, entry: tuple) -> Any:
+        """Get the parsed document of an entry, parsing its bytes on first use."""
+        if entry[1] is not None:
+            return entry[1]
+        data = decode_json(entry[2].data)
+        if not isinstance(data, dict) or "error" in data:
+            return data
+        document = FEEDS[key[0]].parser(data, key[1])
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries[key] = (entry[0], document, entry[2])
+        return document
+
+    def get(
+        self, data_type: str, lang: str, fetch: Callable[[str], Dict[str, Any]]
+    ) -> Any:
+        """
+        Get the parsed document of a feed, fetching it only if it is stale.
+
+        Concurrent callers of a stale feed wait for a single fetch. Error
+        responses are returned but not cached.
+
+        Args:
+            data_type: HKO dataType code, e.g. 'rhrread'
+            lang: Language code (en/tc/sc)
+            fetch: Function fetching a URL, fetch_json_data or fetch_raw_json
+
+        Returns:
+            The shared parsed document, or the upstream error dict
+        """
+        key = (data_type, lang)
+        with self._lock:
+            entry = self._fresh(key)
+        if entry is not None:
+            return self._document(key, entry)
+        return self._fetch(key, fetch, force=False)
+
+    def refresh(
+        self,
+        data_type: str,
+        lang: str,
+        fetch: Callable[[str], Dict[str, Any]],
+        raw: bool = False,
+    ) -> Any:
+        """
+        Fetch a feed now, even if the cached document is still fresh.
+
+        Args:
+            data_type: HKO dataType code, e.g. 'rhrread'
+            lang: Language code (en/tc/sc)
+            fetch: Function fetching a URL, fetch_json_data or fetch_raw_json
+            raw: Whether to return a feed fetched as bytes without parsing it
+
+        Returns:
+            The new parsed document or RawJson, or the upstream error dict
+        """
+        return self._fetch((data_type, lang), fetch, force=True, raw=raw)
+
+    def get_raw(self, data_type: str, lang: str, fetch: Callable[[str], Any]) -> Any:
+        """
+        Get a feed as the bytes HKO sent, fetching it only if it is stale.
+
+        A fresh document fetched without its bytes is fetched again. The bytes
+        are not parsed until a tool reads the document.
+
+        Args:
+            data_type: HKO dataType code, e.g. 'LHL'
+            lang: Language code (en/tc/sc)
+            fetch: Function fetching a URL, normally fetch_raw_json
+
+        Returns:
+            The feed as RawJson, else the parsed document or the upstream
+            error dict
+        """
+        key = (data_type, lang)
+        with self._lock:
+            entry = self._fresh(key)
+        if entry is not None and entry[2] is not None:
+            return entry[2]
+        return self._fetch(key, fetch, force=False, raw=True)
+
+    def _fetch(
+        self, key: tuple, fetch: Callable[[str], Any], force: bool, raw: bool = False
+    ) -> Any:
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+        with fetch_lock:
+            with self._lock:
+                entry = None if force else self._fresh(key)
+            if entry is None or (raw and entry[2] is None):
+                data_type, lang = key
+                data = fetch(feed_url(data_type, lang))
+                if isinstance(data, RawJson):
+                    entry = (time.monotonic(), None, data)
+                elif not isinstance(data, dict) or "error" in data:
+                    return data
+                else:
+                    document = FEEDS[data_type].parser(data, lang)
+                    entry = (time.monotonic(), document, None)
+                with self._lock:
+                    self._entries[key] = entry
+        if raw and entry[2] is not None:
+            return entry[2]
+        return self._document(key, entry)
+
+    def peek(self, data_type: str, lang: str) -> Optional[Any]:
+        """Get the last parsed document of a feed regardless of its age, if any."""
+        key = (data_type, lang)
+        with self._lock:
+            entry = self._entries.get(key)
+        return self._document(key, entry) if entry is not None else None
+
+    def clear(self) -> None:
+        """Forget all cached documents."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Registry shared by all real-time feed tools
+FEED_REGISTRY = FeedRegistry()
@@ -0,0 +1,205 @@
+"""
+Forecast Revisions - Local history of 9-day and local forecast issues.
+
+HKO revises the 9-day forecast (fnd) and the local weather forecast (flw)
+several times a day, but the feeds only hold the latest issue. This module
+keeps every distinct issue, keyed by its updateTime, in a compact form: only
+the fields that describe the forecast are kept, without icons, sea or soil
+temperatures. Issues are appended to a JSON lines file per feed under the cache
+directory, so revisions survive a restart, and at most MAX_ISSUES are kept.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .cache import get_cache_dir
+from .scheduler import SCHEDULER
+
+logger = logging.getLogger(__name__)
+
+# Language of the issues recorded
+FORECAST_LANG = "en"
+
+# Issues kept per feed
+MAX_ISSUES = 120
+
+# Fields kept of each day of the 9-day forecast; temperature and humidity
+# are kept as their numeric value
+DAY_FIELDS = ("forecastWeather", "forecastWind", "PSR")
+DAY_VALUE_FIELDS = ("forecastMaxtemp", "forecastMintemp", "forecastMaxrh", "forecastMinrh")
+
+# Fields kept of the local weather forecast
+LOCAL_FIELDS = ("generalSituation", "forecastPeriod", "forecastDesc", "outlook")
+
+
+def _compact_fnd(document: Mapping[str, Any]) -> Dict[str, Any]:
+    days = {}
+    for day in document.get("weatherForecast", []):
+        entry = {field: day.get(field, "") for field in DAY_FIELDS}
+        for field in DAY_VALUE_FIELDS:
+            value = day.get(field)
+            entry[field] = value.get("value") if isinstance(value, Mapping) else None
+        days[day.get("forecastDate", "")] = entry
+    return {"generalSituation": document.get("generalSituation", ""), "days": days}
+
+
+def _compact_flw(document: Mapping[str, Any]) -> Dict[str, Any]:
+    return {field: document.get(field, "") for field in LOCAL_FIELDS}
+
+
+_COMPACT = {"fnd": _compact_fnd, "flw": _compact_flw}
+
+
+def issue_date(update_time: str) -> str:
+    """Get the date (YYYYMMDD) of an updateTime such as 2025-06-07T16:30:00+08:00."""
+    return update_time[:10].replace("-", "")
+
+
+def diff_forecasts(
+    old: Optional[Mapping[str, Any]], new: Mapping[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the fields that differ between two forecasts.
+
+    Args:
+        old: Earlier forecast, or None if there is none
+        new: Later forecast
+
+    Returns:
+        Mapping of changed field to {from, to}; empty if old is None
+    """
+    if old is None:
+        return {}
+    return {
+        field: {"from": old.get(field), "to": value}
+        for field, value in new.items()
+        if old.get(field) != value
+    }
+
+
+class ForecastStore:
+    """Thread-safe, persistent history of forecast issues per feed."""
+
+    def __init__(self, root: Optional[Path] = None, max_issues: int = MAX_ISSUES):
+        """
+        Args:
+            root: Directory of the issue files, defaults to 'forecasts' under
+                  the cache directory
+            max_issues: Issues kept per feed
+        """
+        self._root = root
+        self._max_issues = max_issues
+        self._issues: Dict[str, "OrderedDict[str, Dict[str, Any]]"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        """Directory holding one JSON lines file per feed."""
+        if self._root is not None:
+            return self._root
+        return get_cache_dir() / "forecasts"
+
+    def _path(self, data_type: str) -> Path:
+        return self.root / f"{data_type}.jsonl"
+
+    def _load(self, data_type: str) -> "OrderedDict[str, Dict[str, Any]]":
+        issues = self._issues.get(data_type)
+        if issues is not None:
+            return issues
+        issues = self._issues[data_type] = OrderedDict()
+        lines = 0
+        try:
+            with open(self._path(data_type), "r", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    try:
+                        update_time, forecast = json.loads(line)
+                    except (ValueError, TypeError):
+                        continue
+                    issues[update_time] = forecast
+        except OSError:
+            return issues
+        while len(issues) > self._max_issues:
+            issues.popitem(last=False)
+        if lines > len(issues):
+            self._rewrite(data_type, issues)
+        return issues
+
+    def _rewrite(self, data_type: str, issues: Mapping[str, Any]) -> None:
+        """Replace the file with the kept issues, dropping older and bad lines."""
+        path = self._path(data_type)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for update_time, forecast in issues.items():
+                    f.write(json.dumps([update_time, forecast], ensure_ascii=False) + "\n")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Compacting %s forecast issues failed: %s", data_type, e)
+
+    def record(self, data_type: str, document: Any) -> bool:
+        """
+        Store a forecast issue if its updateTime has not been seen.
+
+        Args:
+            data_type: 'fnd' or 'flw'
+            document: Parsed feed document
+
+        Returns:
+            bool: True if the issue was new
+        """
+        if not isinstance(document, Mapping) or "error" in document:
+            return False
+        update_time = document.get("updateTime")
+        if not update_time:
+            return False
+        forecast = _COMPACT[data_type](document)
+        with self._lock:
+            issues = self._load(data_type)
+            if update_time in issues:
+                return False
+            issues[update_time] = forecast
+            path = self._path(data_type)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps([update_time, forecast], ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.warning("Storing %s forecast issue failed: %s", data_type, e)
+            if len(issues) > self._max_issues:
+                while len(issues) > self._max_issues:
+                    issues.popitem(last=False)
+                self._rewrite(data_type, issues)
+        return True
+
+    def issues(self, data_type: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get the stored (updateTime, forecast) issues of a feed, oldest first."""
+        with self._lock:
+            return sorted(self._load(data_type).items())
+
+    def clear(self) -> None:
+        """Forget the in-memory issues; they are reloaded from disk when next used."""
+        with self._lock:
+            self._issues.clear()
+
+
+# Issues recorded by the polling scheduler and the forecast tools
+FORECAST_STORE = ForecastStore()
+
+
+def _recorder(data_type: str):
+    def record(document: Any, lang: str) -> None:
+        if lang == FORECAST_LANG:
+            FORECAST_STORE.record(data_type, document)
+
+    return record
+
+
+for _data_type in _COMPACT:
+    SCHEDULER.add_listener(_data_type, _recorder(_data_type))
@@ -0,0 +1,45 @@
+"""
+Immutable Data Helpers - Read-only views of parsed JSON data.
+
+Parsed HKO data is cached and shared between concurrent tool calls, so it is
+kept in read-only containers that cannot be modified by any caller. This
+module converts between plain JSON values and their read-only equivalents.
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """
+    Get a deeply read-only version of a JSON value.
+
+    Args:
+        value: JSON value made of dicts, lists and scalars
+
+    Returns:
+        The same value with dicts replaced by MappingProxyType and lists by
+        tuples
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Get a plain, JSON-serializable copy of a frozen value.
+
+    Args:
+        value: Value produced by freeze()
+
+    Returns:
+        The same value with mappings replaced by dicts and tuples by lists
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(v) for v in value]
+    return value
@@ -0,0 +1,317 @@
+"""
+Observation History - Bounded in-memory history of lightning and visibility.
+
+The LHL (lightning count) and LTMV (10-minute mean visibility) feeds only hold
+the latest readings. This module keeps the readings seen by the polling
+scheduler in fixed-size, array-backed ring buffers, one per station or region,
+so recent history, extremes and trends can be answered locally. Memory use
+does not grow with uptime: each buffer holds at most HISTORY_HOURS of samples.
+"""
+
+import math
+import re
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .feeds import FEED_REGISTRY
+from .scheduler import SCHEDULER
+
+# Hours of readings kept per station or region
+HISTORY_HOURS = 24
+
+# Seconds between the feeds' readings
+SAMPLE_INTERVAL = 600
+
+# Maximum number of series kept per feed
+MAX_SERIES = 256
+
+# Language of the documents recorded; series are named in this language
+HISTORY_LANG = "en"
+
+HKT = timezone(timedelta(hours=8))
+
+_NUMBER = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(.*)$")
+
+
+def _parse_time(value: Any) -> Optional[int]:
+    """Parse an HKO time such as 202506231400 or 202506231400-1459 to epoch seconds."""
+    digits = str(value)[:12]
+    try:
+        moment = datetime.strptime(digits, "%Y%m%d%H%M").replace(tzinfo=HKT)
+    except ValueError:
+        return None
+    return int(moment.timestamp())
+
+
+def _format_time(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, HKT).isoformat()
+
+
+def _parse_number(value: Any) -> Optional[Tuple[float, str]]:
+    """Parse a reading such as 35, '12' or '35 km' into (value, unit)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value), ""
+    match = _NUMBER.match(str(value))
+    if match is None:
+        return None
+    return float(match.group(1)), match.group(2)
+
+
+def iter_readings(document: Mapping[str, Any]) -> Iterator[Tuple[str, int, float, str]]:
+    """
+    Split an LHL or LTMV document into individual readings.
+
+    The first column of each row is its time. Text columns name the series
+    (e.g. the station, or the region and lightning type), and each numeric
+    column is a reading. When a row has several numeric columns, or no text
+    columns, the field name is added to the series name.
+
+    Args:
+        document: Parsed opendata.php document with fields and data
+
+    Yields:
+        Tuples of (series name, epoch seconds, value, unit)
+    """
+    fields = list(document.get("fields", []))
+    for row in document.get("data", []):
+        if not row:
+            continue
+        timestamp = _parse_time(row[0])
+        if timestamp is None:
+            continue
+        labels, readings = [], []
+        for index, cell in enumerate(row[1:], start=1):
+            number = _parse_number(cell)
+            if number is None:
+                labels.append(str(cell))
+            else:
+                field = fields[index] if index < len(fields) else str(index)
+                readings.append((field, number))
+        for field, (value, unit) in readings:
+            parts = labels if labels and len(readings) == 1 else labels + [field]
+            yield " / ".join(parts), timestamp, value, unit
+
+
+class RingBuffer:
+    """Fixed-capacity, time-ordered samples of one series backed by arrays."""
+
+    __slots__ = ("capacity", "unit", "_times", "_values", "_start", "_size")
+
+    def __init__(self, capacity: int, unit: str = ""):
+        self.capacity = capacity
+        self.unit = unit
+        self._times = array("q", [0]) * capacity
+        self._values = array("d", [0.0]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: int, value: float) -> bool:
+        """
+        Add a sample, overwriting the oldest one when full.
+
+        Samples not newer than the last one, e.g. a reading fetched twice,
+        are ignored.
+
+        Returns:
+            bool: True if the sample was added
+        """
+        last = (self._start + self._size - 1) % self.capacity
+        if self._size and timestamp <= self._times[last]:
+            return False
+        if self._size < self.capacity:
+            index = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            index = self._start
+            self._start = (self._start + 1) % self.capacity
+        self._times[index] = timestamp
+        self._values[index] = value
+        return True
+
+    def since(self, timestamp: int) -> List[Tuple[int, float]]:
+        """Get the samples at or after a time, oldest first."""
+        samples = []
+        for offset in range(self._size):
+            index = (self._start + offset) % self.capacity
+            if self._times[index] >= timestamp:
+                samples.append((self._times[index], self._values[index]))
+        return samples
+
+
+def _sample(sample: Optional[Tuple[int, float]]) -> Optional[Dict[str, Any]]:
+    if sample is None:
+        return None
+    return {"time": _format_time(sample[0]), "value": sample[1]}
+
+
+def _trend(samples: List[Tuple[int, float]]) -> Dict[str, Any]:
+    """Least-squares change per hour of the samples."""
+    if len(samples) < 2:
+        return {"perHour": None, "direction": None}
+    t0 = samples[0][0]
+    xs = [(t - t0) / 3600 for t, _ in samples]
+    ys = [v for _, v in samples]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    slope = round(slope, 2)
+    direction = "steady" if slope == 0 else "rising" if slope > 0 else "falling"
+    return {"perHour": slope, "direction": direction}
+
+
+class SeriesHistory:
+    """Thread-safe ring buffers of the series of one feed."""
+
+    def __init__(
+        self,
+        hours: int = HISTORY_HOURS,
+        interval: int = SAMPLE_INTERVAL,
+        max_series: int = MAX_SERIES,
+    ):
+        """
+        Args:
+            hours: Hours of samples kept per series
+            interval: Seconds between the feed's readings
+            max_series: Maximum number of series kept; readings of further
+                        series are dropped
+        """
+        self.hours = hours
+        self._capacity = math.ceil(hours * 3600 / interval)
+        self._max_series = max_series
+        self._series: Dict[str, RingBuffer] = {}
+        self._lock = threading.Lock()
+
+    def record(self, document: Any) -> int:
+        """
+        Add the readings of a feed document.
+
+        Args:
+            document: Parsed LHL or LTMV document
+
+        Returns:
+            int: Number of new samples
+        """
+        if not isinstance(document, Mapping) or "error" in document:
+            return 0
+        added = 0
+        with self._lock:
+            for name, timestamp, value, unit in iter_readings(document):
+                series = self._series.get(name)
+                if series is None:
+                    if len(self._series) >= self._max_series:
+                        continue
+                    series = self._series[name] = RingBuffer(self._capacity, unit)
+                added += series.append(timestamp, value)
+        return added
+
+    def names(self) -> List[str]:
+        """Get the names of all series."""
+        with self._lock:
+            return sorted(self._series)
+
+    def query(
+        self, name: str, hours: float, now: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize the recent samples of the series matching a name.
+
+        Args:
+            name: Station or region name; matches series whose name equals it
+                  or contains it as a part, ignoring case
+            hours: Number of hours back from now
+            now: Epoch seconds to count back from, defaults to the current time
+
+        Returns:
+            One dict per matching series containing name, unit, samples
+            ({time, value}, oldest first), min and max ({time, value}) and
+            trend (perHour and direction: rising, falling or steady)
+        """
+        now = time.time() if now is None else now
+        start = int(now - hours * 3600)
+        wanted = name.strip().lower()
+        with self._lock:
+            matching = [
+                (series_name, series.unit, series.since(start))
+                for series_name, series in sorted(self._series.items())
+                if wanted == series_name.lower()
+                or wanted in (part.lower() for part in series_name.split(" / "))
+            ]
+        return [
+            {
+                "name": series_name,
+                "unit": unit,
+                "samples": [_sample(sample) for sample in samples],
+                "min": _sample(min(samples, key=lambda s: s[1], default=None)),
+                "max": _sample(max(samples, key=lambda s: s[1], default=None)),
+                "trend": _trend(samples),
+            }
+            for series_name, unit, samples in matching
+        ]
+
+    def clear(self) -> None:
+        """Remove all series."""
+        with self._lock:
+            self._series.clear()
+
+
+def get_history(
+    history: SeriesHistory,
+    data_type: str,
+    name: str,
+    hours: int,
+    fetch: Callable[[str], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Get the recent history of a station or region for a history tool.
+
+    The feed's current document is recorded first, so the latest reading is
+    included even if the scheduler has not polled it yet.
+
+    Args:
+        history: History of the feed
+        data_type: HKO dataType code of the feed
+        name: Station or region name
+        hours: Number of hours back from now, 1 to the hours kept
+        fetch: Function fetching a URL, normally fetch_json_data
+
+    Returns:
+        Dict with hours and series (see SeriesHistory.query), or an error
+        message listing the known names if none matches
+    """
+    if not 1 <= hours <= history.hours:
+        return {"error": f"Hours must be between 1 and {history.hours}."}
+    document = FEED_REGISTRY.get(data_type, HISTORY_LANG, fetch)
+    history.record(document)
+    series = history.query(name, hours)
+    if series:
+        return {"hours": hours, "series": series}
+    if isinstance(document, dict) and "error" in document and not history.names():
+        return document
+    return {
+        "error": f"No history for '{name}'. Known names: {', '.join(history.names())}."
+    }
+
+
+# Histories filled by the polling scheduler
+LIGHTNING_HISTORY = SeriesHistory()
+VISIBILITY_HISTORY = SeriesHistory()
+
+
+def _recorder(history: SeriesHistory):
+    def record(document: Any, lang: str) -> None:
+        if lang == HISTORY_LANG:
+            history.record(document)
+
+    return record
+
+
+SCHEDULER.add_listener("LHL", _recorder(LIGHTNING_HISTORY))
+SCHEDULER.add_listener("LTMV", _recorder(VISIBILITY_HISTORY))
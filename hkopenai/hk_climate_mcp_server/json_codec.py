@@ -0,0 +1,288 @@
+"""
+JSON Codec - Pluggable JSON decoding and encoding.
+
+Decoding HKO responses and encoding tool results are the largest CPU costs of
+a call. This module puts one loads/dumps pair in front of them: orjson when it
+is installed (pip install hkopenai.hk_climate_mcp_server[fast]), the standard
+library otherwise. fetch_json_data below decodes responses with it, and the
+server encodes tool results with dumps. Other libraries can be added with
+register_codec, and HK_CLIMATE_MCP_JSON_CODEC selects one by name.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Mapping, Set
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Environment variable naming the codec to use instead of the fastest one
+CODEC_ENV = "HK_CLIMATE_MCP_JSON_CODEC"
+
+
+class JsonCodec(NamedTuple):
+    """A JSON library behind the functions this server needs from it."""
+
+    name: str
+    # Parses a JSON document given as bytes (UTF-8, no BOM) or text
+    loads: Callable[[Union[bytes, str]], Any]
+    # Encodes a value as compact JSON text, non-ASCII characters unescaped
+    dumps: Callable[[Any], str]
+
+
+def _default(value: Any) -> Any:
+    """Encode values JSON has no type for, such as frozen documents."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Set):
+        return list(value)
+    return str(value)
+
+
+def _stdlib_dumps(value: Any) -> str:
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=_default
+    )
+
+
+STDLIB_CODEC = JsonCodec("json", json.loads, _stdlib_dumps)
+
+CODECS: Dict[str, JsonCodec] = {"json": STDLIB_CODEC}
+
+# Codecs in order of preference, used when none is named
+PREFERENCE = ["orjson", "json"]
+
+if orjson is not None:
+
+    def _orjson_dumps(value: Any) -> str:
+        try:
+            return orjson.dumps(
+                value, default=_default, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # Integers beyond 64 bits and the like
+            return _stdlib_dumps(value)
+
+    CODECS["orjson"] = JsonCodec("orjson", orjson.loads, _orjson_dumps)
+
+_lock = threading.Lock()
+_codec: Optional[JsonCodec] = None
+
+
+def register_codec(codec: JsonCodec, preferred: bool = False) -> None:
+    """
+    Make a codec available by its name.
+
+    Args:
+        codec: The codec
+        preferred: Whether to prefer it to every codec registered before when
+                   no codec is named; takes effect from the next set_codec
+    """
+    with _lock:
+        CODECS[codec.name] = codec
+        if codec.name in PREFERENCE:
+            PREFERENCE.remove(codec.name)
+        PREFERENCE.insert(0 if preferred else len(PREFERENCE), codec.name)
+
+
+def set_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Choose the codec used from now on.
+
+    Args:
+        name: Name of a registered codec; if None, the one named by
+              HK_CLIMATE_MCP_JSON_CODEC, or else the first available in
+              PREFERENCE
+
+    Returns:
+        JsonCodec: The codec chosen
+
+    Raises:
+        ValueError: If the codec named is not registered
+    """
+    global _codec
+    with _lock:
+        if name is None:
+            name = os.environ.get(CODEC_ENV) or None
+            if name is not None and name not in CODECS:
+                logger.warning(
+                    "%s=%s is not an available JSON codec; using the default",
+                    CODEC_ENV,
+                    name,
+                )
+                name = None
+        if name is None:
+            name = next(n for n in PREFERENCE if n in CODECS)
+        if name not in CODECS:
+            raise ValueError(
+                f"Unknown JSON codec '{name}'. Available: {', '.join(CODECS)}."
+            )
+        _codec = CODECS[name]
+        return _codec
+
+
+def get_codec() -> JsonCodec:
+    """Get the codec in use, choosing the default one on first use."""
+    codec = _codec
+    return codec if codec is not None else set_codec()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document with the codec in use."""
+    return get_codec().loads(data)
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode a value as compact JSON with the codec in use.
+
+    Mappings such as frozen documents are encoded as objects, sets as
+    arrays and anything else JSON has no type for as its string. This is the
+    server's tool result serializer.
+    """
+    return get_codec().dumps(value)
+
+
+def fetch_json_bytes(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> Union[bytes, Dict[str, Any]]:
+    """
+    Fetch the body of a JSON document as UTF-8 bytes, without decoding it.
+
+    Args:
+        url: URL to fetch
+        params: Optional query parameters
+        headers: Optional request headers
+        timeout: Optional timeout in seconds
+        encoding: Text encoding of the response; a UTF-8 BOM is ignored
+
+    Returns:
+        The body as UTF-8 bytes without a BOM, or the error message
+        fetch_json_data returns for the failed request
+    """
+    try:
+        response = requests.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as req_err:
+        return request_error(req_err)
+
+    content = response.content
+    if encoding.lower().replace("_", "-") in ("utf-8", "utf8", "utf-8-sig"):
+        # Both codecs read UTF-8 bytes directly, without a decoded copy
+        return content[3:] if content.startswith(b"\xef\xbb\xbf") else content
+    try:
+        return content.decode(encoding).lstrip("\ufeff").encode("utf-8")
+    except UnicodeDecodeError as decode_err:
+        return _decode_error(encoding, decode_err)
+
+
+def request_error(req_err: requests.exceptions.RequestException) -> Dict[str, Any]:
+    """
+    Get the error message fetch_json_data returns for a failed request.
+
+    Args:
+        req_err: Exception raised by requests, or by raise_for_status
+
+    Returns:
+        Dict containing the error message
+    """
+    if isinstance(req_err, requests.exceptions.HTTPError):
+        response = req_err.response
+        return {
+            "error": (
+                f"HTTP error occurred: {req_err}. "
+                f"Status code: {response.status_code}. "
+                f"Response: {response.text}"
+            )
+        }
+    if isinstance(req_err, requests.exceptions.ConnectionError):
+        return {
+            "error": f"Connection error occurred: {req_err}. "
+            "Please check your network connection."
+        }
+    if isinstance(req_err, requests.exceptions.Timeout):
+        return {
+            "error": f"The request timed out: {req_err}. Please try again later."
+        }
+    return {"error": f"An unexpected error occurred during the request: {req_err}."}
+
+
+def parse_error() -> Dict[str, Any]:
+    """Get the error message fetch_json_data returns for a body that is not JSON."""
+    return {
+        "error": (
+            "Failed to parse JSON response from API. "
+            "The API might have returned non-JSON data or an empty response."
+        )
+    }
+
+
+def _decode_error(encoding: str, decode_err: UnicodeDecodeError) -> Dict[str, Any]:
+    return {
+        "error": (
+            f"UnicodeDecodeError: Failed to decode content with encoding "
+            f"{encoding}: {decode_err}. Try a different encoding."
+        )
+    }
+
+
+def decode_json(content: bytes, encoding: str = "utf-8") -> Any:
+    """
+    Decode a body returned by fetch_json_bytes with the codec in use.
+
+    Args:
+        content: UTF-8 body of the response
+        encoding: Text encoding the response was read with, for error messages
+
+    Returns:
+        The decoded document, or an error message if the body is not JSON
+    """
+    try:
+        return loads(content)
+    except UnicodeDecodeError as decode_err:
+        return _decode_error(encoding, decode_err)
+    except ValueError:
+        return parse_error()
+
+
+def fetch_json_data(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> Dict[str, Any]:
+    """
+    Fetch a JSON document and decode it with the codec in use.
+
+    Takes the same arguments and returns the same errors as
+    hkopenai_common.json_utils.fetch_json_data, which it replaces in this
+    package.
+
+    Args:
+        url: URL to fetch
+        params: Optional query parameters
+        headers: Optional request headers
+        timeout: Optional timeout in seconds
+        encoding: Text encoding of the response; a UTF-8 BOM is ignored
+
+    Returns:
+        Dict containing the decoded document or an error message
+    """
+    content = fetch_json_bytes(url, params, headers, timeout, encoding)
+    if isinstance(content, dict):
+        return content
+    return decode_json(content, encoding)
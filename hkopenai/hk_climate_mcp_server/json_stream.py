@@ -0,0 +1,261 @@
+"""
+JSON Streaming - Incremental parsing of large opendata.php JSON tables.
+
+fetch_json_data reads the whole response, decodes it and builds every row as a
+list of Python objects before anything can use it, so a multi-megabyte table
+needs several times its size in memory. This module reads the response in
+chunks instead and parses the rows of its data array one at a time as they
+arrive, handing them in small batches to a compact table. Memory then depends
+on the size of a chunk and a batch of rows, not on the size of the table.
+"""
+
+import codecs
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+from .csv_table import BATCH_ROWS, OPENDATA_URL, STREAM_TIMEOUT, CompactTable
+from .json_codec import parse_error, request_error
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s*")
+
+_ROW_SEPARATOR = re.compile(r"\s*,\s*")
+
+# Returned by _decode when the buffer ends before the value does
+_INCOMPLETE = object()
+
+
+class JsonTableParser:
+    """
+    Incremental parser of a JSON object whose "data" member is a list of rows.
+
+    Text is given to feed() in pieces of any size. Rows of the data array are
+    returned as soon as they are complete; the other members, such as fields,
+    are kept whole in document, and those before the data array also in
+    leading.
+    """
+
+    def __init__(self):
+        self.document: Dict[str, Any] = {}
+        self.leading: Optional[Dict[str, Any]] = None
+        self.has_rows = False
+        self._buffer = ""
+        self._state = "start"
+        self._key: Optional[str] = None
+        self._decoder = json.JSONDecoder()
+
+    def _decode(self, buffer: str, pos: int, final: bool) -> Tuple[Any, int]:
+        """Decode the value at pos, or return _INCOMPLETE if it may go on."""
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _INCOMPLETE, pos
+        # A number at the end of the buffer may have more digits to come
+        if end == len(buffer) and not final:
+            return _INCOMPLETE, pos
+        return value, end
+
+    def feed(self, text: str, final: bool = False) -> List[Any]:
+        """
+        Parse the next piece of the document.
+
+        Args:
+            text: Text following the pieces fed before
+            final: Whether this is the end of the document
+
+        Returns:
+            Rows of the data array completed by this piece
+
+        Raises:
+            ValueError: If the text is not such a JSON document, or ends early
+        """
+        buffer = self._buffer + text
+        rows: List[Any] = []
+        pos = 0
+        state = self._state
+        # The decoder's C scanner, without raw_decode's checks around it
+        scan = self._decoder.scan_once
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if state == "start":
+                if char != "{":
+                    raise ValueError("The document is not a JSON object.")
+                state = "key"
+                pos += 1
+            elif state == "key":
+                if char == "}" and not self.document and not self.has_rows:
+                    state = "done"
+                    pos += 1
+                    continue
+                key, pos = self._decode(buffer, pos, final)
+                if key is _INCOMPLETE:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError("Expected a member name.")
+                self._key = key
+                state = "colon"
+            elif state == "colon":
+                if char != ":":
+                    raise ValueError("Expected ':' after a member name.")
+                state = "value"
+                pos += 1
+            elif state == "value":
+                if self._key == "data" and char == "[":
+                    self.has_rows = True
+                    self.leading = dict(self.document)
+                    state = "rows"
+                    pos += 1
+                    continue
+                value, pos = self._decode(buffer, pos, final)
+                if value is _INCOMPLETE:
+                    break
+                self.document[self._key] = value
+                state = "next"
+            elif state == "next":
+                if char == ",":
+                    state = "key"
+                elif char == "}":
+                    state = "done"
+                else:
+                    raise ValueError("Expected ',' or '}' after a member.")
+                pos += 1
+            elif state in ("rows", "row"):
+                if char == "]" and state == "rows":
+                    state = "next"
+                    pos += 1
+                    continue
+                row, pos = self._decode(buffer, pos, final)
+                if row is _INCOMPLETE:
+                    break
+                rows.append(row)
+                state = "row_next"
+                # Most rows follow one another directly; take them in a tight loop
+                while True:
+                    separator = _ROW_SEPARATOR.match(buffer, pos)
+                    if separator is None:
+                        break
+                    try:
+                        row, end = scan(buffer, separator.end())
+                    except (StopIteration, json.JSONDecodeError):
+                        break
+                    if end == len(buffer):
+                        break
+                    rows.append(row)
+                    pos = end
+            elif state == "row_next":
+                if char == ",":
+                    state = "row"
+                elif char == "]":
+                    state = "next"
+                else:
+                    raise ValueError("Expected ',' or ']' after a row.")
+                pos += 1
+            else:
+                raise ValueError("Unexpected text after the document.")
+        self._buffer = buffer[pos:]
+        self._state = state
+        if final and state != "done":
+            raise ValueError("The document ends early.")
+        return rows
+
+
+def parse_json_table(chunks: Iterable[str]) -> Optional[CompactTable]:
+    """
+    Parse a {fields, data} JSON document piece by piece into a compact table.
+
+    Args:
+        chunks: Text of the document in pieces
+
+    Returns:
+        The table, or None if the document has no data rows
+
+    Raises:
+        ValueError: If the document is not valid JSON, or its rows do not
+                    follow its fields
+    """
+    parser = JsonTableParser()
+    table: Optional[CompactTable] = None
+    batch: List[List[str]] = []
+
+    def add(rows: List[Any]) -> None:
+        nonlocal table
+        if not rows:
+            return
+        if table is None:
+            fields = parser.leading.get("fields")
+            if not isinstance(fields, list):
+                raise ValueError("The rows come before the fields.")
+            table = CompactTable(str(field) for field in fields)
+        batch.extend(rows)
+        if len(batch) >= BATCH_ROWS:
+            flush()
+
+    def flush() -> None:
+        nonlocal batch
+        if set(map(type, batch)) != {list} or set(map(len, batch)) != {
+            len(table.fields)
+        }:
+            raise ValueError("A row does not match the fields.")
+        table.extend(batch)
+        batch = []
+
+    for text in chunks:
+        add(parser.feed(text))
+    add(parser.feed("", final=True))
+    if table is None:
+        return None
+    if batch:
+        flush()
+    return table
+
+
+def _decode_chunks(chunks: Iterable[bytes], encoding: str) -> Iterable[str]:
+    """Decode a byte stream, whatever the chunk boundaries."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def fetch_json_table(
+    params: Dict[str, Any], encoding: str = "utf-8-sig"
+) -> Union[CompactTable, Dict[str, Any]]:
+    """
+    Fetch an opendata.php table as JSON, parsed as it streams in.
+
+    Args:
+        params: Query parameters of the request
+        encoding: Text encoding of the response
+
+    Returns:
+        The table, a document with no data if it has no rows, or the error
+        message fetch_json_data returns for the failed request or body
+    """
+    try:
+        with requests.get(
+            OPENDATA_URL,
+            params={**params, "rformat": "json"},
+            timeout=STREAM_TIMEOUT,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=65536)
+            table = parse_json_table(_decode_chunks(chunks, encoding))
+    except requests.exceptions.RequestException as e:
+        return request_error(e)
+    except (UnicodeError, ValueError) as e:
+        logger.warning("Streaming %s as JSON failed: %s", params.get("dataType"), e)
+        return parse_error()
+    if table is None or not len(table):
+        return {"fields": [], "data": []}
+    return table
@@ -0,0 +1,303 @@
+"""
+Observation Store - Persistent history of real-time weather observations.
+
+HKO's current weather report (rhrread) only holds the latest readings. This
+module appends the station temperatures, humidity and district rainfall of
+every new report to an append-only, columnar store on disk, with one segment
+directory per HKT day. Each element has its own fixed-width column files
+(time, place, value), so ranges are found by binary search over memory-mapped
+time columns and only the rows of the requested place are read into memory.
+Segments older than the retention window are deleted when a new day starts.
+"""
+
+import logging
+import math
+import mmap
+import os
+import re
+import shutil
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .cache import get_cache_dir
+from .observations import HKT, WeatherSnapshot, record_timestamp
+from .scheduler import SCHEDULER
+
+logger = logging.getLogger(__name__)
+
+# Language of the reports recorded; places are named in this language
+STORE_LANG = "en"
+
+# Element -> unit of its values
+ELEMENTS: Dict[str, str] = {
+    "temperature": "C",
+    "humidity": "percent",
+    "rainfall": "mm",
+}
+
+# Column -> array typecode. Times are epoch seconds, places are indexes into
+# the segment's places.txt, rainfall values are the district maximum.
+_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("time", "q"),
+    ("place", "H"),
+    ("value", "f"),
+)
+
+_PLACES_FILE = "places.txt"
+
+# Days of segments kept; older ones are deleted when a new day starts
+RETENTION_DAYS = 366
+
+_SEGMENT_NAME = re.compile(r"\d{8}")
+
+
+def _day(timestamp: int) -> date:
+    return datetime.fromtimestamp(timestamp, HKT).date()
+
+
+def _present(readings: Iterator[Tuple[str, Any]]) -> List[Tuple[str, float]]:
+    return [
+        (place, float(value))
+        for place, value in readings
+        if isinstance(value, (int, float)) and not math.isnan(value)
+    ]
+
+
+def _snapshot_rows(
+    snapshot: WeatherSnapshot,
+) -> Iterator[Tuple[str, str, List[Tuple[str, float]]]]:
+    """Yield (element, record time, [(place, value)]) of each element of a report."""
+    yield "temperature", snapshot.temperature_record_time, _present(
+        (r.place, r.value) for r in snapshot.temperature.readings
+    )
+    yield "humidity", snapshot.humidity_record_time, _present(
+        (r.place, r.value) for r in snapshot.humidity.readings
+    )
+    # Districts whose gauges are under maintenance report no rainfall
+    yield "rainfall", snapshot.rainfall_end, _present(
+        (r.place, r.max) for r in snapshot.rainfall.readings if r.main != "TRUE"
+    )
+
+
+@contextmanager
+def _mapped(path: Path, typecode: str) -> Iterator[Sequence]:
+    """Map a column file read-only as a typed memoryview; empty if missing."""
+    itemsize = array(typecode).itemsize
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        yield ()
+        return
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size < itemsize:
+            yield ()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            raw = memoryview(mapped)
+            view = raw[: size - size % itemsize].cast(typecode)
+            try:
+                yield view
+            finally:
+                view.release()
+                raw.release()
+
+
+class ObservationStore:
+    """Append-only columnar store of observations, segmented by HKT day."""
+
+    def __init__(
+        self, root: Optional[Path] = None, retention_days: int = RETENTION_DAYS
+    ):
+        """
+        Args:
+            root: Directory of the store, defaults to 'observations' under
+                  the cache directory
+            retention_days: Number of days, up to the newest, whose segments
+                            are kept
+        """
+        self._root = root
+        self._retention = timedelta(days=retention_days)
+        self._last: Dict[str, int] = {}
+        self._places: Dict[date, List[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        """Directory holding the day segments."""
+        if self._root is not None:
+            return self._root
+        return get_cache_dir() / "observations"
+
+    def _segment(self, day: date) -> Path:
+        return self.root / day.strftime("%Y%m%d")
+
+    def _column(self, day: date, element: str, column: str) -> Path:
+        return self._segment(day) / f"{element}.{column}"
+
+    def _read_places(self, day: date) -> List[str]:
+        try:
+            with open(self._segment(day) / _PLACES_FILE, "r", encoding="utf-8") as f:
+                return f.read().splitlines()
+        except OSError:
+            return []
+
+    def _place_ids(self, day: date, places: Sequence[str]) -> List[int]:
+        """Get the indexes of places in a segment, appending new ones."""
+        known = self._places.get(day)
+        if known is None:
+            known = self._places[day] = self._read_places(day)
+        new = [place for place in dict.fromkeys(places) if place not in known]
+        if new:
+            with open(self._segment(day) / _PLACES_FILE, "a", encoding="utf-8") as f:
+                f.write("".join(f"{place}\n" for place in new))
+            known.extend(new)
+        return [known.index(place) for place in places]
+
+    def _align(self, day: date, element: str) -> None:
+        """Cut off rows left incomplete by an interrupted append."""
+        paths = [(self._column(day, element, c), array(t).itemsize) for c, t in _COLUMNS]
+        sizes = [path.stat().st_size if path.exists() else 0 for path, _ in paths]
+        rows = min(size // itemsize for size, (_, itemsize) in zip(sizes, paths))
+        for size, (path, itemsize) in zip(sizes, paths):
+            if size != rows * itemsize:
+                os.truncate(path, rows * itemsize)
+
+    def _expire(self, today: date) -> None:
+        """Delete the segments of days before the retention window."""
+        oldest = today - self._retention + timedelta(days=1)
+        try:
+            names = [entry.name for entry in os.scandir(self.root) if entry.is_dir()]
+        except OSError:
+            return
+        for name in names:
+            if not _SEGMENT_NAME.fullmatch(name):
+                continue
+            try:
+                day = datetime.strptime(name, "%Y%m%d").date()
+            except ValueError:
+                continue
+            if day < oldest:
+                shutil.rmtree(self.root / name, ignore_errors=True)
+                self._places.pop(day, None)
+
+    def _last_time(self, element: str, day: date) -> int:
+        if element not in self._last:
+            with _mapped(self._column(day, element, "time"), "q") as times:
+                self._last[element] = times[-1] if len(times) else 0
+        return self._last[element]
+
+    def record(self, snapshot: Any) -> int:
+        """
+        Append the readings of a current weather report.
+
+        Elements whose record time is not newer than the last one stored are
+        skipped, so the same report may be recorded any number of times.
+        Failures to write are logged and otherwise ignored.
+
+        Args:
+            snapshot: Parsed rhrread report
+
+        Returns:
+            int: Number of rows appended
+        """
+        if not isinstance(snapshot, WeatherSnapshot):
+            return 0
+        appended = 0
+        with self._lock:
+            for element, record_time, readings in _snapshot_rows(snapshot):
+                timestamp = record_timestamp(record_time)
+                if timestamp is None or not readings:
+                    continue
+                day = _day(timestamp)
+                try:
+                    if timestamp <= self._last_time(element, day):
+                        continue
+                    if not self._segment(day).exists():
+                        self._expire(day)
+                    self._segment(day).mkdir(parents=True, exist_ok=True)
+                    self._align(day, element)
+                    columns = {
+                        "time": [timestamp] * len(readings),
+                        "place": self._place_ids(day, [place for place, _ in readings]),
+                        "value": [value for _, value in readings],
+                    }
+                    # The time column is written last; readers only use rows
+                    # present in every column
+                    for column, typecode in reversed(_COLUMNS):
+                        with open(self._column(day, element, column), "ab") as f:
+                            f.write(array(typecode, columns[column]).tobytes())
+                except (OSError, OverflowError) as e:
+                    logger.warning("Recording %s observations failed: %s", element, e)
+                    continue
+                self._last[element] = timestamp
+                appended += len(readings)
+        return appended
+
+    def _scan(
+        self, day: date, element: str, place_id: int, start: int, end: int
+    ) -> List[Tuple[int, float]]:
+        with _mapped(self._column(day, element, "time"), "q") as times, _mapped(
+            self._column(day, element, "place"), "H"
+        ) as places, _mapped(self._column(day, element, "value"), "f") as values:
+            rows = min(len(times), len(places), len(values))
+            first = bisect_left(times, start, 0, rows)
+            last = bisect_right(times, end, 0, rows)
+            return [
+                (times[i], round(values[i], 2))
+                for i in range(first, last)
+                if places[i] == place_id
+            ]
+
+    def query(
+        self, place: str, element: str, start: int, end: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Read the stored readings of a place.
+
+        Args:
+            place: Station or district name, ignoring case
+            element: One of ELEMENTS
+            start: First epoch second, inclusive
+            end: Last epoch second, inclusive
+
+        Returns:
+            List of (epoch seconds, value), oldest first
+        """
+        wanted = place.strip().lower()
+        readings: List[Tuple[int, float]] = []
+        day, last_day = _day(start), _day(end)
+        while day <= last_day:
+            names = [name.lower() for name in self.places(day)]
+            if wanted in names:
+                readings.extend(self._scan(day, element, names.index(wanted), start, end))
+            day += timedelta(days=1)
+        return readings
+
+    def places(self, day: date) -> List[str]:
+        """Get the places recorded on a day."""
+        with self._lock:
+            return list(self._places.get(day) or self._read_places(day))
+
+    def clear(self) -> None:
+        """Forget what is known about the segments; files on disk are kept."""
+        with self._lock:
+            self._last.clear()
+            self._places.clear()
+
+
+# Store filled by the polling scheduler
+OBSERVATION_STORE = ObservationStore()
+
+
+def _record(document: Any, lang: str) -> None:
+    if lang == STORE_LANG:
+        OBSERVATION_STORE.record(document)
+
+
+SCHEDULER.add_listener("rhrread", _record)
@@ -0,0 +1,288 @@
+"""
+Observation Snapshots - Parsed and indexed HKO current weather reports.
+
+This module parses each rhrread document once per update into a snapshot with
+a normalized region index per language. Lookups accept station names in any
+of the supported languages, ignore case and punctuation, and fall back to
+fuzzy matching for near-misses.
+"""
+
+import difflib
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple
+
+from .frozen import freeze
+from .stations import VALID_STATIONS, VALID_TEMPERATURE_STATIONS
+
+# Minimum similarity for a fuzzy region match
+FUZZY_CUTOFF = 0.75
+
+DEFAULT_STATION = "HKO"
+
+# Hong Kong Time, the time zone of all HKO record times
+HKT = timezone(timedelta(hours=8))
+
+
+def normalize_place(name: str) -> str:
+    """
+    Normalize a place name for lookups.
+
+    Args:
+        name: Place name in any language, e.g. "King's Park"
+
+    Returns:
+        str: Case-folded name without whitespace or punctuation, e.g. "kingspark"
+    """
+    return re.sub(r"[\W_]+", "", str(name)).casefold()
+
+
+def _build_aliases() -> tuple:
+    """Map every known station name to its code, and codes to names per language."""
+    aliases: Dict[str, str] = {}
+    names: Dict[str, Dict[str, str]] = {}
+    for catalog in (VALID_TEMPERATURE_STATIONS, VALID_STATIONS):
+        for lang, stations in catalog.items():
+            for code, name in stations.items():
+                aliases.setdefault(normalize_place(name), code)
+                names.setdefault(code, {}).setdefault(lang, name)
+    return aliases, names
+
+
+_ALIASES, _STATION_NAMES = _build_aliases()
+
+
+@dataclass(frozen=True, slots=True)
+class Reading:
+    """A single observed value at a place."""
+
+    place: str
+    value: Any
+    unit: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the reading as a new plain dict."""
+        return {"place": self.place, "value": self.value, "unit": self.unit}
+
+
+@dataclass(frozen=True, slots=True)
+class RainfallReading:
+    """Rainfall range of a district over the snapshot's rainfall window."""
+
+    place: str
+    min: float
+    max: float
+    unit: str
+    main: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the reading as a new plain dict."""
+        return {
+            "place": self.place,
+            "min": self.min,
+            "max": self.max,
+            "unit": self.unit,
+            "main": self.main,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class PlaceIndex:
+    """Readings in upstream order, with a lookup keyed by normalized place name."""
+
+    readings: Tuple[Any, ...]
+    by_key: Mapping[str, Any]
+
+    @classmethod
+    def build(cls, readings: Iterable[Any]) -> "PlaceIndex":
+        """Create an index over the given readings."""
+        readings = tuple(readings)
+        return cls(
+            readings=readings,
+            by_key=MappingProxyType({normalize_place(r.place): r for r in readings}),
+        )
+
+    def get(self, name: str, fuzzy: bool = True) -> Optional[Any]:
+        """
+        Look up a reading by place name.
+
+        Matching is tried in order: normalized name in this language, the
+        same station named in another language, then a fuzzy match.
+
+        Args:
+            name: Place name in any supported language
+            fuzzy: Whether to fall back to the closest name; without it,
+                   only the same station is returned
+
+        Returns:
+            The matching reading, or None if nothing is close enough
+        """
+        key = normalize_place(name)
+        if not key:
+            return None
+        reading = self.by_key.get(key)
+        if reading is not None:
+            return reading
+        code = _ALIASES.get(key)
+        if code is not None:
+            for translated in _STATION_NAMES.get(code, {}).values():
+                reading = self.by_key.get(normalize_place(translated))
+                if reading is not None:
+                    return reading
+        if not fuzzy:
+            return None
+        close = difflib.get_close_matches(key, self.by_key, n=1, cutoff=FUZZY_CUTOFF)
+        return self.by_key[close[0]] if close else None
+
+
+def _parse_readings(section: Any) -> Iterable[Reading]:
+    if not isinstance(section, dict):
+        return ()
+    return (
+        Reading(item.get("place", ""), item.get("value"), item.get("unit", ""))
+        for item in section.get("data", [])
+        if isinstance(item, dict)
+    )
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherSnapshot:
+    """
+    Parsed rhrread document for one language and update time.
+
+    Snapshots are deeply immutable and shared between concurrent calls, so
+    callers build their own output instead of modifying them.
+    """
+
+    lang: str
+    update_time: str
+    warning_message: Tuple[str, ...]
+    temperature: PlaceIndex
+    temperature_record_time: str
+    humidity: PlaceIndex
+    humidity_record_time: str
+    rainfall: PlaceIndex
+    rainfall_start: str
+    rainfall_end: str
+    uvindex: Any
+    icon: Tuple[Any, ...]
+    icon_update_time: str
+
+    @classmethod
+    def parse(cls, data: Dict[str, Any], lang: str) -> "WeatherSnapshot":
+        """
+        Parse a raw rhrread document.
+
+        Args:
+            data: Raw rhrread JSON response
+            lang: Language code of the response
+
+        Returns:
+            WeatherSnapshot: Parsed and indexed snapshot
+        """
+        temperature = data.get("temperature") or {}
+        humidity = data.get("humidity") or {}
+        rainfall = data.get("rainfall") or {}
+        warning = data.get("warningMessage") or []
+        return cls(
+            lang=lang,
+            update_time=data.get("updateTime", ""),
+            warning_message=(
+                tuple(warning) if isinstance(warning, list) else (warning,)
+            ),
+            temperature=PlaceIndex.build(_parse_readings(temperature)),
+            temperature_record_time=temperature.get("recordTime", ""),
+            humidity=PlaceIndex.build(_parse_readings(humidity)),
+            humidity_record_time=humidity.get("recordTime", ""),
+            rainfall=PlaceIndex.build(
+                RainfallReading(
+                    item.get("place", ""),
+                    _to_float(item.get("min", 0)),
+                    _to_float(item.get("max", 0)),
+                    item.get("unit", "mm"),
+                    item.get("main", ""),
+                )
+                for item in rainfall.get("data", [])
+                if isinstance(item, dict)
+            ),
+            rainfall_start=rainfall.get("startTime", ""),
+            rainfall_end=rainfall.get("endTime", ""),
+            uvindex=freeze(data.get("uvindex", {})),
+            icon=freeze(data.get("icon", [])),
+            icon_update_time=data.get("iconUpdateTime", ""),
+        )
+
+    def default_place(self) -> str:
+        """Get the name of the Hong Kong Observatory station in this language."""
+        names = _STATION_NAMES[DEFAULT_STATION]
+        return names.get(self.lang, names["en"])
+
+
+_SNAPSHOTS: Dict[str, WeatherSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def record_timestamp(value: str) -> Optional[int]:
+    """
+    Convert an HKO record time such as 2025-06-07T22:00:00+08:00 to epoch seconds.
+
+    Args:
+        value: ISO 8601 time; times without an offset are taken as HKT
+
+    Returns:
+        Epoch seconds, or None if the time cannot be parsed
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=HKT)
+    return int(moment.timestamp())
+
+
+def get_snapshot(data: Dict[str, Any], lang: str) -> WeatherSnapshot:
+    """
+    Get the parsed snapshot of an rhrread document.
+
+    The most recent snapshot of each language is memoized, so a document
+    with an unchanged update time is parsed only once.
+
+    Args:
+        data: Raw rhrread JSON response
+        lang: Language code of the response
+
+    Returns:
+        WeatherSnapshot: Parsed and indexed snapshot
+    """
+    version = (
+        data.get("updateTime", ""),
+        (data.get("temperature") or {}).get("recordTime", ""),
+    )
+    with _SNAPSHOTS_LOCK:
+        snapshot = _SNAPSHOTS.get(lang)
+        if snapshot is not None and (
+            snapshot.update_time,
+            snapshot.temperature_record_time,
+        ) == version and version != ("", ""):
+            return snapshot
+    snapshot = WeatherSnapshot.parse(data, lang)
+    with _SNAPSHOTS_LOCK:
+        _SNAPSHOTS[lang] = snapshot
+    return snapshot
+
+
+def clear_snapshots() -> None:
+    """Forget all memoized snapshots."""
+    with _SNAPSHOTS_LOCK:
+        _SNAPSHOTS.clear()
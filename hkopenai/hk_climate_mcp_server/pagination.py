@@ -0,0 +1,233 @@
+"""
+Result Pagination - Cursor-based pages of large HKO tables.
+
+A full year of hourly tides or a century of daily temperatures is a table of
+many thousand rows. Tools returning such tables accept a page size and an
+opaque cursor: the first page fetches the table once and keeps it, read-only,
+in a small series cache, and each page is sliced from it, so a page costs the
+same whatever the size of the table. Cursors name the request they belong to
+and the offset of the next page, so they cannot be used with other arguments.
+
+Pages bound the size of each result, not the memory of the server: a table
+being paged through is held whole. The series cache is therefore bounded in
+bytes as well as in tables, so memory grows with the tables in use, up to
+that budget, and never with the number of pages served.
+"""
+
+import base64
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from .csv_table import CompactTable
+from .frozen import freeze, thaw
+
+# Rows per page when a cursor is given without a page size
+DEFAULT_PAGE_SIZE = 1000
+
+# Largest page size accepted
+MAX_PAGE_SIZE = 5000
+
+
+def request_key(params: Dict[str, Any]) -> str:
+    """Get a short key identifying a request by its query parameters."""
+    canonical = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(key: str, offset: int) -> str:
+    """Get the cursor of the page starting at an offset."""
+    return base64.urlsafe_b64encode(f"{key}:{offset}".encode("ascii")).decode("ascii")
+
+
+def decode_cursor(cursor: str, key: str) -> int:
+    """
+    Get the offset a cursor points to.
+
+    Args:
+        cursor: Cursor from a previous page
+        key: Key of the current request
+
+    Returns:
+        int: Offset of the first row of the page
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another request
+    """
+    try:
+        cursor_key, offset = base64.urlsafe_b64decode(cursor.encode("ascii")).decode(
+            "ascii"
+        ).split(":")
+        offset = int(offset)
+    except (ValueError, UnicodeError, AttributeError):
+        raise ValueError("Invalid cursor. Use nextCursor from the previous page.")
+    if cursor_key != key or offset < 0:
+        raise ValueError(
+            "The cursor belongs to a request with other arguments. Repeat the "
+            "arguments of the previous page, or omit the cursor to start over."
+        )
+    return offset
+
+
+def _table_size(table: Any) -> int:
+    """Estimate the memory held by a compact table or frozen document, in bytes."""
+    if isinstance(table, CompactTable):
+        return table.nbytes()
+    size = sys.getsizeof(table)
+    if isinstance(table, Mapping):
+        size += sum(_table_size(value) for value in table.values())
+    elif isinstance(table, tuple):
+        size += sum(_table_size(value) for value in table)
+    return size
+
+
+class SeriesCache:
+    """Thread-safe LRU cache of fetched tables, kept for paging through them."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_entries: int = 8,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Args:
+            ttl_seconds: How long a table is kept after it was fetched
+            max_entries: Maximum number of tables kept
+            max_bytes: Maximum estimated memory of the tables kept; a larger
+                       table is kept alone, so that its pages are not fetched
+                       again one by one
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a kept table, or None if there is none or it expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, table, size = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                self._size -= size
+                return None
+            self._entries.move_to_end(key)
+            return table
+
+    def put(self, key: str, document: Any) -> Any:
+        """Keep a read-only copy of a table, or a compact table, and return it."""
+        table = document if isinstance(document, CompactTable) else freeze(document)
+        size = _table_size(table)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[key] = (time.monotonic() + self._ttl, table, size)
+            self._size += size
+            while len(self._entries) > 1 and (
+                len(self._entries) > self._max_entries or self._size > self._max_bytes
+            ):
+                _, (_, _, dropped) = self._entries.popitem(last=False)
+                self._size -= dropped
+        return table
+
+    def clear(self) -> None:
+        """Forget all tables."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Tables being paged through by the tide and temperature tools
+SERIES_CACHE = SeriesCache()
+
+
+def get_page(
+    params: Dict[str, Any],
+    fetch: Callable[[], Any],
+    cursor: Optional[str] = None,
+    page_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of the rows of a table.
+
+    Args:
+        params: Query parameters identifying the table
+        fetch: Function fetching the table when it is not cached, as a
+               document or a CompactTable
+        cursor: nextCursor of the previous page, or None for the first page
+        page_size: Rows per page (1 to MAX_PAGE_SIZE, default: DEFAULT_PAGE_SIZE)
+
+    Returns:
+        Dict containing the table's keys with data cut down to the page, and
+        offset, total (rows in the table) and nextCursor (None on the last
+        page), or an error message
+    """
+    if page_size is None:
+        page_size = DEFAULT_PAGE_SIZE
+    if not isinstance(page_size, int) or not 1 <= page_size <= MAX_PAGE_SIZE:
+        return {
+            "error": f"Invalid page_size {page_size}. Use 1 to {MAX_PAGE_SIZE} rows."
+        }
+    key = request_key(params)
+    try:
+        offset = decode_cursor(cursor, key) if cursor is not None else 0
+    except ValueError as e:
+        return {"error": str(e)}
+
+    table = SERIES_CACHE.get(key)
+    if table is None:
+        document = fetch()
+        if not isinstance(document, CompactTable) and (
+            not isinstance(document, dict) or "error" in document
+        ):
+            return document
+        table = SERIES_CACHE.put(key, document)
+    if isinstance(table, CompactTable):
+        total = len(table)
+    else:
+        total = len(table.get("data", ()))
+    if offset > total:
+        return {"error": f"The cursor is past the last of {total} rows."}
+
+    if isinstance(table, CompactTable):
+        page = {"fields": list(table.fields)}
+        page["data"] = table.rows(offset, offset + page_size)
+    else:
+        page = {k: thaw(v) for k, v in table.items() if k != "data"}
+        page["data"] = thaw(table["data"][offset : offset + page_size])
+    end = offset + len(page["data"])
+    page["offset"] = offset
+    page["total"] = total
+    page["nextCursor"] = encode_cursor(key, end) if end < total else None
+    return page
+
+
+def iter_pages(
+    get: Callable[[Optional[str]], Dict[str, Any]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the pages of a table one at a time, starting with the first.
+
+    Args:
+        get: Function returning the page at a cursor, e.g. a tool's function
+             with its arguments and page size bound
+
+    Yields:
+        Each page, or a single error
+    """
+    cursor = None
+    while True:
+        page = get(cursor)
+        yield page
+        cursor = page.get("nextCursor") if isinstance(page, dict) else None
+        if not cursor:
+            return
@@ -0,0 +1,185 @@
+"""
+Raw Passthrough - Serving HKO documents as the bytes HKO sent.
+
+Several tools return HKO's JSON unchanged. Decoding it into Python objects
+only to encode it again for the MCP response is wasted work, so those tools
+keep the response body as UTF-8 bytes, cache it as such, and put it straight
+into the tool result. Large bodies are validated by a cheap scan instead of a
+decode, and a document is decoded only when a tool has to transform or
+project it.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+
+from .availability import is_no_data
+from .json_codec import decode_json, fetch_json_bytes, loads
+from .pagination import request_key
+
+# Bodies up to this size are decoded to tell errors and "no data" answers
+# from documents; larger ones are only scanned
+DECODE_LIMIT = 1024
+
+# An empty data array, the "no data" answer of opendata.php
+_EMPTY_DATA = re.compile(rb'"data"\s*:\s*\[\s*\]')
+
+
+class RawJson:
+    """A validated JSON object kept as UTF-8 bytes, decoded only on demand."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def decode(self) -> Dict[str, Any]:
+        """Decode the document with the codec in use."""
+        return loads(self.data)
+
+    def text(self) -> str:
+        """Get the document as JSON text."""
+        return self.data.decode("utf-8")
+
+
+def _holds_data(content: bytes) -> bool:
+    """Check cheaply that a body is a JSON object other than an error or "no data"."""
+    head = content[:32].lstrip()
+    return (
+        head[:1] == b"{"
+        and content[-32:].rstrip()[-1:] == b"}"
+        and not head[1:].lstrip().startswith(b'"error"')
+        and _EMPTY_DATA.search(content) is None
+    )
+
+
+def fetch_raw_json(
+    url: str, params: Optional[Dict[str, Any]] = None, encoding: str = "utf-8"
+) -> Union[RawJson, Dict[str, Any]]:
+    """
+    Fetch a JSON document, keeping it as bytes if it holds data.
+
+    Bodies larger than DECODE_LIMIT that look like a JSON object holding data
+    are kept without decoding them. Others are decoded, and errors and "no
+    data" answers (see is_no_data) are returned decoded, as fetch_json_data
+    returns them.
+
+    Args:
+        url: URL to fetch
+        params: Optional query parameters
+        encoding: Text encoding of the response; a UTF-8 BOM is ignored
+
+    Returns:
+        The document as RawJson, or the decoded error or "no data" answer
+    """
+    content = fetch_json_bytes(url, params=params, encoding=encoding)
+    if isinstance(content, dict):
+        return content
+    if len(content) > DECODE_LIMIT and _holds_data(content):
+        return RawJson(content)
+    document = decode_json(content, encoding)
+    if not isinstance(document, dict) or "error" in document or is_no_data(document):
+        return document
+    return RawJson(content)
+
+
+class RawCache:
+    """Thread-safe LRU cache of raw documents by request, bounded in bytes."""
+
+    def __init__(self, ttl_seconds: float = 3600, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Args:
+            ttl_seconds: How long a document is kept after it was fetched
+            max_bytes: Maximum total size of the documents kept
+        """
+        self._ttl = ttl_seconds
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, RawJson]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: Dict[str, Any]) -> Optional[RawJson]:
+        """Get a kept document, or None if there is none or it expired."""
+        key = (url, request_key(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, raw = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                self._size -= len(raw)
+                return None
+            self._entries.move_to_end(key)
+            return raw
+
+    def put(self, url: str, params: Dict[str, Any], raw: RawJson) -> None:
+        """Keep a document, dropping the least recently used ones over budget."""
+        if len(raw) > self._max_bytes:
+            return
+        key = (url, request_key(params))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            self._entries[key] = (time.monotonic() + self._ttl, raw)
+            self._size += len(raw)
+            while self._size > self._max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._size -= len(dropped)
+
+    def clear(self) -> None:
+        """Forget all documents."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+# Raw documents of the open data tables served unchanged
+RAW_CACHE = RawCache()
+
+
+def get_raw_json(
+    url: str, params: Dict[str, Any], encoding: str = "utf-8"
+) -> Union[RawJson, Dict[str, Any]]:
+    """
+    Get a document as raw bytes, from the raw cache or else from HKO.
+
+    Args:
+        url: URL of the document
+        params: Query parameters of the document
+        encoding: Text encoding of the response; a UTF-8 BOM is ignored
+
+    Returns:
+        The document as RawJson, or the decoded error or "no data" answer
+    """
+    raw = RAW_CACHE.get(url, params)
+    if raw is not None:
+        return raw
+    result = fetch_raw_json(url, params=params, encoding=encoding)
+    if isinstance(result, RawJson):
+        RAW_CACHE.put(url, params, result)
+    return result
+
+
+def raw_result(result: Any) -> Any:
+    """
+    Turn a raw document into a tool result whose text is its bytes.
+
+    Such results carry no structured content, so tools returning them are
+    registered with output_schema=None. Other results are returned as they
+    are.
+    """
+    if isinstance(result, RawJson):
+        return ToolResult(content=[TextContent(type="text", text=result.text())])
+    return result
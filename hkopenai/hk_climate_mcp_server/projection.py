@@ -0,0 +1,117 @@
+"""
+Field Projection - Trim tool results down to the fields a client asks for.
+
+Every tool accepts an optional `fields` list. A field is a key of the result,
+or a dotted path into it such as 'weatherForecast.forecastDate'; paths through
+lists apply to each element. Tables in the HKO opendata layout ('fields' and
+'data' rows) can also be cut down to columns by naming them, e.g. 'Date'.
+Results are projected before they are serialized, so unrequested data costs
+neither serialization time nor transferred bytes.
+"""
+
+from typing import Annotated, Any, Dict, Iterator, List, Mapping, Optional, Sequence, Set
+from pydantic import Field
+
+# Type of the `fields` parameter shared by the tools
+Fields = Annotated[
+    Optional[List[str]],
+    Field(
+        description="Only return these fields, e.g. ['updateTime', "
+        "'weatherForecast.forecastDate'], or table columns, e.g. ['Date']. "
+        "Omit for all"
+    ),
+]
+
+
+def _tree(fields: Sequence[str]) -> Dict[str, Dict]:
+    """Build a tree of field paths; an empty subtree keeps the whole value."""
+    tree: Dict[str, Dict] = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for depth, part in enumerate(parts):
+            if part in node and not node[part]:
+                # A shorter path already keeps the whole value
+                break
+            if depth == len(parts) - 1:
+                node[part] = {}
+            else:
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _columns(value: Mapping[str, Any]) -> List[Any]:
+    columns = value.get("fields")
+    if isinstance(columns, (list, tuple)) and isinstance(value.get("data"), (list, tuple)):
+        return list(columns)
+    return []
+
+
+def _paths(tree: Mapping[str, Dict], prefix: str) -> Iterator[str]:
+    for name, subtree in tree.items():
+        yield prefix + name
+        yield from _paths(subtree, f"{prefix}{name}.")
+
+
+def _apply(value: Any, tree: Mapping[str, Dict], prefix: str, matched: Set[str]) -> Any:
+    if isinstance(value, (list, tuple)):
+        if not value:
+            # Nothing to match against; the paths are not known to be wrong
+            matched.update(_paths(tree, prefix))
+        return [_apply(item, tree, prefix, matched) for item in value]
+    if not isinstance(value, Mapping):
+        return value
+    columns = _columns(value)
+    projected: Dict[str, Any] = {}
+    selected = []
+    for name, subtree in tree.items():
+        if name in value:
+            matched.add(prefix + name)
+            projected[name] = (
+                _apply(value[name], subtree, f"{prefix}{name}.", matched)
+                if subtree
+                else value[name]
+            )
+        elif name in columns and not subtree:
+            matched.add(prefix + name)
+            selected.append(columns.index(name))
+    if selected:
+        projected["fields"] = [columns[i] for i in selected]
+        projected["data"] = [
+            [row[i] if i < len(row) else None for i in selected] for row in value["data"]
+        ]
+    return projected
+
+
+def project(result: Any, fields: Optional[Sequence[str]]) -> Any:
+    """
+    Keep only the requested fields of a tool result.
+
+    Args:
+        result: Tool result
+        fields: Keys, dotted paths or table column names to keep; None or an
+                empty list keeps everything
+
+    Returns:
+        The projected result, the result itself if no fields are given or it
+        is an error, or an error naming the fields matching nothing
+    """
+    if not fields or not isinstance(result, Mapping) or "error" in result:
+        return result
+    if isinstance(fields, str) or not all(isinstance(f, str) and f for f in fields):
+        return {"error": "Fields must be a list of field names, e.g. ['updateTime']."}
+    matched: Set[str] = set()
+    projected = _apply(result, _tree(fields), "", matched)
+    # Paths inside a field kept whole count as matched
+    unknown = [
+        f
+        for f in fields
+        if f not in matched and not any(f.startswith(g + ".") for g in fields if g in matched)
+    ]
+    if unknown:
+        available = list(result) + [c for c in _columns(result) if c not in result]
+        return {
+            "error": f"Unknown field(s): {', '.join(unknown)}. "
+            f"Available fields: {', '.join(map(str, available))}."
+        }
+    return projected
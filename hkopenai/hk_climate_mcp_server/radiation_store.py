@@ -0,0 +1,184 @@
+"""
+Radiation Store - Typed parsing and compact storage of HKO radiation reports.
+
+This module parses raw RYES responses into slot-based records once, and keeps
+them in a per-station columnar time series so statistics over a date range can
+be computed locally without re-parsing text fields or calling the HKO API.
+"""
+
+import math
+import threading
+from array import array
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Optional
+
+_LOCATION_SUFFIX = "LocationName"
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+@dataclass(frozen=True, slots=True)
+class RadiationRecord:
+    """Parsed weather and radiation report for one station and day."""
+
+    station: str
+    date: int
+    location_name: str
+    microsieverts: float
+    max_temp: float
+    min_temp: float
+    bulletin_date: str = ""
+    bulletin_time: str = ""
+
+
+def parse_radiation_report(
+    report: Dict[str, Any], station: str, date: str
+) -> Optional[RadiationRecord]:
+    """
+    Parse a raw RYES response into a RadiationRecord.
+
+    RYES keys are prefixed with the station's location name without spaces,
+    e.g. ChekLapKokMicrosieverts, so the prefix is derived from the
+    <prefix>LocationName key.
+
+    Args:
+        report: Raw RYES JSON response
+        station: Station code the report was requested for
+        date: Requested date in YYYYMMDD format, used when the report does
+              not carry ReportTimeInfoDate
+
+    Returns:
+        RadiationRecord, or None if the response holds no station reading
+    """
+    if not isinstance(report, dict) or "error" in report:
+        return None
+    prefix = next(
+        (
+            key[: -len(_LOCATION_SUFFIX)]
+            for key in report
+            if key.endswith(_LOCATION_SUFFIX)
+        ),
+        None,
+    )
+    if prefix is None:
+        return None
+    try:
+        record_date = int(report.get("ReportTimeInfoDate") or date)
+    except ValueError:
+        return None
+    return RadiationRecord(
+        station=station,
+        date=record_date,
+        location_name=report.get(prefix + _LOCATION_SUFFIX, ""),
+        microsieverts=_to_float(report.get(prefix + "Microsieverts")),
+        max_temp=_to_float(report.get(prefix + "MaxTemp")),
+        min_temp=_to_float(report.get(prefix + "MinTemp")),
+        bulletin_date=report.get("BulletinDate", ""),
+        bulletin_time=report.get("BulletinTime", ""),
+    )
+
+
+class RadiationSeries:
+    """Columnar, date-sorted readings of a single station. Missing values are NaN."""
+
+    __slots__ = ("dates", "microsieverts", "max_temp", "min_temp")
+
+    def __init__(self):
+        self.dates = array("l")
+        self.microsieverts = array("d")
+        self.max_temp = array("d")
+        self.min_temp = array("d")
+
+    def add(self, record: RadiationRecord) -> None:
+        """Insert or replace the reading for the record's date."""
+        index = bisect_left(self.dates, record.date)
+        if index < len(self.dates) and self.dates[index] == record.date:
+            self.microsieverts[index] = record.microsieverts
+            self.max_temp[index] = record.max_temp
+            self.min_temp[index] = record.min_temp
+            return
+        self.dates.insert(index, record.date)
+        self.microsieverts.insert(index, record.microsieverts)
+        self.max_temp.insert(index, record.max_temp)
+        self.min_temp.insert(index, record.min_temp)
+
+    def window(self, start: int, end: int) -> slice:
+        """Get the slice of positions with start <= date <= end."""
+        return slice(bisect_left(self.dates, start), bisect_right(self.dates, end))
+
+
+def _summarize(values: array) -> Dict[str, Any]:
+    present = [v for v in values if not math.isnan(v)]
+    if not present:
+        return {"min": None, "max": None, "mean": None, "count": 0}
+    return {
+        "min": min(present),
+        "max": max(present),
+        "mean": round(sum(present) / len(present), 4),
+        "count": len(present),
+    }
+
+
+class RadiationStore:
+    """Thread-safe collection of per-station radiation series."""
+
+    def __init__(self):
+        self._series: Dict[str, RadiationSeries] = {}
+        self._lock = threading.Lock()
+
+    def add(self, record: RadiationRecord) -> None:
+        """Add a parsed record to its station's series."""
+        with self._lock:
+            self._series.setdefault(record.station, RadiationSeries()).add(record)
+
+    def ingest(self, report: Dict[str, Any], station: str, date: str) -> None:
+        """Parse a raw RYES response and add it to the store if it holds a reading."""
+        record = parse_radiation_report(report, station, date)
+        if record is not None:
+            self.add(record)
+
+    def statistics(self, station: str, start: int, end: int) -> Dict[str, Any]:
+        """
+        Compute min/max/mean statistics from stored readings.
+
+        Args:
+            station: Station code
+            start: First date as YYYYMMDD integer
+            end: Last date as YYYYMMDD integer, inclusive
+
+        Returns:
+            Dict with the number of stored days and min/max/mean/count for
+            radiation (microsieverts) and max/min temperatures
+        """
+        with self._lock:
+            series = self._series.get(station)
+            if series is None:
+                return {"days": 0}
+            window = series.window(start, end)
+            dates = series.dates[window]
+            microsieverts = series.microsieverts[window]
+            max_temp = series.max_temp[window]
+            min_temp = series.min_temp[window]
+        return {
+            "days": len(dates),
+            "firstDate": str(dates[0]) if dates else None,
+            "lastDate": str(dates[-1]) if dates else None,
+            "microsieverts": _summarize(microsieverts),
+            "maxTemp": _summarize(max_temp),
+            "minTemp": _summarize(min_temp),
+        }
+
+    def clear(self) -> None:
+        """Remove all stored readings."""
+        with self._lock:
+            self._series.clear()
+
+
+# Store shared by the radiation tools
+RADIATION_STORE = RadiationStore()
@@ -0,0 +1,180 @@
+"""
+Rainfall Accumulation - Rolling 1, 3 and 24 hour rainfall per district.
+
+Each current weather report (rhrread) gives the rainfall of every district over
+the past hour. Consecutive reports may overlap, e.g. windows ending at 21:45
+and 22:00, so accumulations add up only windows exactly whole hours apart.
+Per district and minute of the hour, a ring of the last 24 hourly values is
+kept together with running 3 and 24 hour sums, so each new report updates
+every accumulation in constant time per district.
+"""
+
+import threading
+from array import array
+from typing import Any, Dict, Optional, Tuple
+
+from .observations import WeatherSnapshot, record_timestamp
+from .scheduler import SCHEDULER
+
+# Accumulation windows in hours
+WINDOWS = (1, 3, 24)
+
+# Language of the reports recorded; districts are named in this language
+RAINFALL_LANG = "en"
+
+_SLOTS = max(WINDOWS)
+
+
+class RollingRainfall:
+    """Running sums of the last hourly rainfall values of one district and phase."""
+
+    __slots__ = ("hour", "_values", "_seen", "_sums", "_counts")
+
+    def __init__(self):
+        self.hour: Optional[int] = None
+        self._values = array("d", [0.0]) * _SLOTS
+        self._seen = array("b", [0]) * _SLOTS
+        # Running sum and number of observed hours per window
+        self._sums = {window: 0.0 for window in WINDOWS}
+        self._counts = {window: 0 for window in WINDOWS}
+
+    def _set_latest(self, value: float) -> None:
+        slot = self.hour % _SLOTS
+        delta, seen = value - self._values[slot], 1 - self._seen[slot]
+        self._values[slot], self._seen[slot] = value, 1
+        for window in WINDOWS:
+            self._sums[window] += delta
+            self._counts[window] += seen
+
+    def _advance(self, hour: int) -> None:
+        """Move the latest hour forward, dropping values that leave each window."""
+        if self.hour is None or hour - self.hour >= _SLOTS:
+            self._values = array("d", [0.0]) * _SLOTS
+            self._seen = array("b", [0]) * _SLOTS
+            self._sums = {window: 0.0 for window in WINDOWS}
+            self._counts = {window: 0 for window in WINDOWS}
+            self.hour = hour
+            return
+        while self.hour < hour:
+            self.hour += 1
+            for window in WINDOWS:
+                leaving = (self.hour - window) % _SLOTS
+                self._sums[window] -= self._values[leaving]
+                self._counts[window] -= self._seen[leaving]
+            # The 24 hour window's leaving slot is the new hour's slot
+            self._values[self.hour % _SLOTS] = 0.0
+            self._seen[self.hour % _SLOTS] = 0
+
+    def add(self, hour: int, value: float) -> bool:
+        """
+        Record the rainfall of the hour ending at an hour.
+
+        A value for the latest hour replaces the previous one (a revised
+        report); values older than the latest hour are ignored.
+
+        Args:
+            hour: Window end time in whole hours since the epoch
+            value: Rainfall in mm
+
+        Returns:
+            bool: True if the value was recorded
+        """
+        if self.hour is not None and hour < self.hour:
+            return False
+        self._advance(hour)
+        self._set_latest(value)
+        return True
+
+    def totals(self) -> Dict[int, Tuple[float, int]]:
+        """Get the (rainfall, observed hours) of each window."""
+        return {
+            window: (round(max(self._sums[window], 0.0), 1), self._counts[window])
+            for window in WINDOWS
+        }
+
+
+class RainfallAccumulator:
+    """Thread-safe rolling rainfall of every district."""
+
+    def __init__(self):
+        self._districts: Dict[str, Dict[int, RollingRainfall]] = {}
+        self._latest: Optional[Tuple[int, int]] = None
+        self._end_time = ""
+        self._lock = threading.Lock()
+
+    def update(self, snapshot: Any) -> int:
+        """
+        Add the rainfall of a current weather report.
+
+        Args:
+            snapshot: Parsed rhrread report
+
+        Returns:
+            int: Number of districts updated
+        """
+        if not isinstance(snapshot, WeatherSnapshot):
+            return 0
+        timestamp = record_timestamp(snapshot.rainfall_end)
+        if timestamp is None:
+            return 0
+        hour, phase = divmod(timestamp // 60, 60)
+        updated = 0
+        with self._lock:
+            for reading in snapshot.rainfall.readings:
+                # Districts whose gauges are under maintenance report no rainfall
+                if reading.main == "TRUE":
+                    continue
+                phases = self._districts.setdefault(reading.place, {})
+                rolling = phases.setdefault(phase, RollingRainfall())
+                updated += rolling.add(hour, float(reading.max))
+            if updated and (self._latest is None or (hour, phase) >= self._latest):
+                self._latest = (hour, phase)
+                self._end_time = snapshot.rainfall_end
+        return updated
+
+    def accumulations(self) -> Dict[str, Any]:
+        """
+        Get the rolling rainfall of every district up to the latest report.
+
+        Returns:
+            Dict containing endTime of the latest rainfall window and data, a
+            list of {place, past1h, past3h, past24h, hoursObserved} where
+            hoursObserved gives the hourly windows seen within the 3 and 24
+            hours. Districts without a value for the latest window are left out.
+        """
+        with self._lock:
+            if self._latest is None:
+                return {"endTime": "", "data": []}
+            hour, phase = self._latest
+            data = []
+            for place, phases in self._districts.items():
+                rolling = phases.get(phase)
+                if rolling is None or rolling.hour != hour:
+                    continue
+                totals = rolling.totals()
+                entry: Dict[str, Any] = {"place": place}
+                entry.update({f"past{w}h": totals[w][0] for w in WINDOWS})
+                entry["hoursObserved"] = {
+                    f"past{w}h": totals[w][1] for w in WINDOWS[1:]
+                }
+                data.append(entry)
+            return {"endTime": self._end_time, "data": data}
+
+    def clear(self) -> None:
+        """Forget all rainfall."""
+        with self._lock:
+            self._districts.clear()
+            self._latest = None
+            self._end_time = ""
+
+
+# Accumulations updated by the polling scheduler
+RAINFALL_ACCUMULATOR = RainfallAccumulator()
+
+
+def _update(document: Any, lang: str) -> None:
+    if lang == RAINFALL_LANG:
+        RAINFALL_ACCUMULATOR.update(document)
+
+
+SCHEDULER.add_listener("rhrread", _update)
@@ -0,0 +1,37 @@
+"""
+Rate Limiting Utilities - Throttling of outgoing HKO API requests.
+
+This module provides a thread-safe rate limiter shared by tools that issue
+many upstream requests concurrently, so a single MCP call cannot flood the
+Hong Kong Observatory API.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing request start times evenly."""
+
+    def __init__(self, requests_per_second: float):
+        """
+        Args:
+            requests_per_second: Maximum sustained number of requests per second
+        """
+        self._interval = 1.0 / requests_per_second
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """Block until the caller is allowed to start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+# Limiter shared by all batch fetches against the HKO open data API
+HKO_RATE_LIMITER = RateLimiter(requests_per_second=5)
@@ -0,0 +1,236 @@
+"""
+Subscribable Resources - Warning state and current observations as MCP resources.
+
+This module exposes the weather warning summary and the current observations
+of all stations as MCP resources. Clients may subscribe to them instead of
+polling: while any resource has subscribers, a watcher reads the underlying
+feeds through the feed registry and notifies subscribers only when the
+upstream document (its updateTime or content) has changed.
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp import FastMCP
+from mcp.types import SubscribeRequest
+from pydantic import AnyUrl
+
+from .feeds import FEED_REGISTRY
+from .json_codec import fetch_json_data
+from .tools.current_weather import _get_all_regions_weather
+from .tools.warnings import _get_weather_warning_summary
+from .validation import VALID_LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+URI_SCHEME = "hko"
+
+# Resource name -> feed whose changes are notified
+RESOURCE_FEEDS: Dict[str, str] = {
+    "warnings": "warnsum",
+    "observations": "rhrread",
+}
+
+# Seconds between checks for changes while there are subscribers
+WATCH_INTERVAL = 60
+
+
+def resource_uri(name: str, lang: str) -> str:
+    """Get the URI of a resource, e.g. hko://warnings/en."""
+    return f"{URI_SCHEME}://{name}/{lang}"
+
+
+def parse_resource_uri(uri: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a resource URI into its name and language.
+
+    Args:
+        uri: Resource URI, e.g. hko://warnings/en
+
+    Returns:
+        Tuple of (name, lang), or None if the URI is not a known resource in
+        a supported language
+    """
+    prefix = f"{URI_SCHEME}://"
+    if not uri.startswith(prefix):
+        return None
+    name, _, lang = uri[len(prefix) :].partition("/")
+    if name not in RESOURCE_FEEDS or lang not in VALID_LANGUAGES:
+        return None
+    return name, lang
+
+
+class SubscriptionManager:
+    """Subscribers per resource URI, and the watcher that notifies them."""
+
+    def __init__(self, interval: float = WATCH_INTERVAL):
+        """
+        Args:
+            interval: Seconds between checks for changes
+        """
+        self.interval = interval
+        self._subscribers: Dict[str, "weakref.WeakSet[Any]"] = {}
+        self._last: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._watcher: Optional[asyncio.Task] = None
+
+    def subscribe(self, uri: str, session: Any) -> None:
+        """
+        Add a session as subscriber of a resource and start watching if needed.
+
+        The feed's currently cached document, if any, is the baseline against
+        which changes are detected.
+        """
+        name, lang = parse_resource_uri(uri)
+        with self._lock:
+            self._subscribers.setdefault(uri, weakref.WeakSet()).add(session)
+            self._last.setdefault(uri, FEED_REGISTRY.peek(RESOURCE_FEEDS[name], lang))
+        self._ensure_watcher()
+
+    def unsubscribe(self, uri: str, session: Any) -> None:
+        """Remove a session from the subscribers of a resource."""
+        with self._lock:
+            subscribers = self._subscribers.get(uri)
+            if subscribers is not None:
+                subscribers.discard(session)
+                if not subscribers:
+                    del self._subscribers[uri]
+                    self._last.pop(uri, None)
+
+    def subscribed_uris(self) -> List[str]:
+        """Get the URIs that currently have subscribers."""
+        with self._lock:
+            return [uri for uri, sessions in self._subscribers.items() if sessions]
+
+    def check(self) -> List[str]:
+        """
+        Read the feeds of subscribed resources and find those that changed.
+
+        Feeds that cannot be fetched are skipped until the next check.
+
+        Returns:
+            URIs whose upstream document differs from the last one seen
+        """
+        changed = []
+        for uri in self.subscribed_uris():
+            name, lang = parse_resource_uri(uri)
+            document = FEED_REGISTRY.get(RESOURCE_FEEDS[name], lang, fetch_json_data)
+            if isinstance(document, dict) and "error" in document:
+                continue
+            with self._lock:
+                if uri not in self._subscribers:
+                    continue
+                last = self._last.get(uri)
+                self._last[uri] = document
+            if last is not None and last != document:
+                changed.append(uri)
+        return changed
+
+    async def notify(self, uris: List[str]) -> None:
+        """Send a resource updated notification to every subscriber of the URIs."""
+        for uri in uris:
+            with self._lock:
+                sessions = list(self._subscribers.get(uri, ()))
+            for session in sessions:
+                try:
+                    await session.send_resource_updated(AnyUrl(uri))
+                except Exception as e:
+                    logger.debug("Dropping subscriber of %s: %s", uri, e)
+                    self.unsubscribe(uri, session)
+
+    def _ensure_watcher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._watcher is None or self._watcher.done():
+            self._watcher = loop.create_task(self._watch())
+
+    async def _watch(self) -> None:
+        """Check for changes every interval until no resource has subscribers."""
+        while self.subscribed_uris():
+            await asyncio.sleep(self.interval)
+            changed = await asyncio.to_thread(self.check)
+            await self.notify(changed)
+
+    def clear(self) -> None:
+        """Forget all subscribers and stop watching."""
+        with self._lock:
+            self._subscribers.clear()
+            self._last.clear()
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+
+# Subscriptions shared by all sessions of the server
+SUBSCRIPTIONS = SubscriptionManager()
+
+
+def register(mcp: FastMCP):
+    """Registers the subscribable resources with the FastMCP server."""
+
+    @mcp.resource(
+        resource_uri("warnings", "{lang}"),
+        name="weather_warnings",
+        description="Weather warnings in force in HK (warning summary). "
+        "Subscribe to be notified when warnings change. lang is en, tc or sc.",
+        mime_type="application/json",
+    )
+    def weather_warnings(lang: str) -> Dict[str, Any]:
+        return _get_weather_warning_summary(lang)
+
+    @mcp.resource(
+        resource_uri("observations", "{lang}"),
+        name="current_observations",
+        description="Current temperature and humidity of all HK stations and rainfall "
+        "of all districts. Subscribe to be notified of each new observation. "
+        "lang is en, tc or sc.",
+        mime_type="application/json",
+    )
+    def current_observations(lang: str) -> Dict[str, Any]:
+        return _get_all_regions_weather(lang)
+
+    _register_subscriptions(mcp)
+
+
+def _register_subscriptions(mcp: FastMCP) -> None:
+    """
+    Handle resources/subscribe and resources/unsubscribe requests.
+
+    FastMCP has no API for resource subscriptions, so the handlers are
+    registered on its low-level MCP server with the MCP SDK's decorators.
+    The SDK advertises subscribe=False whatever handlers are registered, so
+    the capability is derived from the registered handlers instead. Both
+    rely on FastMCP internals, which is why fastmcp is pinned below 2.13.
+    """
+    low_level = mcp._mcp_server
+
+    @low_level.subscribe_resource()
+    async def subscribe(uri: AnyUrl) -> None:
+        if parse_resource_uri(str(uri)) is None:
+            raise ValueError(
+                f"Unknown resource {uri}. Use hko://warnings/{{lang}} or "
+                "hko://observations/{lang} with lang one of: en, tc, sc."
+            )
+        SUBSCRIPTIONS.subscribe(str(uri), low_level.request_context.session)
+
+    @low_level.unsubscribe_resource()
+    async def unsubscribe(uri: AnyUrl) -> None:
+        SUBSCRIPTIONS.unsubscribe(str(uri), low_level.request_context.session)
+
+    get_capabilities = low_level.get_capabilities
+
+    def get_capabilities_with_subscribe(*args, **kwargs):
+        capabilities = get_capabilities(*args, **kwargs)
+        if (
+            capabilities.resources is not None
+            and SubscribeRequest in low_level.request_handlers
+        ):
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    low_level.get_capabilities = get_capabilities_with_subscribe
@@ -0,0 +1,151 @@
+"""
+Result Cache - Serialized tool results reused until their feed is updated.
+
+Tools deriving their output from a real-time feed rebuild and re-serialize
+the same result on every call, although the feed only changes when HKO
+issues a new report. A tool declares a CachePolicy when it is registered:
+the feed it reads, the arguments its result depends on and how long a
+result may be kept. Its results are then cached as tool results holding both
+the structured result and its serialized JSON text, keyed by the canonical
+values of those arguments, and are dropped as soon as the feed's updateTime
+changes.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+
+from .feeds import FEED_REGISTRY
+from .json_codec import dumps, fetch_json_data
+from .validation import VALID_LANGUAGES
+
+
+class CachePolicy(NamedTuple):
+    """Declarative caching of a tool's serialized result."""
+
+    # HKO dataType of the feed the result is derived from
+    data_type: str
+    # Seconds a result is kept at most, even if the feed is not updated
+    ttl: float
+    # Arguments the result depends on; the feed is read in the 'lang' argument
+    key_args: Tuple[str, ...] = ("lang", "fields")
+
+
+def update_time(document: Any) -> Optional[str]:
+    """Get the updateTime of a parsed feed document, if it has one."""
+    if isinstance(document, Mapping):
+        value = document.get("updateTime")
+    else:
+        value = getattr(document, "update_time", None)
+    return value or None
+
+
+class ResultCache:
+    """Thread-safe LRU cache of tool results, each of one feed version."""
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Args:
+            max_entries: Maximum number of results kept
+        """
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[float, str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, version: str) -> Optional[Any]:
+        """Get a kept result of a feed version, or None if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, kept_version, result = entry
+            if expires < time.monotonic() or kept_version != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: tuple, version: str, result: Any, ttl: float) -> None:
+        """Keep a result of a feed version."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, version, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget all results."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Results of the tools registered with a cache policy
+RESULT_CACHE = ResultCache()
+
+
+def cached_result(policy: CachePolicy) -> Callable[[Callable], Callable]:
+    """
+    Cache the results of a tool function under a policy.
+
+    Results are returned as tool results carrying the structured result and
+    its serialized text, so decorated tools keep their output schema. Error
+    results and results of feeds without an updateTime are returned as they
+    are and not cached.
+
+    Args:
+        policy: Cache policy of the tool
+
+    Returns:
+        Decorator keeping the tool function's name and signature
+    """
+
+    def decorate(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            lang = bound.arguments.get("lang", "en")
+            if lang not in VALID_LANGUAGES:
+                return function(*args, **kwargs)
+            key = (
+                function.__name__,
+                dumps([bound.arguments.get(name) for name in policy.key_args]),
+            )
+            # The tool reads the same feed, so this fetch is shared with it
+            document = FEED_REGISTRY.get(policy.data_type, lang, fetch_json_data)
+            version = update_time(document)
+            if version is not None:
+                kept = RESULT_CACHE.get(key, version)
+                if kept is not None:
+                    return kept
+
+            result = function(*args, **kwargs)
+            if not isinstance(result, dict) or "error" in result:
+                return result
+            tool_result = _tool_result(result)
+            # A result is only kept if the feed was not updated while it was built
+            if version is not None and version == update_time(
+                FEED_REGISTRY.peek(policy.data_type, lang)
+            ):
+                RESULT_CACHE.put(key, version, tool_result, policy.ttl)
+            return tool_result
+
+        return wrapper
+
+    return decorate
+
+
+def _tool_result(result: Dict[str, Any]) -> ToolResult:
+    return ToolResult(
+        content=[TextContent(type="text", text=dumps(result))],
+        structured_content=result,
+    )
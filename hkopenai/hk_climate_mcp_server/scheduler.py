@@ -0,0 +1,282 @@
+"""
+Polling Scheduler - Warning-adaptive background refresh of HKO real-time feeds.
+
+This module keeps the fast-changing feeds warm in the feed registry. The
+weather warnings in force (warnsum) decide how unsettled the weather is: while
+tropical cyclone, rainstorm or thunderstorm signals are in force, current
+observations, lightning, visibility and warning details are refreshed often;
+when no such signal is in force they are refreshed rarely. The intervals only
+set how often feeds are polled: on-demand tool calls keep each feed's own
+freshness window, so a feed polled rarely is still fetched when a tool asks
+for it after that window. When HK_CLIMATE_MCP_DISCOVER_COVERAGE is set, the
+scheduler also starts the weekly discovery of dataset coverage used to
+validate requests.
+"""
+
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from .availability import (
+    AVAILABILITY,
+    DISCOVERABLE_DATASETS,
+    background_discovery_enabled,
+)
+from .feeds import FEED_REGISTRY
+from .passthrough import fetch_raw_json
+from .warning_tracker import get_warning_tracker
+
+logger = logging.getLogger(__name__)
+
+CALM = "calm"
+UNSETTLED = "unsettled"
+SEVERE = "severe"
+
+# Warning codes (warnsum 'code') by the level of weather they indicate.
+# Tropical cyclone signals No. 8 and above and red/black rainstorms are severe;
+# any other cyclone signal, amber rainstorm or thunderstorm is unsettled.
+SEVERE_CODES = frozenset(
+    {"TC8NE", "TC8SE", "TC8NW", "TC8SW", "TC9", "TC10", "WRAINR", "WRAINB"}
+)
+UNSETTLED_CODES = frozenset({"TC1", "TC3", "WRAINA", "WTS"})
+
+
+class PollIntervals(NamedTuple):
+    """Seconds between refreshes of a feed at each weather level."""
+
+    calm: float
+    unsettled: float
+    severe: float
+
+
+# Feeds refreshed in the background, in refresh order. warnsum comes first as
+# it decides the level used for the others.
+POLL_INTERVALS: Dict[str, PollIntervals] = {
+    "warnsum": PollIntervals(300, 60, 60),
+    "warningInfo": PollIntervals(300, 120, 60),
+    "rhrread": PollIntervals(600, 120, 60),
+    "LHL": PollIntervals(600, 300, 300),
+    "LTMV": PollIntervals(600, 600, 300),
+    "flw": PollIntervals(600, 300, 300),
+    "fnd": PollIntervals(1200, 900, 600),
+}
+
+# Seconds between checks for feeds that are due
+TICK_INTERVAL = 15
+
+# Seconds between checks for dataset coverage that needs discovering again
+COVERAGE_CHECK_INTERVAL = 3600
+
+
+def weather_level(warnsum: Any) -> str:
+    """
+    Get how unsettled the weather is from the warnings in force.
+
+    Args:
+        warnsum: Parsed warnsum document, keyed by warning type
+
+    Returns:
+        str: SEVERE, UNSETTLED or CALM
+    """
+    codes = {
+        entry.get("code")
+        for entry in (warnsum or {}).values()
+        if isinstance(entry, Mapping) and entry.get("actionCode") != "CANCEL"
+    }
+    if codes & SEVERE_CODES:
+        return SEVERE
+    if codes & UNSETTLED_CODES:
+        return UNSETTLED
+    return CALM
+
+
+def _track_warnings(document: Any, lang: str) -> None:
+    # warningInfo is refreshed right after warnsum, so both are fresh here
+    get_warning_tracker(lang).poll(fetch_raw_json)
+
+
+def poll_interval(data_type: str, level: str) -> float:
+    """Get the seconds between refreshes of a feed at a weather level."""
+    return getattr(POLL_INTERVALS[data_type], level)
+
+
+class PollingScheduler:
+    """Background thread refreshing feeds at intervals set by the warnings in force."""
+
+    def __init__(self, languages: Sequence[str] = ("en",), tick: float = TICK_INTERVAL):
+        """
+        Args:
+            languages: Languages whose feeds are refreshed; the first one's
+                       warnsum sets the weather level
+            tick: Seconds between checks for feeds that are due
+        """
+        self.languages = tuple(languages)
+        self.tick = tick
+        self.level = CALM
+        self._due: Dict[str, float] = {}
+        self._coverage_due: Optional[float] = None
+        self._listeners: Dict[str, List[Callable[[Any, str], None]]] = {}
+        self._users = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.add_listener("warningInfo", _track_warnings)
+
+    def add_listener(self, data_type: str, listener: Callable[[Any, str], None]) -> None:
+        """
+        Call a function with every document the scheduler fetches for a feed.
+
+        Args:
+            data_type: HKO dataType code of a scheduled feed
+            listener: Function called as listener(document, lang)
+        """
+        with self._lock:
+            self._listeners.setdefault(data_type, []).append(listener)
+
+    def _refresh(self, data_type: str) -> bool:
+        refreshed = False
+        with self._lock:
+            listeners = list(self._listeners.get(data_type, ()))
+        for lang in self.languages:
+            # Feeds are kept with their bytes, for tools serving them unchanged,
+            # and parsed here only for listeners
+            document = FEED_REGISTRY.refresh(
+                data_type, lang, fetch_raw_json, raw=not listeners
+            )
+            if isinstance(document, dict) and "error" in document:
+                logger.debug("Refreshing %s (%s) failed: %s", data_type, lang, document["error"])
+                continue
+            refreshed = True
+            for listener in listeners:
+                try:
+                    listener(document, lang)
+                except Exception as e:
+                    logger.warning("Listener of %s failed: %s", data_type, e)
+        return refreshed
+
+    def _set_level(self, level: str, now: float) -> None:
+        """Switch level, bringing forward refreshes due later than the new interval."""
+        self.level = level
+        for data_type in POLL_INTERVALS:
+            interval = poll_interval(data_type, level)
+            if data_type in self._due:
+                self._due[data_type] = min(self._due[data_type], now + interval)
+
+    def run_once(self, now: Optional[float] = None) -> List[str]:
+        """
+        Refresh every feed that is due.
+
+        Args:
+            now: Monotonic time to schedule against, defaults to the current time
+
+        Returns:
+            Data types that were refreshed
+        """
+        now = time.monotonic() if now is None else now
+        refreshed = []
+        for data_type in POLL_INTERVALS:
+            if self._due.get(data_type, now) > now:
+                continue
+            if self._refresh(data_type):
+                refreshed.append(data_type)
+            if data_type == "warnsum":
+                warnsum = FEED_REGISTRY.peek("warnsum", self.languages[0])
+                level = weather_level(warnsum)
+                if level != self.level or not self._due:
+                    logger.info("Weather level is %s, adjusting refresh intervals", level)
+                    self._set_level(level, now)
+            # Failed refreshes are retried at the next due time like any other
+            self._due[data_type] = now + poll_interval(data_type, self.level)
+        return refreshed
+
+    def check_coverage(self, now: Optional[float] = None) -> List[str]:
+        """
+        Start discovering the datasets whose coverage is missing or out of date.
+
+        Coverage is checked at most every COVERAGE_CHECK_INTERVAL seconds, so
+        each dataset is discovered again about once a week (MAX_CATALOG_AGE).
+        Nothing is started unless HK_CLIMATE_MCP_DISCOVER_COVERAGE is set.
+
+        Args:
+            now: Monotonic time to schedule against, defaults to the current time
+
+        Returns:
+            Data types whose discovery was started
+        """
+        if not background_discovery_enabled():
+            return []
+        now = time.monotonic() if now is None else now
+        if self._coverage_due is not None and self._coverage_due > now:
+            return []
+        self._coverage_due = now + COVERAGE_CHECK_INTERVAL
+        stale = [dt for dt in DISCOVERABLE_DATASETS if AVAILABILITY.is_stale(dt)]
+        if stale and AVAILABILITY.start_discovery(stale):
+            logger.info("Discovering coverage of %s", ", ".join(stale))
+            return stale
+        return []
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.is_set():
+            try:
+                self.check_coverage()
+                self.run_once()
+            except Exception as e:
+                logger.warning("Scheduled refresh failed: %s", e)
+            stop.wait(self.tick)
+
+    def start(self) -> None:
+        """Start refreshing in the background; each start needs a matching stop."""
+        with self._lock:
+            self._users += 1
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop,), name="hko-feed-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refreshing once every start has been matched by a stop."""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users:
+                return
+            self._stop.set()
+            self._thread = None
+
+    def clear(self) -> None:
+        """Stop refreshing and forget the schedule and level."""
+        with self._lock:
+            self._users = 0
+            self._stop.set()
+            self._thread = None
+        self._due.clear()
+        self._coverage_due = None
+        self.level = CALM
+
+
+# Scheduler shared by all sessions of the server
+SCHEDULER = PollingScheduler()
+
+
+@asynccontextmanager
+async def lifespan(mcp: Any) -> AsyncIterator[Dict[str, Any]]:
+    """Server lifespan running the scheduler while the server runs."""
+    SCHEDULER.start()
+    try:
+        yield {}
+    finally:
+        SCHEDULER.stop()
@@ -7,11 +7,18 @@ transports for communication.
 """
 
 from fastmcp import FastMCP
+from . import json_codec
+from . import resources
+from . import scheduler
 from .tools import astronomical
+from .tools import batch
+from .tools import briefing
+from .tools import catalog
 from .tools import current_weather
 from .tools import forecast
 from .tools import lightning
 from .tools import radiation
+from .tools import streaming
 from .tools import temperature
 from .tools import tides
 from .tools import visibility
@@ -25,7 +32,11 @@ def server():
     Returns:
         FastMCP: Configured MCP server instance with weather data tools.
     """
-    mcp = FastMCP(name="HKOServer")
+    mcp = FastMCP(
+        name="HKOServer",
+        lifespan=scheduler.lifespan,
+        tool_serializer=json_codec.dumps,
+    )
 
     current_weather.register(mcp)
     forecast.register(mcp)
@@ -36,5 +47,10 @@ def server():
     visibility.register(mcp)
     warnings.register(mcp)
     astronomical.register(mcp)
+    catalog.register(mcp)
+    briefing.register(mcp)
+    batch.register(mcp)
+    streaming.register(mcp)
+    resources.register(mcp)
 
     return mcp
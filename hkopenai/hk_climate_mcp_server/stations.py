@@ -0,0 +1,311 @@
+"""
+Station Catalog - Station codes and names used by the HKO open data APIs.
+
+This module is the single source of station codes for radiation reports,
+tides and daily temperature data, keyed by language code. The catalogs are
+read-only so they can be handed out without copying.
+"""
+
+from .frozen import freeze
+
+# Station names in different languages: en (English), tc (Traditional Chinese),
+# sc (Simplified Chinese)
+VALID_STATIONS = freeze(
+    {
+        "en": {
+            "CCH": "Cheung Chau",
+            "CLK": "Chek Lap Kok",
+            "EPC": "Ping Chau",
+            "HKO": "Hong Kong Observatory",
+            "HKP": "Hong Kong Park",
+            "HKS": "Wong Chuk Hang",
+            "HPV": "Happy Valley",
+            "JKB": "Tseung Kwan O",
+            "KAT": "Kat O",
+            "KLT": "Kowloon City",
+            "KP": "Kings Park",
+            "KTG": "Kwun Tong",
+            "LFS": "Lau Fau Shan",
+            "PLC": "Tai Mei Tuk",
+            "SE1": "Kai Tak Runway Park",
+            "SEK": "Shek Kong",
+            "SHA": "Sha Tin",
+            "SKG": "Sai Kung",
+            "SKW": "Shau Kei Wan",
+            "SSP": "Sham Shui Po",
+            "STK": "Sha Tau Kok",
+            "STY": "Stanley",
+            "SWH": "Sai Wan Ho",
+            "TAP": "Tap Mun",
+            "TBT": "Tsim Bei Tsui",
+            "TKL": "Ta Kwu Ling",
+            "TUN": "Tuen Mun",
+            "TW": "Tsuen Wan Shing Mun Valley",
+            "TWN": "Tsuen Wan Ho Koon",
+            "TY1": "Tsing Yi",
+            "WTS": "Wong Tai Sin",
+            "YCT": "Tai Po",
+            "YLP": "Yuen Long Park",
+            "YNF": "Yuen Ng Fan",
+        },
+        "tc": {
+            "CCH": "長洲",
+            "CLK": "赤鱲角",
+            "EPC": "平洲",
+            "HKO": "香港天文台",
+            "HKP": "香港公園",
+            "HKS": "黃竹坑",
+            "HPV": "跑馬地",
+            "JKB": "將軍澳",
+            "KAT": "吉澳",
+            "KLT": "九龍城",
+            "KP": "京士柏",
+            "KTG": "觀塘",
+            "LFS": "流浮山",
+            "PLC": "大美督",
+            "SE1": "啟德跑道公園",
+            "SEK": "石崗",
+            "SHA": "沙田",
+            "SKG": "西貢",
+            "SKW": "筲箕灣",
+            "SSP": "深水埗",
+            "STK": "沙頭角",
+            "STY": "赤柱",
+            "SWH": "西灣河",
+            "TAP": "塔門",
+            "TBT": "尖鼻咀",
+            "TKL": "打鼓嶺",
+            "TUN": "屯門",
+            "TW": "荃灣城門谷",
+            "TWN": "荃灣可觀",
+            "TY1": "青衣",
+            "WTS": "黃大仙",
+            "YCT": "大埔",
+            "YLP": "元朗公園",
+            "YNF": "元五墳",
+        },
+        "sc": {
+            "CCH": "长洲",
+            "CLK": "赤鱲角",
+            "EPC": "平洲",
+            "HKO": "香港天文台",
+            "HKP": "香港公园",
+            "HKS": "黄竹坑",
+            "HPV": "跑马地",
+            "JKB": "将军澳",
+            "KAT": "吉澳",
+            "KLT": "九龙城",
+            "KP": "京士柏",
+            "KTG": "观塘",
+            "LFS": "流浮山",
+            "PLC": "大美督",
+            "SE1": "启德跑道公园",
+            "SEK": "石岗",
+            "SHA": "沙田",
+            "SKG": "西贡",
+            "SKW": "筲箕湾",
+            "SSP": "深水埗",
+            "STK": "沙头角",
+            "STY": "赤柱",
+            "SWH": "西湾河",
+            "TAP": "塔门",
+            "TBT": "尖鼻咀",
+            "TKL": "打鼓岭",
+            "TUN": "屯门",
+            "TW": "荃湾城门谷",
+            "TWN": "荃湾可观",
+            "TY1": "青衣",
+            "WTS": "黄大仙",
+            "YCT": "大埔",
+            "YLP": "元朗公园",
+            "YNF": "元五坟",
+        },
+    }
+)
+
+# Station names for tide data in different languages: en (English), tc (Traditional Chinese), sc (Simplified Chinese)
+VALID_TIDE_STATIONS = freeze(
+    {
+        "en": {
+            "CCH": "Cheung Chau",
+            "CLK": "Chek Lap Kok",
+            "CMW": "Chi Ma Wan",
+            "KCT": "Kwai Chung",
+            "KLW": "Ko Lau Wan",
+            "LOP": "Lok On Pai",
+            "MWC": "Ma Wan",
+            "QUB": "Quarry Bay",
+            "SPW": "Shek Pik",
+            "TAO": "Tai O",
+            "TBT": "Tsim Bei Tsui",
+            "TMW": "Tai Miu Wan",
+            "TPK": "Tai Po Kau",
+            "WAG": "Waglan Island",
+        },
+        "tc": {
+            "CCH": "長洲",
+            "CLK": "赤鱲角",
+            "CMW": "芝麻灣",
+            "KCT": "葵涌",
+            "KLW": "高流灣",
+            "LOP": "樂安排",
+            "MWC": "馬灣",
+            "QUB": "鰂魚涌",
+            "SPW": "石壁",
+            "TAO": "大澳",
+            "TBT": "尖鼻咀",
+            "TMW": "大廟灣",
+            "TPK": "大埔滘",
+            "WAG": "橫瀾島",
+        },
+        "sc": {
+            "CCH": "长洲",
+            "CLK": "赤鱲角",
+            "CMW": "芝麻湾",
+            "KCT": "葵涌",
+            "KLW": "高流湾",
+            "LOP": "乐安排",
+            "MWC": "马湾",
+            "QUB": "鲗鱼涌",
+            "SPW": "石壁",
+            "TAO": "大澳",
+            "TBT": "尖鼻咀",
+            "TMW": "大庙湾",
+            "TPK": "大埔滘",
+            "WAG": "横澜岛",
+        },
+    }
+)
+
+# Station names for daily temperature data (CLMTEMP/CLMMAXT/CLMMINT) in different
+# languages: en (English), tc (Traditional Chinese), sc (Simplified Chinese)
+VALID_TEMPERATURE_STATIONS = freeze(
+    {
+        "en": {
+            "CCH": "Cheung Chau",
+            "CLK": "Chek Lap Kok",
+            "EPC": "Ping Chau",
+            "HKA": "Hong Kong International Airport",
+            "HKO": "Hong Kong Observatory",
+            "HKP": "Hong Kong Park",
+            "HKS": "Wong Chuk Hang",
+            "HPV": "Happy Valley",
+            "JKB": "Tseung Kwan O",
+            "KLT": "Kowloon City",
+            "KP": "King's Park",
+            "KSC": "Kau Sai Chau",
+            "KTG": "Kwun Tong",
+            "LFS": "Lau Fau Shan",
+            "NGP": "Ngong Ping",
+            "PEN": "Peng Chau",
+            "PLC": "Tai Mei Tuk",
+            "SE1": "Kai Tak Runway Park",
+            "SEK": "Shek Kong",
+            "SHA": "Sha Tin",
+            "SKG": "Sai Kung",
+            "SKW": "Shau Kei Wan",
+            "SSH": "Sheung Shui",
+            "SSP": "Sham Shui Po",
+            "STY": "Stanley",
+            "TC": "Tate's Cairn",
+            "TKL": "Ta Kwu Ling",
+            "TMS": "Tai Mo Shan",
+            "TPO": "Tai Po Kau",
+            "TU1": "Tuen Mun",
+            "TW": "Tsuen Wan Shing Mun Valley",
+            "TWN": "Tsuen Wan Ho Koon",
+            "TY1": "Tsing Yi",
+            "TYW": "Pak Tam Chung",
+            "VP1": "The Peak",
+            "WGL": "Waglan Island",
+            "WLP": "Wetland Park",
+            "WTS": "Wong Tai Sin",
+            "YCT": "Tai Po",
+            "YLP": "Yuen Long Park",
+        },
+        "tc": {
+            "CCH": "長洲",
+            "CLK": "赤鱲角",
+            "EPC": "平洲",
+            "HKA": "香港國際機場",
+            "HKO": "香港天文台",
+            "HKP": "香港公園",
+            "HKS": "黃竹坑",
+            "HPV": "跑馬地",
+            "JKB": "將軍澳",
+            "KLT": "九龍城",
+            "KP": "京士柏",
+            "KSC": "滘西洲",
+            "KTG": "觀塘",
+            "LFS": "流浮山",
+            "NGP": "昂坪",
+            "PEN": "坪洲",
+            "PLC": "大美督",
+            "SE1": "啟德跑道公園",
+            "SEK": "石崗",
+            "SHA": "沙田",
+            "SKG": "西貢",
+            "SKW": "筲箕灣",
+            "SSH": "上水",
+            "SSP": "深水埗",
+            "STY": "赤柱",
+            "TC": "大老山",
+            "TKL": "打鼓嶺",
+            "TMS": "大帽山",
+            "TPO": "大埔滘",
+            "TU1": "屯門",
+            "TW": "荃灣城門谷",
+            "TWN": "荃灣可觀",
+            "TY1": "青衣",
+            "TYW": "北潭涌",
+            "VP1": "山頂",
+            "WGL": "橫瀾島",
+            "WLP": "濕地公園",
+            "WTS": "黃大仙",
+            "YCT": "大埔",
+            "YLP": "元朗公園",
+        },
+        "sc": {
+            "CCH": "长洲",
+            "CLK": "赤鱲角",
+            "EPC": "平洲",
+            "HKA": "香港国际机场",
+            "HKO": "香港天文台",
+            "HKP": "香港公园",
+            "HKS": "黄竹坑",
+            "HPV": "跑马地",
+            "JKB": "将军澳",
+            "KLT": "九龙城",
+            "KP": "京士柏",
+            "KSC": "滘西洲",
+            "KTG": "观塘",
+            "LFS": "流浮山",
+            "NGP": "昂坪",
+            "PEN": "坪洲",
+            "PLC": "大美督",
+            "SE1": "启德跑道公园",
+            "SEK": "石岗",
+            "SHA": "沙田",
+            "SKG": "西贡",
+            "SKW": "筲箕湾",
+            "SSH": "上水",
+            "SSP": "深水埗",
+            "STY": "赤柱",
+            "TC": "大老山",
+            "TKL": "打鼓岭",
+            "TMS": "大帽山",
+            "TPO": "大埔滘",
+            "TU1": "屯门",
+            "TW": "荃湾城门谷",
+            "TWN": "荃湾可观",
+            "TY1": "青衣",
+            "TYW": "北潭涌",
+            "VP1": "山顶",
+            "WGL": "横澜岛",
+            "WLP": "湿地公园",
+            "WTS": "黄大仙",
+            "YCT": "大埔",
+            "YLP": "元朗公园",
+        },
+    }
+)
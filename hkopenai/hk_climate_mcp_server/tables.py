@@ -0,0 +1,72 @@
+"""
+Opendata Tables - Fetching the large opendata.php tables.
+
+The tide and temperature tools read large tables from opendata.php and serve
+them the same three ways: in pages cut from a compact table, as the raw bytes
+HKO sent, or as the decoded document. This module holds that fetch logic, so
+the tools only validate and build their query parameters. "No data" answers
+are remembered by the negative cache in every case.
+"""
+
+from typing import Any, Dict, Optional, Union
+
+from .csv_table import CompactTable, fetch_csv_table
+from .json_codec import fetch_json_data
+from .json_stream import fetch_json_table
+from .pagination import get_page
+from .passthrough import RawJson, get_raw_json
+from .validation import NEGATIVE_CACHE
+
+OPENDATA_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+
+# Text encoding of the JSON tables that start with a UTF-8 BOM
+ENCODINGS: Dict[str, str] = {
+    "HHOT": "utf-8-sig",
+    "HLT": "utf-8-sig",
+}
+
+
+def get_table(
+    data_type: str,
+    params: Dict[str, Any],
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    raw: bool = False,
+) -> Union[Dict[str, Any], RawJson]:
+    """
+    Get an opendata.php table, a page of it or its raw bytes.
+
+    Args:
+        data_type: HKO dataType code, e.g. 'HHOT'
+        params: Query parameters of the table besides dataType and rformat
+        page_size: Optional rows per page; pages are returned with a nextCursor
+        cursor: Optional nextCursor of the previous page
+        raw: Whether to return an unpaged document as the bytes HKO sent
+
+    Returns:
+        A page, the document as RawJson or decoded, or an error message
+    """
+    params = {"dataType": data_type, "rformat": "json", **params}
+    encoding = ENCODINGS.get(data_type, "utf-8")
+
+    def fetch_table() -> Union[CompactTable, Dict[str, Any]]:
+        # Pages are cut from a compact table streamed from CSV, or from JSON
+        # only if the CSV body could not be read; errors and "no data"
+        # answers are returned from the one request that got them
+        table = fetch_csv_table(params)
+        if table is None:
+            table = fetch_json_table(params, encoding)
+        return table
+
+    if page_size is not None or cursor is not None:
+        return get_page(
+            params, lambda: NEGATIVE_CACHE.fetch(params, fetch_table), cursor, page_size
+        )
+    if raw:
+        return NEGATIVE_CACHE.fetch(
+            params, lambda: get_raw_json(OPENDATA_URL, params, encoding=encoding)
+        )
+    return NEGATIVE_CACHE.fetch(
+        params,
+        lambda: fetch_json_data(OPENDATA_URL, params=params, encoding=encoding),
+    )
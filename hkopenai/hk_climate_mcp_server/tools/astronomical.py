@@ -6,9 +6,13 @@ sunrise/sunset times, and Gregorian-Lunar calendar conversion data from the Hong
 Observatory API.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..json_codec import fetch_json_data
+from ..passthrough import RawJson, get_raw_json, raw_result
+from ..projection import Fields, project
+from ..validation import NEGATIVE_CACHE, validate_request
 
 
 def register(mcp: FastMCP):
@@ -16,25 +20,43 @@ def register(mcp: FastMCP):
 
     @mcp.tool(
         description="Get times of moonrise, moon transit and moonset",
+        output_schema=None,
     )
     def get_moon_times(
         year: int,
         month: Optional[int] = None,
         day: Optional[int] = None,
         lang: str = "en",
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_moon_times(year=year, month=month, day=day, lang=lang)
+        return raw_result(
+            project(
+                _get_moon_times(
+                    year=year, month=month, day=day, lang=lang, raw=not fields
+                ),
+                fields,
+            )
+        )
 
     @mcp.tool(
         description="Get times of sunrise, sun transit and sunset for Hong Kong",
+        output_schema=None,
     )
     def get_sunrise_sunset_times(
         year: int,
         month: Optional[int] = None,
         day: Optional[int] = None,
         lang: str = "en",
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_sunrise_sunset_times(year=year, month=month, day=day, lang=lang)
+        return raw_result(
+            project(
+                _get_sunrise_sunset_times(
+                    year=year, month=month, day=day, lang=lang, raw=not fields
+                ),
+                fields,
+            )
+        )
 
     @mcp.tool(
         description="Get Gregorian-Lunar calendar conversion data",
@@ -44,60 +66,84 @@ def register(mcp: FastMCP):
         month: Optional[int] = None,
         day: Optional[int] = None,
         lang: str = "en",
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_gregorian_lunar_calendar(year=year, month=month, day=day, lang=lang)
+        return project(
+            _get_gregorian_lunar_calendar(year=year, month=month, day=day, lang=lang),
+            fields,
+        )
 
 
 def _get_moon_times(
-    year: int, month: Optional[int] = None, day: Optional[int] = None, lang: str = "en"
-) -> Dict[str, Any]:
+    year: int,
+    month: Optional[int] = None,
+    day: Optional[int] = None,
+    lang: str = "en",
+    raw: bool = False,
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get times of moonrise, moon transit and moonset.
 
     Args:
-        year: Year (2018-2024)
+        year: Year (2018 to next year)
         month: Optional month (1-12)
         day: Optional day (1-31)
         lang: Language code (en/tc/sc, default: en)
+        raw: Whether to return the document as the bytes HKO sent
 
     Returns:
-        Dict containing moon times data with fields and data arrays
+        Dict containing moon times data with fields and data arrays, the same
+        document as RawJson, or an error message if the request is invalid
     """
+    error = validate_request("MRS", year=year, month=month, day=day, lang=lang)
+    if error:
+        return error
     params = {"dataType": "MRS", "lang": lang, "rformat": "json", "year": year}
     if month:
         params["month"] = str(month)
     if day:
         params["day"] = str(day)
 
-    return fetch_json_data(
-        "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php", params=params
-    )
+    url = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+    if raw:
+        return NEGATIVE_CACHE.fetch(params, lambda: get_raw_json(url, params))
+    return NEGATIVE_CACHE.fetch(params, lambda: fetch_json_data(url, params=params))
 
 
 def _get_sunrise_sunset_times(
-    year: int, month: Optional[int] = None, day: Optional[int] = None, lang: str = "en"
-) -> Dict[str, Any]:
+    year: int,
+    month: Optional[int] = None,
+    day: Optional[int] = None,
+    lang: str = "en",
+    raw: bool = False,
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get times of sunrise, sun transit and sunset.
 
     Args:
-        year: Year (2018-2024)
+        year: Year (2018 to next year)
         month: Optional month (1-12)
         day: Optional day (1-31)
         lang: Language code (en/tc/sc, default: en)
+        raw: Whether to return the document as the bytes HKO sent
 
     Returns:
-        Dict containing sun times data with fields and data arrays
+        Dict containing sun times data with fields and data arrays, the same
+        document as RawJson, or an error message if the request is invalid
     """
+    error = validate_request("SRS", year=year, month=month, day=day, lang=lang)
+    if error:
+        return error
     params = {"dataType": "SRS", "lang": lang, "rformat": "json", "year": year}
     if month:
         params["month"] = str(month)
     if day:
         params["day"] = str(day)
 
-    return fetch_json_data(
-        "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php", params=params
-    )
+    url = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+    if raw:
+        return NEGATIVE_CACHE.fetch(params, lambda: get_raw_json(url, params))
+    return NEGATIVE_CACHE.fetch(params, lambda: fetch_json_data(url, params=params))
 
 
 def _get_gregorian_lunar_calendar(
@@ -113,8 +159,12 @@ def _get_gregorian_lunar_calendar(
         lang: Language code (en/tc/sc, default: en)
 
     Returns:
-        Dict containing calendar conversion data
+        Dict containing calendar conversion data or an error message if the
+        request is invalid
     """
+    error = validate_request("LUNAR", year=year, month=month, day=day, lang=lang)
+    if error:
+        return error
     # Construct the date string in YYYY-MM-DD format
     if month and day:
         date_str = f"{year:04d}-{month:02d}-{day:02d}"
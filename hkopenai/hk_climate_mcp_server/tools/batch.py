@@ -0,0 +1,159 @@
+"""
+Batch Tools - Run several HKO tool calls in one MCP call.
+
+This module provides a tool that accepts a list of tool calls, dispatches them
+in parallel through the tools' own `_get_*` functions with a cap on the number
+of calls in flight, and returns each call's result or error in request order.
+"""
+
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Dict, Any, List, Annotated, Tuple
+from pydantic import Field
+from fastmcp import FastMCP
+
+from . import astronomical
+from . import briefing
+from . import catalog
+from . import current_weather
+from . import forecast
+from . import lightning
+from . import radiation
+from . import temperature
+from . import tides
+from . import visibility
+from . import warnings
+from ..frozen import thaw
+from ..projection import project
+
+# Maximum number of calls accepted in one batch
+MAX_BATCH_CALLS = 20
+
+# Maximum number of calls running at the same time
+MAX_BATCH_WORKERS = 4
+
+# Tool name -> module and name of the function implementing it. Functions are
+# looked up when called so they are always the module's current ones.
+BATCH_TOOLS: Dict[str, Tuple[ModuleType, str]] = {
+    "get_current_weather": (current_weather, "_get_current_weather"),
+    "get_all_regions_weather": (current_weather, "_get_all_regions_weather"),
+    "get_rainfall_ranking": (current_weather, "_get_rainfall_ranking"),
+    "get_uv_index": (current_weather, "_get_uv_index"),
+    "get_station_temperatures": (current_weather, "_get_station_temperatures"),
+    "get_observation_history": (current_weather, "_get_observation_history"),
+    "get_rainfall_accumulation": (current_weather, "_get_rainfall_accumulation"),
+    "get_daily_extremes": (current_weather, "_get_daily_extremes"),
+    "get_9_day_weather_forecast": (forecast, "_get_9_day_weather_forecast"),
+    "get_local_weather_forecast": (forecast, "_get_local_weather_forecast"),
+    "get_forecast_revisions": (forecast, "_get_forecast_revisions"),
+    "get_weather_warning_summary": (warnings, "_get_weather_warning_summary"),
+    "get_weather_warning_info": (warnings, "_get_weather_warning_info"),
+    "get_special_weather_tips": (warnings, "_get_special_weather_tips"),
+    "get_warning_changes": (warnings, "_get_warning_changes"),
+    "get_weather_briefing": (briefing, "_get_weather_briefing"),
+    "get_visibility": (visibility, "_get_visibility"),
+    "get_visibility_history": (visibility, "_get_visibility_history"),
+    "get_lightning_data": (lightning, "_get_lightning_data"),
+    "get_lightning_history": (lightning, "_get_lightning_history"),
+    "get_moon_times": (astronomical, "_get_moon_times"),
+    "get_sunrise_sunset_times": (astronomical, "_get_sunrise_sunset_times"),
+    "get_gregorian_lunar_calendar": (astronomical, "_get_gregorian_lunar_calendar"),
+    "get_hourly_tides": (tides, "_get_hourly_tides"),
+    "get_high_low_tides": (tides, "_get_high_low_tides"),
+    "get_tide_station_codes": (tides, "_get_tide_station_codes"),
+    "get_daily_mean_temperature": (temperature, "_get_daily_mean_temperature"),
+    "get_daily_max_temperature": (temperature, "_get_daily_max_temperature"),
+    "get_daily_min_temperature": (temperature, "_get_daily_min_temperature"),
+    "get_temperature_station_codes": (temperature, "_get_temperature_station_codes"),
+    "get_weather_radiation_report": (radiation, "_get_weather_radiation_report"),
+    "get_weather_radiation_reports": (radiation, "_get_weather_radiation_reports"),
+    "get_radiation_statistics": (radiation, "_get_radiation_statistics"),
+    "get_radiation_station_codes": (radiation, "_get_radiation_station_codes"),
+    "get_dataset_catalog": (catalog, "_get_dataset_catalog"),
+}
+
+
+def register(mcp: FastMCP):
+    """Registers the batch tool with the FastMCP server."""
+
+    @mcp.tool(
+        description="Run several HKO tools in one call. Each call names a tool and its "
+        "arguments; results are returned in the same order.",
+    )
+    def run_tool_batch(
+        calls: Annotated[
+            List[Dict[str, Any]],
+            Field(
+                description="Tool calls, e.g. [{'tool': 'get_high_low_tides', "
+                "'args': {'station': 'CCH', 'year': 2025, 'month': 6}}]"
+            ),
+        ],
+    ) -> Dict[str, Any]:
+        return _run_tool_batch(calls)
+
+
+def _run_call(call: Any) -> Dict[str, Any]:
+    """Run a single batch item, turning every failure into an error entry."""
+    if not isinstance(call, dict) or not isinstance(call.get("args", {}), dict):
+        return {"tool": None, "error": "Each call must be {'tool': name, 'args': {...}}."}
+    name = call.get("tool")
+    if name not in BATCH_TOOLS:
+        return {
+            "tool": name,
+            "error": f"Unknown tool '{name}'. Valid tools: {', '.join(BATCH_TOOLS)}.",
+        }
+    args = dict(call.get("args") or {})
+    # fields is handled by the tool wrappers, not the _get_* functions
+    fields = args.pop("fields", None)
+    # Results are returned in the batch's own document, so raw bytes are of no use
+    args.pop("raw", None)
+    # Tide tools take month/day/hour/lang in an options dict
+    options = args.pop("options", None)
+    if isinstance(options, dict):
+        args = {**options, **args}
+    module, function_name = BATCH_TOOLS[name]
+    function = getattr(module, function_name)
+    try:
+        inspect.signature(function).bind(**args)
+    except TypeError as e:
+        return {"tool": name, "error": f"Invalid arguments for {name}: {e}"}
+    try:
+        result = function(**args)
+    except Exception as e:
+        return {"tool": name, "error": f"{name} failed: {e}"}
+    result = project(result if isinstance(result, dict) else thaw(result), fields)
+    if isinstance(result, dict) and "error" in result:
+        return {"tool": name, "error": result["error"]}
+    return {"tool": name, "result": result}
+
+
+def _run_tool_batch(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Run several tool calls in parallel.
+
+    Args:
+        calls: List of {'tool': name, 'args': {...}} dicts. Arguments are those
+               of the named tool, including fields; tide tools also accept
+               month, day, hour and lang directly instead of in options. raw
+               is ignored, as results are always decoded documents.
+
+    Returns:
+        Dict containing:
+            - results: One {tool, result} or {tool, error} per call, in the
+              order of the calls
+            - succeeded: Number of calls that returned a result
+            - failed: Number of calls that returned an error
+        or an error message if the batch itself is invalid
+    """
+    if not isinstance(calls, list) or not calls:
+        return {"error": "Calls must be a non-empty list of tool calls."}
+    if len(calls) > MAX_BATCH_CALLS:
+        return {
+            "error": f"A batch may contain at most {MAX_BATCH_CALLS} calls; "
+            f"{len(calls)} were given. Split it into several batches."
+        }
+    with ThreadPoolExecutor(max_workers=min(MAX_BATCH_WORKERS, len(calls))) as executor:
+        results = list(executor.map(_run_call, calls))
+    failed = sum(1 for item in results if "error" in item)
+    return {"results": results, "succeeded": len(results) - failed, "failed": failed}
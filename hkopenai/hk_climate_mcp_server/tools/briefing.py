@@ -0,0 +1,176 @@
+"""
+Weather Briefing Tools - A combined summary of HKO real-time feeds.
+
+This module provides a tool that gathers current weather, warnings, the local
+and 9-day forecasts, special weather tips and visibility in one call. The
+feeds are fetched concurrently (or read from the feed registry's cache) and
+merged into a single document with overlapping content removed.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
+from fastmcp import FastMCP
+
+from ..feeds import FEED_REGISTRY
+from ..frozen import thaw
+from ..json_codec import fetch_json_data
+from ..observations import WeatherSnapshot
+from ..projection import Fields, project
+
+# Feeds merged into the briefing
+BRIEFING_FEEDS = ("rhrread", "warnsum", "flw", "fnd", "swt", "LTMV")
+
+
+def register(mcp: FastMCP):
+    """Registers the weather briefing tool with the FastMCP server."""
+
+    @mcp.tool(
+        description="Get a combined HK weather briefing from HKO: current weather, "
+        "warnings, local and 9-day forecast, special weather tips and visibility.",
+    )
+    def get_weather_briefing(lang: str = "en", fields: Fields = None) -> Dict[str, Any]:
+        return project(_get_weather_briefing(lang), fields)
+
+
+def _unique(items: List[Any]) -> List[Any]:
+    """Drop empty and repeated items, keeping the first occurrence."""
+    seen: List[Any] = []
+    for item in items:
+        if item and item not in seen:
+            seen.append(item)
+    return seen
+
+
+def _current(snapshot: WeatherSnapshot) -> Dict[str, Any]:
+    place = snapshot.default_place()
+    temperature = snapshot.temperature.get(place)
+    humidity = snapshot.humidity.get(place)
+    districts = snapshot.rainfall.readings
+    return {
+        "place": place,
+        "temperature": temperature.value if temperature else None,
+        "humidity": humidity.value if humidity else None,
+        "rainfallMax": max((r.max for r in districts), default=0),
+        "uvindex": thaw(snapshot.uvindex.get("data", [])) if snapshot.uvindex else [],
+        "icon": list(snapshot.icon),
+        "recordTime": snapshot.temperature_record_time,
+    }
+
+
+def _warnings(warnsum: Dict[str, Any], snapshot: Any) -> Dict[str, Any]:
+    active = [
+        {
+            "code": entry.get("code", code),
+            "name": entry.get("name", ""),
+            "type": entry.get("type", ""),
+            "actionCode": entry.get("actionCode", ""),
+            "issueTime": entry.get("issueTime", ""),
+        }
+        for code, entry in warnsum.items()
+        if isinstance(entry, dict) and entry.get("actionCode") != "CANCEL"
+    ]
+    messages = list(snapshot.warning_message) if snapshot is not None else []
+    messages += warnsum.get("warningMessage", [])
+    return {"active": active, "messages": _unique(messages)}
+
+
+def _nine_day(fnd: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "forecastDate": day.get("forecastDate", ""),
+            "week": day.get("week", ""),
+            "forecastWeather": day.get("forecastWeather", ""),
+            "forecastWind": day.get("forecastWind", ""),
+            "minTemp": day.get("forecastMintemp", {}).get("value"),
+            "maxTemp": day.get("forecastMaxtemp", {}).get("value"),
+            "PSR": day.get("PSR", ""),
+        }
+        for day in fnd.get("weatherForecast", [])
+    ]
+
+
+def _visibility(ltmv: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {"time": row[0], "station": row[1], "visibility": row[2]}
+        for row in ltmv.get("data", [])
+        if len(row) >= 3
+    ]
+
+
+def _get_weather_briefing(lang: str = "en") -> Dict[str, Any]:
+    """
+    Get a combined weather briefing for Hong Kong.
+
+    All feeds are requested concurrently through the feed registry, so the
+    briefing costs at most one upstream round-trip when feeds are stale and
+    none when they are cached. Content repeated across feeds is included
+    once: warning messages from the current weather report and the warning
+    summary are merged, and the 9-day forecast's general situation is only
+    included when it differs from the local forecast's.
+
+    Args:
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Dict containing:
+            - current: Temperature and humidity at the Hong Kong Observatory,
+              maximum district rainfall, UV index and weather icons
+            - warnings: Active warnings and de-duplicated warning messages
+            - generalSituation: General weather situation
+            - localForecast: forecastPeriod, forecastDesc and outlook
+            - nineDayForecast: Daily forecast summaries, with
+              generalSituation when it differs from the local forecast
+            - specialWeatherTips: List of special weather tips
+            - visibility: Latest visibility per station
+            - updateTime: Latest update time among the feeds
+            - errors: Feeds that could not be fetched, with their errors
+    """
+    data_types = BRIEFING_FEEDS
+    with ThreadPoolExecutor(max_workers=len(data_types)) as executor:
+        documents = dict(
+            zip(
+                data_types,
+                executor.map(
+                    lambda dt: FEED_REGISTRY.get(dt, lang, fetch_json_data),
+                    data_types,
+                ),
+            )
+        )
+
+    errors = {
+        dt: doc["error"]
+        for dt, doc in documents.items()
+        if not isinstance(doc, WeatherSnapshot) and "error" in doc
+    }
+    snapshot = documents["rhrread"] if "rhrread" not in errors else None
+    feeds = {
+        dt: thaw(doc) if dt not in errors else {}
+        for dt, doc in documents.items()
+        if dt != "rhrread"
+    }
+    flw, fnd = feeds["flw"], feeds["fnd"]
+
+    general_situation = flw.get("generalSituation") or fnd.get("generalSituation", "")
+    nine_day: Dict[str, Any] = {"forecast": _nine_day(fnd)}
+    if fnd.get("generalSituation") and fnd["generalSituation"] != general_situation:
+        nine_day["generalSituation"] = fnd["generalSituation"]
+
+    update_times = [doc.get("updateTime", "") for doc in feeds.values()]
+    if snapshot is not None:
+        update_times.append(snapshot.update_time)
+
+    return {
+        "current": _current(snapshot) if snapshot is not None else None,
+        "warnings": _warnings(feeds["warnsum"], snapshot),
+        "generalSituation": general_situation,
+        "localForecast": {
+            "forecastPeriod": flw.get("forecastPeriod", ""),
+            "forecastDesc": flw.get("forecastDesc", ""),
+            "outlook": flw.get("outlook", ""),
+        },
+        "nineDayForecast": nine_day,
+        "specialWeatherTips": _unique(feeds["swt"].get("specialWeatherTips", [])),
+        "visibility": _visibility(feeds["LTMV"]),
+        "updateTime": max(update_times, default=""),
+        "errors": errors,
+    }
@@ -0,0 +1,82 @@
+"""
+Dataset Catalog Tools - Functions for reporting HKO dataset coverage.
+
+This module provides a tool listing the years (per station where applicable)
+for which the Hong Kong Observatory open data API has data, as discovered by
+the availability job, alongside the documented ranges.
+"""
+
+from typing import Dict, Any, Optional
+from fastmcp import FastMCP
+
+from ..availability import AVAILABILITY, DISCOVERABLE_DATASETS, ALL_STATIONS
+from ..projection import Fields, project
+from ..validation import DATASETS, get_static_year_range
+
+
+def register(mcp: FastMCP):
+    """Registers the dataset catalog tool with the FastMCP server."""
+
+    @mcp.tool(
+        description="Get available years per station for HK temperature, tide and "
+        "sun/moon datasets (CLMTEMP, CLMMAXT, CLMMINT, HHOT, HLT, SRS, MRS).",
+    )
+    def get_dataset_catalog(
+        data_type: Optional[str] = None, refresh: bool = False, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(
+            _get_dataset_catalog(data_type=data_type, refresh=refresh),
+            fields,
+        )
+
+
+def _get_dataset_catalog(
+    data_type: Optional[str] = None, refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Get the discovered year coverage of HKO datasets.
+
+    Discovery runs in the background. It is started when requested with
+    refresh, or when the coverage of a requested dataset was never discovered
+    or is older than a week; until it finishes the documented ranges apply.
+
+    Args:
+        data_type: Optional dataset code (CLMTEMP, CLMMAXT, CLMMINT, HHOT, HLT,
+                   SRS or MRS). If omitted, all datasets are returned.
+        refresh: Force a new discovery run
+
+    Returns:
+        Dict containing:
+            - datasets: Per dataset, its description, documented year range,
+              discovered years per station ('*' for datasets without stations)
+              and the time coverage was discovered
+            - discoveryRunning: Whether a discovery job is in progress
+        or an error message if the dataset code is invalid
+    """
+    if data_type is not None and data_type not in DISCOVERABLE_DATASETS:
+        return {
+            "error": f"Invalid data_type '{data_type}'. Use one of: "
+            f"{', '.join(DISCOVERABLE_DATASETS)}."
+        }
+    data_types = [data_type] if data_type else list(DISCOVERABLE_DATASETS)
+
+    stale = [dt for dt in data_types if refresh or AVAILABILITY.is_stale(dt)]
+    if stale:
+        AVAILABILITY.start_discovery(stale)
+
+    snapshot = AVAILABILITY.snapshot()
+    datasets = {}
+    for dt in data_types:
+        first_year, last_year = get_static_year_range(dt)
+        discovered = snapshot["datasets"].get(dt)
+        datasets[dt] = {
+            "description": DATASETS[dt].description,
+            "documentedYears": [first_year, last_year],
+            "years": (
+                discovered.get(ALL_STATIONS)
+                if discovered is not None and ALL_STATIONS in discovered
+                else discovered
+            ),
+            "updateTime": snapshot["updateTime"].get(dt),
+        }
+    return {"datasets": datasets, "discoveryRunning": snapshot["discoveryRunning"]}
@@ -2,12 +2,28 @@
 Current Weather Data Tools - Functions for fetching current weather data from HKO.
 
 This module provides tools to retrieve current weather information including temperature,
-humidity, rainfall, and weather warnings from the Hong Kong Observatory API.
+humidity, rainfall, UV index and weather warnings from the Hong Kong Observatory API.
+All tools are served from the same parsed rhrread snapshot, which the feed registry
+fetches at most once per language within the feed's freshness window. Past
+observations are read from the local observation store.
 """
 
-from typing import Dict
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Union
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..daily_extremes import DAILY_EXTREMES, EXTREMES_LANG
+from ..feeds import FEED_REGISTRY
+from ..frozen import thaw
+from ..json_codec import fetch_json_data
+from ..observation_store import ELEMENTS, OBSERVATION_STORE, STORE_LANG
+from ..observations import HKT, Reading, WeatherSnapshot
+from ..projection import Fields, project
+from ..rainfall import RAINFALL_ACCUMULATOR, RAINFALL_LANG, WINDOWS
+from ..result_cache import CachePolicy, cached_result
+
+# Maximum number of days of one observation history request
+MAX_HISTORY_DAYS = 31
 
 
 def register(mcp: FastMCP):
@@ -16,15 +32,21 @@ def register(mcp: FastMCP):
     @mcp.tool(
         description="Get current weather data, warnings, temp, humidity in HK from HKO.",
     )
+    @cached_result(
+        CachePolicy("rhrread", ttl=600, key_args=("region", "lang", "fields"))
+    )
     def get_current_weather(
-        region: str = "Hong Kong Observatory", lang: str = "en"
+        region: str = "Hong Kong Observatory", lang: str = "en", fields: Fields = None
     ) -> Dict:
         """
         Get current weather observations for a specific region in Hong Kong
 
         Args:
-            region: The region to get weather for (default: "Hong Kong Observatory")
+            region: The region to get weather for, in any language; close
+                    spellings are matched (default: "Hong Kong Observatory")
             lang: Language code (en/tc/sc, default: en)
+            fields: Optional fields of the result to return, e.g.
+                    ['weatherObservation.temperature']
 
         Returns:
             Dict containing:
@@ -33,7 +55,86 @@ def register(mcp: FastMCP):
             - humidity: Current humidity percentage
             - rainfall: Current rainfall in mm
         """
-        return _get_current_weather(region, lang)
+        return project(_get_current_weather(region, lang), fields)
+
+    @mcp.tool(
+        description="Get current temperature, humidity of all HK stations and rainfall "
+        "of all districts from HKO in one call.",
+    )
+    def get_all_regions_weather(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_all_regions_weather(lang), fields)
+
+    @mcp.tool(
+        description="Get HK districts ranked by rainfall over the past hour from HKO.",
+    )
+    def get_rainfall_ranking(
+        lang: str = "en", limit: Optional[int] = None, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_rainfall_ranking(lang, limit), fields)
+
+    @mcp.tool(
+        description="Get rolling 1, 3 and 24 hour rainfall of every HK district, "
+        "ranked by one of them, accumulated from HKO hourly rainfall reports.",
+    )
+    def get_rainfall_accumulation(
+        hours: int = 24, limit: Optional[int] = None, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_rainfall_accumulation(hours, limit), fields)
+
+    @mcp.tool(
+        description="Get the current UV index in HK from HKO.",
+    )
+    def get_uv_index(lang: str = "en", fields: Fields = None) -> Dict[str, Any]:
+        return project(_get_uv_index(lang), fields)
+
+    @mcp.tool(
+        description="Get a table of current temperatures at all HK stations, "
+        "hottest first, with the highest, lowest and mean from HKO.",
+    )
+    def get_station_temperatures(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_station_temperatures(lang), fields)
+
+    @mcp.tool(
+        description="Get today's (HKT) highest and lowest temperature and humidity "
+        "so far at a HK station, or at all stations, from HKO current weather reports.",
+    )
+    def get_daily_extremes(
+        place: Optional[str] = None, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_daily_extremes(place), fields)
+
+    @mcp.tool(
+        description="Get past temperature or humidity of a HK station, or rainfall of "
+        "a district, recorded by this server from HKO current weather reports.",
+    )
+    def get_observation_history(
+        place: str,
+        element: str = "temperature",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        fields: Fields = None,
+    ) -> Dict[str, Any]:
+        return project(
+            _get_observation_history(place, element, start_date, end_date),
+            fields,
+        )
+
+
+def _fetch_snapshot(lang: str) -> Union[WeatherSnapshot, Dict[str, Any]]:
+    """
+    Get the current rhrread snapshot, fetching it only if the cached one is stale.
+
+    Args:
+        lang: Language code (en/tc/sc)
+
+    Returns:
+        WeatherSnapshot, or the upstream error dict
+    """
+    return FEED_REGISTRY.get("rhrread", lang, fetch_json_data)
 
 
 def _get_current_weather(
@@ -43,7 +144,8 @@ def _get_current_weather(
     Get current weather observations for a specific region in Hong Kong
 
     Args:
-        region: The region to get weather for (default: "Hong Kong Observatory")
+        region: The region to get weather for, in any language; close spellings
+                are matched (default: "Hong Kong Observatory")
         lang: Language code (en/tc/sc, default: en)
 
     Returns:
@@ -53,93 +155,335 @@ def _get_current_weather(
         - humidity: Current humidity percentage
         - rainfall: Current rainfall in mm
     """
-    data = fetch_json_data(
-        f"https://data.weather.gov.hk/weatherAPI/opendata/weather.php"
-        f"?dataType=rhrread&lang={lang}"
-    )
+    snapshot = _fetch_snapshot(lang)
+    if not isinstance(snapshot, WeatherSnapshot):
+        return snapshot
 
     # Handle warnings
-    warning = "No warning in force"
-    if "warningMessage" in data:
-        if isinstance(data["warningMessage"], list) and data["warningMessage"]:
-            warning = data["warningMessage"][0]
-        elif data["warningMessage"]:
-            warning = data["warningMessage"]
-
-    # Get default values from HKO data
-    default_temp = next(
-        (
-            t
-            for t in data.get("temperature", {}).get("data", [])
-            if t.get("place") == "Hong Kong Observatory"
-        ),
-        {"value": 25, "unit": "C", "recordTime": ""},
+    warning = (
+        snapshot.warning_message[0]
+        if snapshot.warning_message and snapshot.warning_message[0]
+        else "No warning in force"
     )
-    default_humidity = next(
-        (
-            h
-            for h in data.get("humidity", {}).get("data", [])
-            if h.get("place") == "Hong Kong Observatory"
-        ),
-        {"value": 60, "unit": "percent", "recordTime": ""},
-    )
-    # Find matching region temperature
-    temp_data = data.get("temperature", {}).get("data", [])
-    matched_temp = next(
-        (t for t in temp_data if t["place"].lower() == region.lower()),
-        {
-            "place": "Hong Kong Observatory",
-            "value": default_temp["value"],
-            "unit": default_temp["unit"],
-        },
+
+    # Find matching region temperature, falling back to the HKO station
+    default_place = snapshot.default_place()
+    matched_temp = (
+        snapshot.temperature.get(region)
+        or snapshot.temperature.get(default_place)
+        or Reading(default_place, 25, "C")
     )
-    matched_temp["recordTime"] = data["temperature"]["recordTime"]
-
-    # Get humidity
-    humidity = next(
-        (
-            h
-            for h in data.get("humidity", {}).get("data", [])
-            if h.get("place") == matched_temp["place"]
-        ),
-        default_humidity,
+
+    # Get humidity of the same station only; few stations report it, so a
+    # fuzzy match would be another station's reading
+    humidity = (
+        snapshot.humidity.get(matched_temp.place, fuzzy=False)
+        or snapshot.humidity.get(default_place, fuzzy=False)
+        or Reading(default_place, 60, "percent")
     )
-    humidity["recordTime"] = data["humidity"]["recordTime"]
 
     # Get rainfall (0 if no rain)
-    rainfall = 0
-    rainfall_start = ""
-    rainfall_end = ""
-    if "rainfall" in data:
-        rainfall = max(float(r.get("max", 0)) for r in data["rainfall"]["data"])
-        rainfall_start = data["rainfall"]["startTime"]
-        rainfall_end = data["rainfall"]["endTime"]
+    districts = snapshot.rainfall.readings
+    rainfall = max((r.max for r in districts), default=0)
+    rainfall_min = min((r.min for r in districts), default=0)
 
     return {
         "generalSituation": warning,
         "weatherObservation": {
             "temperature": {
-                "value": matched_temp["value"],
-                "unit": matched_temp["unit"],
-                "recordTime": matched_temp["recordTime"],
-                "place": matched_temp["place"],
+                "value": matched_temp.value,
+                "unit": matched_temp.unit,
+                "recordTime": snapshot.temperature_record_time,
+                "place": matched_temp.place,
             },
             "humidity": {
-                "value": humidity["value"],
-                "unit": humidity["unit"],
-                "recordTime": humidity["recordTime"],
-                "place": matched_temp["place"],
+                "value": humidity.value,
+                "unit": humidity.unit,
+                "recordTime": snapshot.humidity_record_time,
+                "place": humidity.place,
             },
             "rainfall": {
                 "value": rainfall,
-                "min": min(float(r.get("min", 0)) for r in data["rainfall"]["data"]),
+                "min": rainfall_min,
                 "unit": "mm",
-                "startTime": rainfall_start,
-                "endTime": rainfall_end,
+                "startTime": snapshot.rainfall_start,
+                "endTime": snapshot.rainfall_end,
             },
-            "uvindex": data.get("uvindex", {}),
+            "uvindex": thaw(snapshot.uvindex),
+        },
+        "updateTime": snapshot.update_time,
+        "icon": list(snapshot.icon),
+        "iconUpdateTime": snapshot.icon_update_time,
+    }
+
+
+def _get_all_regions_weather(lang: str = "en") -> Dict[str, Any]:
+    """
+    Get current temperature and humidity of every station and rainfall of every district.
+
+    Args:
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Dict containing:
+        - temperature: recordTime and a list of {place, value, unit} per station
+        - humidity: recordTime and a list of {place, value, unit} per station
+        - rainfall: startTime, endTime and a list of {place, min, max, unit, main}
+          per district
+        - updateTime: Last update time
+    """
+    snapshot = _fetch_snapshot(lang)
+    if not isinstance(snapshot, WeatherSnapshot):
+        return snapshot
+    return {
+        "temperature": {
+            "recordTime": snapshot.temperature_record_time,
+            "data": [r.to_dict() for r in snapshot.temperature.readings],
         },
-        "updateTime": data["updateTime"],
-        "icon": data.get("icon", []),
-        "iconUpdateTime": data.get("iconUpdateTime", ""),
+        "humidity": {
+            "recordTime": snapshot.humidity_record_time,
+            "data": [r.to_dict() for r in snapshot.humidity.readings],
+        },
+        "rainfall": {
+            "startTime": snapshot.rainfall_start,
+            "endTime": snapshot.rainfall_end,
+            "data": [r.to_dict() for r in snapshot.rainfall.readings],
+        },
+        "updateTime": snapshot.update_time,
+    }
+
+
+def _get_rainfall_ranking(
+    lang: str = "en", limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get districts ranked by maximum rainfall over the past hour.
+
+    Args:
+        lang: Language code (en/tc/sc, default: en)
+        limit: Optional number of top districts to return (default: all)
+
+    Returns:
+        Dict containing:
+        - startTime, endTime: Rainfall measurement window
+        - data: List of {rank, place, min, max, unit, main}, wettest first;
+          districts with equal rainfall share a rank
+        - updateTime: Last update time
+    """
+    if limit is not None and limit < 1:
+        return {"error": "Limit must be a positive number of districts."}
+    snapshot = _fetch_snapshot(lang)
+    if not isinstance(snapshot, WeatherSnapshot):
+        return snapshot
+    ranked = sorted(snapshot.rainfall.readings, key=lambda r: (-r.max, -r.min))
+    data = []
+    rank, previous = 0, None
+    for position, reading in enumerate(ranked[:limit], start=1):
+        if (reading.max, reading.min) != previous:
+            rank, previous = position, (reading.max, reading.min)
+        data.append(dict(reading.to_dict(), rank=rank))
+    return {
+        "startTime": snapshot.rainfall_start,
+        "endTime": snapshot.rainfall_end,
+        "data": data,
+        "updateTime": snapshot.update_time,
+    }
+
+
+def _get_rainfall_accumulation(
+    hours: int = 24, limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get rolling rainfall accumulations of every district, wettest first.
+
+    Accumulations add up the hourly rainfall of the current weather reports
+    polled by the server, so they cover at most the time the server has run;
+    hoursObserved tells how many hourly windows each total includes.
+
+    Args:
+        hours: Accumulation to rank by, 1, 3 or 24 (default: 24)
+        limit: Optional number of top districts to return (default: all)
+
+    Returns:
+        Dict containing:
+        - endTime: End of the latest hourly rainfall window
+        - rankedBy: Name of the accumulation the districts are ranked by
+        - data: List of {rank, place, past1h, past3h, past24h, hoursObserved}
+          in mm, wettest first; districts with equal rainfall share a rank
+    """
+    if hours not in WINDOWS:
+        return {"error": f"Hours must be one of {', '.join(map(str, WINDOWS))}."}
+    if limit is not None and limit < 1:
+        return {"error": "Limit must be a positive number of districts."}
+    snapshot = _fetch_snapshot(RAINFALL_LANG)
+    RAINFALL_ACCUMULATOR.update(snapshot)
+    accumulations = RAINFALL_ACCUMULATOR.accumulations()
+    if not accumulations["data"] and not isinstance(snapshot, WeatherSnapshot):
+        return snapshot
+    key = f"past{hours}h"
+    ranked = sorted(accumulations["data"], key=lambda entry: -entry[key])
+    data = []
+    rank, previous = 0, None
+    for position, entry in enumerate(ranked[:limit], start=1):
+        if entry[key] != previous:
+            rank, previous = position, entry[key]
+        data.append(dict(entry, rank=rank))
+    return {"endTime": accumulations["endTime"], "rankedBy": key, "data": data}
+
+
+def _get_uv_index(lang: str = "en") -> Dict[str, Any]:
+    """
+    Get the current UV index.
+
+    Args:
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Dict containing:
+        - data: List of {place, value, desc}; empty when no UV index is
+          reported, e.g. at night
+        - recordDesc: Description of the recording period
+        - updateTime: Last update time
+    """
+    snapshot = _fetch_snapshot(lang)
+    if not isinstance(snapshot, WeatherSnapshot):
+        return snapshot
+    uvindex = thaw(snapshot.uvindex) if snapshot.uvindex else {}
+    return {
+        "data": uvindex.get("data", []),
+        "recordDesc": uvindex.get("recordDesc", ""),
+        "updateTime": snapshot.update_time,
+    }
+
+
+def _get_station_temperatures(lang: str = "en") -> Dict[str, Any]:
+    """
+    Get the current temperature of every station as a table, hottest first.
+
+    Args:
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Dict containing:
+        - recordTime: Time the temperatures were recorded
+        - highest, lowest: {place, value, unit} of the hottest and coolest station
+        - mean: Mean temperature over all stations, rounded to 0.1
+        - data: List of {place, value, unit}, hottest first
+        - updateTime: Last update time
+    """
+    snapshot = _fetch_snapshot(lang)
+    if not isinstance(snapshot, WeatherSnapshot):
+        return snapshot
+    table = sorted(
+        (r for r in snapshot.temperature.readings if isinstance(r.value, (int, float))),
+        key=lambda r: -r.value,
+    )
+    return {
+        "recordTime": snapshot.temperature_record_time,
+        "highest": table[0].to_dict() if table else None,
+        "lowest": table[-1].to_dict() if table else None,
+        "mean": round(sum(r.value for r in table) / len(table), 1) if table else None,
+        "data": [r.to_dict() for r in table],
+        "updateTime": snapshot.update_time,
+    }
+
+
+def _get_daily_extremes(place: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get today's highest and lowest temperature and humidity so far.
+
+    Extremes are kept from every current weather report polled by the server
+    since midnight HKT, so they only cover the reports seen since then.
+
+    Args:
+        place: Station name in English, e.g. 'Sha Tin' (default: all stations)
+
+    Returns:
+        Dict containing:
+        - date: Today's date in HKT (YYYYMMDD)
+        - temperature, humidity: {place, max, maxTime, min, minTime} of the
+          station, or a list of those of all stations when no place is given
+        or an error message if the station has no readings today
+    """
+    DAILY_EXTREMES.update(_fetch_snapshot(EXTREMES_LANG))
+    extremes = DAILY_EXTREMES.get(place)
+    found = extremes["temperature"] or extremes["humidity"]
+    if place is not None and not found:
+        return {
+            "error": f"No temperature or humidity readings for '{place}' today. "
+            "Use 'get_station_temperatures' for station names."
+        }
+    return extremes
+
+
+def _get_observation_history(
+    place: str,
+    element: str = "temperature",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Get the recorded observations of a station or district over a date range.
+
+    Every new current weather report is recorded by the server, so history is
+    available from when the server first ran, for up to a year
+    (RETENTION_DAYS). No request is made to the HKO API other than for the
+    current report.
+
+    Args:
+        place: Station or district name in English, e.g. 'Sha Tin'
+        element: temperature, humidity or rainfall (default: temperature)
+        start_date: First date in YYYYMMDD format (default: end_date)
+        end_date: Last date in YYYYMMDD format, inclusive (default: today in HKT)
+
+    Returns:
+        Dict containing place, element, unit, startDate, endDate, data as a
+        list of {time, value} (oldest first), count, min and max, or an error
+        message. Rainfall values are the district maximum of the past hour.
+    """
+    if element not in ELEMENTS:
+        return {"error": f"Invalid element. Use one of: {', '.join(ELEMENTS)}."}
+    end_date = end_date or datetime.now(HKT).strftime("%Y%m%d")
+    start_date = start_date or end_date
+    try:
+        start = datetime.strptime(start_date, "%Y%m%d").replace(tzinfo=HKT)
+        end = datetime.strptime(end_date, "%Y%m%d").replace(tzinfo=HKT)
+    except (TypeError, ValueError):
+        return {
+            "error": "Invalid date format. Dates must be in YYYYMMDD format (e.g., 20250618)"
+        }
+    if end < start:
+        return {"error": "end_date must not be earlier than start_date."}
+    if (end - start).days >= MAX_HISTORY_DAYS:
+        return {"error": f"A date range may span at most {MAX_HISTORY_DAYS} days."}
+
+    # Record the current report in case the scheduler has not yet
+    OBSERVATION_STORE.record(_fetch_snapshot(STORE_LANG))
+    rows = OBSERVATION_STORE.query(
+        place,
+        element,
+        int(start.timestamp()),
+        int((end + timedelta(days=1)).timestamp()) - 1,
+    )
+    if not rows:
+        places = OBSERVATION_STORE.places(end.date())
+        return {
+            "error": f"No {element} observations recorded for '{place}' "
+            f"from {start_date} to {end_date}."
+            + (f" Places recorded on {end_date}: {', '.join(places)}." if places else "")
+        }
+    values = [value for _, value in rows]
+    return {
+        "place": place,
+        "element": element,
+        "unit": ELEMENTS[element],
+        "startDate": start_date,
+        "endDate": end_date,
+        "data": [
+            {"time": datetime.fromtimestamp(t, HKT).isoformat(), "value": value}
+            for t, value in rows
+        ],
+        "count": len(rows),
+        "min": min(values),
+        "max": max(values),
     }
@@ -2,12 +2,20 @@
 Weather Forecast Tools - Functions for fetching weather forecast data from HKO.
 
 This module provides tools to retrieve weather forecast information including
-9-day and local weather forecasts from the Hong Kong Observatory API.
+9-day and local weather forecasts from the Hong Kong Observatory API, and how
+the forecasts for a date were revised from issue to issue.
 """
 
+from datetime import datetime, timedelta
 from typing import Dict, Any
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..feeds import FEED_REGISTRY
+from ..forecast_store import FORECAST_LANG, FORECAST_STORE, diff_forecasts, issue_date
+from ..frozen import thaw
+from ..json_codec import fetch_json_data
+from ..projection import Fields, project
+from ..result_cache import CachePolicy, cached_result
 
 
 def register(mcp: FastMCP):
@@ -16,14 +24,28 @@ def register(mcp: FastMCP):
     @mcp.tool(
         description="Get 9-day weather forecast for HK with general situation, daily data.",
     )
-    def get_9_day_weather_forecast(lang: str = "en") -> Dict[str, Any]:
-        return _get_9_day_weather_forecast(lang)
+    @cached_result(CachePolicy("fnd", ttl=3600))
+    def get_9_day_weather_forecast(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_9_day_weather_forecast(lang), fields)
 
     @mcp.tool(
         description="Get local weather forecast for HK with description, outlook, update.",
     )
-    def get_local_weather_forecast(lang: str = "en") -> Dict[str, Any]:
-        return _get_local_weather_forecast(lang)
+    @cached_result(CachePolicy("flw", ttl=3600))
+    def get_local_weather_forecast(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_local_weather_forecast(lang), fields)
+
+    @mcp.tool(
+        description="Get how the HK forecasts for a date (YYYYMMDD) were revised across issues.",
+    )
+    def get_forecast_revisions(
+        forecast_date: str, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_forecast_revisions(forecast_date), fields)
 
 
 def _get_9_day_weather_forecast(lang: str = "en") -> Dict[str, Any]:
@@ -42,9 +64,7 @@ def _get_9_day_weather_forecast(lang: str = "en") -> Dict[str, Any]:
             - seaTemp: Sea temperature info
             - soilTemp: List of soil temperature info
     """
-    base_url = "https://data.weather.gov.hk/weatherAPI/opendata/weather.php"
-    url = f"{base_url}?dataType=fnd&lang={lang}"
-    data = fetch_json_data(url)
+    data = thaw(FEED_REGISTRY.get("fnd", lang, fetch_json_data))
 
     # Structure the output
     forecast = {
@@ -89,8 +109,7 @@ def _get_local_weather_forecast(lang: str = "en") -> Dict[str, Any]:
             - forecastPeriod: Forecast period
             - forecastDate: Forecast date
     """
-    url = f"https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=flw&lang={lang}"
-    data = fetch_json_data(url)
+    data = thaw(FEED_REGISTRY.get("flw", lang, fetch_json_data))
     return {
         "generalSituation": data.get("generalSituation", ""),
         "forecastDesc": data.get("forecastDesc", ""),
@@ -99,3 +118,83 @@ def _get_local_weather_forecast(lang: str = "en") -> Dict[str, Any]:
         "forecastPeriod": data.get("forecastPeriod", ""),
         "forecastDate": data.get("forecastDate", ""),
     }
+
+
+def _get_forecast_revisions(forecast_date: str) -> Dict[str, Any]:
+    """
+    Get how the forecasts for a date changed from issue to issue.
+
+    The current 9-day and local forecasts are recorded first; earlier issues
+    come from the forecast store, so no past issue is fetched again.
+
+    Args:
+        forecast_date: Date in YYYYMMDD format
+
+    Returns:
+        Dict containing:
+            - forecastDate: The date
+            - nineDayForecast: List of {updateTime, forecast, changes} of the
+              9-day forecast issues that first included the date or changed
+              its forecast, oldest first. changes maps each changed field to
+              {from, to} and is empty for the first issue.
+            - localForecast: List of {updateTime, forecastPeriod,
+              forecastDesc, outlook, changes} of the local forecasts issued on
+              the date or the day before, oldest first
+            - issuesStored: Number of stored issues of each forecast
+        or an error if the date is invalid or no stored issue covers it
+    """
+    try:
+        day = datetime.strptime(forecast_date, "%Y%m%d")
+    except (TypeError, ValueError):
+        return {"error": f"Invalid forecast_date '{forecast_date}'. Use YYYYMMDD format."}
+
+    for data_type in ("fnd", "flw"):
+        FORECAST_STORE.record(
+            data_type, FEED_REGISTRY.get(data_type, FORECAST_LANG, fetch_json_data)
+        )
+    nine_day_issues = FORECAST_STORE.issues("fnd")
+    local_issues = FORECAST_STORE.issues("flw")
+
+    nine_day = []
+    previous = None
+    for update_time, issue in nine_day_issues:
+        forecast = issue["days"].get(forecast_date)
+        if forecast is None or forecast == previous:
+            continue
+        nine_day.append(
+            {
+                "updateTime": update_time,
+                "forecast": forecast,
+                "changes": diff_forecasts(previous, forecast),
+            }
+        )
+        previous = forecast
+
+    issue_dates = {forecast_date, (day - timedelta(days=1)).strftime("%Y%m%d")}
+    local = []
+    previous = None
+    for update_time, issue in local_issues:
+        if issue_date(update_time) not in issue_dates:
+            continue
+        local.append(
+            {
+                "updateTime": update_time,
+                "forecastPeriod": issue.get("forecastPeriod", ""),
+                "forecastDesc": issue.get("forecastDesc", ""),
+                "outlook": issue.get("outlook", ""),
+                "changes": diff_forecasts(previous, issue),
+            }
+        )
+        previous = issue
+
+    if not nine_day and not local:
+        return {
+            "error": f"No stored forecast covers {forecast_date}. "
+            "Forecasts are recorded from when the server first runs."
+        }
+    return {
+        "forecastDate": forecast_date,
+        "nineDayForecast": nine_day,
+        "localForecast": local,
+        "issuesStored": {"fnd": len(nine_day_issues), "flw": len(local_issues)},
+    }
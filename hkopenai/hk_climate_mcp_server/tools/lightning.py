@@ -2,36 +2,75 @@
 Lightning Data Tools - Functions for fetching lightning data from HKO.
 
 This module provides tools to retrieve lightning data including cloud-to-ground
-and cloud-to-cloud lightning counts from the Hong Kong Observatory API.
+and cloud-to-cloud lightning counts from the Hong Kong Observatory API, and the
+recent history of the counts per region.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..feeds import FEED_REGISTRY
+from ..frozen import thaw
+from ..history import LIGHTNING_HISTORY, get_history
+from ..json_codec import fetch_json_data
+from ..passthrough import RawJson, fetch_raw_json, raw_result
+from ..projection import Fields, project
 
 
 def register(mcp: FastMCP):
-    """Registers the lightning data tool with the FastMCP server."""
+    """Registers the lightning data tools with the FastMCP server."""
 
     @mcp.tool(
         description="Get cloud-to-ground and cloud-to-cloud lightning count data",
+        output_schema=None,
+    )
+    def get_lightning_data(lang: str = "en", fields: Fields = None) -> Dict[str, Any]:
+        return raw_result(project(_get_lightning_data(lang, raw=not fields), fields))
+
+    @mcp.tool(
+        description="Get lightning counts of a region over the last hours (up to 24), "
+        "with their min, max and trend",
     )
-    def get_lightning_data(lang: str = "en") -> Dict[str, Any]:
-        return _get_lightning_data(lang)
+    def get_lightning_history(
+        region: str, hours: int = 6, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_lightning_history(region, hours), fields)
 
 
-def _get_lightning_data(lang: str = "en") -> Dict[str, Any]:
+def _get_lightning_data(
+    lang: str = "en", raw: bool = False
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get cloud-to-ground and cloud-to-cloud lightning count data.
 
     Args:
         lang: Language code (en/tc/sc, default: en)
+        raw: Whether to return the document as the bytes HKO sent
 
     Returns:
-        Dict containing lightning data with fields and data arrays
+        Dict containing lightning data with fields and data arrays, or the
+        same document as RawJson
     """
-    url = (
-        f"https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
-        f"?dataType=LHL&lang={lang}&rformat=json"
-    )
-    return fetch_json_data(url)
+    if raw:
+        return thaw(FEED_REGISTRY.get_raw("LHL", lang, fetch_raw_json))
+    return thaw(FEED_REGISTRY.get("LHL", lang, fetch_json_data))
+
+
+def _get_lightning_history(region: str, hours: int = 6) -> Dict[str, Any]:
+    """
+    Get the recent lightning counts of a region.
+
+    Counts are recorded every time the lightning feed is polled and kept for
+    24 hours.
+
+    Args:
+        region: Region name in English, e.g. 'Hong Kong Island'; every
+                lightning type recorded for the region is returned
+        hours: Number of hours back from now (1-24, default: 6)
+
+    Returns:
+        Dict containing hours and series, one per lightning type of the
+        region, each with name, unit, samples ({time, value}), min, max and
+        trend (perHour and direction), or an error message
+    """
+    return get_history(LIGHTNING_HISTORY, "LHL", region, hours, fetch_json_data)
@@ -5,125 +5,26 @@ This module provides tools to retrieve radiation data including weather
 and radiation level reports from the Hong Kong Observatory API.
 """
 
-from datetime import datetime
-from typing import Dict, Any, Optional, Annotated
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Annotated, Mapping
 from pydantic import Field
 
-from hkopenai_common.json_utils import fetch_json_data
 from fastmcp import FastMCP
 
-# Station names in different languages: en (English), tc (Traditional Chinese),
-# sc (Simplified Chinese)
-VALID_STATIONS = {
-    "en": {
-        "CCH": "Cheung Chau",
-        "CLK": "Chek Lap Kok",
-        "EPC": "Ping Chau",
-        "HKO": "Hong Kong Observatory",
-        "HKP": "Hong Kong Park",
-        "HKS": "Wong Chuk Hang",
-        "HPV": "Happy Valley",
-        "JKB": "Tseung Kwan O",
-        "KAT": "Kat O",
-        "KLT": "Kowloon City",
-        "KP": "Kings Park",
-        "KTG": "Kwun Tong",
-        "LFS": "Lau Fau Shan",
-        "PLC": "Tai Mei Tuk",
-        "SE1": "Kai Tak Runway Park",
-        "SEK": "Shek Kong",
-        "SHA": "Sha Tin",
-        "SKG": "Sai Kung",
-        "SKW": "Shau Kei Wan",
-        "SSP": "Sham Shui Po",
-        "STK": "Sha Tau Kok",
-        "STY": "Stanley",
-        "SWH": "Sai Wan Ho",
-        "TAP": "Tap Mun",
-        "TBT": "Tsim Bei Tsui",
-        "TKL": "Ta Kwu Ling",
-        "TUN": "Tuen Mun",
-        "TW": "Tsuen Wan Shing Mun Valley",
-        "TWN": "Tsuen Wan Ho Koon",
-        "TY1": "Tsing Yi",
-        "WTS": "Wong Tai Sin",
-        "YCT": "Tai Po",
-        "YLP": "Yuen Long Park",
-        "YNF": "Yuen Ng Fan",
-    },
-    "tc": {
-        "CCH": "長洲",
-        "CLK": "赤鱲角",
-        "EPC": "平洲",
-        "HKO": "香港天文台",
-        "HKP": "香港公園",
-        "HKS": "黃竹坑",
-        "HPV": "跑馬地",
-        "JKB": "將軍澳",
-        "KAT": "吉澳",
-        "KLT": "九龍城",
-        "KP": "京士柏",
-        "KTG": "觀塘",
-        "LFS": "流浮山",
-        "PLC": "大美督",
-        "SE1": "啟德跑道公園",
-        "SEK": "石崗",
-        "SHA": "沙田",
-        "SKG": "西貢",
-        "SKW": "筲箕灣",
-        "SSP": "深水埗",
-        "STK": "沙頭角",
-        "STY": "赤柱",
-        "SWH": "西灣河",
-        "TAP": "塔門",
-        "TBT": "尖鼻咀",
-        "TKL": "打鼓嶺",
-        "TUN": "屯門",
-        "TW": "荃灣城門谷",
-        "TWN": "荃灣可觀",
-        "TY1": "青衣",
-        "WTS": "黃大仙",
-        "YCT": "大埔",
-        "YLP": "元朗公園",
-        "YNF": "元五墳",
-    },
-    "sc": {
-        "CCH": "长洲",
-        "CLK": "赤鱲角",
-        "EPC": "平洲",
-        "HKO": "香港天文台",
-        "HKP": "香港公园",
-        "HKS": "黄竹坑",
-        "HPV": "跑马地",
-        "JKB": "将军澳",
-        "KAT": "吉澳",
-        "KLT": "九龙城",
-        "KP": "京士柏",
-        "KTG": "观塘",
-        "LFS": "流浮山",
-        "PLC": "大美督",
-        "SE1": "启德跑道公园",
-        "SEK": "石岗",
-        "SHA": "沙田",
-        "SKG": "西贡",
-        "SKW": "筲箕湾",
-        "SSP": "深水埗",
-        "STK": "沙头角",
-        "STY": "赤柱",
-        "SWH": "西湾河",
-        "TAP": "塔门",
-        "TBT": "尖鼻咀",
-        "TKL": "打鼓岭",
-        "TUN": "屯门",
-        "TW": "荃湾城门谷",
-        "TWN": "荃湾可观",
-        "TY1": "青衣",
-        "WTS": "黄大仙",
-        "YCT": "大埔",
-        "YLP": "元朗公园",
-        "YNF": "元五坟",
-    },
-}
+from ..cache import PersistentCache
+from ..json_codec import fetch_json_data
+from ..projection import Fields, project
+from ..radiation_store import RADIATION_STORE
+from ..ratelimit import HKO_RATE_LIMITER
+from ..stations import VALID_STATIONS
+
+# Limits for the batch radiation report tool
+MAX_BATCH_DAYS = 31
+MAX_BATCH_WORKERS = 4
+
+# Reports for past dates are final, so they are cached permanently
+_REPORT_CACHE = PersistentCache("radiation")
 
 
 def register(mcp: FastMCP):
@@ -138,16 +39,71 @@ def register(mcp: FastMCP):
         ],
         station: Annotated[str, Field(description="Station code, e.g., HKO")],
         lang: Annotated[Optional[str], Field(description="Language (en/tc/sc)")] = "en",
+        fields: Fields = None,
+    ) -> Dict[str, Any]:
+        return project(
+            _get_weather_radiation_report(
+                date=date, station=station, lang=lang or "en"
+            ),
+            fields,
+        )
+
+    @mcp.tool(
+        description="Get weather, radiation reports for HK over a date range (YYYYMMDD) "
+        "for several stations.",
+    )
+    def get_weather_radiation_reports(
+        start_date: Annotated[
+            str, Field(description="Start date in yyyyMMdd format, e.g., 20250601")
+        ],
+        end_date: Annotated[
+            str, Field(description="End date in yyyyMMdd format, e.g., 20250630")
+        ],
+        stations: Annotated[
+            Optional[List[str]],
+            Field(description="Station codes, e.g., ['HKO', 'CCH']. Omit for all"),
+        ] = None,
+        lang: Annotated[Optional[str], Field(description="Language (en/tc/sc)")] = "en",
+        fields: Fields = None,
+    ) -> Dict[str, Any]:
+        return project(
+            _get_weather_radiation_reports(
+                start_date=start_date,
+                end_date=end_date,
+                stations=stations,
+                lang=lang or "en",
+            ),
+            fields,
+        )
+
+    @mcp.tool(
+        description="Get min/max/mean radiation and temperature for a HK station over a "
+        "date range (YYYYMMDD) from previously retrieved reports.",
+    )
+    def get_radiation_statistics(
+        station: Annotated[str, Field(description="Station code, e.g., HKO")],
+        start_date: Annotated[
+            str, Field(description="Start date in yyyyMMdd format, e.g., 20250601")
+        ],
+        end_date: Annotated[
+            str, Field(description="End date in yyyyMMdd format, e.g., 20250630")
+        ],
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_weather_radiation_report(
-            date=date, station=station, lang=lang or "en"
+        return project(
+            _get_radiation_statistics(
+                station=station, start_date=start_date, end_date=end_date
+            ),
+            fields,
         )
 
     @mcp.tool(
         description="Get list of weather station codes and names for radiation reports in HK.",
     )
-    def get_radiation_station_codes(lang: str = "en") -> Dict[str, str]:
-        return _get_radiation_station_codes(lang=lang)
+    def get_radiation_station_codes(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, str]:
+        return project(dict(_get_radiation_station_codes(lang=lang)), fields)
 
 
 def _get_weather_radiation_report(
@@ -185,6 +141,21 @@ def _get_weather_radiation_report(
         }
     if is_date_in_future(date):
         return {"error": "Date must be yesterday or before."}
+    return _fetch_radiation_report(date=date, station=station, lang=lang)
+
+
+def _fetch_radiation_report(date: str, station: str, lang: str) -> Dict[str, Any]:
+    """
+    Fetch a single weather and radiation report from the HKO API.
+
+    Args:
+        date: Validated date in YYYYMMDD format
+        station: Validated station code
+        lang: Language code (en/tc/sc)
+
+    Returns:
+        Dict containing the raw report or an error message
+    """
     params = {
         "dataType": "RYES",
         "lang": lang,
@@ -195,7 +166,9 @@ def _get_weather_radiation_report(
 
     base_url = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
     try:
-        return fetch_json_data(base_url, params=params)
+        report = fetch_json_data(base_url, params=params)
+        RADIATION_STORE.ingest(report, station=station, date=date)
+        return report
     except ValueError as e:
         return {
             "error": f"Failed to parse JSON response from API: {e}. The API might have returned non-JSON data or an empty response."
@@ -204,7 +177,160 @@ def _get_weather_radiation_report(
         return {"error": f"An unexpected error occurred during the API request: {e}."}
 
 
-def _get_radiation_station_codes(lang: str = "en") -> Dict[str, str]:
+def _get_weather_radiation_reports(
+    start_date: str,
+    end_date: str,
+    stations: Optional[List[str]] = None,
+    lang: str = "en",
+) -> Dict[str, Any]:
+    """
+    Get weather and radiation level reports for a range of dates and stations.
+
+    All parameters are validated before any upstream request is made. Reports
+    already held in the persistent cache are served locally; the remaining
+    day/station pairs are fetched concurrently under a shared rate limit.
+
+    Args:
+        start_date: First date in YYYYMMDD format (e.g., 20250601)
+        end_date: Last date in YYYYMMDD format, inclusive (e.g., 20250630)
+        stations: Optional list of station codes. If omitted or empty, all
+                  stations from get_radiation_station_codes are used.
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Dict containing:
+            - startDate / endDate: The requested range
+            - stations: Station codes covered
+            - reports: List of {date, station, report} or {date, station, error}
+              entries ordered by station then date
+            - cachedCount: Number of reports served from the local cache
+            - fetchedCount: Number of reports fetched from HKO
+        or an error message if any parameter is invalid
+    """
+    stations_dict = VALID_STATIONS.get(lang, VALID_STATIONS["en"])
+    codes = list(stations) if stations else list(stations_dict)
+    invalid = [code for code in codes if code not in stations_dict]
+    if invalid:
+        return {
+            "error": f"Invalid station code(s): {', '.join(map(str, invalid))}. "
+            "Use 'get_radiation_station_codes' for codes."
+        }
+    try:
+        start = datetime.strptime(start_date, "%Y%m%d")
+        end = datetime.strptime(end_date, "%Y%m%d")
+    except (TypeError, ValueError):
+        return {
+            "error": "Invalid date format. Dates must be in YYYYMMDD format (e.g., 20250618)"
+        }
+    if end < start:
+        return {"error": "end_date must not be earlier than start_date."}
+    if is_date_in_future(end_date):
+        return {"error": "Dates must be yesterday or before."}
+    day_count = (end - start).days + 1
+    if day_count > MAX_BATCH_DAYS:
+        return {
+            "error": f"Date range spans {day_count} days; at most {MAX_BATCH_DAYS} "
+            "days can be requested at once. Split the range into smaller batches."
+        }
+
+    dates = [
+        (start + timedelta(days=offset)).strftime("%Y%m%d")
+        for offset in range(day_count)
+    ]
+    pairs = [(station, date) for station in dict.fromkeys(codes) for date in dates]
+
+    reports: Dict[tuple, Dict[str, Any]] = {}
+    missing = []
+    for station, date in pairs:
+        cached = _REPORT_CACHE.get(f"{lang}_{station}_{date}")
+        if cached is None:
+            missing.append((station, date))
+        else:
+            reports[(station, date)] = cached
+            RADIATION_STORE.ingest(cached, station=station, date=date)
+
+    def fetch(pair: tuple) -> Dict[str, Any]:
+        station, date = pair
+        HKO_RATE_LIMITER.acquire()
+        return _fetch_radiation_report(date=date, station=station, lang=lang)
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=MAX_BATCH_WORKERS) as executor:
+            for pair, report in zip(missing, executor.map(fetch, missing)):
+                reports[pair] = report
+                if report and "error" not in report:
+                    _REPORT_CACHE.put(f"{lang}_{pair[0]}_{pair[1]}", report)
+
+    entries = []
+    for station, date in pairs:
+        report = reports[(station, date)]
+        if report and "error" not in report:
+            entries.append({"date": date, "station": station, "report": report})
+        else:
+            entries.append(
+                {
+                    "date": date,
+                    "station": station,
+                    "error": (report or {}).get("error", "No report available."),
+                }
+            )
+
+    return {
+        "startDate": start_date,
+        "endDate": end_date,
+        "stations": list(dict.fromkeys(codes)),
+        "reports": entries,
+        "cachedCount": len(pairs) - len(missing),
+        "fetchedCount": len(missing),
+    }
+
+
+def _get_radiation_statistics(
+    station: str, start_date: str, end_date: str
+) -> Dict[str, Any]:
+    """
+    Get radiation and temperature statistics for a station over a date range.
+
+    Statistics are computed from reports already retrieved by
+    get_weather_radiation_report or get_weather_radiation_reports; no request
+    is made to the HKO API.
+
+    Args:
+        station: Station code (e.g. 'HKO' for Hong Kong Observatory)
+        start_date: First date in YYYYMMDD format
+        end_date: Last date in YYYYMMDD format, inclusive
+
+    Returns:
+        Dict containing the number of days with stored reports and min/max/mean
+        of microsieverts, maxTemp and minTemp, or an error message
+    """
+    if not station or station not in VALID_STATIONS["en"]:
+        return {
+            "error": "Invalid or missing station code. "
+            "Use 'get_radiation_station_codes' for codes."
+        }
+    try:
+        start = int(datetime.strptime(start_date, "%Y%m%d").strftime("%Y%m%d"))
+        end = int(datetime.strptime(end_date, "%Y%m%d").strftime("%Y%m%d"))
+    except (TypeError, ValueError):
+        return {
+            "error": "Invalid date format. Dates must be in YYYYMMDD format (e.g., 20250618)"
+        }
+    if end < start:
+        return {"error": "end_date must not be earlier than start_date."}
+
+    stats = RADIATION_STORE.statistics(station, start, end)
+    result = {"station": station, "startDate": start_date, "endDate": end_date}
+    result.update(stats)
+    if not stats["days"]:
+        result["error"] = (
+            "No reports stored for this station and range. Retrieve them first "
+            "with 'get_weather_radiation_reports'."
+        )
+    return result
+
+
+def _get_radiation_station_codes(lang: str = "en") -> Mapping[str, str]:
     """
     Get a dictionary of station codes and their corresponding names for weather and radiation reports in Hong Kong used in radiation API.
 
@@ -212,7 +338,7 @@ def _get_radiation_station_codes(lang: str = "en") -> Dict[str, str]:
         lang: Language code (en/tc/sc, default: en)
 
     Returns:
-        Dict mapping station codes to station names in the specified language.
+        Read-only mapping of station codes to station names in the specified language.
     """
     # Return the dictionary for the specified language, default to English
     return VALID_STATIONS.get(lang, VALID_STATIONS["en"])
@@ -0,0 +1,127 @@
+"""
+Row Streaming Tools - Stream large HKO tables to the client in chunks.
+
+This module provides a tool that sends the rows of a large tide or daily
+temperature table as MCP progress notifications, one bounded chunk at a time.
+Chunks are pages of the table cached for paging, produced one after the other,
+so the server holds a single chunk of output at a time whatever the size of
+the table. The table itself is held whole in the series cache while it is
+streamed, within that cache's memory budget.
+"""
+
+import asyncio
+import inspect
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from fastmcp import Context, FastMCP
+
+from . import temperature
+from . import tides
+from ..json_codec import dumps
+from ..pagination import MAX_PAGE_SIZE, iter_pages
+
+# Rows per chunk unless the caller asks otherwise
+DEFAULT_CHUNK_SIZE = 500
+
+# Tool name -> module and name of the function implementing it; each takes
+# page_size and cursor arguments
+STREAM_TOOLS: Dict[str, Tuple[ModuleType, str]] = {
+    "get_hourly_tides": (tides, "_get_hourly_tides"),
+    "get_high_low_tides": (tides, "_get_high_low_tides"),
+    "get_daily_mean_temperature": (temperature, "_get_daily_mean_temperature"),
+    "get_daily_max_temperature": (temperature, "_get_daily_max_temperature"),
+    "get_daily_min_temperature": (temperature, "_get_daily_min_temperature"),
+}
+
+
+def register(mcp: FastMCP):
+    """Registers the row streaming tool with the FastMCP server."""
+
+    @mcp.tool(
+        description="Stream the rows of a large HK tide or daily temperature table in "
+        "chunks, sent as progress notifications. Needs a progress token; otherwise "
+        "page through the tool's results with page_size and cursor.",
+    )
+    async def stream_tool_rows(
+        tool: str,
+        args: Dict[str, Any],
+        ctx: Context,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        meta = ctx.request_context.meta
+        if meta is None or meta.progressToken is None:
+            return {
+                "error": "Streaming sends rows as progress notifications, but the "
+                "request has no progress token. Call the tool with page_size and "
+                "cursor instead."
+            }
+        return await _stream_tool_rows(tool, args, chunk_size, ctx.report_progress)
+
+
+async def _stream_tool_rows(
+    tool: str,
+    args: Dict[str, Any],
+    chunk_size: int,
+    report: Callable[[float, Optional[float], Optional[str]], Awaitable[None]],
+) -> Dict[str, Any]:
+    """
+    Send the rows of a table in chunks.
+
+    Args:
+        tool: Name of a tool in STREAM_TOOLS
+        args: Arguments of the tool; tide tools also accept month, day, hour
+              and lang directly instead of in options
+        chunk_size: Rows per chunk (1 to MAX_PAGE_SIZE)
+        report: Function sending a progress notification (progress, total,
+                message); each message is a JSON {offset, fields, data} chunk
+
+    Returns:
+        Dict containing tool, fields, rows (rows sent) and chunks, or an error
+        message; rows already sent before an error are given in rows
+    """
+    if tool not in STREAM_TOOLS:
+        return {
+            "error": f"Tool '{tool}' cannot be streamed. "
+            f"Streamable tools: {', '.join(STREAM_TOOLS)}."
+        }
+    if not isinstance(args, dict):
+        return {"error": "Args must be a dict of the tool's arguments."}
+    args = dict(args)
+    options = args.pop("options", None)
+    if isinstance(options, dict):
+        args = {**options, **args}
+    for name in ("page_size", "cursor"):
+        args.pop(name, None)
+    module, function_name = STREAM_TOOLS[tool]
+    function = getattr(module, function_name)
+    try:
+        inspect.signature(function).bind(**args)
+    except TypeError as e:
+        return {"error": f"Invalid arguments for {tool}: {e}"}
+    if not isinstance(chunk_size, int) or not 1 <= chunk_size <= MAX_PAGE_SIZE:
+        return {
+            "error": f"Invalid chunk_size {chunk_size}. Use 1 to {MAX_PAGE_SIZE} rows."
+        }
+
+    pages = iter_pages(
+        lambda cursor: function(**args, page_size=chunk_size, cursor=cursor)
+    )
+    fields = None
+    rows = chunks = 0
+    while True:
+        # Fetching the table on the first page blocks, so pages are taken in a thread
+        page = await asyncio.to_thread(next, pages, None)
+        if page is None:
+            break
+        if not isinstance(page, dict) or "error" in page:
+            error = page.get("error") if isinstance(page, dict) else "No data returned."
+            return {"tool": tool, "error": error, "rows": rows}
+        fields = page.get("fields")
+        rows += len(page["data"])
+        chunks += 1
+        await report(
+            rows,
+            page["total"],
+            dumps({"offset": page["offset"], "fields": fields, "data": page["data"]}),
+        )
+    return {"tool": tool, "fields": fields, "rows": rows, "chunks": chunks}
@@ -5,9 +5,14 @@ This module provides tools to retrieve temperature data including daily mean,
 maximum, and minimum temperatures from the Hong Kong Observatory API.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Mapping, Union
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..passthrough import RawJson, raw_result
+from ..projection import Fields, project
+from ..stations import VALID_TEMPERATURE_STATIONS
+from ..tables import get_table
+from ..validation import validate_request
 
 
 def register(mcp: FastMCP):
@@ -15,66 +20,129 @@ def register(mcp: FastMCP):
 
     @mcp.tool(
         description="Get daily mean temperature data for a specific station in Hong Kong",
+        output_schema=None,
     )
     def get_daily_mean_temperature(
         station: str,
         year: Optional[int] = None,
         month: Optional[int] = None,
         lang: str = "en",
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_daily_mean_temperature(
-            station=station, year=year, month=month, lang=lang
+        return raw_result(
+            project(
+                _get_daily_mean_temperature(
+                    station=station,
+                    year=year,
+                    month=month,
+                    lang=lang,
+                    page_size=page_size,
+                    cursor=cursor,
+                    raw=not fields,
+                ),
+                fields,
+            )
         )
 
     @mcp.tool(
         description="Get daily maximum temperature data for a specific station in Hong Kong",
+        output_schema=None,
     )
     def get_daily_max_temperature(
         station: str,
         year: Optional[int] = None,
         month: Optional[int] = None,
         lang: str = "en",
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_daily_max_temperature(
-            station=station, year=year, month=month, lang=lang
+        return raw_result(
+            project(
+                _get_daily_max_temperature(
+                    station=station,
+                    year=year,
+                    month=month,
+                    lang=lang,
+                    page_size=page_size,
+                    cursor=cursor,
+                    raw=not fields,
+                ),
+                fields,
+            )
         )
 
     @mcp.tool(
         description="Get daily minimum temperature data for a specific station in Hong Kong",
+        output_schema=None,
     )
     def get_daily_min_temperature(
         station: str,
         year: Optional[int] = None,
         month: Optional[int] = None,
         lang: str = "en",
+        page_size: Optional[int] = None,
+        cursor: Optional[str] = None,
+        fields: Fields = None,
     ) -> Dict[str, Any]:
-        return _get_daily_min_temperature(
-            station=station, year=year, month=month, lang=lang
+        return raw_result(
+            project(
+                _get_daily_min_temperature(
+                    station=station,
+                    year=year,
+                    month=month,
+                    lang=lang,
+                    page_size=page_size,
+                    cursor=cursor,
+                    raw=not fields,
+                ),
+                fields,
+            )
         )
 
+    @mcp.tool(
+        description="Get list of station codes and names for daily temperature data in HK.",
+    )
+    def get_temperature_station_codes(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, str]:
+        return project(dict(_get_temperature_station_codes(lang)), fields)
+
 
 def _get_daily_mean_temperature(
     station: str,
     year: Optional[int] = None,
     month: Optional[int] = None,
     lang: str = "en",
-) -> Dict[str, Any]:
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    raw: bool = False,
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get daily mean temperature data for a specific station.
 
     Args:
         station: Station code (e.g. 'HKO' for Hong Kong Observatory)
-        year: Optional year (varies by station)
+        year: Optional year (varies by station, see get_dataset_catalog)
         month: Optional month (1-12)
         lang: Language code (en/tc/sc, default: en)
+        page_size: Optional rows per page; pages are returned with a nextCursor
+        cursor: Optional nextCursor of the previous page
+        raw: Whether to return an unpaged document as the bytes HKO sent
 
     Returns:
-        Dict containing temperature data with fields and data arrays
+        Dict containing temperature data with fields and data arrays, the same
+        document as RawJson, or an error message if the request is invalid
     """
+    error = validate_request(
+        "CLMTEMP", station=station, year=year, month=month, lang=lang
+    )
+    if error:
+        return error
     params = {
-        "dataType": "CLMTEMP",
         "lang": lang,
-        "rformat": "json",
         "station": station,
     }
     if year:
@@ -82,9 +150,7 @@ def _get_daily_mean_temperature(
     if month:
         params["month"] = str(month)
 
-    return fetch_json_data(
-        "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php", params=params
-    )
+    return get_table("CLMTEMP", params, page_size, cursor, raw)
 
 
 def _get_daily_max_temperature(
@@ -92,23 +158,33 @@ def _get_daily_max_temperature(
     year: Optional[int] = None,
     month: Optional[int] = None,
     lang: str = "en",
-) -> Dict[str, Any]:
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    raw: bool = False,
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get daily maximum temperature data for a specific station.
 
     Args:
         station: Station code (e.g. 'HKO' for Hong Kong Observatory)
-        year: Optional year (varies by station)
+        year: Optional year (varies by station, see get_dataset_catalog)
         month: Optional month (1-12)
         lang: Language code (en/tc/sc, default: en)
+        page_size: Optional rows per page; pages are returned with a nextCursor
+        cursor: Optional nextCursor of the previous page
+        raw: Whether to return an unpaged document as the bytes HKO sent
 
     Returns:
-        Dict containing temperature data with fields and data arrays
+        Dict containing temperature data with fields and data arrays, the same
+        document as RawJson, or an error message if the request is invalid
     """
+    error = validate_request(
+        "CLMMAXT", station=station, year=year, month=month, lang=lang
+    )
+    if error:
+        return error
     params = {
-        "dataType": "CLMMAXT",
         "lang": lang,
-        "rformat": "json",
         "station": station,
     }
     if year:
@@ -116,9 +192,7 @@ def _get_daily_max_temperature(
     if month:
         params["month"] = str(month)
 
-    return fetch_json_data(
-        "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php", params=params
-    )
+    return get_table("CLMMAXT", params, page_size, cursor, raw)
 
 
 def _get_daily_min_temperature(
@@ -126,23 +200,33 @@ def _get_daily_min_temperature(
     year: Optional[int] = None,
     month: Optional[int] = None,
     lang: str = "en",
-) -> Dict[str, Any]:
+    page_size: Optional[int] = None,
+    cursor: Optional[str] = None,
+    raw: bool = False,
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get daily minimum temperature data for a specific station.
 
     Args:
         station: Station code (e.g. 'HKO' for Hong Kong Observatory)
-        year: Optional year (varies by station)
+        year: Optional year (varies by station, see get_dataset_catalog)
         month: Optional month (1-12)
         lang: Language code (en/tc/sc, default: en)
+        page_size: Optional rows per page; pages are returned with a nextCursor
+        cursor: Optional nextCursor of the previous page
+        raw: Whether to return an unpaged document as the bytes HKO sent
 
     Returns:
-        Dict containing temperature data with fields and data arrays
+        Dict containing temperature data with fields and data arrays, the same
+        document as RawJson, or an error message if the request is invalid
     """
+    error = validate_request(
+        "CLMMINT", station=station, year=year, month=month, lang=lang
+    )
+    if error:
+        return error
     params = {
-        "dataType": "CLMMINT",
         "lang": lang,
-        "rformat": "json",
         "station": station,
     }
     if year:
@@ -150,6 +234,18 @@ def _get_daily_min_temperature(
     if month:
         params["month"] = str(month)
 
-    return fetch_json_data(
-        "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php", params=params
-    )
+    return get_table("CLMMINT", params, page_size, cursor, raw)
+
+
+def _get_temperature_station_codes(lang: str = "en") -> Mapping[str, str]:
+    """
+    Get a dictionary of station codes and their corresponding names for daily temperature data.
+
+    Args:
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Read-only mapping of station codes to station names in the specified language.
+    """
+    # Return the dictionary for the specified language, default to English
+    return VALID_TEMPERATURE_STATIONS.get(lang, VALID_TEMPERATURE_STATIONS["en"])
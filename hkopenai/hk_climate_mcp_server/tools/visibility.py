@@ -1,42 +1,84 @@
 """
 Visibility Data Tools - Functions for fetching visibility data from HKO.
 
-This module provides tools to retrieve visibility data from the Hong Kong Observatory API.
+This module provides tools to retrieve visibility data from the Hong Kong Observatory API,
+and the recent history of visibility per station.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..feeds import FEED_REGISTRY
+from ..frozen import thaw
+from ..history import VISIBILITY_HISTORY, get_history
+from ..json_codec import fetch_json_data
+from ..passthrough import RawJson, fetch_raw_json, raw_result
+from ..projection import Fields, project
 
 
 def register(mcp: FastMCP):
-    """Registers the visibility data tool with the FastMCP server."""
+    """Registers the visibility data tools with the FastMCP server."""
 
     @mcp.tool(
         description="Get latest 10-minute mean visibility data for Hong Kong",
+        output_schema=None,
     )
-    def get_visibility(lang: str = "en") -> Dict[str, Any]:
+    def get_visibility(lang: str = "en", fields: Fields = None) -> Dict[str, Any]:
         """
         Get latest 10-minute mean visibility data for Hong Kong.
 
         Args:
             lang: Language code (en/tc/sc, default: en)
+            fields: Optional keys or columns to return, e.g. ['10 minute mean visibility']
 
         Returns:
             Dict containing visibility data with fields and data arrays
         """
-        return _get_visibility(lang=lang)
+        return raw_result(project(_get_visibility(lang=lang, raw=not fields), fields))
+
+    @mcp.tool(
+        description="Get 10-minute mean visibility of a station over the last hours "
+        "(up to 24), with its min, max and trend",
+    )
+    def get_visibility_history(
+        station: str, hours: int = 6, fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_visibility_history(station, hours), fields)
 
 
-def _get_visibility(lang: str = "en") -> Dict[str, Any]:
+def _get_visibility(
+    lang: str = "en", raw: bool = False
+) -> Union[Dict[str, Any], RawJson]:
     """
     Get latest 10-minute mean visibility data for Hong Kong.
 
     Args:
         lang: Language code (en/tc/sc, default: en)
+        raw: Whether to return the document as the bytes HKO sent
+
+    Returns:
+        Dict containing visibility data with fields and data arrays, or the
+        same document as RawJson
+    """
+    if raw:
+        return thaw(FEED_REGISTRY.get_raw("LTMV", lang, fetch_raw_json))
+    return thaw(FEED_REGISTRY.get("LTMV", lang, fetch_json_data))
+
+
+def _get_visibility_history(station: str, hours: int = 6) -> Dict[str, Any]:
+    """
+    Get the recent 10-minute mean visibility of a station.
+
+    Readings are recorded every time the visibility feed is polled and kept
+    for 24 hours.
+
+    Args:
+        station: Station name in English, e.g. 'Central'
+        hours: Number of hours back from now (1-24, default: 6)
 
     Returns:
-        Dict containing visibility data with fields and data arrays
+        Dict containing hours and series with the station's name, unit,
+        samples ({time, value}), min, max and trend (perHour and direction),
+        or an error message
     """
-    url = f"https://data.weather.gov.hk/weatherAPI/opendata/opendata.php?dataType=LTMV&lang={lang}&rformat=json"
-    return fetch_json_data(url)
+    return get_history(VISIBILITY_HISTORY, "LTMV", station, hours, fetch_json_data)
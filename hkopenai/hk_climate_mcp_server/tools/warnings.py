@@ -2,12 +2,19 @@
 Weather Warnings Tools - Functions for fetching weather warning data from HKO.
 
 This module provides tools to retrieve weather warning information from
-the Hong Kong Observatory API.
+the Hong Kong Observatory API, and changes in the warnings in force since a
+client's last check.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastmcp import FastMCP
-from hkopenai_common.json_utils import fetch_json_data
+
+from ..feeds import FEED_REGISTRY
+from ..frozen import thaw
+from ..json_codec import fetch_json_data
+from ..projection import Fields, project
+from ..validation import VALID_LANGUAGES
+from ..warning_tracker import get_warning_tracker
 
 
 def register(mcp: FastMCP):
@@ -16,20 +23,35 @@ def register(mcp: FastMCP):
     @mcp.tool(
         description="Get weather warning summary for HK with messages and update.",
     )
-    def get_weather_warning_summary(lang: str = "en") -> Dict[str, Any]:
-        return _get_weather_warning_summary(lang)
+    def get_weather_warning_summary(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_weather_warning_summary(lang), fields)
 
     @mcp.tool(
         description="Get detailed weather warning info for HK with statement and update.",
     )
-    def get_weather_warning_info(lang: str = "en") -> Dict[str, Any]:
-        return _get_weather_warning_info(lang)
+    def get_weather_warning_info(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_weather_warning_info(lang), fields)
 
     @mcp.tool(
         description="Get special weather tips for Hong Kong including tips list and update.",
     )
-    def get_special_weather_tips(lang: str = "en") -> Dict[str, Any]:
-        return _get_special_weather_tips(lang)
+    def get_special_weather_tips(
+        lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_special_weather_tips(lang), fields)
+
+    @mcp.tool(
+        description="Get HK weather warnings issued, updated or cancelled since a "
+        "version token from a previous call. Omit the token to get all warnings.",
+    )
+    def get_warning_changes(
+        since: Optional[str] = None, lang: str = "en", fields: Fields = None
+    ) -> Dict[str, Any]:
+        return project(_get_warning_changes(since, lang), fields)
 
 
 def _get_weather_warning_summary(lang: str = "en") -> Dict[str, Any]:
@@ -44,8 +66,7 @@ def _get_weather_warning_summary(lang: str = "en") -> Dict[str, Any]:
             - warningMessage: List of warning messages
             - updateTime: Last update time
     """
-    url = f"https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=warnsum&lang={lang}"
-    data = fetch_json_data(url)
+    data = thaw(FEED_REGISTRY.get("warnsum", lang, fetch_json_data))
 
     return {
         "warningMessage": data.get("warningMessage", []),
@@ -65,8 +86,7 @@ def _get_weather_warning_info(lang: str = "en") -> Dict[str, Any]:
             - warningStatement: Warning statement
             - updateTime: Last update time
     """
-    url = f"https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=warningInfo&lang={lang}"
-    data = fetch_json_data(url)
+    data = thaw(FEED_REGISTRY.get("warningInfo", lang, fetch_json_data))
 
     return {
         "warningStatement": data.get("warningStatement", ""),
@@ -86,10 +106,40 @@ def _get_special_weather_tips(lang: str = "en") -> Dict[str, Any]:
             - specialWeatherTips: List of special weather tips
             - updateTime: Last update time
     """
-    url = f"https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=swt&lang={lang}"
-    data = fetch_json_data(url)
+    data = thaw(FEED_REGISTRY.get("swt", lang, fetch_json_data))
 
     return {
         "specialWeatherTips": data.get("specialWeatherTips", []),
         "updateTime": data.get("updateTime", ""),
     }
+
+
+def _get_warning_changes(since: Optional[str] = None, lang: str = "en") -> Dict[str, Any]:
+    """
+    Get changes in the weather warnings in force since a previous call.
+
+    Args:
+        since: Version token returned by a previous call, or None for all
+               warnings in force
+        lang: Language code (en/tc/sc, default: en)
+
+    Returns:
+        Dict containing:
+            - version: Token to pass as since in the next call
+            - changed: Whether anything changed; nothing else is returned
+              when it did not
+            - issued, updated: Warning entries (warnsum fields, warningType
+              and statement lines) issued or changed since the token
+            - cancelled: Warning types no longer in force
+            - reset, active: All warnings in force, instead of the changes,
+              when the token is missing, unknown or too old
+        or an error message if the language is invalid or the warnings were
+        never retrieved
+    """
+    if lang not in VALID_LANGUAGES:
+        return {"error": f"Invalid language '{lang}'. Use one of: en, tc, sc."}
+    tracker = get_warning_tracker(lang)
+    error = tracker.poll(fetch_json_data)
+    if error is not None and tracker.version is None:
+        return error
+    return tracker.changes_since(since)
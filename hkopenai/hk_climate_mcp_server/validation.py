@@ -0,0 +1,311 @@
+"""
+Request Validation - Local checks for HKO API requests.
+
+This module describes each HKO dataset (valid stations, year range and
+parameter limits) so that tools can reject requests that are bound to fail
+before making a network round-trip. Coverage discovered from HKO takes
+precedence over the static year ranges. It also keeps a short-lived negative
+cache of requests for which HKO answered with no data.
+"""
+
+import threading
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, Any, NamedTuple, Optional
+
+from .availability import AVAILABILITY, is_no_data
+from .stations import (
+    VALID_STATIONS,
+    VALID_TEMPERATURE_STATIONS,
+    VALID_TIDE_STATIONS,
+)
+
+VALID_LANGUAGES = ("en", "tc", "sc")
+
+
+class DatasetSpec(NamedTuple):
+    """Static description of the parameters accepted by an HKO dataset."""
+
+    description: str
+    first_year: Optional[int] = None
+    # Fixed last year, or None to use the current year plus years_ahead
+    last_year: Optional[int] = None
+    years_ahead: int = 0
+    stations: Optional[Dict[str, Dict[str, str]]] = None
+    station_tool: str = ""
+    year_required: bool = False
+    has_hour: bool = False
+
+
+DATASETS: Dict[str, DatasetSpec] = {
+    "CLMTEMP": DatasetSpec(
+        "daily mean temperature",
+        first_year=1884,
+        stations=VALID_TEMPERATURE_STATIONS,
+        station_tool="get_temperature_station_codes",
+    ),
+    "CLMMAXT": DatasetSpec(
+        "daily maximum temperature",
+        first_year=1884,
+        stations=VALID_TEMPERATURE_STATIONS,
+        station_tool="get_temperature_station_codes",
+    ),
+    "CLMMINT": DatasetSpec(
+        "daily minimum temperature",
+        first_year=1884,
+        stations=VALID_TEMPERATURE_STATIONS,
+        station_tool="get_temperature_station_codes",
+    ),
+    "HHOT": DatasetSpec(
+        "hourly heights of astronomical tides",
+        first_year=2022,
+        years_ahead=1,
+        stations=VALID_TIDE_STATIONS,
+        station_tool="get_tide_station_codes",
+        year_required=True,
+        has_hour=True,
+    ),
+    "HLT": DatasetSpec(
+        "high and low tides",
+        first_year=2022,
+        years_ahead=1,
+        stations=VALID_TIDE_STATIONS,
+        station_tool="get_tide_station_codes",
+        year_required=True,
+        has_hour=True,
+    ),
+    "SRS": DatasetSpec(
+        "sunrise and sunset times",
+        first_year=2018,
+        years_ahead=1,
+        year_required=True,
+    ),
+    "MRS": DatasetSpec(
+        "moonrise and moonset times",
+        first_year=2018,
+        years_ahead=1,
+        year_required=True,
+    ),
+    "LUNAR": DatasetSpec(
+        "Gregorian-Lunar calendar conversion",
+        first_year=1901,
+        last_year=2100,
+        year_required=True,
+    ),
+    "RYES": DatasetSpec(
+        "weather and radiation level report",
+        stations=VALID_STATIONS,
+        station_tool="get_radiation_station_codes",
+    ),
+}
+
+
+def get_static_year_range(data_type: str) -> tuple:
+    """
+    Get the documented range of years of a dataset.
+
+    Args:
+        data_type: HKO dataType code, e.g. 'HHOT'
+
+    Returns:
+        Tuple of (first_year, last_year); either may be None if unbounded
+    """
+    spec = DATASETS[data_type]
+    if spec.first_year is None:
+        return (None, None)
+    if spec.last_year is not None:
+        return (spec.first_year, spec.last_year)
+    return (spec.first_year, datetime.now().year + spec.years_ahead)
+
+
+def get_year_range(data_type: str, station: Optional[str] = None) -> tuple:
+    """
+    Get the inclusive range of years accepted for a dataset.
+
+    Discovered coverage is used when available. A discovered last year that
+    is recent (the year of discovery or the one before) means the series is
+    ongoing, so the documented upper bound is kept to allow newer data.
+
+    Args:
+        data_type: HKO dataType code, e.g. 'HHOT'
+        station: Station code for per-station datasets
+
+    Returns:
+        Tuple of (first_year, last_year); either may be None if unbounded
+    """
+    static_range = get_static_year_range(data_type)
+    discovered = AVAILABILITY.year_range(data_type, station)
+    if discovered is None or discovered[0] is None:
+        return static_range
+    first_year, last_year = discovered
+    discovered_year = AVAILABILITY.discovered_year(data_type) or last_year
+    if last_year >= discovered_year - 1 and static_range[1] is not None:
+        last_year = max(last_year, static_range[1])
+    return (first_year, last_year)
+
+
+def validate_request(
+    data_type: str,
+    station: Optional[str] = None,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    day: Optional[int] = None,
+    hour: Optional[int] = None,
+    lang: str = "en",
+) -> Optional[Dict[str, str]]:
+    """
+    Check request parameters against the dataset's local description.
+
+    Args:
+        data_type: HKO dataType code, e.g. 'HHOT' or 'CLMTEMP'
+        station: Station code, for datasets that are per station
+        year: Requested year
+        month: Optional month (1-12)
+        day: Optional day (1-31)
+        hour: Optional hour (1-24)
+        lang: Language code (en/tc/sc)
+
+    Returns:
+        None if the request may be sent upstream, otherwise a dict with an
+        error message describing how to correct the request
+    """
+    spec = DATASETS[data_type]
+    if lang not in VALID_LANGUAGES:
+        return {"error": f"Invalid language '{lang}'. Use one of: en, tc, sc."}
+
+    if spec.stations is not None and (
+        not station or station not in spec.stations["en"]
+    ):
+        return {
+            "error": (
+                f"Invalid or missing station code for {spec.description} data. "
+                f"Use the '{spec.station_tool}' tool to retrieve the list of "
+                "valid station codes."
+            )
+        }
+
+    if station and AVAILABILITY.year_range(data_type, station) == (None, None):
+        return {
+            "error": (
+                f"No {spec.description} data is available for station {station}. "
+                "Use the 'get_dataset_catalog' tool to see which stations have data."
+            )
+        }
+
+    if year is None:
+        if spec.year_required:
+            return {"error": f"Year is required for {spec.description} data."}
+    else:
+        first_year, last_year = get_year_range(data_type, station)
+        if (first_year is not None and year < first_year) or (
+            last_year is not None and year > last_year
+        ):
+            where = f" at station {station}" if spec.stations is not None else ""
+            return {
+                "error": (
+                    f"Year {year} is outside the available range for "
+                    f"{spec.description} data{where} ({first_year}-{last_year}). "
+                    "Use the 'get_dataset_catalog' tool to see available years."
+                )
+            }
+
+    if month is not None and not 1 <= month <= 12:
+        return {"error": f"Invalid month {month}. Month must be between 1 and 12."}
+    if day is not None:
+        if month is None:
+            return {"error": "Month is required when day is specified."}
+        try:
+            date(year if year is not None else 2000, month, day)
+        except ValueError:
+            return {"error": f"Invalid day {day} for month {month}."}
+    if hour is not None and (not spec.has_hour or not 1 <= hour <= 24):
+        return {"error": f"Invalid hour {hour}. Hour must be between 1 and 24."}
+    return None
+
+
+class NegativeCache:
+    """Thread-safe TTL cache of requests that HKO answered with no data."""
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 4096):
+        """
+        Args:
+            ttl_seconds: How long a "no data" answer is remembered
+            max_entries: Maximum number of remembered requests
+        """
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(params: Dict[str, Any]) -> tuple:
+        return tuple(sorted((k, str(v)) for k, v in params.items()))
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the remembered "no data" answer for a request.
+
+        Args:
+            params: Query parameters of the request
+
+        Returns:
+            A copy of the remembered answer, or None if there is none
+        """
+        key = self._key(params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, result = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            return dict(result)
+
+    def remember(self, params: Dict[str, Any], result: Any) -> None:
+        """
+        Remember the answer to a request if it is a "no data" answer.
+
+        Only decoded documents and errors are considered; raw documents and
+        compact tables were checked to hold data when they were fetched.
+
+        Args:
+            params: Query parameters of the request
+            result: Value returned by the fetch of the request
+        """
+        if not isinstance(result, dict) or not is_no_data(result):
+            return
+        if not result:
+            result = {"error": "No data available for the requested parameters."}
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[self._key(params)] = (time.monotonic() + self._ttl, result)
+
+    def fetch(self, params: Dict[str, Any], fetch: Callable[[], Any]) -> Any:
+        """
+        Answer a request from the remembered answers, else fetch it.
+
+        Args:
+            params: Query parameters of the request
+            fetch: Function fetching the request from HKO
+
+        Returns:
+            A copy of the remembered "no data" answer, or the fetched answer,
+            which is remembered if it is a "no data" answer
+        """
+        cached = self.get(params)
+        if cached is not None:
+            return cached
+        result = fetch()
+        self.remember(params, result)
+        return result
+
+    def clear(self) -> None:
+        """Forget all remembered answers."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Negative cache shared by all opendata.php tools
+NEGATIVE_CACHE = NegativeCache()
@@ -0,0 +1,200 @@
+"""
+Warning Tracker - Versioned history of HKO weather warning states.
+
+This module combines the warning summary (warnsum) and detailed warning
+information (warningInfo) feeds into one warning state per language, keeps a
+short history of distinct states, and computes what changed between a
+client's last seen version and the current one.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .feeds import FEED_REGISTRY
+from .frozen import freeze, thaw
+from .validation import VALID_LANGUAGES
+
+# Number of past warning states kept for computing changes
+MAX_HISTORY = 64
+
+
+def build_warning_state(
+    warnsum: Mapping[str, Any], warning_info: Mapping[str, Any]
+) -> Any:
+    """
+    Combine warnsum and warningInfo documents into one warning state.
+
+    Args:
+        warnsum: Parsed warnsum document, keyed by warning type
+        warning_info: Parsed warningInfo document
+
+    Returns:
+        Read-only mapping of warning type to the warning's warnsum entry,
+        with its detailed statement lines under 'statement'. Cancelled
+        warnings are not included.
+    """
+    statements = {
+        detail.get("warningStatementCode"): list(detail.get("contents", []))
+        for detail in warning_info.get("details", [])
+        if isinstance(detail, Mapping)
+    }
+    state = {}
+    for warning_type, entry in warnsum.items():
+        if not isinstance(entry, Mapping) or entry.get("actionCode") == "CANCEL":
+            continue
+        state[warning_type] = dict(thaw(entry), statement=statements.get(warning_type, []))
+    return freeze(state)
+
+
+def _entry(state: Mapping[str, Any], warning_type: str) -> Dict[str, Any]:
+    return dict(thaw(state[warning_type]), warningType=warning_type)
+
+
+def diff_warning_states(
+    old: Mapping[str, Any], new: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """
+    Get the changes between two warning states.
+
+    Args:
+        old: Earlier warning state
+        new: Later warning state
+
+    Returns:
+        Dict containing:
+            - issued: Entries of warnings in new but not in old
+            - updated: Entries of warnings in both that differ
+            - cancelled: Warning types in old but not in new
+        Entries carry their warning type (the warnsum key) as 'warningType'.
+    """
+    return {
+        "issued": [_entry(new, k) for k in new if k not in old],
+        "updated": [_entry(new, k) for k in new if k in old and old[k] != new[k]],
+        "cancelled": [k for k in old if k not in new],
+    }
+
+
+class WarningTracker:
+    """Thread-safe versioned history of the warning state of one language."""
+
+    def __init__(self, lang: str, max_history: int = MAX_HISTORY):
+        """
+        Args:
+            lang: Language code of the tracked feeds
+            max_history: Number of past states kept
+        """
+        self.lang = lang
+        # Tokens from another process, e.g. before a restart, are not reused
+        self._epoch = uuid.uuid4().hex[:8]
+        self._max_history = max_history
+        self._history: "OrderedDict[int, Any]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def _token(self, version: int) -> str:
+        return f"{self._epoch}-{version}"
+
+    def _parse_token(self, token: Optional[str]) -> Optional[int]:
+        epoch, _, version = (token or "").partition("-")
+        if epoch != self._epoch or not version.isdigit():
+            return None
+        return int(version)
+
+    @property
+    def version(self) -> Optional[str]:
+        """Token of the current state, or None before the first poll."""
+        with self._lock:
+            return self._token(self._version) if self._history else None
+
+    def update(self, state: Any) -> bool:
+        """
+        Record a warning state as a new version if it differs from the current one.
+
+        Args:
+            state: Warning state from build_warning_state()
+
+        Returns:
+            bool: True if a new version was recorded
+        """
+        with self._lock:
+            if self._history and self._history[self._version] == state:
+                return False
+            self._version += 1
+            self._history[self._version] = state
+            while len(self._history) > self._max_history:
+                self._history.popitem(last=False)
+            return True
+
+    def poll(self, fetch: Callable[[str], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Read the warnsum and warningInfo feeds and record their state.
+
+        The feeds come from the feed registry, so polling more often than
+        their freshness window does not reach HKO.
+
+        Args:
+            fetch: Function fetching a URL, normally fetch_json_data
+
+        Returns:
+            None on success, otherwise the upstream error dict
+        """
+        warnsum = FEED_REGISTRY.get("warnsum", self.lang, fetch)
+        if "error" in warnsum:
+            return warnsum
+        warning_info = FEED_REGISTRY.get("warningInfo", self.lang, fetch)
+        if "error" in warning_info:
+            return warning_info
+        self.update(build_warning_state(warnsum, warning_info))
+        return None
+
+    def changes_since(self, token: Optional[str]) -> Dict[str, Any]:
+        """
+        Get what changed since a client's last seen version.
+
+        Args:
+            token: Version token from a previous response, or None
+
+        Returns:
+            Dict containing the current version token and whether anything
+            changed. Only the token and changed flag are returned when the
+            state is unchanged. When the token is missing, unknown or too
+            old, the full state is returned under 'active' with 'reset' set;
+            otherwise issued, updated and cancelled warnings are returned.
+        """
+        with self._lock:
+            current = self._history[self._version]
+            version = self._token(self._version)
+            since = self._parse_token(token)
+            previous = self._history.get(since) if since is not None else None
+        if previous is not None and previous == current:
+            return {"version": version, "changed": False}
+        if previous is None:
+            active: List[Dict[str, Any]] = [_entry(current, k) for k in current]
+            return {"version": version, "changed": True, "reset": True, "active": active}
+        changes = diff_warning_states(previous, current)
+        return dict({"version": version, "changed": True}, **changes)
+
+
+_TRACKERS: Dict[str, WarningTracker] = {}
+_TRACKERS_LOCK = threading.Lock()
+
+
+def get_warning_tracker(lang: str) -> WarningTracker:
+    """
+    Get the shared warning tracker of a language.
+
+    Raises:
+        ValueError: If the language is not en, tc or sc
+    """
+    if lang not in VALID_LANGUAGES:
+        raise ValueError(f"Invalid language '{lang}'. Use one of: en, tc, sc.")
+    with _TRACKERS_LOCK:
+        return _TRACKERS.setdefault(lang, WarningTracker(lang))
+
+
+def clear_warning_trackers() -> None:
+    """Forget all warning trackers and their history."""
+    with _TRACKERS_LOCK:
+        _TRACKERS.clear()
@@ -0,0 +1,148 @@
+"""
+Benchmark CSV - Compare CSV and JSON ingestion of large HKO tables.
+
+This script downloads a table from opendata.php as both JSON and CSV and
+compares download size, parse time and peak memory of parsing each: JSON with
+json.loads into lists of strings, JSON with the incremental parser into a
+compact table, and CSV with the streaming parser into a compact table. With
+--synthetic ROWS it builds a daily temperature table of that many rows
+instead, for running without network access.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+import tracemalloc
+
+import requests
+
+from hkopenai.hk_climate_mcp_server.csv_table import (
+    STREAM_TIMEOUT,
+    OPENDATA_URL,
+    _decode_lines,
+    parse_csv,
+)
+from hkopenai.hk_climate_mcp_server.json_stream import (
+    _decode_chunks,
+    parse_json_table,
+)
+
+DATASETS = {
+    "CLMTEMP": {"dataType": "CLMTEMP", "station": "HKO"},
+    "HHOT": {"dataType": "HHOT", "station": "CCH", "year": "2025"},
+    "HLT": {"dataType": "HLT", "station": "CCH", "year": "2025"},
+}
+
+
+def download(params, rformat):
+    """Download a table in a format and return the raw bytes."""
+    response = requests.get(
+        OPENDATA_URL,
+        params={**params, "lang": "en", "rformat": rformat},
+        timeout=STREAM_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.content
+
+
+def synthetic(rows):
+    """Build a CLMTEMP-like table of a number of rows as (json, csv) bytes."""
+    data = [
+        [
+            str(1884 + i // 365),
+            f"{i // 31 % 12 + 1:02d}",
+            str(i % 31 + 1),
+            "***" if i % 97 == 0 else f"{15 + i % 170 / 10:.1f}",
+            "C",
+        ]
+        for i in range(rows)
+    ]
+    fields = ["Year", "Month", "Day", "Value", "data Completeness"]
+    text = io.StringIO()
+    text.write('"Daily Mean Temperature (°C) at the Hong Kong Observatory",\n')
+    writer = csv.writer(text, lineterminator="\n")
+    writer.writerow(fields)
+    writer.writerows(data)
+    document = json.dumps({"fields": fields, "data": data}, ensure_ascii=False)
+    return document.encode("utf-8"), text.getvalue().encode("utf-8")
+
+
+def measure(parse, raw, repeat):
+    """Return the best parse time in seconds and the peak memory in bytes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(raw)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = parse(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def parse_json(raw):
+    """Parse a JSON table the way the tools do today."""
+    return json.loads(raw.decode("utf-8-sig"))
+
+
+def parse_json_stream(raw):
+    """Parse a JSON table in 64 KiB chunks, as it arrives from the network."""
+    chunks = (raw[i : i + 65536] for i in range(0, len(raw), 65536))
+    return parse_json_table(_decode_chunks(chunks, "utf-8-sig"))
+
+
+def parse_csv_bytes(raw):
+    """Parse a CSV table in 64 KiB chunks, as it arrives from the network."""
+    chunks = (raw[i : i + 65536] for i in range(0, len(raw), 65536))
+    return parse_csv(_decode_lines(chunks, "utf-8-sig"))
+
+
+def report(name, json_raw, csv_raw, repeat):
+    """Print the comparison of the two formats of a table."""
+    json_time, json_peak = measure(parse_json, json_raw, repeat)
+    stream_time, stream_peak = measure(parse_json_stream, json_raw, repeat)
+    csv_time, csv_peak = measure(parse_csv_bytes, csv_raw, repeat)
+    rows = len(parse_csv_bytes(csv_raw))
+    print(f"{name}: {rows} rows")
+    print(f"  {'':11} {'size KiB':>10} {'parse ms':>10} {'peak KiB':>10}")
+    for label, size, seconds, peak in (
+        ("json", len(json_raw), json_time, json_peak),
+        ("json-stream", len(json_raw), stream_time, stream_peak),
+        ("csv", len(csv_raw), csv_time, csv_peak),
+    ):
+        print(
+            f"  {label:11} {size / 1024:10.1f} "
+            f"{seconds * 1000:10.1f} {peak / 1024:10.1f}"
+        )
+
+
+def main():
+    """Run the benchmark on the datasets given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("datasets", nargs="*", default=list(DATASETS))
+    parser.add_argument("--synthetic", type=int, metavar="ROWS")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.synthetic:
+        report("synthetic CLMTEMP", *synthetic(args.synthetic), args.repeat)
+        return 0
+    for name in args.datasets:
+        params = DATASETS[name]
+        try:
+            json_raw = download(params, "json")
+            csv_raw = download(params, "csv")
+        except requests.exceptions.RequestException as e:
+            print(f"{name}: download failed: {e}", file=sys.stderr)
+            return 1
+        report(name, json_raw, csv_raw, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Benchmark JSON - Compare the JSON codecs on payloads of each tool module.
+
+This script times decoding (loads from the response bytes) and encoding
+(dumps of the tool result) with every available codec, on a representative
+payload for each of the nine data tool modules. Payloads are built locally
+in the shape of HKO's responses; with --live they are fetched from HKO
+instead.
+"""
+
+import argparse
+import sys
+import timeit
+
+import requests
+
+from hkopenai.hk_climate_mcp_server.json_codec import CODECS
+
+WEATHER_URL = "https://data.weather.gov.hk/weatherAPI/opendata/weather.php"
+OPENDATA_URL = "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+RADIATION_URL = "https://data.weather.gov.hk/weatherAPI/opendata/radiation.php"
+
+# Tool module -> URL and query of a representative live payload
+LIVE = {
+    "astronomical": (OPENDATA_URL, {"dataType": "SRS", "year": "2025"}),
+    "current_weather": (WEATHER_URL, {"dataType": "rhrread", "lang": "tc"}),
+    "forecast": (WEATHER_URL, {"dataType": "fnd", "lang": "en"}),
+    "lightning": (OPENDATA_URL, {"dataType": "LHL", "lang": "en"}),
+    "radiation": (RADIATION_URL, {"lang": "en", "rformat": "json"}),
+    "temperature": (OPENDATA_URL, {"dataType": "CLMTEMP", "station": "HKO"}),
+    "tides": (OPENDATA_URL, {"dataType": "HHOT", "station": "CCH", "year": "2025"}),
+    "visibility": (OPENDATA_URL, {"dataType": "LTMV", "lang": "en"}),
+    "warnings": (WEATHER_URL, {"dataType": "warningInfo", "lang": "en"}),
+}
+
+
+def _place_values(places, unit, base):
+    return [
+        {"place": place, "value": base + i % 7, "unit": unit}
+        for i, place in enumerate(places)
+    ]
+
+
+def synthetic_payloads():
+    """Build a payload in the shape of each tool module's HKO response."""
+    places = [f"Station {i}" for i in range(27)]
+    days = [f"202507{d:02d}" for d in range(1, 10)]
+    return {
+        "astronomical": {
+            "fields": ["YYYY-MM-DD", "RISE", "TRAN.", "SET"],
+            "data": [
+                [f"2025-{m:02d}-{d:02d}", "05:39", "12:10", "18:41"]
+                for m in range(1, 13)
+                for d in range(1, 31)
+            ],
+        },
+        "current_weather": {
+            "rainfall": {
+                "data": [
+                    {"unit": "mm", "place": p, "max": 0, "main": "FALSE"}
+                    for p in places[:18]
+                ],
+                "startTime": "2025-06-23T09:45:00+08:00",
+                "endTime": "2025-06-23T10:45:00+08:00",
+            },
+            "icon": [62],
+            "iconUpdateTime": "2025-06-23T06:00:00+08:00",
+            "uvindex": {
+                "data": [{"place": "King's Park", "value": 6, "desc": "high"}],
+                "recordDesc": "During the past hour",
+            },
+            "updateTime": "2025-06-23T11:02:00+08:00",
+            "temperature": {
+                "data": _place_values(places, "C", 27),
+                "recordTime": "2025-06-23T11:00:00+08:00",
+            },
+            "warningMessage": ["The Very Hot Weather Warning is now in force."],
+            "humidity": {
+                "recordTime": "2025-06-23T11:00:00+08:00",
+                "data": _place_values(places[:1], "percent", 78),
+            },
+        },
+        "forecast": {
+            "generalSituation": "An upper-air anticyclone will bring fine weather "
+            "to southern China in the next couple of days. " * 3,
+            "weatherForecast": [
+                {
+                    "forecastDate": day,
+                    "week": "Monday",
+                    "forecastWind": "South force 3 to 4.",
+                    "forecastWeather": "Mainly fine and very hot.",
+                    "forecastMaxtemp": {"value": 33, "unit": "C"},
+                    "forecastMintemp": {"value": 28, "unit": "C"},
+                    "forecastMaxrh": {"value": 90, "unit": "percent"},
+                    "forecastMinrh": {"value": 65, "unit": "percent"},
+                    "ForecastIcon": 90,
+                    "PSR": "Low",
+                }
+                for day in days
+            ],
+            "updateTime": "2025-06-23T11:30:00+08:00",
+            "seaTemp": {
+                "place": "North Point",
+                "value": 28,
+                "unit": "C",
+                "recordTime": "2025-06-23T07:00:00+08:00",
+            },
+        },
+        "lightning": {
+            "fields": ["Date time", "Type", "Region", "Count"],
+            "data": [
+                ["202506231100", t, r, "0"]
+                for t in ("Cloud-to-ground", "Cloud-to-cloud")
+                for r in ("Hong Kong Island", "Kowloon", "New Territories", "Lantau")
+            ],
+        },
+        "radiation": {
+            f"{code}{field}": value
+            for code in ("KP", "TC", "TP", "SK", "KLT", "LFS", "SKG", "TKL", "YL")
+            for field, value in (
+                ("Location", "King's Park"),
+                ("Microsieverts", "0.14"),
+                ("Date", "20250622"),
+                ("Time", "0000-2400"),
+            )
+        },
+        "temperature": {
+            "fields": ["Year", "Month", "Day", "Value", "data Completeness"],
+            "data": [
+                [
+                    str(2015 + i // 365),
+                    f"{i // 31 % 12 + 1:02d}",
+                    str(i % 31 + 1),
+                    f"{15 + i % 170 / 10:.1f}",
+                    "C",
+                ]
+                for i in range(3650)
+            ],
+        },
+        "tides": {
+            "fields": ["MM", "DD"] + [f"{h:02d}" for h in range(1, 25)],
+            "data": [
+                [f"{m:02d}", f"{d:02d}"] + [f"{1 + h % 12 / 10:.2f}" for h in range(24)]
+                for m in range(1, 13)
+                for d in range(1, 31)
+            ],
+        },
+        "visibility": {
+            "fields": [
+                "Date time",
+                "Automatic Weather Station",
+                "10 minute mean visibility",
+            ],
+            "data": [["202506231100", place, "30 km"] for place in places[:8]],
+        },
+        "warnings": {
+            "details": [
+                {
+                    "contents": [
+                        "The Very Hot Weather Warning is now in force. "
+                        "Prolonged heat alert! Please drink sufficient water."
+                    ]
+                    * 4,
+                    "warningStatementCode": code,
+                    "updateTime": "2025-06-23T06:45:00+08:00",
+                }
+                for code in ("WHOT", "WTS", "WFIRE")
+            ]
+        },
+    }
+
+
+def live_payloads():
+    """Fetch a payload for each tool module from HKO, as raw bytes."""
+    payloads = {}
+    for module, (url, params) in LIVE.items():
+        response = requests.get(url, params=params, timeout=30)
+        response.raise_for_status()
+        payloads[module] = response.content.removeprefix(b"\xef\xbb\xbf")
+    return payloads
+
+
+def best_microseconds(function, argument, number):
+    """Return the best time of a call in microseconds."""
+    times = timeit.repeat(lambda: function(argument), number=number, repeat=5)
+    return min(times) / number * 1e6
+
+
+def main():
+    """Print decode and encode times of every codec for every payload."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    stdlib = CODECS["json"]
+    if args.live:
+        try:
+            raw = live_payloads()
+        except requests.exceptions.RequestException as e:
+            print(f"Download failed: {e}", file=sys.stderr)
+            return 1
+    else:
+        raw = {
+            module: stdlib.dumps(payload).encode("utf-8")
+            for module, payload in synthetic_payloads().items()
+        }
+
+    header = f"{'module':16} {'KiB':>7}"
+    for name in CODECS:
+        header += f" {name + ' loads':>13} {name + ' dumps':>13}"
+    print(header + "   (microseconds per call)")
+    for module, data in raw.items():
+        document = stdlib.loads(data)
+        line = f"{module:16} {len(data) / 1024:7.1f}"
+        for codec in CODECS.values():
+            line += f" {best_microseconds(codec.loads, data, args.number):13.1f}"
+            line += f" {best_microseconds(codec.dumps, document, args.number):13.1f}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,7 +38,7 @@ class TestAstronomicalTools(unittest.TestCase):
         ) as mock_get_moon_times:
             decorated_funcs["get_moon_times"](year=2025, month=6, day=30)
             mock_get_moon_times.assert_called_once_with(
-                year=2025, month=6, day=30, lang="en"
+                year=2025, month=6, day=30, lang="en", raw=True
             )
 
         # Test get_sunrise_sunset_times
@@ -47,7 +47,7 @@ class TestAstronomicalTools(unittest.TestCase):
         ) as mock_get_sunrise_sunset_times:
             decorated_funcs["get_sunrise_sunset_times"](year=2025)
             mock_get_sunrise_sunset_times.assert_called_once_with(
-                year=2025, month=None, day=None, lang="en"
+                year=2025, month=None, day=None, lang="en", raw=True
             )
 
         # Test get_gregorian_lunar_calendar
@@ -0,0 +1,136 @@
+"""
+Unit tests for dataset availability discovery.
+
+This module tests probing of HKO datasets for year coverage, persistence of
+the discovered catalog and its use by the validation layer.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from hkopenai.hk_climate_mcp_server.availability import (
+    AvailabilityCatalog,
+    _probe_years,
+)
+from hkopenai.hk_climate_mcp_server.cache import CACHE_DIR_ENV
+from hkopenai.hk_climate_mcp_server.stations import VALID_TIDE_STATIONS
+from hkopenai.hk_climate_mcp_server.validation import get_year_range, validate_request
+
+
+def fake_fetch(url, params=None, encoding="utf-8"):
+    """Simulate HKO: HKO temperature from 1884, tides 2022-2026, CCH has no max temp."""
+    data_type = params["dataType"]
+    if data_type in ("CLMTEMP", "CLMMAXT", "CLMMINT"):
+        if data_type == "CLMMAXT" and params["station"] == "CCH":
+            return {}
+        if data_type == "CLMMINT" and params["station"] == "CCH":
+            return {"error": "Failed to parse JSON response from API."}
+        first = 1884 if params["station"] == "HKO" else 1990
+        return {"fields": ["Year"], "data": [[first, 1, 1, 20.0], [2026, 1, 1, 18.0]]}
+    if 2022 <= params["year"] <= 2026:
+        return {"fields": ["Date"], "data": [["row"]]}
+    return {"fields": [], "data": []}
+
+
+class TestAvailability(unittest.TestCase):
+    """Test case class for availability discovery."""
+
+    def setUp(self):
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {CACHE_DIR_ENV: self._cache_dir.name})
+        self._env.start()
+        self._limiter = patch(
+            "hkopenai.hk_climate_mcp_server.availability.HKO_RATE_LIMITER"
+        )
+        self._limiter.start()
+
+    def tearDown(self):
+        self._limiter.stop()
+        self._env.stop()
+        self._cache_dir.cleanup()
+
+    def test_probe_years(self):
+        """Test finding the contiguous block of years with data."""
+        probed = []
+
+        def has_data(year):
+            probed.append(year)
+            return 2019 <= year <= 2023
+
+        with patch("hkopenai.hk_climate_mcp_server.availability.datetime") as dt:
+            dt.now.return_value.year = 2026
+            self.assertEqual(_probe_years(has_data, 2028), [2019, 2023])
+        self.assertEqual(probed[0], 2026)
+        self.assertIsNone(_probe_years(lambda year: False, 2028))
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.availability.fetch_json_data",
+        side_effect=fake_fetch,
+    )
+    def test_discover_and_persist(self, mock_fetch_json_data):
+        """Test that discovery results are persisted and reloaded."""
+        catalog = AvailabilityCatalog()
+        catalog.discover(["CLMMAXT", "HLT", "SRS"])
+
+        self.assertEqual(catalog.year_range("CLMMAXT", "HKO"), (1884, 2026))
+        self.assertEqual(catalog.year_range("CLMMAXT", "CCH"), (None, None))
+        self.assertEqual(catalog.year_range("HLT", "QUB"), (2022, 2026))
+        self.assertEqual(catalog.year_range("SRS"), (2022, 2026))
+        self.assertIsNone(catalog.year_range("CLMTEMP", "HKO"))
+        self.assertFalse(catalog.is_stale("HLT"))
+        self.assertTrue(catalog.is_stale("HHOT"))
+
+        reloaded = AvailabilityCatalog()
+        self.assertEqual(reloaded.year_range("HLT", "QUB"), (2022, 2026))
+        self.assertEqual(
+            len(reloaded.snapshot()["datasets"]["HLT"]), len(VALID_TIDE_STATIONS["en"])
+        )
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.availability.fetch_json_data",
+        return_value={"error": "Connection error occurred"},
+    )
+    def test_transient_failures_keep_previous_coverage(self, mock_fetch_json_data):
+        """Test that a failed discovery run does not record empty coverage."""
+        catalog = AvailabilityCatalog()
+        catalog.discover(["SRS"])
+        self.assertIsNone(catalog.year_range("SRS"))
+        self.assertTrue(catalog.is_stale("SRS"))
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.availability.fetch_json_data",
+        side_effect=fake_fetch,
+    )
+    def test_unparsed_bodies_are_discovered_again(self, mock_fetch_json_data):
+        """Test that a body that could not be parsed is not recorded as no data."""
+        catalog = AvailabilityCatalog()
+        catalog.discover(["CLMMINT"])
+        self.assertEqual(catalog.year_range("CLMMINT", "HKO"), (1884, 2026))
+        self.assertIsNone(catalog.year_range("CLMMINT", "CCH"))
+        with patch("hkopenai.hk_climate_mcp_server.validation.AVAILABILITY", catalog):
+            self.assertIsNone(validate_request("CLMMINT", station="CCH", year=2020))
+        self.assertTrue(catalog.is_stale("CLMMINT"))
+
+    def test_validation_uses_discovered_coverage(self):
+        """Test that discovered ranges short-circuit requests in validation."""
+        catalog = AvailabilityCatalog()
+        with patch(
+            "hkopenai.hk_climate_mcp_server.availability.fetch_json_data",
+            side_effect=fake_fetch,
+        ):
+            catalog.discover(["CLMMAXT"])
+
+        with patch("hkopenai.hk_climate_mcp_server.validation.AVAILABILITY", catalog):
+            self.assertEqual(get_year_range("CLMMAXT", "SHA")[0], 1990)
+            self.assertIn(
+                "error", validate_request("CLMMAXT", station="SHA", year=1950)
+            )
+            self.assertIsNone(validate_request("CLMMAXT", station="SHA", year=1995))
+            self.assertIn("error", validate_request("CLMMAXT", station="CCH"))
+            # Ongoing series keep the documented upper bound
+            self.assertGreaterEqual(get_year_range("CLMMAXT", "HKO")[1], 2026)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""
+Unit tests for the batch tool.
+
+This module tests that batched calls are dispatched to the tools' functions,
+run with a concurrency cap and return results and errors in request order.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.json_codec import dumps
+from hkopenai.hk_climate_mcp_server.passthrough import RawJson
+from hkopenai.hk_climate_mcp_server.server import server
+from hkopenai.hk_climate_mcp_server.tools.batch import (
+    BATCH_TOOLS,
+    MAX_BATCH_CALLS,
+    MAX_BATCH_WORKERS,
+    register,
+    _run_tool_batch,
+)
+
+
+class TestBatchTools(unittest.TestCase):
+    """Test case class for the batch tool."""
+
+    def test_register_tool(self):
+        """Tests that the batch tool is correctly registered."""
+        mock_mcp = MagicMock()
+        register(mock_mcp)
+        self.assertEqual(mock_mcp.tool.call_count, 1)
+
+        decorated_funcs = {
+            call.args[0].__name__: call.args[0]
+            for call in mock_mcp.tool.return_value.call_args_list
+        }
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.batch._run_tool_batch"
+        ) as mock_run_tool_batch:
+            decorated_funcs["run_tool_batch"](calls=[{"tool": "get_uv_index"}])
+            mock_run_tool_batch.assert_called_once_with([{"tool": "get_uv_index"}])
+
+    def test_all_tools_are_batchable(self):
+        """Test that every registered tool except batch and streaming can be batched."""
+        tools = asyncio.run(server().get_tools())
+        self.assertEqual(
+            set(BATCH_TOOLS), set(tools) - {"run_tool_batch", "stream_tool_rows"}
+        )
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.temperature._get_daily_max_temperature")
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tools.tides._get_high_low_tides", autospec=True
+    )
+    def test_results_in_order(self, mock_get_high_low_tides, mock_get_daily_max):
+        """Test dispatch, per-item errors and result order."""
+        mock_get_high_low_tides.side_effect = lambda **kwargs: {"data": [kwargs["month"]]}
+        mock_get_daily_max.return_value = {"error": "Invalid or missing station code"}
+
+        result = _run_tool_batch(
+            [
+                {
+                    "tool": "get_high_low_tides",
+                    "args": {"station": "CCH", "year": 2025, "options": {"month": 6}},
+                },
+                {"tool": "get_daily_max_temperature", "args": {"station": "XXX"}},
+                {"tool": "get_high_low_tides", "args": {"station": "CCH", "year": 2025, "month": 7}},
+                {"tool": "no_such_tool"},
+                {"tool": "get_high_low_tides", "args": {"station": "CCH", "colour": "red"}},
+                "get_uv_index",
+            ]
+        )
+
+        results = result["results"]
+        self.assertEqual(results[0], {"tool": "get_high_low_tides", "result": {"data": [6]}})
+        self.assertEqual(
+            results[1],
+            {"tool": "get_daily_max_temperature", "error": "Invalid or missing station code"},
+        )
+        self.assertEqual(results[2]["result"], {"data": [7]})
+        self.assertIn("Unknown tool 'no_such_tool'", results[3]["error"])
+        self.assertIn("Invalid arguments for get_high_low_tides", results[4]["error"])
+        self.assertIn("error", results[5])
+        self.assertEqual((result["succeeded"], result["failed"]), (2, 4))
+        mock_get_high_low_tides.assert_any_call(
+            station="CCH", year=2025, month=6
+        )
+        self.assertEqual(mock_get_high_low_tides.call_count, 2)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.tides._get_hourly_tides")
+    def test_fields_projection(self, mock_get_hourly_tides):
+        """Test that each call's fields argument trims its result."""
+        mock_get_hourly_tides.return_value = {
+            "fields": ["Date", "Hour", "Height"],
+            "data": [["2025-06-01", 1, 1.2], ["2025-06-01", 2, 1.5]],
+        }
+
+        results = _run_tool_batch(
+            [
+                {"tool": "get_hourly_tides", "args": {"station": "CCH", "year": 2025}},
+                {
+                    "tool": "get_hourly_tides",
+                    "args": {"station": "CCH", "year": 2025, "fields": ["Height"]},
+                },
+                {
+                    "tool": "get_hourly_tides",
+                    "args": {"station": "CCH", "year": 2025, "fields": ["Depth"]},
+                },
+            ]
+        )["results"]
+
+        self.assertEqual(len(results[0]["result"]["fields"]), 3)
+        self.assertEqual(results[1]["result"], {"fields": ["Height"], "data": [[1.2], [1.5]]})
+        self.assertIn("Unknown field(s): Depth", results[2]["error"])
+        mock_get_hourly_tides.assert_called_with(station="CCH", year=2025)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.visibility.FEED_REGISTRY")
+    def test_raw_is_ignored(self, mock_feed_registry):
+        """Test that raw calls return decoded documents, not RawJson."""
+        document = {"fields": ["Station"], "data": [["Central"]]}
+        mock_feed_registry.get.return_value = document
+        mock_feed_registry.get_raw.return_value = RawJson(b'{"data":[["Central"]]}')
+
+        result = _run_tool_batch([{"tool": "get_visibility", "args": {"raw": True}}])
+
+        self.assertEqual(result["results"][0]["result"], document)
+        self.assertIn('"Central"', dumps(result))
+        mock_feed_registry.get_raw.assert_not_called()
+
+    def test_station_codes_are_plain_dicts(self):
+        """Test that read-only results are converted for serialization."""
+        result = _run_tool_batch(
+            [{"tool": "get_tide_station_codes", "args": {"lang": "en"}}]
+        )
+        self.assertIs(type(result["results"][0]["result"]), dict)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.warnings._get_special_weather_tips")
+    def test_concurrency_cap(self, mock_get_special_weather_tips):
+        """Test that calls run in parallel but never more than the cap at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def slow_call(**kwargs):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return {"specialWeatherTips": []}
+
+        mock_get_special_weather_tips.side_effect = slow_call
+        result = _run_tool_batch(
+            [{"tool": "get_special_weather_tips"}] * (MAX_BATCH_WORKERS * 2)
+        )
+
+        self.assertEqual(result["failed"], 0)
+        self.assertGreater(state["peak"], 1)
+        self.assertLessEqual(state["peak"], MAX_BATCH_WORKERS)
+
+    def test_invalid_batches(self):
+        """Test that empty and oversized batches are rejected."""
+        self.assertIn("error", _run_tool_batch([]))
+        self.assertIn(
+            "at most",
+            _run_tool_batch([{"tool": "get_uv_index"}] * (MAX_BATCH_CALLS + 1))["error"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
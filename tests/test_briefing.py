@@ -0,0 +1,183 @@
+"""
+Unit tests for the weather briefing tool.
+
+This module tests that the briefing fetches each feed once, merges the feeds
+into one document without repeated content and reports failed feeds.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.observations import clear_snapshots
+from hkopenai.hk_climate_mcp_server.tools.briefing import (
+    register,
+    _get_weather_briefing,
+)
+from hkopenai.hk_climate_mcp_server.tools.forecast import _get_local_weather_forecast
+
+SITUATION = "An area of low pressure will bring showers to the coast."
+
+FEED_RESPONSES = {
+    "rhrread": {
+        "updateTime": "2025-06-07T22:02:00+08:00",
+        "warningMessage": [
+            "The Thunderstorm Warning is in force.",
+            "The Thunderstorm Warning is in force.",
+        ],
+        "temperature": {
+            "recordTime": "2025-06-07T22:00:00+08:00",
+            "data": [{"place": "Hong Kong Observatory", "value": 29, "unit": "C"}],
+        },
+        "humidity": {
+            "recordTime": "2025-06-07T22:00:00+08:00",
+            "data": [{"place": "Hong Kong Observatory", "value": 79, "unit": "percent"}],
+        },
+        "rainfall": {
+            "data": [
+                {"place": "Sha Tin", "min": 1, "max": 4, "unit": "mm", "main": "FALSE"}
+            ]
+        },
+        "uvindex": "",
+        "icon": [63],
+    },
+    "warnsum": {
+        "WTS": {
+            "name": "Thunderstorm Warning",
+            "code": "WTS",
+            "actionCode": "ISSUE",
+            "issueTime": "2025-06-07T21:30:00+08:00",
+            "updateTime": "2025-06-07T21:30:00+08:00",
+        },
+        "WFIRE": {
+            "name": "Fire Danger Warning",
+            "code": "WFIREY",
+            "actionCode": "CANCEL",
+            "updateTime": "2025-06-07T20:00:00+08:00",
+        },
+    },
+    "flw": {
+        "generalSituation": SITUATION,
+        "forecastPeriod": "Weather forecast for tonight and tomorrow",
+        "forecastDesc": "Cloudy with showers.",
+        "outlook": "Showers in the next few days.",
+        "updateTime": "2025-06-07T21:45:00+08:00",
+    },
+    "fnd": {
+        "generalSituation": SITUATION,
+        "weatherForecast": [
+            {
+                "forecastDate": "20250608",
+                "week": "Sunday",
+                "forecastWind": "South force 3.",
+                "forecastWeather": "Showers.",
+                "forecastMaxtemp": {"value": 31, "unit": "C"},
+                "forecastMintemp": {"value": 27, "unit": "C"},
+                "PSR": "High",
+            }
+        ],
+        "updateTime": "2025-06-07T16:30:00+08:00",
+    },
+    "swt": {"specialWeatherTips": ["Tip 1", "Tip 1", "Tip 2"]},
+    "LTMV": {
+        "fields": ["Date time", "Automatic Weather Station", "10 minute mean visibility"],
+        "data": [["202506072150", "Central", "12 km"]],
+    },
+}
+
+
+def fake_fetch(url):
+    data_type = url.split("dataType=")[1].split("&")[0]
+    return FEED_RESPONSES[data_type]
+
+
+class TestBriefingTools(unittest.TestCase):
+    """Test case class for the weather briefing tool."""
+
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        clear_snapshots()
+
+    def test_register_tool(self):
+        """Tests that the briefing tool is correctly registered."""
+        mock_mcp = MagicMock()
+        register(mock_mcp)
+        self.assertEqual(mock_mcp.tool.call_count, 1)
+
+        decorated_funcs = {
+            call.args[0].__name__: call.args[0]
+            for call in mock_mcp.tool.return_value.call_args_list
+        }
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.briefing._get_weather_briefing"
+        ) as mock_get_weather_briefing:
+            decorated_funcs["get_weather_briefing"](lang="tc")
+            mock_get_weather_briefing.assert_called_once_with("tc")
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tools.briefing.fetch_json_data",
+        side_effect=fake_fetch,
+    )
+    def test_merged_briefing(self, mock_fetch_json_data):
+        """Test the merged, de-duplicated briefing document."""
+        result = _get_weather_briefing(lang="en")
+
+        self.assertEqual(mock_fetch_json_data.call_count, 6)
+        self.assertEqual(result["current"]["temperature"], 29)
+        self.assertEqual(result["current"]["humidity"], 79)
+        self.assertEqual(result["current"]["rainfallMax"], 4.0)
+        self.assertEqual(
+            [w["code"] for w in result["warnings"]["active"]], ["WTS"]
+        )
+        self.assertEqual(
+            result["warnings"]["messages"], ["The Thunderstorm Warning is in force."]
+        )
+        self.assertEqual(result["generalSituation"], SITUATION)
+        self.assertNotIn("generalSituation", result["nineDayForecast"])
+        self.assertEqual(result["nineDayForecast"]["forecast"][0]["maxTemp"], 31)
+        self.assertEqual(result["localForecast"]["outlook"], "Showers in the next few days.")
+        self.assertEqual(result["specialWeatherTips"], ["Tip 1", "Tip 2"])
+        self.assertEqual(result["visibility"][0]["visibility"], "12 km")
+        self.assertEqual(result["updateTime"], "2025-06-07T22:02:00+08:00")
+        self.assertEqual(result["errors"], {})
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tools.forecast.fetch_json_data",
+    )
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tools.briefing.fetch_json_data",
+        side_effect=fake_fetch,
+    )
+    def test_feeds_shared_with_other_tools(self, mock_fetch_json_data, mock_forecast_fetch):
+        """Test that a briefing and later tool calls reuse the cached feeds."""
+        _get_weather_briefing(lang="en")
+        _get_weather_briefing(lang="en")
+        self.assertEqual(mock_fetch_json_data.call_count, 6)
+
+        self.assertEqual(
+            _get_local_weather_forecast(lang="en")["forecastDesc"], "Cloudy with showers."
+        )
+        mock_forecast_fetch.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.briefing.fetch_json_data")
+    def test_failed_feeds_are_reported(self, mock_fetch_json_data):
+        """Test that feeds which fail are listed under errors."""
+
+        def partly_failing(url):
+            if "dataType=fnd" in url or "dataType=rhrread" in url:
+                return {"error": "The request timed out"}
+            return fake_fetch(url)
+
+        mock_fetch_json_data.side_effect = partly_failing
+        result = _get_weather_briefing(lang="en")
+
+        self.assertEqual(
+            result["errors"],
+            {"rhrread": "The request timed out", "fnd": "The request timed out"},
+        )
+        self.assertIsNone(result["current"])
+        self.assertEqual(result["nineDayForecast"], {"forecast": []})
+        self.assertEqual(result["generalSituation"], SITUATION)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Unit tests for the dataset catalog tool.
+
+This module tests that the catalog tool reports discovered coverage and
+starts discovery when coverage is missing or stale.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.tools.catalog import register, _get_dataset_catalog
+
+
+class TestCatalogTools(unittest.TestCase):
+    """Test case class for the dataset catalog tool."""
+
+    def test_register_tool(self):
+        """Tests that the catalog tool is correctly registered."""
+        mock_mcp = MagicMock()
+        register(mock_mcp)
+
+        self.assertEqual(mock_mcp.tool.call_count, 1)
+        decorated_func = mock_mcp.tool.return_value.call_args[0][0]
+
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.catalog._get_dataset_catalog"
+        ) as mock_get_dataset_catalog:
+            decorated_func(data_type="HLT")
+            mock_get_dataset_catalog.assert_called_once_with(
+                data_type="HLT", refresh=False
+            )
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.catalog.AVAILABILITY")
+    def test_get_dataset_catalog(self, mock_availability):
+        """Test the catalog output and discovery triggering."""
+        mock_availability.is_stale.return_value = False
+        mock_availability.snapshot.return_value = {
+            "datasets": {
+                "HLT": {"CCH": [2022, 2026]},
+                "SRS": {"*": [2018, 2027]},
+            },
+            "updateTime": {"HLT": "2026-10-01T00:00:00"},
+            "discoveryRunning": False,
+        }
+
+        result = _get_dataset_catalog()
+        mock_availability.start_discovery.assert_not_called()
+        self.assertEqual(result["datasets"]["HLT"]["years"], {"CCH": [2022, 2026]})
+        self.assertEqual(result["datasets"]["SRS"]["years"], [2018, 2027])
+        self.assertIsNone(result["datasets"]["MRS"]["years"])
+        self.assertEqual(result["datasets"]["SRS"]["documentedYears"][0], 2018)
+
+        _get_dataset_catalog(data_type="HLT", refresh=True)
+        mock_availability.start_discovery.assert_called_once_with(["HLT"])
+
+    def test_invalid_data_type(self):
+        """Test that unknown datasets are rejected."""
+        self.assertIn("error", _get_dataset_catalog(data_type="RHRREAD"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import unittest
 from unittest.mock import patch, Mock
+from hkopenai.hk_climate_mcp_server import json_codec
 from hkopenai.hk_climate_mcp_server.server import server
 
 
@@ -9,11 +10,16 @@ class TestApp(unittest.TestCase):
     """Test case class for MCP server functionality."""
 
     @patch("hkopenai.hk_climate_mcp_server.server.FastMCP")
+    @patch("hkopenai.hk_climate_mcp_server.resources.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.astronomical.register")
+    @patch("hkopenai.hk_climate_mcp_server.tools.batch.register")
+    @patch("hkopenai.hk_climate_mcp_server.tools.briefing.register")
+    @patch("hkopenai.hk_climate_mcp_server.tools.catalog.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.forecast.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.lightning.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.radiation.register")
+    @patch("hkopenai.hk_climate_mcp_server.tools.streaming.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.temperature.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.tides.register")
     @patch("hkopenai.hk_climate_mcp_server.tools.visibility.register")
@@ -24,11 +30,16 @@ class TestApp(unittest.TestCase):
         mock_visibility_register,
         mock_tides_register,
         mock_temperature_register,
+        mock_streaming_register,
         mock_radiation_register,
         mock_lightning_register,
         mock_forecast_register,
         mock_current_weather_register,
+        mock_catalog_register,
+        mock_briefing_register,
+        mock_batch_register,
         mock_astronomical_register,
+        mock_resources_register,
         mock_fastmcp,
     ):
         """
@@ -43,18 +54,26 @@ class TestApp(unittest.TestCase):
 
         # Verify server creation
         mock_fastmcp.assert_called_once()
+        self.assertIs(
+            mock_fastmcp.call_args.kwargs["tool_serializer"], json_codec.dumps
+        )
         self.assertEqual(server_instance, mock_server)
 
         # Verify that the register function of each tool module was called with the mcp instance
         mock_astronomical_register.assert_called_once_with(mock_server)
+        mock_batch_register.assert_called_once_with(mock_server)
+        mock_briefing_register.assert_called_once_with(mock_server)
+        mock_catalog_register.assert_called_once_with(mock_server)
         mock_current_weather_register.assert_called_once_with(mock_server)
         mock_forecast_register.assert_called_once_with(mock_server)
         mock_lightning_register.assert_called_once_with(mock_server)
         mock_radiation_register.assert_called_once_with(mock_server)
+        mock_streaming_register.assert_called_once_with(mock_server)
         mock_temperature_register.assert_called_once_with(mock_server)
         mock_tides_register.assert_called_once_with(mock_server)
         mock_visibility_register.assert_called_once_with(mock_server)
         mock_warnings_register.assert_called_once_with(mock_server)
+        mock_resources_register.assert_called_once_with(mock_server)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,150 @@
+"""
+Unit tests for CSV ingestion into compact tables.
+
+This module tests that HKO's CSV files are read into column storage with
+their title lines and notes skipped, that values read back as the text HKO
+sent, and that the paging tools use CSV with JSON as fallback.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from hkopenai.hk_climate_mcp_server.csv_table import (
+    CompactTable,
+    _decode_lines,
+    fetch_csv_table,
+    parse_csv,
+)
+from hkopenai.hk_climate_mcp_server.pagination import SERIES_CACHE
+from hkopenai.hk_climate_mcp_server.tools.temperature import _get_daily_mean_temperature
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
+
+CLMTEMP_CSV = """\
+"香港天文台 - 日平均氣溫 (°C)/Daily Mean Temperature (°C) at the Hong Kong Observatory",
+年/Year,月/Month,日/Day,數值/Value,數據完整性/data Completeness
+1884,3,1,***,
+2025,06,23,28.5,C
+2025,06,24,29,C
+"*** 沒有數據/unavailable"
+"""
+
+
+class TestCsvTable(unittest.TestCase):
+    """Test case class for CSV tables."""
+
+    def setUp(self):
+        SERIES_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    def tearDown(self):
+        SERIES_CACHE.clear()
+
+    def test_parse_hko_csv(self):
+        """Test that title lines and notes are skipped and values kept as sent."""
+        table = parse_csv(CLMTEMP_CSV.splitlines())
+
+        self.assertEqual(table.fields[0], "年/Year")
+        self.assertEqual(len(table), 3)
+        self.assertEqual(
+            table.rows(),
+            [
+                ["1884", "3", "1", "***", ""],
+                ["2025", "06", "23", "28.5", "C"],
+                ["2025", "06", "24", "29", "C"],
+            ],
+        )
+        self.assertEqual(table.rows(1, 2), [["2025", "06", "23", "28.5", "C"]])
+        self.assertIsNone(parse_csv([]))
+
+    def test_header_after_several_titles(self):
+        """Test that two title lines, or titles padded to the width, are skipped."""
+        two_titles = [
+            '"每小時潮汐高度/Hourly Heights of Astronomical Tides"',
+            '"Station: Quarry Bay"',
+            "Year,Month,Day,Height",
+            "2025,06,30,1.5",
+        ]
+        padded = [
+            "Hourly Heights of Astronomical Tides,,,",
+            "Quarry Bay (QUB),,,",
+            "Year,Month,Day,Height",
+            "2025,06,30,1.5",
+            "Remarks: heights in metres above Chart Datum,,,",
+        ]
+        for lines in (two_titles, padded):
+            table = parse_csv(lines)
+            self.assertEqual(table.fields, ["Year", "Month", "Day", "Height"])
+            self.assertEqual(table.rows(), [["2025", "06", "30", "1.5"]])
+        self.assertIsNone(parse_csv(["Title,,", "No data,,"]))
+
+    def test_column_kinds(self):
+        """Test that numbers are kept in arrays only if they read back the same."""
+        table = CompactTable(["Year", "Height", "Station", "Time", "Value"])
+        table.append(["2025", "1.50", "1", "0530", "1.5"])
+        table.append(["2025", "***", "***", "0600", "-"])
+        table.append(["2026", "-0.25", "CCH", "0630", "***"])
+        self.assertEqual(
+            [type(column).__name__ for column in table._columns],
+            ["_NumberColumn", "_NumberColumn"] + ["_TextColumn"] * 3,
+        )
+        self.assertEqual(
+            table.to_document()["data"],
+            [
+                ["2025", "1.50", "1", "0530", "1.5"],
+                ["2025", "***", "***", "0600", "-"],
+                ["2026", "-0.25", "CCH", "0630", "***"],
+            ],
+        )
+
+        table = CompactTable(["Height"])
+        table.extend([["1.5"], ["12"], [None], [1.3]])
+        self.assertEqual(table.rows(), [["1.5"], ["12"], [None], [1.3]])
+
+    def test_decode_lines_across_chunks(self):
+        """Test that lines and characters split between chunks are rejoined."""
+        data = "﻿年,Value\n1,2\n".encode("utf-8")
+        chunks = [data[i : i + 1] for i in range(len(data))]
+        self.assertEqual(list(_decode_lines(chunks, "utf-8-sig")), ["年,Value", "1,2"])
+
+    @patch("hkopenai.hk_climate_mcp_server.csv_table.requests.get")
+    def test_fetch_csv_table(self, mock_get):
+        """Test that CSV is streamed and only unreadable bodies give None."""
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [CLMTEMP_CSV.encode("utf-8")]
+        mock_get.return_value = response
+
+        table = fetch_csv_table({"dataType": "CLMTEMP", "rformat": "json"})
+        self.assertEqual(len(table), 3)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["rformat"], "csv")
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+        response.iter_content.return_value = [b"\xef\xbb\xbf", b" \r\n"]
+        self.assertEqual(
+            fetch_csv_table({"dataType": "CLMTEMP"}), {"fields": [], "data": []}
+        )
+        response.iter_content.return_value = [b"<html><body>Busy</body></html>"]
+        self.assertIsNone(fetch_csv_table({"dataType": "CLMTEMP"}))
+        mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+        self.assertIn("Connection error", fetch_csv_table({})["error"])
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_csv_table")
+    def test_pages_read_from_csv(self, mock_fetch_csv_table, mock_fetch_json_table):
+        """Test that pages come from CSV, and from JSON when CSV is unreadable."""
+        mock_fetch_csv_table.return_value = parse_csv(CLMTEMP_CSV.splitlines())
+
+        first = _get_daily_mean_temperature(station="HKO", page_size=2)
+        second = _get_daily_mean_temperature(station="HKO", cursor=first["nextCursor"])
+        self.assertEqual(first["total"], 3)
+        self.assertEqual(second["data"], [["2025", "06", "24", "29", "C"]])
+        mock_fetch_csv_table.assert_called_once()
+        mock_fetch_json_table.assert_not_called()
+
+        mock_fetch_csv_table.return_value = None
+        mock_fetch_json_table.return_value = {"fields": ["Year"], "data": [["2024"]]}
+        page = _get_daily_mean_temperature(station="HKO", year=2024, page_size=2)
+        self.assertEqual(page["data"], [["2024"]])
+
+if __name__ == "__main__":
+    unittest.main()
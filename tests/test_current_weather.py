@@ -4,11 +4,28 @@ Unit tests for current weather data fetching functions.
 This module tests the functionality of fetching current weather data from the Hong Kong Observatory API.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+import copy
+from hkopenai.hk_climate_mcp_server.cache import CACHE_DIR_ENV
+from hkopenai.hk_climate_mcp_server.daily_extremes import DAILY_EXTREMES
+from hkopenai.hk_climate_mcp_server.daily_extremes import hkt_date as real_hkt_date
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.observation_store import OBSERVATION_STORE
+from hkopenai.hk_climate_mcp_server.observations import clear_snapshots
+from hkopenai.hk_climate_mcp_server.rainfall import RAINFALL_ACCUMULATOR
 from hkopenai.hk_climate_mcp_server.tools.current_weather import (
     register,
     _get_current_weather,
+    _get_all_regions_weather,
+    _get_rainfall_ranking,
+    _get_uv_index,
+    _get_station_temperatures,
+    _get_observation_history,
+    _get_rainfall_accumulation,
+    _get_daily_extremes,
 )
 from hkopenai_common.json_utils import fetch_json_data
 
@@ -100,24 +117,99 @@ class TestCurrentWeatherTools(unittest.TestCase):
         },
     }
 
-    def test_register_tool(self):
-        """Tests that the current weather tool is correctly registered."""
+    def setUp(self):
+        clear_snapshots()
+        FEED_REGISTRY.clear()
+        OBSERVATION_STORE.clear()
+        RAINFALL_ACCUMULATOR.clear()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {CACHE_DIR_ENV: self._cache_dir.name})
+        self._env.start()
+        DAILY_EXTREMES.clear()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache_dir.cleanup()
+        OBSERVATION_STORE.clear()
+        DAILY_EXTREMES.clear()
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.result_cache.fetch_json_data", return_value={}
+    )
+    def test_register_tool(self, mock_fetch_version):
+        """Tests that the current weather tools are correctly registered."""
         mock_mcp = MagicMock()
         register(mock_mcp)
 
         # Verify that mcp.tool was called for each tool function
-        self.assertEqual(mock_mcp.tool.call_count, 1)
+        self.assertEqual(mock_mcp.tool.call_count, 8)
 
-        # Get the decorated function
-        decorated_func = mock_mcp.tool.return_value.call_args[0][0]
+        # Get the decorated functions
+        decorated_funcs = {
+            call.args[0].__name__: call.args[0]
+            for call in mock_mcp.tool.return_value.call_args_list
+        }
 
         # Test get_current_weather
         with patch(
             "hkopenai.hk_climate_mcp_server.tools.current_weather._get_current_weather"
         ) as mock_get_current_weather:
-            decorated_func(region="test", lang="en")
+            decorated_funcs["get_current_weather"](region="test", lang="en")
             mock_get_current_weather.assert_called_once_with("test", "en")
 
+        # Test get_all_regions_weather
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_all_regions_weather"
+        ) as mock_get_all_regions_weather:
+            decorated_funcs["get_all_regions_weather"](lang="tc")
+            mock_get_all_regions_weather.assert_called_once_with("tc")
+
+        # Test get_rainfall_ranking
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_rainfall_ranking"
+        ) as mock_get_rainfall_ranking:
+            decorated_funcs["get_rainfall_ranking"](lang="en", limit=3)
+            mock_get_rainfall_ranking.assert_called_once_with("en", 3)
+
+        # Test get_rainfall_accumulation
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_rainfall_accumulation"
+        ) as mock_get_rainfall_accumulation:
+            decorated_funcs["get_rainfall_accumulation"](hours=3, limit=5)
+            mock_get_rainfall_accumulation.assert_called_once_with(3, 5)
+
+        # Test get_uv_index
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_uv_index"
+        ) as mock_get_uv_index:
+            decorated_funcs["get_uv_index"](lang="sc")
+            mock_get_uv_index.assert_called_once_with("sc")
+
+        # Test get_station_temperatures
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_station_temperatures"
+        ) as mock_get_station_temperatures:
+            decorated_funcs["get_station_temperatures"](lang="en")
+            mock_get_station_temperatures.assert_called_once_with("en")
+
+        # Test get_daily_extremes
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_daily_extremes"
+        ) as mock_get_daily_extremes:
+            decorated_funcs["get_daily_extremes"](place="Sha Tin")
+            mock_get_daily_extremes.assert_called_once_with("Sha Tin")
+
+        # Test get_observation_history
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.current_weather._get_observation_history"
+        ) as mock_get_observation_history:
+            decorated_funcs["get_observation_history"](
+                place="Sha Tin", element="humidity", start_date="20250607"
+            )
+            mock_get_observation_history.assert_called_once_with(
+                "Sha Tin", "humidity", "20250607", None
+            )
+
     @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
     def test_get_current_weather_internal(self, mock_fetch_json_data):
         """Test the internal _get_current_weather function."""
@@ -134,6 +226,278 @@ class TestCurrentWeatherTools(unittest.TestCase):
             "https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=rhrread&lang=en"
         )
 
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_region_matching(self, mock_fetch_json_data):
+        """Test case-insensitive, punctuation-insensitive and fuzzy region matching."""
+        mock_fetch_json_data.return_value = self.default_mock_response
+
+        for region in ["tseung kwan o", "Kings Park", "Tseung Kwan 0", "將軍澳"]:
+            result = _get_current_weather(region=region, lang="en")
+            place = result["weatherObservation"]["temperature"]["place"]
+            self.assertIn(place, ("Tseung Kwan O", "King's Park"), region)
+        self.assertEqual(
+            _get_current_weather(region="Kings Park")["weatherObservation"][
+                "temperature"
+            ]["value"],
+            28,
+        )
+
+        result = _get_current_weather(region="Nowhere Land", lang="en")
+        self.assertEqual(
+            result["weatherObservation"]["temperature"]["place"],
+            "Hong Kong Observatory",
+        )
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_english_region_in_chinese_response(self, mock_fetch_json_data):
+        """Test that English region names match stations in a tc response."""
+        response = copy.deepcopy(self.default_mock_response)
+        response["temperature"]["data"] = [
+            {"place": "香港天文台", "value": 29, "unit": "C"},
+            {"place": "沙田", "value": 31, "unit": "C"},
+        ]
+        response["humidity"]["data"] = [
+            {"unit": "percent", "value": 79, "place": "香港天文台"}
+        ]
+        mock_fetch_json_data.return_value = response
+
+        result = _get_current_weather(region="Sha Tin", lang="tc")
+        self.assertEqual(result["weatherObservation"]["temperature"]["place"], "沙田")
+        self.assertEqual(result["weatherObservation"]["temperature"]["value"], 31)
+        self.assertEqual(result["weatherObservation"]["humidity"]["value"], 79)
+
+        result = _get_current_weather(lang="tc")
+        self.assertEqual(result["weatherObservation"]["temperature"]["value"], 29)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_humidity_of_the_same_station(self, mock_fetch_json_data):
+        """Test that humidity is never taken from a similarly named station."""
+        response = copy.deepcopy(self.default_mock_response)
+        response["temperature"]["data"].append(
+            {"place": "Tai Po", "value": 30, "unit": "C"}
+        )
+        response["humidity"]["data"].append(
+            {"unit": "percent", "value": 90, "place": "Tai Po Kau"}
+        )
+        mock_fetch_json_data.return_value = response
+
+        result = _get_current_weather(region="Tai Po")
+        self.assertEqual(result["weatherObservation"]["temperature"]["place"], "Tai Po")
+        humidity = result["weatherObservation"]["humidity"]
+        self.assertEqual(humidity["value"], 79)
+        self.assertEqual(humidity["place"], "Hong Kong Observatory")
+
+    @patch("hkopenai.hk_climate_mcp_server.feeds.get_snapshot")
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_error_response_is_returned(self, mock_fetch_json_data, mock_get_snapshot):
+        """Test that an upstream error is returned instead of default values."""
+        mock_fetch_json_data.return_value = {"error": "Connection error occurred"}
+        self.assertEqual(
+            _get_current_weather(), {"error": "Connection error occurred"}
+        )
+        self.assertIn("error", _get_all_regions_weather())
+        mock_get_snapshot.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_all_regions_weather(self, mock_fetch_json_data):
+        """Test the all-regions snapshot tool."""
+        mock_fetch_json_data.return_value = self.default_mock_response
+
+        result = _get_all_regions_weather(lang="en")
+        self.assertEqual(len(result["temperature"]["data"]), 27)
+        self.assertEqual(
+            result["temperature"]["data"][1],
+            {"place": "Hong Kong Observatory", "value": 29, "unit": "C"},
+        )
+        self.assertEqual(len(result["humidity"]["data"]), 1)
+        self.assertEqual(len(result["rainfall"]["data"]), 18)
+        self.assertEqual(result["rainfall"]["data"][0]["place"], "Central & Western District")
+        self.assertEqual(result["rainfall"]["startTime"], "2025-06-07T20:45:00+08:00")
+        self.assertEqual(result["updateTime"], "2025-06-07T22:02:00+08:00")
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_rhrread_tools_share_one_fetch(self, mock_fetch_json_data):
+        """Test that all rhrread tools are served from one fetched snapshot."""
+        mock_fetch_json_data.return_value = self.default_mock_response
+
+        _get_current_weather(lang="en")
+        _get_all_regions_weather(lang="en")
+        _get_rainfall_ranking(lang="en")
+        _get_uv_index(lang="en")
+        _get_station_temperatures(lang="en")
+        self.assertEqual(mock_fetch_json_data.call_count, 1)
+
+        _get_uv_index(lang="tc")
+        self.assertEqual(mock_fetch_json_data.call_count, 2)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_rainfall_ranking(self, mock_fetch_json_data):
+        """Test that districts are ranked wettest first, sharing ranks on ties."""
+        response = copy.deepcopy(self.default_mock_response)
+        response["rainfall"]["data"][3].update(min=5, max=10)
+        response["rainfall"]["data"][6].update(min=2, max=10)
+        response["rainfall"]["data"][8].update(min=2, max=10)
+        mock_fetch_json_data.return_value = response
+
+        result = _get_rainfall_ranking(lang="en", limit=4)
+        self.assertEqual(
+            [(r["rank"], r["place"]) for r in result["data"]],
+            [
+                (1, "Islands District"),
+                (2, "Sha Tin"),
+                (2, "Tai Po"),
+                (4, "Central & Western District"),
+            ],
+        )
+        self.assertEqual(result["data"][0]["max"], 10.0)
+        self.assertEqual(result["endTime"], "2025-06-07T21:45:00+08:00")
+        self.assertEqual(len(_get_rainfall_ranking(lang="en")["data"]), 18)
+        self.assertIn("error", _get_rainfall_ranking(limit=0))
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_rainfall_accumulation(self, mock_fetch_json_data):
+        """Test accumulations over successive hourly reports, ranked by window."""
+        for end_hour, sha_tin, tai_po in ((20, 10, 1), (21, 0, 30), (22, 5, 0)):
+            response = copy.deepcopy(self.default_mock_response)
+            response["rainfall"]["data"][6]["max"] = sha_tin
+            response["rainfall"]["data"][8]["max"] = tai_po
+            response["rainfall"]["endTime"] = f"2025-06-07T{end_hour}:45:00+08:00"
+            response["updateTime"] = f"2025-06-07T{end_hour}:50:00+08:00"
+            mock_fetch_json_data.return_value = response
+            FEED_REGISTRY.clear()
+            result = _get_rainfall_accumulation(hours=3, limit=2)
+
+        self.assertEqual(result["endTime"], "2025-06-07T22:45:00+08:00")
+        self.assertEqual(result["rankedBy"], "past3h")
+        self.assertEqual(
+            [(e["rank"], e["place"], e["past1h"], e["past3h"]) for e in result["data"]],
+            [(1, "Tai Po", 0.0, 31.0), (2, "Sha Tin", 5.0, 15.0)],
+        )
+        self.assertEqual(result["data"][0]["hoursObserved"], {"past3h": 3, "past24h": 3})
+        self.assertEqual(_get_rainfall_accumulation(hours=1)["data"][0]["place"], "Sha Tin")
+        self.assertIn("error", _get_rainfall_accumulation(hours=2))
+        self.assertIn("error", _get_rainfall_accumulation(limit=0))
+
+    @patch("hkopenai.hk_climate_mcp_server.daily_extremes.hkt_date")
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_daily_extremes(self, mock_fetch_json_data, mock_hkt_date):
+        """Test running extremes of today, their reset and their persistence."""
+        mock_hkt_date.side_effect = lambda timestamp=None: (
+            "20250607" if timestamp is None else real_hkt_date(timestamp)
+        )
+        for minute, sha_tin in (("00", 29), ("10", 32), ("20", 27), ("30", 30)):
+            response = copy.deepcopy(self.default_mock_response)
+            response["temperature"]["data"][6]["value"] = sha_tin
+            response["temperature"]["recordTime"] = f"2025-06-07T22:{minute}:00+08:00"
+            response["updateTime"] = f"2025-06-07T22:{minute}:30+08:00"
+            mock_fetch_json_data.return_value = response
+            FEED_REGISTRY.clear()
+            result = _get_daily_extremes("sha tin")
+
+        self.assertEqual(result["date"], "20250607")
+        self.assertEqual(
+            result["temperature"],
+            {
+                "place": "Sha Tin",
+                "max": 32,
+                "maxTime": "2025-06-07T22:10:00+08:00",
+                "min": 27,
+                "minTime": "2025-06-07T22:20:00+08:00",
+            },
+        )
+        self.assertIsNone(result["humidity"])
+        self.assertIn("error", _get_daily_extremes("Mars"))
+
+        # A restarted server continues the day from the saved state
+        DAILY_EXTREMES.clear()
+        all_stations = _get_daily_extremes()
+        self.assertEqual(len(all_stations["temperature"]), 27)
+        self.assertEqual(all_stations["humidity"][0]["max"], 79)
+
+        # The next day starts over
+        mock_hkt_date.side_effect = lambda timestamp=None: (
+            "20250608" if timestamp is None else real_hkt_date(timestamp)
+        )
+        self.assertEqual(_get_daily_extremes()["temperature"], [])
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_uv_index(self, mock_fetch_json_data):
+        """Test the UV index tool with and without a reported index."""
+        mock_fetch_json_data.return_value = self.default_mock_response
+        self.assertEqual(
+            _get_uv_index(lang="en"),
+            {"data": [], "recordDesc": "", "updateTime": "2025-06-07T22:02:00+08:00"},
+        )
+
+        FEED_REGISTRY.clear()
+        response = copy.deepcopy(self.default_mock_response)
+        response["updateTime"] = "2025-06-08T13:02:00+08:00"
+        response["uvindex"] = {
+            "data": [{"place": "King's Park", "value": 6, "desc": "high"}],
+            "recordDesc": "During the past hour",
+        }
+        mock_fetch_json_data.return_value = response
+        result = _get_uv_index(lang="en")
+        self.assertEqual(result["data"][0]["value"], 6)
+        self.assertEqual(result["recordDesc"], "During the past hour")
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_station_temperatures(self, mock_fetch_json_data):
+        """Test the station temperature table."""
+        response = copy.deepcopy(self.default_mock_response)
+        response["temperature"]["data"] = [
+            {"place": "King's Park", "value": 28, "unit": "C"},
+            {"place": "Sha Tin", "value": 31, "unit": "C"},
+            {"place": "Tai Mo Shan", "value": 22, "unit": "C"},
+        ]
+        mock_fetch_json_data.return_value = response
+
+        result = _get_station_temperatures(lang="en")
+        self.assertEqual(
+            [r["place"] for r in result["data"]], ["Sha Tin", "King's Park", "Tai Mo Shan"]
+        )
+        self.assertEqual(result["highest"]["value"], 31)
+        self.assertEqual(result["lowest"]["place"], "Tai Mo Shan")
+        self.assertEqual(result["mean"], 27.0)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.current_weather.fetch_json_data")
+    def test_get_observation_history(self, mock_fetch_json_data):
+        """Test that successive reports are recorded and read back by date."""
+        for minute, sha_tin in (("00", 29), ("10", 31)):
+            response = copy.deepcopy(self.default_mock_response)
+            response["temperature"]["data"][6]["value"] = sha_tin
+            response["temperature"]["recordTime"] = f"2025-06-07T22:{minute}:00+08:00"
+            response["updateTime"] = f"2025-06-07T22:{minute}:30+08:00"
+            mock_fetch_json_data.return_value = response
+            FEED_REGISTRY.clear()
+            result = _get_observation_history(
+                "Sha Tin", start_date="20250607", end_date="20250608"
+            )
+
+        self.assertEqual(
+            result["data"],
+            [
+                {"time": "2025-06-07T22:00:00+08:00", "value": 29.0},
+                {"time": "2025-06-07T22:10:00+08:00", "value": 31.0},
+            ],
+        )
+        self.assertEqual((result["min"], result["max"], result["unit"]), (29.0, 31.0, "C"))
+
+        humidity = _get_observation_history(
+            "Hong Kong Observatory", "humidity", "20250607", "20250607"
+        )
+        self.assertEqual(humidity["count"], 1)
+
+        missing = _get_observation_history("Mars", "temperature", "20250607", "20250607")
+        self.assertIn("Places recorded on 20250607: King's Park", missing["error"])
+        self.assertIn("error", _get_observation_history("Sha Tin", "wind"))
+        self.assertIn("error", _get_observation_history("Sha Tin", start_date="2025-06-07"))
+        self.assertIn(
+            "error", _get_observation_history("Sha Tin", "temperature", "20250608", "20250607")
+        )
+        too_long = _get_observation_history("Sha Tin", "temperature", "20250101", "20250607")
+        self.assertIn("at most", too_long["error"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,113 @@
+"""
+Unit tests for the feed registry.
+
+This module tests that feeds are fetched at most once per freshness window
+and that errors are not cached.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.feeds import (
+    FEED_REGISTRY,
+    FeedRegistry,
+    feed_url,
+)
+
+
+class TestFeedRegistry(unittest.TestCase):
+    """Test case class for the feed registry."""
+
+    def setUp(self):
+        FEED_REGISTRY.clear()
+
+    def test_feed_url(self):
+        """Test the request URLs of weather.php and opendata.php feeds."""
+        self.assertEqual(
+            feed_url("warnsum", "tc"),
+            "https://data.weather.gov.hk/weatherAPI/opendata/weather.php"
+            "?dataType=warnsum&lang=tc",
+        )
+        self.assertEqual(
+            feed_url("LTMV", "en"),
+            "https://data.weather.gov.hk/weatherAPI/opendata/opendata.php"
+            "?dataType=LTMV&lang=en&rformat=json",
+        )
+
+    def test_fetched_once_per_freshness_window(self):
+        """Test that a fresh document is shared and a stale one is refetched."""
+        registry = FeedRegistry()
+        fetch = MagicMock(return_value={"updateTime": "t1", "tips": ["a"]})
+
+        first = registry.get("swt", "en", fetch)
+        self.assertIs(registry.get("swt", "en", fetch), first)
+        self.assertEqual(fetch.call_count, 1)
+        with self.assertRaises(TypeError):
+            first["tips"] = []
+
+        registry.get("swt", "tc", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+        with patch(
+            "hkopenai.hk_climate_mcp_server.feeds.time.monotonic",
+            return_value=time.monotonic() + 61,
+        ):
+            registry.get("swt", "en", fetch)
+        self.assertEqual(fetch.call_count, 3)
+        self.assertEqual(registry.peek("swt", "en")["updateTime"], "t1")
+
+    def test_errors_are_not_cached(self):
+        """Test that an upstream error is returned and retried on the next call."""
+        registry = FeedRegistry()
+        fetch = MagicMock(return_value={"error": "Connection error occurred"})
+
+        self.assertEqual(
+            registry.get("flw", "en", fetch), {"error": "Connection error occurred"}
+        )
+        registry.get("flw", "en", fetch)
+        self.assertEqual(fetch.call_count, 2)
+        self.assertIsNone(registry.peek("flw", "en"))
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """Test that concurrent calls for a stale feed wait for a single fetch."""
+        registry = FeedRegistry()
+        started = threading.Event()
+
+        def slow_fetch(url):
+            started.set()
+            time.sleep(0.05)
+            return {"updateTime": "t1"}
+
+        fetch = MagicMock(side_effect=slow_fetch)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(registry.get("fnd", "en", fetch))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    @patch("hkopenai.hk_climate_mcp_server.feeds.time.monotonic")
+    def test_refresh(self, mock_monotonic):
+        """Test that forced refreshes do not change the freshness window."""
+        mock_monotonic.return_value = 1000.0
+        registry = FeedRegistry()
+        fetch = MagicMock(side_effect=[{"updateTime": t} for t in ("t1", "t2", "t3")])
+
+        registry.get("fnd", "en", fetch)
+        self.assertEqual(registry.refresh("fnd", "en", fetch)["updateTime"], "t2")
+        self.assertEqual(fetch.call_count, 2)
+
+        mock_monotonic.return_value = 1000.0 + 601
+        self.assertEqual(registry.get("fnd", "en", fetch)["updateTime"], "t3")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,15 +2,22 @@
 Unit Tests for Forecast Tools
 
 This module contains unit tests for the forecast tools provided by the HKO MCP Server.
-It tests the functionality of fetching 9-day and local weather forecasts using mocked API responses.
+It tests the functionality of fetching 9-day and local weather forecasts using mocked API responses,
+and the history of forecast revisions.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.cache import CACHE_DIR_ENV
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.forecast_store import FORECAST_STORE
 from hkopenai.hk_climate_mcp_server.tools.forecast import (
     register,
     _get_9_day_weather_forecast,
     _get_local_weather_forecast,
+    _get_forecast_revisions,
 )
 from hkopenai_common.json_utils import fetch_json_data
 
@@ -23,13 +30,28 @@ class TestForecastTools(unittest.TestCase):
     forecast data retrieval functions using mocked HTTP requests.
     """
 
-    def test_register_tool(self):
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {CACHE_DIR_ENV: self._cache_dir.name})
+        self._env.start()
+        FORECAST_STORE.clear()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache_dir.cleanup()
+        FORECAST_STORE.clear()
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.result_cache.fetch_json_data", return_value={}
+    )
+    def test_register_tool(self, mock_fetch_version):
         """Tests that the forecast tools are correctly registered."""
         mock_mcp = MagicMock()
         register(mock_mcp)
 
         # Verify that mcp.tool was called for each tool function
-        self.assertEqual(mock_mcp.tool.call_count, 2)
+        self.assertEqual(mock_mcp.tool.call_count, 3)
 
         # Get the decorated functions
         decorated_funcs = {
@@ -51,6 +73,13 @@ class TestForecastTools(unittest.TestCase):
             decorated_funcs["get_local_weather_forecast"](lang="en")
             mock_get_local_weather_forecast.assert_called_once_with("en")
 
+        # Test get_forecast_revisions
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.forecast._get_forecast_revisions"
+        ) as mock_get_forecast_revisions:
+            decorated_funcs["get_forecast_revisions"](forecast_date="20250623")
+            mock_get_forecast_revisions.assert_called_once_with("20250623")
+
     @patch("hkopenai.hk_climate_mcp_server.tools.forecast.fetch_json_data")
     def test_get_9_day_weather_forecast_internal(self, mock_fetch_json_data):
         """Test the internal _get_9_day_weather_forecast function."""
@@ -103,6 +132,78 @@ class TestForecastTools(unittest.TestCase):
             "https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=flw&lang=en"
         )
 
+    @patch("hkopenai.hk_climate_mcp_server.tools.forecast.fetch_json_data")
+    def test_get_forecast_revisions_internal(self, mock_fetch_json_data):
+        """Test that each changed issue of a date's forecast is kept and compared."""
+
+        def nine_day(update_time, weather, max_temp):
+            return {
+                "weatherForecast": [
+                    {
+                        "forecastDate": "20250623",
+                        "forecastWind": "Light winds.",
+                        "forecastWeather": weather,
+                        "forecastMaxtemp": {"value": max_temp, "unit": "C"},
+                        "forecastMintemp": {"value": 25, "unit": "C"},
+                        "ForecastIcon": 51,
+                        "PSR": "Low",
+                    }
+                ],
+                "updateTime": update_time,
+            }
+
+        local = {
+            "forecastDesc": "Sunny periods.",
+            "outlook": "Mainly fine.",
+            "updateTime": "2025-06-22T16:45:00+08:00",
+            "forecastPeriod": "Weather forecast for tonight and tomorrow",
+        }
+        documents = {
+            "fnd": nine_day("2025-06-21T11:30:00+08:00", "Sunny periods.", 31),
+            "flw": local,
+        }
+        mock_fetch_json_data.side_effect = lambda url: documents[
+            url.split("dataType=")[1].split("&")[0]
+        ]
+
+        self.assertIn("error", _get_forecast_revisions("20250701"))
+        self.assertIn("error", _get_forecast_revisions("2025-06-23"))
+
+        for document in (
+            nine_day("2025-06-21T16:30:00+08:00", "Sunny periods.", 31),
+            nine_day("2025-06-22T11:30:00+08:00", "Showers.", 29),
+        ):
+            FEED_REGISTRY.clear()
+            documents["fnd"] = document
+            _get_forecast_revisions("20250623")
+        mock_fetch_json_data.reset_mock()
+
+        # The store is reloaded from disk; nothing past is fetched again
+        FORECAST_STORE.clear()
+        result = _get_forecast_revisions("20250623")
+        mock_fetch_json_data.assert_not_called()
+
+        self.assertEqual(result["issuesStored"], {"fnd": 3, "flw": 1})
+        revisions = result["nineDayForecast"]
+        self.assertEqual(
+            [r["updateTime"] for r in revisions],
+            ["2025-06-21T11:30:00+08:00", "2025-06-22T11:30:00+08:00"],
+        )
+        self.assertEqual(revisions[0]["changes"], {})
+        self.assertEqual(revisions[0]["forecast"]["forecastMaxtemp"], 31)
+        self.assertNotIn("ForecastIcon", revisions[0]["forecast"])
+        self.assertEqual(
+            revisions[1]["changes"],
+            {
+                "forecastWeather": {"from": "Sunny periods.", "to": "Showers."},
+                "forecastMaxtemp": {"from": 31, "to": 29},
+            },
+        )
+        self.assertEqual(len(result["localForecast"]), 1)
+        self.assertEqual(result["localForecast"][0]["forecastDesc"], "Sunny periods.")
+        self.assertEqual(_get_forecast_revisions("20250622")["localForecast"][0]["changes"], {})
+        self.assertIn("error", _get_forecast_revisions("20250624"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for the in-memory lightning and visibility history.
+
+This module tests parsing feed rows into readings, the fixed-size ring
+buffers and the min/max/trend summaries of recent samples.
+"""
+
+import unittest
+from hkopenai.hk_climate_mcp_server.history import (
+    RingBuffer,
+    SeriesHistory,
+    iter_readings,
+)
+
+FIELDS = ["Date time", "Automatic Weather Station", "10 minute mean visibility"]
+
+
+class TestHistory(unittest.TestCase):
+    """Test case class for the observation history."""
+
+    def test_iter_readings(self):
+        """Test series names, times, values and units of each feed layout."""
+        visibility = list(
+            iter_readings({"fields": FIELDS, "data": [["202506231320", "Central", "35 km"]]})
+        )
+        self.assertEqual(visibility, [("Central", 1750656000, 35.0, "km")])
+
+        lightning = list(
+            iter_readings(
+                {
+                    "fields": ["Time", "Cloud-to-ground", "Cloud-to-cloud"],
+                    "data": [["202506231400", 10, 5], ["bad time", 1, 1]],
+                }
+            )
+        )
+        self.assertEqual(
+            [(name, value) for name, _, value, _ in lightning],
+            [("Cloud-to-ground", 10.0), ("Cloud-to-cloud", 5.0)],
+        )
+
+    def test_ring_buffer_is_bounded(self):
+        """Test that the oldest samples are overwritten and duplicates ignored."""
+        buffer = RingBuffer(3)
+        for timestamp in range(5):
+            self.assertTrue(buffer.append(timestamp, float(timestamp)))
+        self.assertFalse(buffer.append(4, 99.0))
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.since(0), [(2, 2.0), (3, 3.0), (4, 4.0)])
+        self.assertEqual(buffer.since(4), [(4, 4.0)])
+
+    def test_query_window_and_trend(self):
+        """Test that only samples within the hours are summarized."""
+        history = SeriesHistory(hours=1, interval=600, max_series=1)
+        for minute, value in ((0, 10), (10, 20), (20, 30), (30, 30)):
+            time = f"2025062313{minute:02d}"
+            history.record({"fields": FIELDS, "data": [[time, "Central", value]]})
+        history.record({"fields": FIELDS, "data": [["202506231330", "Waglan Island", 5]]})
+
+        self.assertEqual(history.names(), ["Central"])
+        # 2025-06-23 13:30 HKT, 20 minutes back
+        series = history.query("Central", hours=1 / 3, now=1750656600)[0]
+        self.assertEqual([s["value"] for s in series["samples"]], [20.0, 30.0, 30.0])
+        self.assertEqual(series["trend"]["direction"], "rising")
+        later = history.query("Central", hours=1, now=1750656600 + 7200)
+        self.assertEqual(later[0]["samples"], [])
+        self.assertEqual(history.query("Waglan", hours=1), [])
+        self.assertEqual(history.record({"error": "The request timed out"}), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the pluggable JSON codec.
+
+This module tests that every codec decodes and encodes the same documents the
+same way, that codecs are chosen by preference, name or environment, and that
+fetch_json_data decodes responses with the codec in use.
+"""
+
+import os
+import unittest
+from types import MappingProxyType
+from unittest.mock import patch, MagicMock
+import requests
+from hkopenai.hk_climate_mcp_server import json_codec
+from hkopenai.hk_climate_mcp_server.json_codec import (
+    CODEC_ENV,
+    CODECS,
+    JsonCodec,
+    fetch_json_data,
+    get_codec,
+    register_codec,
+    set_codec,
+)
+
+DOCUMENT = {
+    "updateTime": "2025-06-23T10:02:00+08:00",
+    "temperature": {"data": [{"place": "京士柏", "value": 28.5, "unit": "C"}]},
+    "warningMessage": "",
+    "icon": [62],
+}
+
+
+class TestJsonCodec(unittest.TestCase):
+    """Test case class for the JSON codec."""
+
+    def tearDown(self):
+        set_codec()
+
+    def test_codecs_agree(self):
+        """Test that each codec reads and writes documents alike."""
+        frozen = MappingProxyType(
+            {"data": (1, 2), "names": frozenset({"HKO"}), 3: None}
+        )
+        for name, codec in CODECS.items():
+            with self.subTest(codec=name):
+                text = codec.dumps(DOCUMENT)
+                self.assertIn("京士柏", text)
+                self.assertNotIn(", ", text)
+                self.assertEqual(codec.loads(text), DOCUMENT)
+                self.assertEqual(codec.loads(text.encode("utf-8")), DOCUMENT)
+                self.assertEqual(
+                    codec.loads(codec.dumps(frozen)),
+                    {"data": [1, 2], "names": ["HKO"], "3": None},
+                )
+                self.assertEqual(codec.dumps({"big": 2**70}), '{"big":%d}' % 2**70)
+
+    def test_choose_codec(self):
+        """Test that codecs are chosen by name, environment and preference."""
+        self.assertEqual(set_codec("json").name, "json")
+        self.assertIs(get_codec(), CODECS["json"])
+        self.assertEqual(json_codec.dumps([1]), "[1]")
+        with self.assertRaises(ValueError):
+            set_codec("yaml")
+        with patch.dict(os.environ, {CODEC_ENV: "json"}):
+            self.assertEqual(set_codec().name, "json")
+        with patch.dict(os.environ, {CODEC_ENV: "yaml"}):
+            self.assertEqual(set_codec().name, json_codec.PREFERENCE[0])
+
+        preferences = list(json_codec.PREFERENCE)
+        upper = JsonCodec("upper", CODECS["json"].loads, lambda v: str(v).upper())
+        try:
+            register_codec(upper, preferred=True)
+            with patch.dict(os.environ, {CODEC_ENV: ""}):
+                self.assertEqual(set_codec().dumps("x"), "X")
+        finally:
+            del CODECS["upper"]
+            json_codec.PREFERENCE[:] = preferences
+
+    @patch("hkopenai.hk_climate_mcp_server.json_codec.requests.get")
+    def test_fetch_json_data(self, mock_get):
+        """Test that responses are decoded, with or without a BOM."""
+        response = MagicMock()
+        mock_get.return_value = response
+        for name in CODECS:
+            set_codec(name)
+            response.content = b"\xef\xbb\xbf" + b'{"value": "\xe5\xa4\xa9"}'
+            self.assertEqual(
+                fetch_json_data("https://example.com", encoding="utf-8-sig"),
+                {"value": "天"},
+            )
+            response.content = b"not json"
+            self.assertIn("Failed to parse JSON", fetch_json_data("https://x")["error"])
+        response.content = '{"value": "天"}'.encode("big5")
+        self.assertEqual(
+            fetch_json_data("https://example.com", encoding="big5"), {"value": "天"}
+        )
+        mock_get.side_effect = requests.exceptions.ConnectionError("offline")
+        self.assertIn("Connection error", fetch_json_data("https://x")["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
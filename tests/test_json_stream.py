@@ -0,0 +1,117 @@
+"""
+Unit tests for incremental parsing of opendata.php JSON tables.
+
+This module tests that rows are returned as soon as they are complete however
+the document is split, that malformed documents are rejected, and that
+streamed tables reach the paging tools when CSV is not available.
+"""
+
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from hkopenai.hk_climate_mcp_server.json_stream import (
+    JsonTableParser,
+    fetch_json_table,
+    parse_json_table,
+)
+from hkopenai.hk_climate_mcp_server.pagination import SERIES_CACHE
+from hkopenai.hk_climate_mcp_server.tools.tides import _get_hourly_tides
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
+
+TIDES = {
+    "fields": ["MM", "DD", "01", "02"],
+    "data": [
+        ["06", "01", "1.21", 1.3],
+        ["06", "02", "***", 12],
+        ["06", "03", "1.1", None],
+    ],
+}
+
+
+class TestJsonStream(unittest.TestCase):
+    """Test case class for streamed JSON tables."""
+
+    def setUp(self):
+        SERIES_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    def tearDown(self):
+        SERIES_CACHE.clear()
+
+    def test_rows_complete_as_they_arrive(self):
+        """Test that each row is returned by the piece completing it."""
+        text = json.dumps(TIDES, ensure_ascii=False)
+        parser = JsonTableParser()
+        rows = []
+        for char in text[:-1]:
+            rows.extend(parser.feed(char))
+        self.assertEqual(rows, TIDES["data"])
+        self.assertEqual(parser.document, {"fields": TIDES["fields"]})
+        self.assertEqual(parser.feed(text[-1], final=True), [])
+
+    def test_parse_json_table(self):
+        """Test that rows of any split read back as they were sent."""
+        text = json.dumps(TIDES, indent=1)
+        for size in (1, 7, len(text)):
+            pieces = [text[i : i + size] for i in range(0, len(text), size)]
+            table = parse_json_table(pieces)
+            self.assertEqual(table.fields, TIDES["fields"])
+            self.assertEqual(table.rows(), TIDES["data"])
+        self.assertIsNone(parse_json_table(['{"fields": [], "data": []}']))
+        self.assertIsNone(parse_json_table(["{}"]))
+
+    def test_invalid_documents(self):
+        """Test that malformed documents and rows raise ValueError."""
+        for text in (
+            "[1, 2]",
+            '{"fields": ["a"], "data": [[1], [2]',
+            '{"fields": ["a"], "data": [[1] [2]]}',
+            '{"data": [[1]], "fields": ["a"]}',
+            '{"fields": ["a"], "data": [[1, 2]]}',
+            '{"fields": ["a"], "data": [[[1]]]}',
+            '{"fields": ["a"], "data": []} x',
+        ):
+            with self.assertRaises(ValueError, msg=text):
+                parse_json_table([text])
+
+    @patch("hkopenai.hk_climate_mcp_server.json_stream.requests.get")
+    def test_fetch_json_table(self, mock_get):
+        """Test that JSON is streamed in chunks and failures give errors."""
+        raw = json.dumps(TIDES).encode("utf-8")
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = [b"\xef\xbb\xbf" + raw[:5], raw[5:]]
+        mock_get.return_value = response
+
+        table = fetch_json_table({"dataType": "HHOT", "rformat": "json"})
+        self.assertEqual(len(table), 3)
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+
+        response.iter_content.return_value = [b'{"fields": [], "data": []}']
+        self.assertEqual(
+            fetch_json_table({"dataType": "HHOT"}), {"fields": [], "data": []}
+        )
+        response.iter_content.return_value = [raw[:-1]]
+        self.assertIn("Failed to parse", fetch_json_table({})["error"])
+        mock_get.side_effect = requests.exceptions.Timeout("slow")
+        self.assertIn("timed out", fetch_json_table({})["error"])
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tables.fetch_csv_table",
+        return_value=None,
+    )
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    def test_pages_read_from_streamed_json(
+        self, mock_fetch_json_table, mock_fetch_csv_table
+    ):
+        """Test that pages come from streamed JSON when CSV is unreadable."""
+        mock_fetch_json_table.return_value = parse_json_table([json.dumps(TIDES)])
+
+        page = _get_hourly_tides(station="CCH", year=2025, page_size=2)
+        self.assertEqual(page["data"], TIDES["data"][:2])
+        self.assertEqual(page["total"], 3)
+        mock_fetch_csv_table.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
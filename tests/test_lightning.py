@@ -7,30 +7,50 @@ to ensure it correctly fetches and processes lightning data from the HKO API.
 
 import unittest
 from unittest.mock import patch, MagicMock
-from hkopenai.hk_climate_mcp_server.tools.lightning import register, _get_lightning_data
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.history import LIGHTNING_HISTORY
+from hkopenai.hk_climate_mcp_server.tools.lightning import (
+    register,
+    _get_lightning_data,
+    _get_lightning_history,
+)
 from hkopenai.hk_climate_mcp_server.tools.lightning import fetch_json_data
 
 
 class TestLightningTools(unittest.TestCase):
     """Test case class for lightning data tools."""
 
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        LIGHTNING_HISTORY.clear()
+
     def test_register_tool(self):
         """Tests that the lightning data tool is correctly registered."""
         mock_mcp = MagicMock()
         register(mock_mcp)
 
         # Verify that mcp.tool was called for each tool function
-        self.assertEqual(mock_mcp.tool.call_count, 1)
+        self.assertEqual(mock_mcp.tool.call_count, 2)
 
-        # Get the decorated function
-        decorated_func = mock_mcp.tool.return_value.call_args[0][0]
+        # Get the decorated functions
+        decorated_funcs = {
+            call.args[0].__name__: call.args[0]
+            for call in mock_mcp.tool.return_value.call_args_list
+        }
 
         # Test get_lightning_data
         with patch(
             "hkopenai.hk_climate_mcp_server.tools.lightning._get_lightning_data"
         ) as mock_get_lightning_data:
-            decorated_func(lang="en")
-            mock_get_lightning_data.assert_called_once_with("en")
+            decorated_funcs["get_lightning_data"](lang="en")
+            mock_get_lightning_data.assert_called_once_with("en", raw=True)
+
+        # Test get_lightning_history
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.lightning._get_lightning_history"
+        ) as mock_get_lightning_history:
+            decorated_funcs["get_lightning_history"](region="Lantau", hours=2)
+            mock_get_lightning_history.assert_called_once_with("Lantau", 2)
 
     @patch("hkopenai.hk_climate_mcp_server.tools.lightning.fetch_json_data")
     def test_get_lightning_data_internal(self, mock_fetch_json_data):
@@ -51,5 +71,36 @@ class TestLightningTools(unittest.TestCase):
         )
 
 
+    @patch("hkopenai.hk_climate_mcp_server.history.time.time")
+    @patch("hkopenai.hk_climate_mcp_server.tools.lightning.fetch_json_data")
+    def test_get_lightning_history(self, mock_fetch_json_data, mock_time):
+        """Test that every lightning type of a region is returned."""
+        mock_fetch_json_data.return_value = {
+            "fields": ["Date time", "Lightning type", "Region", "Count"],
+            "data": [
+                ["202506231300-1359", "Cloud-to-ground", "Lantau", "3"],
+                ["202506231300-1359", "Cloud-to-cloud", "Lantau", "8"],
+                ["202506231300-1359", "Cloud-to-ground", "Hong Kong Island", "0"],
+            ],
+        }
+        # 2025-06-23 14:00 HKT
+        mock_time.return_value = 1750658400
+
+        result = _get_lightning_history("Lantau", hours=2)
+
+        self.assertEqual(
+            [(s["name"], s["max"]["value"]) for s in result["series"]],
+            [("Cloud-to-cloud / Lantau", 8.0), ("Cloud-to-ground / Lantau", 3.0)],
+        )
+        self.assertEqual(result["series"][0]["trend"]["direction"], None)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.lightning.fetch_json_data")
+    def test_get_lightning_history_error(self, mock_fetch_json_data):
+        """Test that an upstream error is returned while there is no history."""
+        mock_fetch_json_data.return_value = {"error": "The request timed out"}
+        result = _get_lightning_history("Lantau")
+        self.assertEqual(result, {"error": "The request timed out"})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for the persistent observation store.
+
+This module tests that current weather reports are appended once to day
+segments on disk and read back by place, element and time range.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from hkopenai.hk_climate_mcp_server.observation_store import ObservationStore
+from hkopenai.hk_climate_mcp_server.observations import WeatherSnapshot
+
+# 2025-06-07 00:00 HKT
+MIDNIGHT = 1749225600
+
+
+def report(hour: int, minute: int, sha_tin: float, rainfall: float = 0) -> WeatherSnapshot:
+    """Build a report recorded at an hour and minute of 2025-06-07."""
+    record_time = f"2025-06-07T{hour:02d}:{minute:02d}:00+08:00"
+    return WeatherSnapshot.parse(
+        {
+            "temperature": {
+                "data": [
+                    {"place": "Hong Kong Observatory", "value": 29, "unit": "C"},
+                    {"place": "Sha Tin", "value": sha_tin, "unit": "C"},
+                ],
+                "recordTime": record_time,
+            },
+            "humidity": {
+                "data": [{"place": "Hong Kong Observatory", "value": 80, "unit": "percent"}],
+                "recordTime": record_time,
+            },
+            "rainfall": {
+                "data": [
+                    {"place": "Sha Tin", "max": rainfall, "unit": "mm", "main": "FALSE"},
+                    {"place": "Tai Po", "unit": "mm", "main": "TRUE"},
+                ],
+                "endTime": record_time,
+            },
+            "updateTime": record_time,
+        },
+        "en",
+    )
+
+
+class TestObservationStore(unittest.TestCase):
+    """Test case class for the observation store."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = Path(self._dir.name)
+        self.store = ObservationStore(self.root)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_record_and_query(self):
+        """Test appending reports once and reading a place back by range."""
+        self.assertEqual(self.store.record(report(10, 0, 30.5, rainfall=2)), 4)
+        self.assertEqual(self.store.record(report(10, 0, 30.5)), 0)
+        self.assertEqual(self.store.record(report(10, 10, 31)), 4)
+        self.assertEqual(self.store.record({"error": "The request timed out"}), 0)
+
+        day = self.root / "20250607"
+        self.assertEqual(os.path.getsize(day / "temperature.time"), 4 * 8)
+        self.assertEqual(
+            self.store.places(date(2025, 6, 7)), ["Hong Kong Observatory", "Sha Tin"]
+        )
+
+        end_of_day = MIDNIGHT + 86399
+        self.assertEqual(
+            self.store.query("sha tin", "temperature", MIDNIGHT, end_of_day),
+            [(MIDNIGHT + 36000, 30.5), (MIDNIGHT + 36600, 31.0)],
+        )
+        self.assertEqual(
+            self.store.query("Sha Tin", "temperature", MIDNIGHT + 36001, end_of_day),
+            [(MIDNIGHT + 36600, 31.0)],
+        )
+        # Rainfall of a district under maintenance (Tai Po) is not stored
+        self.assertEqual(
+            self.store.query("Sha Tin", "rainfall", MIDNIGHT, end_of_day),
+            [(MIDNIGHT + 36000, 2.0), (MIDNIGHT + 36600, 0.0)],
+        )
+        self.assertEqual(self.store.query("Tai Po", "rainfall", MIDNIGHT, end_of_day), [])
+        self.assertEqual(
+            self.store.query("Sha Tin", "temperature", MIDNIGHT + 86400, MIDNIGHT + 90000),
+            [],
+        )
+
+    def test_reopen_and_recover(self):
+        """Test that a new store continues the files of a previous one."""
+        self.store.record(report(10, 0, 30))
+        # Simulate an append interrupted after the value column was written
+        with open(self.root / "20250607" / "temperature.value", "ab") as f:
+            f.write(b"\0" * 4)
+
+        reopened = ObservationStore(self.root)
+        self.assertEqual(reopened.record(report(10, 0, 30)), 0)
+        self.assertEqual(reopened.record(report(10, 10, 32)), 4)
+        rows = reopened.query("Sha Tin", "temperature", MIDNIGHT, MIDNIGHT + 86399)
+        self.assertEqual([value for _, value in rows], [30.0, 32.0])
+
+    def test_old_segments_expire(self):
+        """Test that segments before the retention window go when a day starts."""
+        store = ObservationStore(self.root, retention_days=2)
+        for name in ("20250605", "20250606", "notes"):
+            (self.root / name).mkdir()
+        store.record(report(10, 0, 30))
+        self.assertEqual(
+            sorted(p.name for p in self.root.iterdir()), ["20250606", "20250607", "notes"]
+        )
+        # Segments are only checked when a new one is created
+        (self.root / "20250601").mkdir()
+        store.record(report(11, 0, 31))
+        self.assertTrue((self.root / "20250601").exists())
+        rows = store.query("Sha Tin", "temperature", MIDNIGHT, MIDNIGHT + 86399)
+        self.assertEqual([value for _, value in rows], [30.0, 31.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Unit tests for parsed rhrread observation snapshots.
+
+This module tests place name normalization, the region index, the
+memoization of parsed snapshots and their immutability.
+"""
+
+import dataclasses
+import unittest
+from hkopenai.hk_climate_mcp_server.frozen import freeze, thaw
+from hkopenai.hk_climate_mcp_server.observations import (
+    clear_snapshots,
+    get_snapshot,
+    normalize_place,
+)
+
+RHRREAD = {
+    "updateTime": "2025-06-07T22:02:00+08:00",
+    "temperature": {
+        "recordTime": "2025-06-07T22:00:00+08:00",
+        "data": [
+            {"place": "King's Park", "value": 28, "unit": "C"},
+            {"place": "Hong Kong Observatory", "value": 29, "unit": "C"},
+            {"place": "Sha Tin", "value": 30, "unit": "C"},
+        ],
+    },
+    "humidity": {
+        "recordTime": "2025-06-07T22:00:00+08:00",
+        "data": [{"unit": "percent", "value": 79, "place": "Hong Kong Observatory"}],
+    },
+    "rainfall": {
+        "startTime": "2025-06-07T20:45:00+08:00",
+        "endTime": "2025-06-07T21:45:00+08:00",
+        "data": [
+            {"unit": "mm", "place": "Sha Tin", "max": 4, "min": 1, "main": "FALSE"},
+            {"unit": "mm", "place": "Tai Po", "max": 0, "main": "FALSE"},
+        ],
+    },
+}
+
+
+class TestObservations(unittest.TestCase):
+    """Test case class for observation snapshots."""
+
+    def setUp(self):
+        clear_snapshots()
+
+    def test_normalize_place(self):
+        """Test that case, whitespace and punctuation are ignored."""
+        self.assertEqual(normalize_place("King's Park"), "kingspark")
+        self.assertEqual(normalize_place("  KINGS  park "), "kingspark")
+        self.assertEqual(normalize_place("香港 天文台"), "香港天文台")
+
+    def test_index_lookup(self):
+        """Test exact, translated and fuzzy lookups."""
+        snapshot = get_snapshot(RHRREAD, "en")
+        self.assertEqual(snapshot.temperature.get("kings park").value, 28)
+        self.assertEqual(snapshot.temperature.get("沙田").place, "Sha Tin")
+        self.assertEqual(snapshot.temperature.get("Sha Tim").place, "Sha Tin")
+        self.assertEqual(snapshot.temperature.get("HK Observatory").value, 29)
+        self.assertIsNone(snapshot.temperature.get("Lantau Peak"))
+        self.assertIsNone(snapshot.temperature.get(""))
+        self.assertEqual(snapshot.rainfall.get("tai po").max, 0.0)
+        self.assertEqual(snapshot.default_place(), "Hong Kong Observatory")
+        self.assertEqual(get_snapshot(RHRREAD, "sc").default_place(), "香港天文台")
+
+    def test_snapshot_memoized_per_update(self):
+        """Test that a document is parsed once per update time and language."""
+        first = get_snapshot(RHRREAD, "en")
+        self.assertIs(get_snapshot(dict(RHRREAD), "en"), first)
+        self.assertIsNot(get_snapshot(RHRREAD, "tc"), first)
+
+        updated = dict(RHRREAD, updateTime="2025-06-07T23:02:00+08:00")
+        self.assertIsNot(get_snapshot(updated, "en"), first)
+
+    def test_snapshot_is_immutable(self):
+        """Test that shared snapshots cannot be modified by callers."""
+        data = dict(RHRREAD, uvindex={"data": [{"place": "King's Park", "value": 3}]})
+        snapshot = get_snapshot(data, "en")
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.update_time = ""
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.temperature.get("Sha Tin").value = 0
+        with self.assertRaises(TypeError):
+            snapshot.uvindex["data"] = []
+        with self.assertRaises(TypeError):
+            snapshot.temperature.by_key["shatin"] = None
+
+        data["uvindex"]["data"][0]["value"] = 9
+        self.assertEqual(snapshot.uvindex["data"][0]["value"], 3)
+
+    def test_freeze_and_thaw(self):
+        """Test that thaw() returns plain JSON values equal to the original."""
+        value = {"a": [1, {"b": [2, 3]}], "c": "d"}
+        frozen = freeze(value)
+        self.assertIsInstance(frozen["a"], tuple)
+        self.assertEqual(thaw(frozen), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
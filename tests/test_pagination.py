@@ -0,0 +1,124 @@
+"""
+Unit tests for cursor-based pagination of large tables.
+
+This module tests that pages are sliced from a single fetch of the table,
+that cursors lead through every row and are tied to their request, and that
+the tide and temperature tools return pages when asked.
+"""
+
+import unittest
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.csv_table import parse_csv
+from hkopenai.hk_climate_mcp_server.pagination import (
+    SERIES_CACHE,
+    SeriesCache,
+    get_page,
+    iter_pages,
+)
+from hkopenai.hk_climate_mcp_server.tools.temperature import _get_daily_mean_temperature
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
+
+TABLE = {
+    "fields": ["Date", "Hour", "Height"],
+    "data": [["2025-06-01", hour, hour / 10] for hour in range(1, 26)],
+}
+
+
+class TestPagination(unittest.TestCase):
+    """Test case class for pagination."""
+
+    def setUp(self):
+        SERIES_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    def tearDown(self):
+        SERIES_CACHE.clear()
+
+    def test_pages_follow_cursors(self):
+        """Test that every row is returned once, fetching the table once."""
+        fetch = MagicMock(return_value=TABLE)
+        params = {"dataType": "HHOT", "station": "CCH", "year": 2025}
+
+        first = get_page(params, fetch, page_size=10)
+        self.assertEqual(first["fields"], TABLE["fields"])
+        self.assertEqual(first["data"], TABLE["data"][:10])
+        self.assertEqual((first["offset"], first["total"]), (0, 25))
+        self.assertIsNotNone(first["nextCursor"])
+
+        pages = list(iter_pages(lambda cursor: get_page(params, fetch, cursor, 10)))
+        self.assertEqual([len(page["data"]) for page in pages], [10, 10, 5])
+        self.assertEqual(sum((page["data"] for page in pages), []), TABLE["data"])
+        self.assertIsNone(pages[-1]["nextCursor"])
+        fetch.assert_called_once()
+
+    def test_invalid_requests(self):
+        """Test errors for bad cursors and page sizes, and fetch errors passed through."""
+        fetch = MagicMock(return_value=TABLE)
+        params = {"dataType": "HHOT", "station": "CCH", "year": 2025}
+        cursor = get_page(params, fetch, page_size=10)["nextCursor"]
+
+        other = {"dataType": "HHOT", "station": "CCH", "year": 2024}
+        self.assertIn("other arguments", get_page(other, fetch, cursor)["error"])
+        self.assertIn("Invalid cursor", get_page(params, fetch, "not a cursor")["error"])
+        self.assertIn("Invalid page_size", get_page(params, fetch, page_size=0)["error"])
+
+        failing = MagicMock(return_value={"error": "Failed to fetch data"})
+        self.assertEqual(
+            get_page({"dataType": "HLT"}, failing, page_size=10),
+            {"error": "Failed to fetch data"},
+        )
+
+    def test_cache_is_bounded(self):
+        """Test that the least recently used tables are dropped first."""
+        cache = SeriesCache(max_entries=2)
+        cache.put("a", TABLE)
+        cache.put("b", TABLE)
+        cache.get("a")
+        cache.put("c", TABLE)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        expired = SeriesCache(ttl_seconds=-1)
+        expired.put("a", TABLE)
+        self.assertIsNone(expired.get("a"))
+
+    def test_cache_is_bounded_in_bytes(self):
+        """Test that tables over the memory budget are dropped, except the newest."""
+        table = parse_csv(["Year,Value"] + [f"{i},{i}.5" for i in range(1000)])
+        self.assertGreaterEqual(table.nbytes(), 2 * 1000 * 8)
+        cache = SeriesCache(max_bytes=table.nbytes() * 2)
+        cache.put("a", table)
+        cache.put("b", TABLE)
+        cache.put("c", table)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        small = SeriesCache(max_bytes=1)
+        small.put("a", table)
+        small.put("b", table)
+        self.assertIsNone(small.get("a"))
+        self.assertIs(small.get("b"), table)
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tables.fetch_csv_table",
+        return_value=None,
+    )
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    def test_tool_pages(self, mock_fetch_json_table, mock_fetch_csv_table):
+        """Test that a temperature tool pages through a table fetched once."""
+        mock_fetch_json_table.return_value = TABLE
+
+        first = _get_daily_mean_temperature(station="HKO", page_size=20)
+        second = _get_daily_mean_temperature(station="HKO", cursor=first["nextCursor"])
+
+        self.assertEqual(len(first["data"]), 20)
+        self.assertEqual(second["data"], TABLE["data"][20:])
+        self.assertIsNone(second["nextCursor"])
+        mock_fetch_json_table.assert_called_once()
+        self.assertIn(
+            "error",
+            _get_daily_mean_temperature(station="HKO", year=2024, cursor=first["nextCursor"]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
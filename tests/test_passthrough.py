@@ -0,0 +1,170 @@
+"""
+Unit tests for the raw passthrough of HKO documents.
+
+This module tests that documents holding data are kept as the bytes HKO sent,
+that they are cached and shared by the feed registry as such, and that tools
+serve them unchanged unless fields are requested.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from fastmcp import Client, FastMCP
+from hkopenai.hk_climate_mcp_server.feeds import FeedRegistry
+from hkopenai.hk_climate_mcp_server.passthrough import (
+    DECODE_LIMIT,
+    RAW_CACHE,
+    RawCache,
+    RawJson,
+    fetch_raw_json,
+    get_raw_json,
+    raw_result,
+)
+from hkopenai.hk_climate_mcp_server.tools.astronomical import register
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
+
+MOON_TIMES = (
+    b'{"fields":["YYYY-MM-DD","RISE","TRAN.","SET"],'
+    b'"data":[["2025-06-30","09:27","16:11","22:48"]]}'
+)
+
+
+class TestPassthrough(unittest.TestCase):
+    """Test case class for the raw passthrough."""
+
+    def setUp(self):
+        RAW_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    def tearDown(self):
+        RAW_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    @patch("hkopenai.hk_climate_mcp_server.json_codec.requests.get")
+    def test_fetch_raw_json(self, mock_get):
+        """Test that only documents holding data are kept as bytes."""
+        response = MagicMock()
+        mock_get.return_value = response
+        response.content = b"\xef\xbb\xbf" + MOON_TIMES
+        raw = fetch_raw_json("https://example.com", encoding="utf-8-sig")
+        self.assertIsInstance(raw, RawJson)
+        self.assertEqual(raw.data, MOON_TIMES)
+        self.assertEqual(raw.decode()["data"][0][1], "09:27")
+
+        response.content = b'{"fields":[],"data":[]}'
+        self.assertEqual(fetch_raw_json("https://x"), {"fields": [], "data": []})
+        response.content = b"not json"
+        self.assertIn("Failed to parse JSON", fetch_raw_json("https://x")["error"])
+        response.content = '{"place":"天文台"}'.encode("big5")
+        raw = fetch_raw_json("https://x", encoding="big5")
+        self.assertEqual(raw.text(), '{"place":"天文台"}')
+
+    @patch("hkopenai.hk_climate_mcp_server.passthrough.decode_json")
+    @patch("hkopenai.hk_climate_mcp_server.passthrough.fetch_json_bytes")
+    def test_large_bodies_are_scanned(self, mock_fetch_json_bytes, mock_decode_json):
+        """Test that large bodies holding data are kept without decoding them."""
+        rows = b",".join([b'["2025-06-30","09:27","16:11","22:48"]'] * 100)
+        mock_fetch_json_bytes.return_value = b'{"fields":["a"],"data":[' + rows + b"]}"
+        self.assertIsInstance(fetch_raw_json("https://x"), RawJson)
+        mock_decode_json.assert_not_called()
+
+        padding = b" " * (DECODE_LIMIT + 1)
+        for body in (
+            b'{"fields": ["a"], "data": [ ]}' + padding,
+            b'{"error": "x", "more": "' + padding + b'"}',
+            b"[" + rows + b"]",
+        ):
+            mock_fetch_json_bytes.return_value = body
+            mock_decode_json.return_value = {"error": "decoded"}
+            self.assertEqual(fetch_raw_json("https://x"), {"error": "decoded"})
+        self.assertEqual(mock_decode_json.call_count, 3)
+
+    def test_raw_cache(self):
+        """Test that the raw cache drops the least recently used documents."""
+        cache = RawCache(max_bytes=10)
+        cache.put("u", {"year": 1}, RawJson(b"12345"))
+        cache.put("u", {"year": 2}, RawJson(b"12345"))
+        self.assertIsNotNone(cache.get("u", {"year": 1}))
+        cache.put("u", {"year": 3}, RawJson(b"1234"))
+        self.assertIsNone(cache.get("u", {"year": 2}))
+        self.assertIsNotNone(cache.get("u", {"year": 1}))
+        self.assertIsNone(cache.get("v", {"year": 1}))
+        cache.put("u", {"year": 4}, RawJson(b"12345678901"))
+        self.assertIsNone(cache.get("u", {"year": 4}))
+
+        expired = RawCache(ttl_seconds=-1)
+        expired.put("u", {}, RawJson(b"{}"))
+        self.assertIsNone(expired.get("u", {}))
+
+    @patch("hkopenai.hk_climate_mcp_server.passthrough.fetch_json_bytes")
+    def test_get_raw_json(self, mock_fetch_json_bytes):
+        """Test that raw documents are fetched once and errors are not kept."""
+        mock_fetch_json_bytes.return_value = MOON_TIMES
+        first = get_raw_json("https://x", {"year": 2025})
+        self.assertIs(get_raw_json("https://x", {"year": 2025}), first)
+        self.assertEqual(mock_fetch_json_bytes.call_count, 1)
+
+        mock_fetch_json_bytes.return_value = {"error": "The request timed out"}
+        self.assertIn("error", get_raw_json("https://x", {"year": 2026}))
+        self.assertIn("error", get_raw_json("https://x", {"year": 2026}))
+        self.assertEqual(mock_fetch_json_bytes.call_count, 3)
+
+        result = raw_result(first)
+        self.assertIsNone(result.structured_content)
+        self.assertEqual(result.content[0].text, MOON_TIMES.decode("utf-8"))
+        self.assertEqual(raw_result({"error": "x"}), {"error": "x"})
+
+    def test_feed_registry_keeps_bytes(self):
+        """Test that feeds fetched as raw bytes are kept whole and parsed on demand."""
+        registry = FeedRegistry()
+        document = {"fields": ["Region"], "data": [["Lantau"]]}
+        fetch_json = MagicMock(return_value=document)
+        fetch_raw = MagicMock(return_value=RawJson(json.dumps(document).encode()))
+
+        # A document fetched without its bytes is fetched again for them
+        self.assertEqual(registry.get("LHL", "en", fetch_json)["data"], (("Lantau",),))
+        with patch(
+            "hkopenai.hk_climate_mcp_server.feeds.decode_json", wraps=json.loads
+        ) as mock_decode_json:
+            raw = registry.get_raw("LHL", "en", fetch_raw)
+            self.assertIsInstance(raw, RawJson)
+            self.assertIs(registry.get_raw("LHL", "en", fetch_raw), raw)
+            self.assertEqual(fetch_raw.call_count, 1)
+            # The bytes are parsed once, when the document is first read
+            mock_decode_json.assert_not_called()
+            document = registry.get("LHL", "en", fetch_json)
+            self.assertEqual(document["fields"], ("Region",))
+            self.assertIs(registry.get("LHL", "en", fetch_json), document)
+            self.assertEqual(mock_decode_json.call_count, 1)
+        self.assertEqual(fetch_json.call_count, 1)
+
+        # Fetches returning plain documents still serve get_raw
+        document = registry.get_raw("LTMV", "en", fetch_json)
+        self.assertEqual(document["fields"], ("Region",))
+
+    @patch("hkopenai.hk_climate_mcp_server.passthrough.fetch_json_bytes")
+    def test_tool_serves_bytes(self, mock_fetch_json_bytes):
+        """Test that tools serve raw bytes unless fields are requested."""
+        mock_fetch_json_bytes.return_value = MOON_TIMES
+        mcp = FastMCP("test")
+        register(mcp)
+
+        async def call(args):
+            async with Client(mcp) as client:
+                return await client.call_tool("get_moon_times", args)
+
+        result = asyncio.run(call({"year": 2025, "month": 6, "day": 30}))
+        self.assertIsNone(result.structured_content)
+        self.assertEqual(result.content[0].text, MOON_TIMES.decode("utf-8"))
+
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.astronomical.fetch_json_data",
+            return_value=json.loads(MOON_TIMES),
+        ):
+            result = asyncio.run(call({"year": 2025, "fields": ["RISE"]}))
+        self.assertEqual(result.structured_content["data"], [["09:27"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
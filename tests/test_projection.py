@@ -0,0 +1,77 @@
+"""
+Unit tests for field projection of tool results.
+
+This module tests that keys, dotted paths and table columns are kept, that
+everything else is dropped, and that unknown fields are reported.
+"""
+
+import unittest
+from hkopenai.hk_climate_mcp_server.projection import project
+
+FORECAST = {
+    "generalSituation": "Fine.",
+    "weatherForecast": [
+        {"forecastDate": "20250623", "PSR": "Low", "forecastMaxtemp": {"value": 31, "unit": "C"}},
+        {"forecastDate": "20250624", "PSR": "High", "forecastMaxtemp": {"value": 30, "unit": "C"}},
+    ],
+    "updateTime": "2025-06-22T16:30:00+08:00",
+    "seaTemp": {"place": "North Point", "value": 27},
+    "soilTemp": [],
+}
+
+TIDES = {
+    "fields": ["Date", "Hour", "Height"],
+    "data": [["2025-06-01", 1, 1.2], ["2025-06-01", 2, 1.5]],
+}
+
+
+class TestProjection(unittest.TestCase):
+    """Test case class for field projection."""
+
+    def test_keys_and_paths(self):
+        """Test that keys and dotted paths through lists and dicts are kept."""
+        result = project(
+            FORECAST,
+            ["updateTime", "weatherForecast.forecastDate", "weatherForecast.forecastMaxtemp.value"],
+        )
+        self.assertEqual(
+            result,
+            {
+                "updateTime": "2025-06-22T16:30:00+08:00",
+                "weatherForecast": [
+                    {"forecastDate": "20250623", "forecastMaxtemp": {"value": 31}},
+                    {"forecastDate": "20250624", "forecastMaxtemp": {"value": 30}},
+                ],
+            },
+        )
+        # A whole key wins over paths into it
+        self.assertEqual(
+            project(FORECAST, ["seaTemp.value", "seaTemp"]), {"seaTemp": FORECAST["seaTemp"]}
+        )
+        # Paths into empty lists are not errors
+        self.assertEqual(project(FORECAST, ["soilTemp.value"]), {"soilTemp": []})
+
+    def test_table_columns(self):
+        """Test that tables in the opendata layout are cut down to named columns."""
+        self.assertEqual(
+            project(TIDES, ["Height", "Date"]),
+            {"fields": ["Height", "Date"], "data": [[1.2, "2025-06-01"], [1.5, "2025-06-01"]]},
+        )
+        self.assertEqual(project(TIDES, ["fields"]), {"fields": TIDES["fields"]})
+
+    def test_no_fields_and_errors(self):
+        """Test pass-through without fields and errors for unknown or invalid fields."""
+        self.assertIs(project(FORECAST, None), FORECAST)
+        self.assertIs(project(FORECAST, []), FORECAST)
+        error = {"error": "Invalid station"}
+        self.assertIs(project(error, ["data"]), error)
+
+        result = project(FORECAST, ["updateTime", "weatherForecast.icon", "nothing"])
+        self.assertIn("Unknown field(s): weatherForecast.icon, nothing", result["error"])
+        self.assertIn("Available fields: generalSituation, weatherForecast", result["error"])
+        self.assertIn("error", project(FORECAST, "updateTime"))
+        self.assertIn("error", project(FORECAST, ["updateTime", ""]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,17 @@ This module contains tests for the get_weather_radiation_report function,
 ensuring it handles various input scenarios and API responses correctly.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.cache import CACHE_DIR_ENV
+from hkopenai.hk_climate_mcp_server.radiation_store import RADIATION_STORE
 from hkopenai.hk_climate_mcp_server.tools.radiation import (
     register,
     _get_weather_radiation_report,
+    _get_weather_radiation_reports,
+    _get_radiation_statistics,
     fetch_json_data,
 )
 
@@ -191,7 +197,7 @@ class TestRadiationTools(unittest.TestCase):
         register(mock_mcp)
 
         # Verify that mcp.tool was called for each tool function
-        self.assertEqual(mock_mcp.tool.call_count, 2)
+        self.assertEqual(mock_mcp.tool.call_count, 4)
 
         # Get the decorated functions
         decorated_funcs = {
@@ -210,6 +216,31 @@ class TestRadiationTools(unittest.TestCase):
                 date="20250629", station="HKO", lang="en"
             )
 
+        # Test get_weather_radiation_reports
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.radiation._get_weather_radiation_reports"
+        ) as mock_get_weather_radiation_reports:
+            decorated_funcs["get_weather_radiation_reports"](
+                start_date="20250601", end_date="20250603", stations=["HKO"]
+            )
+            mock_get_weather_radiation_reports.assert_called_once_with(
+                start_date="20250601",
+                end_date="20250603",
+                stations=["HKO"],
+                lang="en",
+            )
+
+        # Test get_radiation_statistics
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.radiation._get_radiation_statistics"
+        ) as mock_get_radiation_statistics:
+            decorated_funcs["get_radiation_statistics"](
+                station="HKO", start_date="20250601", end_date="20250603"
+            )
+            mock_get_radiation_statistics.assert_called_once_with(
+                station="HKO", start_date="20250601", end_date="20250603"
+            )
+
         # Test get_radiation_station_codes
         with patch(
             "hkopenai.hk_climate_mcp_server.tools.radiation._get_radiation_station_codes"
@@ -218,5 +249,123 @@ class TestRadiationTools(unittest.TestCase):
             mock_get_radiation_station_codes.assert_called_once_with(lang="en")
 
 
+class TestRadiationBatchTool(unittest.TestCase):
+    """Test case class for the batch radiation report tool."""
+
+    def setUp(self):
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {CACHE_DIR_ENV: self._cache_dir.name})
+        self._env.start()
+        self._limiter = patch(
+            "hkopenai.hk_climate_mcp_server.tools.radiation.HKO_RATE_LIMITER"
+        )
+        self._limiter.start()
+        RADIATION_STORE.clear()
+
+    def tearDown(self):
+        self._limiter.stop()
+        self._env.stop()
+        self._cache_dir.cleanup()
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.radiation.fetch_json_data")
+    def test_batch_fetches_each_pair_once_then_serves_cache(self, mock_fetch_json_data):
+        """Test that past reports are fetched once and then served from cache."""
+        mock_fetch_json_data.return_value = TestRadiationTools.EXAMPLE_JSON
+
+        result = _get_weather_radiation_reports(
+            start_date="20230601", end_date="20230603", stations=["HKO", "CCH"]
+        )
+        self.assertEqual(mock_fetch_json_data.call_count, 6)
+        self.assertEqual(result["fetchedCount"], 6)
+        self.assertEqual(result["cachedCount"], 0)
+        self.assertEqual(
+            [(r["station"], r["date"]) for r in result["reports"]],
+            [
+                ("HKO", "20230601"),
+                ("HKO", "20230602"),
+                ("HKO", "20230603"),
+                ("CCH", "20230601"),
+                ("CCH", "20230602"),
+                ("CCH", "20230603"),
+            ],
+        )
+
+        mock_fetch_json_data.reset_mock()
+        result = _get_weather_radiation_reports(
+            start_date="20230601", end_date="20230603", stations=["HKO", "CCH"]
+        )
+        mock_fetch_json_data.assert_not_called()
+        self.assertEqual(result["cachedCount"], 6)
+        self.assertEqual(
+            result["reports"][0]["report"], TestRadiationTools.EXAMPLE_JSON
+        )
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.radiation.fetch_json_data")
+    def test_batch_errors_are_reported_and_not_cached(self, mock_fetch_json_data):
+        """Test that failed fetches are reported per item and retried later."""
+        mock_fetch_json_data.return_value = {"error": "HTTP error occurred"}
+
+        result = _get_weather_radiation_reports(
+            start_date="20230601", end_date="20230601", stations=["HKO"]
+        )
+        self.assertEqual(result["reports"][0]["error"], "HTTP error occurred")
+
+        _get_weather_radiation_reports(
+            start_date="20230601", end_date="20230601", stations=["HKO"]
+        )
+        self.assertEqual(mock_fetch_json_data.call_count, 2)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.radiation.fetch_json_data")
+    def test_batch_defaults_to_all_stations(self, mock_fetch_json_data):
+        """Test that omitting stations covers every radiation station."""
+        mock_fetch_json_data.return_value = TestRadiationTools.EXAMPLE_JSON
+
+        result = _get_weather_radiation_reports(
+            start_date="20230601", end_date="20230601"
+        )
+        self.assertEqual(len(result["stations"]), 34)
+        self.assertEqual(mock_fetch_json_data.call_count, 34)
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.radiation.fetch_json_data")
+    def test_batch_validates_locally(self, mock_fetch_json_data):
+        """Test that invalid parameters are rejected without upstream calls."""
+        cases = [
+            {"start_date": "20230601", "end_date": "20230602", "stations": ["BAD"]},
+            {"start_date": "2023-06-01", "end_date": "20230602"},
+            {"start_date": "20230602", "end_date": "20230601"},
+            {"start_date": "20230101", "end_date": "20230301"},
+            {"start_date": "20230601", "end_date": "29990101"},
+        ]
+        for kwargs in cases:
+            result = _get_weather_radiation_reports(**kwargs)
+            self.assertIn("error", result, kwargs)
+        mock_fetch_json_data.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.radiation.fetch_json_data")
+    def test_statistics_served_from_store(self, mock_fetch_json_data):
+        """Test that statistics use reports already retrieved, without refetching."""
+        mock_fetch_json_data.return_value = TestRadiationTools.EXAMPLE_JSON
+        _get_weather_radiation_reports(
+            start_date="20230601", end_date="20230601", stations=["CLK"]
+        )
+        mock_fetch_json_data.reset_mock()
+
+        result = _get_radiation_statistics(
+            station="CLK", start_date="20230601", end_date="20250630"
+        )
+        mock_fetch_json_data.assert_not_called()
+        self.assertEqual(result["days"], 1)
+        self.assertEqual(result["microsieverts"]["max"], 0.15)
+
+    def test_statistics_without_stored_reports(self):
+        """Test the guidance returned when nothing has been retrieved yet."""
+        result = _get_radiation_statistics(
+            station="HKO", start_date="20230601", end_date="20230630"
+        )
+        self.assertIn("error", result)
+        self.assertEqual(result["days"], 0)
+        self.assertIn("error", _get_radiation_statistics("BAD", "20230601", "20230630"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+"""Unit tests for the typed radiation report store.
+
+This module tests parsing of raw RYES responses into records and the
+statistics computed from the per-station columnar series.
+"""
+
+import math
+import unittest
+from hkopenai.hk_climate_mcp_server.radiation_store import (
+    RadiationStore,
+    parse_radiation_report,
+)
+
+
+def make_report(date: str, microsieverts: str, max_temp: str = "30.0"):
+    """Build a minimal RYES response for Chek Lap Kok."""
+    return {
+        "ChekLapKokLocationName": "Chek Lap Kok",
+        "ChekLapKokMaxTemp": max_temp,
+        "ChekLapKokMicrosieverts": microsieverts,
+        "ChekLapKokMinTemp": "25.0",
+        "BulletinTime": "0015",
+        "BulletinDate": "20250624",
+        "ReportTimeInfoDate": date,
+    }
+
+
+class TestRadiationStore(unittest.TestCase):
+    """Test case class for radiation report parsing and storage."""
+
+    def test_parse_radiation_report(self):
+        """Test that RYES fields are parsed into typed values."""
+        record = parse_radiation_report(make_report("20250623", "0.15"), "CLK", "")
+        self.assertEqual(record.station, "CLK")
+        self.assertEqual(record.date, 20250623)
+        self.assertEqual(record.location_name, "Chek Lap Kok")
+        self.assertEqual(record.microsieverts, 0.15)
+        self.assertEqual(record.max_temp, 30.0)
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_parse_missing_values(self):
+        """Test that unparsable readings become NaN and empty reports are skipped."""
+        record = parse_radiation_report(make_report("20250623", "N/A"), "CLK", "")
+        self.assertTrue(math.isnan(record.microsieverts))
+        self.assertIsNone(parse_radiation_report({}, "CLK", "20250623"))
+        self.assertIsNone(parse_radiation_report({"error": "x"}, "CLK", "20250623"))
+
+    def test_statistics_over_range(self):
+        """Test min/max/mean over a date range, ignoring missing readings."""
+        store = RadiationStore()
+        store.ingest(make_report("20250603", "0.12", "31.0"), "CLK", "20250603")
+        store.ingest(make_report("20250601", "0.10", "29.0"), "CLK", "20250601")
+        store.ingest(make_report("20250602", "N/A", "30.0"), "CLK", "20250602")
+        store.ingest(make_report("20250610", "0.50"), "CLK", "20250610")
+
+        stats = store.statistics("CLK", 20250601, 20250605)
+        self.assertEqual(stats["days"], 3)
+        self.assertEqual(stats["firstDate"], "20250601")
+        self.assertEqual(stats["lastDate"], "20250603")
+        self.assertEqual(stats["microsieverts"]["count"], 2)
+        self.assertEqual(stats["microsieverts"]["min"], 0.10)
+        self.assertEqual(stats["microsieverts"]["max"], 0.12)
+        self.assertEqual(stats["microsieverts"]["mean"], 0.11)
+        self.assertEqual(stats["maxTemp"]["max"], 31.0)
+
+    def test_reingesting_a_date_replaces_it(self):
+        """Test that the same date is stored once."""
+        store = RadiationStore()
+        store.ingest(make_report("20250601", "0.10"), "CLK", "20250601")
+        store.ingest(make_report("20250601", "0.20"), "CLK", "20250601")
+        stats = store.statistics("CLK", 20250601, 20250601)
+        self.assertEqual(stats["days"], 1)
+        self.assertEqual(stats["microsieverts"]["max"], 0.20)
+
+    def test_unknown_station(self):
+        """Test statistics for a station with no stored reports."""
+        self.assertEqual(RadiationStore().statistics("HKO", 20250601, 20250630), {"days": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
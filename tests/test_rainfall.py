@@ -0,0 +1,81 @@
+"""
+Unit tests for rolling rainfall accumulations.
+
+This module tests the running 1, 3 and 24 hour sums of hourly rainfall,
+including overlapping reports, revisions and gaps between reports.
+"""
+
+import unittest
+from hkopenai.hk_climate_mcp_server.observations import WeatherSnapshot
+from hkopenai.hk_climate_mcp_server.rainfall import RainfallAccumulator, RollingRainfall
+
+
+def report(end_time: str, sha_tin: float) -> WeatherSnapshot:
+    """Build a report whose rainfall window ends at a time of 2025-06-07."""
+    return WeatherSnapshot.parse(
+        {
+            "rainfall": {
+                "data": [
+                    {"place": "Sha Tin", "max": sha_tin, "unit": "mm", "main": "FALSE"},
+                    {"place": "Tai Po", "unit": "mm", "main": "TRUE"},
+                ],
+                "endTime": f"2025-06-07T{end_time}:00+08:00",
+            },
+            "updateTime": f"2025-06-07T{end_time}:00+08:00",
+        },
+        "en",
+    )
+
+
+class TestRainfall(unittest.TestCase):
+    """Test case class for rainfall accumulations."""
+
+    def test_rolling_windows(self):
+        """Test that values leave each window as hours pass."""
+        rolling = RollingRainfall()
+        for hour in range(30):
+            self.assertTrue(rolling.add(hour, 1.0))
+        self.assertEqual(rolling.totals(), {1: (1.0, 1), 3: (3.0, 3), 24: (24.0, 24)})
+
+        # A revision of the latest hour replaces it; older hours are ignored
+        self.assertTrue(rolling.add(29, 5.0))
+        self.assertFalse(rolling.add(28, 9.0))
+        self.assertEqual(rolling.totals()[3], (7.0, 3))
+
+        # Two missing hours drop out of the sums
+        rolling.add(32, 2.0)
+        self.assertEqual(rolling.totals(), {1: (2.0, 1), 3: (2.0, 1), 24: (27.0, 22)})
+
+        # A gap of a day or more starts over
+        rolling.add(100, 3.0)
+        self.assertEqual(rolling.totals(), {1: (3.0, 1), 3: (3.0, 1), 24: (3.0, 1)})
+
+    def test_overlapping_reports(self):
+        """Test that only windows whole hours apart are added up."""
+        accumulator = RainfallAccumulator()
+        self.assertEqual(accumulator.accumulations(), {"endTime": "", "data": []})
+
+        accumulator.update(report("20:00", 4))
+        accumulator.update(report("20:15", 6))
+        accumulator.update(report("21:00", 2))
+        self.assertEqual(accumulator.update({"error": "The request timed out"}), 0)
+
+        result = accumulator.accumulations()
+        self.assertEqual(result["endTime"], "2025-06-07T21:00:00+08:00")
+        # Tai Po is under maintenance and has no accumulation
+        self.assertEqual(
+            result["data"],
+            [
+                {
+                    "place": "Sha Tin",
+                    "past1h": 2.0,
+                    "past3h": 6.0,
+                    "past24h": 6.0,
+                    "hoursObserved": {"past3h": 2, "past24h": 2},
+                }
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Unit tests for the subscribable warning and observation resources.
+
+This module tests resource URIs, change detection against the feed registry
+and that subscribed clients are notified only when a feed changes.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+import mcp.types
+from mcp.shared.exceptions import McpError
+from fastmcp import Client, FastMCP
+from hkopenai.hk_climate_mcp_server import resources
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.observations import clear_snapshots
+from hkopenai.hk_climate_mcp_server.resources import (
+    SUBSCRIPTIONS,
+    SubscriptionManager,
+    parse_resource_uri,
+    resource_uri,
+)
+
+WARNSUM = {
+    "WTS": {"name": "Thunderstorm Warning", "code": "WTS", "actionCode": "ISSUE"},
+}
+
+
+class TestResources(unittest.TestCase):
+    """Test case class for subscribable resources."""
+
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        clear_snapshots()
+        SUBSCRIPTIONS.clear()
+
+    def tearDown(self):
+        SUBSCRIPTIONS.clear()
+
+    def test_resource_uris(self):
+        """Test building and parsing resource URIs."""
+        self.assertEqual(resource_uri("warnings", "tc"), "hko://warnings/tc")
+        self.assertEqual(parse_resource_uri("hko://observations/en"), ("observations", "en"))
+        self.assertIsNone(parse_resource_uri("hko://forecast/en"))
+        self.assertIsNone(parse_resource_uri("https://warnings/en"))
+        self.assertIsNone(parse_resource_uri("hko://warnings/"))
+        self.assertIsNone(parse_resource_uri("hko://warnings/fr"))
+
+    @patch("hkopenai.hk_climate_mcp_server.resources.fetch_json_data")
+    def test_check_reports_only_changes(self, mock_fetch_json_data):
+        """Test that a resource is reported only when its feed document changes."""
+        manager = SubscriptionManager()
+        session = MagicMock()
+        manager.subscribe("hko://warnings/en", session)
+
+        mock_fetch_json_data.return_value = {}
+        self.assertEqual(manager.check(), [])
+
+        FEED_REGISTRY.clear()
+        self.assertEqual(manager.check(), [])
+
+        FEED_REGISTRY.clear()
+        mock_fetch_json_data.return_value = WARNSUM
+        self.assertEqual(manager.check(), ["hko://warnings/en"])
+
+        FEED_REGISTRY.clear()
+        mock_fetch_json_data.return_value = {"error": "The request timed out"}
+        self.assertEqual(manager.check(), [])
+
+        manager.unsubscribe("hko://warnings/en", session)
+        self.assertEqual(manager.subscribed_uris(), [])
+        self.assertEqual(manager.check(), [])
+
+    def test_notify_drops_broken_sessions(self):
+        """Test that sessions failing to receive a notification are unsubscribed."""
+        manager = SubscriptionManager()
+        good, broken = MagicMock(), MagicMock()
+        good.send_resource_updated = AsyncMock()
+        broken.send_resource_updated = AsyncMock(side_effect=RuntimeError("closed"))
+        manager.subscribe("hko://warnings/en", good)
+        manager.subscribe("hko://warnings/en", broken)
+
+        asyncio.run(manager.notify(["hko://warnings/en"]))
+
+        good.send_resource_updated.assert_awaited_once()
+        self.assertEqual(str(good.send_resource_updated.call_args.args[0]), "hko://warnings/en")
+        asyncio.run(manager.notify(["hko://warnings/en"]))
+        broken.send_resource_updated.assert_awaited_once()
+
+    @patch("hkopenai.hk_climate_mcp_server.resources.fetch_json_data")
+    @patch("hkopenai.hk_climate_mcp_server.tools.warnings.fetch_json_data")
+    def test_subscribed_client_is_notified(self, mock_tool_fetch, mock_fetch_json_data):
+        """Test reading, subscribing and receiving a change notification end to end."""
+        mock_tool_fetch.return_value = {}
+        mock_fetch_json_data.return_value = WARNSUM
+        server = FastMCP(name="test")
+        resources.register(server)
+        updates = []
+
+        async def message_handler(message):
+            if isinstance(message, mcp.types.ServerNotification) and isinstance(
+                message.root, mcp.types.ResourceUpdatedNotification
+            ):
+                updates.append(str(message.root.params.uri))
+
+        async def scenario():
+            async with Client(server, message_handler=message_handler) as client:
+                capabilities = client.initialize_result.capabilities
+                self.assertTrue(capabilities.resources.subscribe)
+
+                contents = await client.read_resource("hko://warnings/en")
+                self.assertEqual(json.loads(contents[0].text)["warningMessage"], [])
+
+                with patch.object(SUBSCRIPTIONS, "interval", 0.01):
+                    await client.session.subscribe_resource("hko://warnings/en")
+                    FEED_REGISTRY.clear()
+                    for _ in range(100):
+                        if updates:
+                            break
+                        await asyncio.sleep(0.01)
+                    await client.session.unsubscribe_resource("hko://warnings/en")
+
+                with self.assertRaises(McpError):
+                    await client.session.subscribe_resource("hko://warnings/fr")
+
+        asyncio.run(scenario())
+        self.assertEqual(updates[:1], ["hko://warnings/en"])
+        self.assertEqual(SUBSCRIPTIONS.subscribed_uris(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
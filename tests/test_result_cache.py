@@ -0,0 +1,145 @@
+"""
+Unit tests for the serialized tool result cache.
+
+This module tests that results of tools with a cache policy are built once
+per feed update and set of arguments, from the first call on, keep their
+structured content, are dropped when the feed's updateTime changes or their
+TTL expires, and that errors are never kept.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from fastmcp import Client, FastMCP
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.result_cache import (
+    RESULT_CACHE,
+    CachePolicy,
+    ResultCache,
+    cached_result,
+    update_time,
+)
+from hkopenai.hk_climate_mcp_server.tools import forecast
+from hkopenai.hk_climate_mcp_server.tools.forecast import register
+
+FLW = {
+    "generalSituation": "A ridge of high pressure is bringing fine weather.",
+    "forecastPeriod": "Weather forecast for today",
+    "forecastDesc": "Mainly fine and very hot.",
+    "outlook": "Hot with sunny periods.",
+    "updateTime": "2025-06-23T11:45:00+08:00",
+}
+
+
+def fake_fetch(documents):
+    """Build a fetch returning the current document of each dataType."""
+    return MagicMock(
+        side_effect=lambda url: documents[url.split("dataType=")[1].split("&")[0]]
+    )
+
+
+class TestResultCache(unittest.TestCase):
+    """Test case class for the result cache."""
+
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        RESULT_CACHE.clear()
+
+    def tearDown(self):
+        FEED_REGISTRY.clear()
+        RESULT_CACHE.clear()
+
+    def test_result_cache(self):
+        """Test that kept results expire and belong to one feed version."""
+        cache = ResultCache(max_entries=2)
+        cache.put(("a",), "v1", "A", ttl=60)
+        cache.put(("b",), "v1", "B", ttl=-1)
+        self.assertEqual(cache.get(("a",), "v1"), "A")
+        self.assertIsNone(cache.get(("b",), "v1"))
+        self.assertIsNone(cache.get(("a",), "v2"))
+        self.assertIsNone(cache.get(("a",), "v1"))
+
+        cache.put(("a",), "v1", "A", ttl=60)
+        cache.put(("b",), "v1", "B", ttl=60)
+        cache.put(("c",), "v1", "C", ttl=60)
+        self.assertIsNone(cache.get(("a",), "v1"))
+        self.assertEqual(update_time(FLW), FLW["updateTime"])
+        self.assertIsNone(update_time({"error": "offline"}))
+
+    def test_results_follow_updates(self):
+        """Test that results are reused until the feed's updateTime changes."""
+        documents = {"flw": dict(FLW)}
+        fetch = fake_fetch(documents)
+        build = MagicMock(side_effect=lambda lang="en", fields=None: {"lang": lang})
+
+        @cached_result(CachePolicy("flw", ttl=3600))
+        def tool(lang: str = "en", fields=None):
+            return build(lang=lang, fields=fields)
+
+        with patch(
+            "hkopenai.hk_climate_mcp_server.result_cache.fetch_json_data", fetch
+        ):
+            first = tool()
+            self.assertEqual(json.loads(first.content[0].text), {"lang": "en"})
+            self.assertEqual(first.structured_content, {"lang": "en"})
+            self.assertEqual(tool(lang="en").content[0].text, first.content[0].text)
+            self.assertEqual(build.call_count, 1)
+
+            tool(fields=["lang"])
+            self.assertEqual(build.call_count, 2)
+
+            documents["flw"] = {**FLW, "updateTime": "2025-06-23T16:45:00+08:00"}
+            FEED_REGISTRY.refresh("flw", "en", fetch)
+            tool()
+            tool()
+            self.assertEqual(build.call_count, 3)
+
+            build.side_effect = lambda lang="en", fields=None: {"error": "offline"}
+            self.assertEqual(tool(lang="tc"), {"error": "offline"})
+            self.assertEqual(tool(lang="tc"), {"error": "offline"})
+            self.assertEqual(build.call_count, 5)
+
+        # Requests in unknown languages are not looked up
+        tool(lang="xx")
+        self.assertEqual(fetch.call_count, 3)
+
+    @patch("hkopenai.hk_climate_mcp_server.result_cache.fetch_json_data")
+    @patch("hkopenai.hk_climate_mcp_server.tools.forecast.fetch_json_data")
+    def test_tool_serves_cached_result(self, mock_fetch_json_data, mock_fetch_version):
+        """Test that a registered tool serves its cached result over MCP."""
+        mock_fetch_json_data.side_effect = mock_fetch_version.side_effect = (
+            fake_fetch({"flw": FLW})
+        )
+        mcp = FastMCP("test")
+        register(mcp)
+
+        async def call():
+            async with Client(mcp) as client:
+                return [
+                    await client.call_tool("get_local_weather_forecast", {})
+                    for _ in range(3)
+                ]
+
+        with patch.object(
+            forecast,
+            "_get_local_weather_forecast",
+            wraps=forecast._get_local_weather_forecast,
+        ) as mock_build:
+            results = asyncio.run(call())
+        # The first call fetches the feed and keeps its result
+        self.assertEqual(mock_build.call_count, 1)
+        self.assertEqual(
+            mock_fetch_json_data.call_count + mock_fetch_version.call_count, 1
+        )
+        self.assertEqual(len({r.content[0].text for r in results}), 1)
+        self.assertEqual(
+            results[2].structured_content["forecastDesc"], FLW["forecastDesc"]
+        )
+        self.assertEqual(
+            json.loads(results[2].content[0].text), results[2].structured_content
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Unit tests for the warning-adaptive polling scheduler.
+
+This module tests how the warnings in force set the weather level, which
+feeds are refreshed when, and that the warning tracker follows the refreshes.
+"""
+
+import os
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.availability import DISCOVERY_ENV
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.observations import clear_snapshots
+from hkopenai.hk_climate_mcp_server.scheduler import (
+    CALM,
+    COVERAGE_CHECK_INTERVAL,
+    POLL_INTERVALS,
+    SEVERE,
+    UNSETTLED,
+    PollingScheduler,
+    poll_interval,
+    weather_level,
+)
+from hkopenai.hk_climate_mcp_server.warning_tracker import (
+    clear_warning_trackers,
+    get_warning_tracker,
+)
+
+CALM_WARNSUM = {}
+THUNDERSTORM_WARNSUM = {
+    "WTS": {"name": "Thunderstorm Warning", "code": "WTS", "actionCode": "ISSUE"},
+}
+TYPHOON_WARNSUM = {
+    "WTCSGNL": {"name": "Tropical Cyclone Signal", "code": "TC8NE", "actionCode": "ISSUE"},
+}
+
+
+def fake_fetch(documents):
+    """Build a fetch returning the document of each dataType in the URL."""
+
+    def fetch(url):
+        data_type = url.split("dataType=")[1].split("&")[0]
+        return documents.get(data_type, {})
+
+    return MagicMock(side_effect=fetch)
+
+
+def fetched_types(mock_fetch):
+    return [
+        call.args[0].split("dataType=")[1].split("&")[0]
+        for call in mock_fetch.call_args_list
+    ]
+
+
+class TestScheduler(unittest.TestCase):
+    """Test case class for the polling scheduler."""
+
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        clear_snapshots()
+        clear_warning_trackers()
+
+    def tearDown(self):
+        FEED_REGISTRY.clear()
+
+    def test_weather_level(self):
+        """Test the level set by each kind of warning."""
+        self.assertEqual(weather_level(CALM_WARNSUM), CALM)
+        self.assertEqual(weather_level(None), CALM)
+        self.assertEqual(weather_level(THUNDERSTORM_WARNSUM), UNSETTLED)
+        self.assertEqual(weather_level(TYPHOON_WARNSUM), SEVERE)
+        self.assertEqual(
+            weather_level({"WRAIN": {"code": "WRAINB", "actionCode": "EXTEND"}}), SEVERE
+        )
+        self.assertEqual(
+            weather_level({"WTS": {"code": "WTS", "actionCode": "CANCEL"}}), CALM
+        )
+        for intervals in POLL_INTERVALS.values():
+            self.assertGreaterEqual(intervals.calm, intervals.unsettled)
+            self.assertGreaterEqual(intervals.unsettled, intervals.severe)
+
+    @patch("hkopenai.hk_climate_mcp_server.scheduler.fetch_raw_json")
+    def test_refreshes_follow_warnings(self, mock_fetch_raw_json):
+        """Test that feeds are refreshed when due and sooner once warnings are issued."""
+        documents = {"warnsum": CALM_WARNSUM}
+        mock_fetch_raw_json.side_effect = fake_fetch(documents)
+        scheduler = PollingScheduler()
+
+        self.assertEqual(scheduler.run_once(now=0), list(POLL_INTERVALS))
+        self.assertEqual(scheduler.level, CALM)
+
+        mock_fetch_raw_json.reset_mock()
+        self.assertEqual(scheduler.run_once(now=100), [])
+        mock_fetch_raw_json.assert_not_called()
+
+        documents["warnsum"] = TYPHOON_WARNSUM
+        refreshed = scheduler.run_once(now=300)
+        self.assertEqual(scheduler.level, SEVERE)
+        self.assertEqual(refreshed, ["warnsum", "warningInfo"])
+
+        # rhrread was due at 600 when calm, now at 300 + 60
+        mock_fetch_raw_json.reset_mock()
+        scheduler.run_once(now=300 + poll_interval("rhrread", SEVERE))
+        self.assertIn("rhrread", fetched_types(mock_fetch_raw_json))
+
+        documents["warnsum"] = CALM_WARNSUM
+        scheduler.run_once(now=1000)
+        self.assertEqual(scheduler.level, CALM)
+
+    @patch("hkopenai.hk_climate_mcp_server.scheduler.fetch_raw_json")
+    def test_errors_and_listeners(self, mock_fetch_raw_json):
+        """Test that failed refreshes are skipped and listeners see new documents."""
+        mock_fetch_raw_json.side_effect = fake_fetch(
+            {"warnsum": THUNDERSTORM_WARNSUM, "LHL": {"error": "The request timed out"}}
+        )
+        scheduler = PollingScheduler()
+        seen = []
+        scheduler.add_listener("rhrread", lambda document, lang: seen.append(lang))
+        scheduler.add_listener("LTMV", MagicMock(side_effect=RuntimeError("broken")))
+
+        refreshed = scheduler.run_once(now=0)
+
+        self.assertNotIn("LHL", refreshed)
+        self.assertIn("LTMV", refreshed)
+        self.assertEqual(seen, ["en"])
+        self.assertIsNotNone(get_warning_tracker("en").version)
+        changes = get_warning_tracker("en").changes_since(None)
+        self.assertEqual([w["warningType"] for w in changes["active"]], ["WTS"])
+
+    @patch.dict(os.environ, {DISCOVERY_ENV: "1"})
+    @patch("hkopenai.hk_climate_mcp_server.scheduler.AVAILABILITY")
+    def test_check_coverage(self, mock_availability):
+        """Test that stale coverage is discovered again, checked hourly."""
+        mock_availability.is_stale.side_effect = lambda data_type: data_type == "HLT"
+        mock_availability.start_discovery.return_value = True
+        scheduler = PollingScheduler()
+
+        self.assertEqual(scheduler.check_coverage(now=0), ["HLT"])
+        mock_availability.start_discovery.assert_called_once_with(["HLT"])
+        self.assertEqual(scheduler.check_coverage(now=COVERAGE_CHECK_INTERVAL - 1), [])
+        mock_availability.is_stale.side_effect = lambda data_type: False
+        self.assertEqual(scheduler.check_coverage(now=COVERAGE_CHECK_INTERVAL), [])
+        self.assertEqual(mock_availability.start_discovery.call_count, 1)
+
+    @patch.dict(os.environ, {DISCOVERY_ENV: ""})
+    @patch("hkopenai.hk_climate_mcp_server.scheduler.AVAILABILITY")
+    def test_coverage_discovery_is_opt_in(self, mock_availability):
+        """Test that coverage is not discovered unless the server is told to."""
+        mock_availability.is_stale.return_value = True
+        self.assertEqual(PollingScheduler().check_coverage(now=0), [])
+        mock_availability.start_discovery.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.scheduler.AVAILABILITY")
+    @patch("hkopenai.hk_climate_mcp_server.scheduler.fetch_raw_json")
+    def test_start_and_stop(self, mock_fetch_raw_json, mock_availability):
+        """Test that the background thread runs until every start is stopped."""
+        mock_fetch_raw_json.side_effect = fake_fetch({})
+        scheduler = PollingScheduler(tick=0.01)
+
+        scheduler.start()
+        scheduler.start()
+        for _ in range(100):
+            if mock_fetch_raw_json.called:
+                break
+            time.sleep(0.01)
+        thread = scheduler._thread
+        scheduler.stop()
+        self.assertTrue(thread.is_alive() or mock_fetch_raw_json.called)
+        self.assertIsNotNone(scheduler._thread)
+        scheduler.stop()
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(mock_fetch_raw_json.called)
+        scheduler.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the row streaming tool.
+
+This module tests that large tables are sent in bounded chunks as progress
+notifications, and that requests which cannot be streamed are rejected.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from fastmcp import Client, FastMCP
+from hkopenai.hk_climate_mcp_server.pagination import SERIES_CACHE
+from hkopenai.hk_climate_mcp_server.tools.streaming import register, _stream_tool_rows
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
+
+TIDES = {
+    "fields": ["Date", "Hour", "Height"],
+    "data": [["2025-06-01", hour, hour / 10] for hour in range(1, 24)],
+}
+
+
+class TestStreamingTools(unittest.TestCase):
+    """Test case class for the row streaming tool."""
+
+    def setUp(self):
+        SERIES_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    def tearDown(self):
+        SERIES_CACHE.clear()
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tables.fetch_csv_table",
+        return_value=None,
+    )
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    def test_stream_in_chunks(self, mock_fetch_json_table, mock_fetch_csv_table):
+        """Test that every row is sent once, in chunks of at most chunk_size rows."""
+        mock_fetch_json_table.return_value = TIDES
+        sent = []
+
+        async def report(progress, total, message):
+            sent.append((progress, total, json.loads(message)))
+
+        result = asyncio.run(
+            _stream_tool_rows(
+                "get_hourly_tides",
+                {"station": "CCH", "year": 2025, "options": {"month": 6}},
+                10,
+                report,
+            )
+        )
+
+        self.assertEqual(
+            result,
+            {
+                "tool": "get_hourly_tides",
+                "fields": TIDES["fields"],
+                "rows": 23,
+                "chunks": 3,
+            },
+        )
+        self.assertEqual([(p, t) for p, t, _ in sent], [(10, 23), (20, 23), (23, 23)])
+        self.assertEqual(sum((chunk["data"] for _, _, chunk in sent), []), TIDES["data"])
+        self.assertEqual(sent[2][2]["offset"], 20)
+        mock_fetch_json_table.assert_called_once()
+        self.assertEqual(mock_fetch_json_table.call_args.args[0]["month"], "6")
+
+    def test_invalid_requests(self):
+        """Test errors for unknown tools, bad arguments and failed fetches."""
+        report = MagicMock()
+        args = {"station": "CCH", "year": 2025}
+        self.assertIn(
+            "cannot be streamed",
+            asyncio.run(_stream_tool_rows("get_uv_index", {}, 10, report))["error"],
+        )
+        self.assertIn(
+            "Invalid arguments",
+            asyncio.run(
+                _stream_tool_rows("get_hourly_tides", {"colour": "red"}, 10, report)
+            )["error"],
+        )
+        self.assertIn(
+            "Invalid chunk_size",
+            asyncio.run(_stream_tool_rows("get_hourly_tides", args, 0, report))["error"],
+        )
+        result = asyncio.run(
+            _stream_tool_rows("get_hourly_tides", {**args, "station": "XXX"}, 10, report)
+        )
+        self.assertEqual(result["rows"], 0)
+        self.assertIn("error", result)
+        report.assert_not_called()
+
+    @patch(
+        "hkopenai.hk_climate_mcp_server.tables.fetch_csv_table",
+        return_value=None,
+    )
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    def test_progress_notifications(self, mock_fetch_json_table, mock_fetch_csv_table):
+        """Test that chunks reach an MCP client as progress messages."""
+        mock_fetch_json_table.return_value = TIDES
+        mcp = FastMCP("test")
+        register(mcp)
+        messages = []
+
+        async def on_progress(progress, total, message):
+            messages.append(json.loads(message))
+
+        async def call():
+            async with Client(mcp) as client:
+                return await client.call_tool(
+                    "stream_tool_rows",
+                    {
+                        "tool": "get_hourly_tides",
+                        "args": {"station": "CCH", "year": 2025},
+                        "chunk_size": 20,
+                    },
+                    progress_handler=on_progress,
+                )
+
+        result = asyncio.run(call())
+        self.assertEqual(result.data["rows"], 23)
+        self.assertEqual([len(m["data"]) for m in messages], [20, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Unit tests for fetching opendata.php tables.
+
+This module tests that tables are requested with their dataType and text
+encoding whether they are served whole, raw or in pages.
+"""
+
+import unittest
+from unittest.mock import patch
+from hkopenai.hk_climate_mcp_server.pagination import SERIES_CACHE
+from hkopenai.hk_climate_mcp_server.passthrough import RAW_CACHE, RawJson
+from hkopenai.hk_climate_mcp_server.tables import OPENDATA_URL, get_table
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
+
+TABLE = {"fields": ["Year", "Value"], "data": [["2025", "28.5"], ["2026", "29"]]}
+
+
+class TestTables(unittest.TestCase):
+    """Test case class for opendata.php tables."""
+
+    def setUp(self):
+        SERIES_CACHE.clear()
+        RAW_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    def tearDown(self):
+        SERIES_CACHE.clear()
+        RAW_CACHE.clear()
+        NEGATIVE_CACHE.clear()
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_csv_table", return_value=None)
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
+    def test_get_table(
+        self, mock_fetch_json_data, mock_fetch_csv_table, mock_fetch_json_table
+    ):
+        """Test whole documents and pages of tables with and without a BOM."""
+        mock_fetch_json_data.return_value = TABLE
+        mock_fetch_json_table.return_value = TABLE
+        params = {"dataType": "HLT", "rformat": "json", "station": "CCH"}
+
+        self.assertEqual(get_table("HLT", {"station": "CCH"}), TABLE)
+        mock_fetch_json_data.assert_called_once_with(
+            OPENDATA_URL, params=params, encoding="utf-8-sig"
+        )
+
+        page = get_table("CLMTEMP", {"station": "HKO"}, page_size=1)
+        self.assertEqual(page["data"], [["2025", "28.5"]])
+        params = {"dataType": "CLMTEMP", "rformat": "json", "station": "HKO"}
+        mock_fetch_csv_table.assert_called_once_with(params)
+        mock_fetch_json_table.assert_called_once_with(params, "utf-8")
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_table")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_csv_table")
+    def test_page_answers_from_one_request(
+        self, mock_fetch_csv_table, mock_fetch_json_table
+    ):
+        """Test that errors and "no data" answers to CSV are not fetched again."""
+        mock_fetch_csv_table.return_value = {
+            "error": "HTTP error occurred: 404. Status code: 404. Response: "
+        }
+        args = ("CLMTEMP", {"station": "HKO", "year": 1900})
+        self.assertIn("error", get_table(*args, page_size=10))
+        self.assertIn("error", get_table(*args, page_size=10))
+        mock_fetch_csv_table.assert_called_once()
+
+        mock_fetch_csv_table.return_value = {"fields": [], "data": []}
+        page = get_table("CLMTEMP", {"station": "HKO", "year": 1901}, page_size=10)
+        self.assertEqual((page["data"], page["total"]), ([], 0))
+        mock_fetch_json_table.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.passthrough.fetch_json_bytes")
+    def test_get_raw_table(self, mock_fetch_json_bytes):
+        """Test that raw tables are kept as the bytes HKO sent."""
+        mock_fetch_json_bytes.return_value = b'{"fields":["Year"],"data":[["2025"]]}'
+        raw = get_table("HHOT", {"station": "CCH", "year": 2025}, raw=True)
+        self.assertIsInstance(raw, RawJson)
+        self.assertEqual(
+            mock_fetch_json_bytes.call_args.kwargs["encoding"], "utf-8-sig"
+        )
+
+        mock_fetch_json_bytes.return_value = b'{"fields":[],"data":[]}'
+        result = get_table("HHOT", {"station": "CCH", "year": 2020}, raw=True)
+        self.assertEqual(result, {"fields": [], "data": []})
+        get_table("HHOT", {"station": "CCH", "year": 2020}, raw=True)
+        self.assertEqual(mock_fetch_json_bytes.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,27 +5,41 @@ This module tests the temperature-related functions from the temperature tools m
 to ensure they correctly fetch and process temperature data from the HKO API.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.cache import CACHE_DIR_ENV
 from hkopenai.hk_climate_mcp_server.tools.temperature import (
     register,
     _get_daily_mean_temperature,
     _get_daily_max_temperature,
     _get_daily_min_temperature,
+    _get_temperature_station_codes,
 )
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
 from hkopenai_common.json_utils import fetch_json_data
 
 
 class TestTemperatureTools(unittest.TestCase):
     """Test case class for temperature data tools."""
 
+    def setUp(self):
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {CACHE_DIR_ENV: self._cache_dir.name})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache_dir.cleanup()
+
     def test_register_tool(self):
         """Tests that the temperature tools are correctly registered."""
         mock_mcp = MagicMock()
         register(mock_mcp)
 
         # Verify that mcp.tool was called for each tool function
-        self.assertEqual(mock_mcp.tool.call_count, 3)
+        self.assertEqual(mock_mcp.tool.call_count, 4)
 
         # Get the decorated functions
         decorated_funcs = {
@@ -39,7 +53,13 @@ class TestTemperatureTools(unittest.TestCase):
         ) as mock_get_daily_mean_temperature:
             decorated_funcs["get_daily_mean_temperature"](station="HKO", year=2025)
             mock_get_daily_mean_temperature.assert_called_once_with(
-                station="HKO", year=2025, month=None, lang="en"
+                station="HKO",
+                year=2025,
+                month=None,
+                lang="en",
+                page_size=None,
+                cursor=None,
+                raw=True,
             )
 
         # Test get_daily_max_temperature
@@ -50,7 +70,13 @@ class TestTemperatureTools(unittest.TestCase):
                 station="HKO", year=2025, month=6
             )
             mock_get_daily_max_temperature.assert_called_once_with(
-                station="HKO", year=2025, month=6, lang="en"
+                station="HKO",
+                year=2025,
+                month=6,
+                lang="en",
+                page_size=None,
+                cursor=None,
+                raw=True,
             )
 
         # Test get_daily_min_temperature
@@ -59,10 +85,23 @@ class TestTemperatureTools(unittest.TestCase):
         ) as mock_get_daily_min_temperature:
             decorated_funcs["get_daily_min_temperature"](station="HKO")
             mock_get_daily_min_temperature.assert_called_once_with(
-                station="HKO", year=None, month=None, lang="en"
+                station="HKO",
+                year=None,
+                month=None,
+                lang="en",
+                page_size=None,
+                cursor=None,
+                raw=True,
             )
 
-    @patch("hkopenai.hk_climate_mcp_server.tools.temperature.fetch_json_data")
+        # Test get_temperature_station_codes
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.temperature._get_temperature_station_codes"
+        ) as mock_get_temperature_station_codes:
+            decorated_funcs["get_temperature_station_codes"](lang="tc")
+            mock_get_temperature_station_codes.assert_called_once_with("tc")
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
     def test_get_daily_mean_temperature_internal(self, mock_fetch_json_data):
         """Test the internal _get_daily_mean_temperature function."""
         example_json = {
@@ -87,9 +126,10 @@ class TestTemperatureTools(unittest.TestCase):
                 "year": "2025",
                 "month": "6",
             },
+            encoding="utf-8",
         )
 
-    @patch("hkopenai.hk_climate_mcp_server.tools.temperature.fetch_json_data")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
     def test_get_daily_max_temperature_internal(self, mock_fetch_json_data):
         """Test the internal _get_daily_max_temperature function."""
         example_json = {
@@ -114,9 +154,10 @@ class TestTemperatureTools(unittest.TestCase):
                 "year": "2025",
                 "month": "6",
             },
+            encoding="utf-8",
         )
 
-    @patch("hkopenai.hk_climate_mcp_server.tools.temperature.fetch_json_data")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
     def test_get_daily_min_temperature_internal(self, mock_fetch_json_data):
         """Test the internal _get_daily_min_temperature function."""
         example_json = {
@@ -141,7 +182,47 @@ class TestTemperatureTools(unittest.TestCase):
                 "year": "2025",
                 "month": "6",
             },
+            encoding="utf-8",
+        )
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
+    def test_invalid_requests_rejected_locally(self, mock_fetch_json_data):
+        """Test that invalid stations, years and months never reach the API."""
+        for kwargs in [
+            {"station": "XYZ"},
+            {"station": "HKO", "year": 1800},
+            {"station": "HKO", "year": 2025, "month": 13},
+            {"station": "HKO", "lang": "fr"},
+        ]:
+            for func in (
+                _get_daily_mean_temperature,
+                _get_daily_max_temperature,
+                _get_daily_min_temperature,
+            ):
+                self.assertIn("error", func(**kwargs), kwargs)
+        mock_fetch_json_data.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
+    def test_no_data_answer_is_cached(self, mock_fetch_json_data):
+        """Test that a "no data" answer is served from the negative cache."""
+        NEGATIVE_CACHE.clear()
+        mock_fetch_json_data.return_value = {"fields": [], "data": []}
+
+        first = _get_daily_max_temperature(station="WGL", year=1890, lang="en")
+        second = _get_daily_max_temperature(station="WGL", year=1890, lang="en")
+        self.assertEqual(first, second)
+        mock_fetch_json_data.assert_called_once()
+        NEGATIVE_CACHE.clear()
+
+    def test_get_temperature_station_codes(self):
+        """Test the temperature station catalog in each language."""
+        self.assertEqual(_get_temperature_station_codes("en")["HKO"], "Hong Kong Observatory")
+        self.assertEqual(_get_temperature_station_codes("tc")["HKO"], "香港天文台")
+        self.assertEqual(
+            _get_temperature_station_codes("xx"), _get_temperature_station_codes("en")
         )
+        with self.assertRaises(TypeError):
+            _get_temperature_station_codes("en")["HKO"] = "Elsewhere"
 
 
 if __name__ == "__main__":
@@ -5,20 +5,32 @@ This module tests the tides-related functions from the tides tools module
 to ensure they correctly fetch and process tides data from the HKO API.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.cache import CACHE_DIR_ENV
 from hkopenai.hk_climate_mcp_server.tools.tides import (
     register,
     _get_hourly_tides,
     _get_high_low_tides,
     _get_tide_station_codes,
 )
-from hkopenai.hk_climate_mcp_server.tools.tides import fetch_json_data
+from hkopenai.hk_climate_mcp_server.validation import NEGATIVE_CACHE
 
 
 class TestTidesTools(unittest.TestCase):
     """Test case class for tides data tools."""
 
+    def setUp(self):
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {CACHE_DIR_ENV: self._cache_dir.name})
+        self._env.start()
+
+    def tearDown(self):
+        self._env.stop()
+        self._cache_dir.cleanup()
+
     def test_register_tool(self):
         """Tests that the tides tools are correctly registered."""
         mock_mcp = MagicMock()
@@ -38,10 +50,20 @@ class TestTidesTools(unittest.TestCase):
             "hkopenai.hk_climate_mcp_server.tools.tides._get_hourly_tides"
         ) as mock_get_hourly_tides:
             decorated_funcs["get_hourly_tides"](
-                station="TBT", year=2025, options={"month": 6, "day": 30}
+                station="TBT",
+                year=2025,
+                options={"month": 6, "day": 30, "page_size": 100},
             )
             mock_get_hourly_tides.assert_called_once_with(
-                station="TBT", year=2025, month=6, day=30, hour=None, lang="en"
+                station="TBT",
+                year=2025,
+                month=6,
+                day=30,
+                hour=None,
+                lang="en",
+                page_size=100,
+                cursor=None,
+                raw=True,
             )
 
         # Test get_high_low_tides
@@ -52,7 +74,14 @@ class TestTidesTools(unittest.TestCase):
                 station="TBT", year=2025, options={"month": 6}
             )
             mock_get_high_low_tides.assert_called_once_with(
-                station="TBT", year=2025, month=6, day=None, hour=None, lang="en"
+                station="TBT",
+                year=2025,
+                month=6,
+                day=None,
+                hour=None,
+                lang="en",
+                page_size=None,
+                cursor=None,
             )
 
         # Test get_tide_station_codes
@@ -62,7 +91,7 @@ class TestTidesTools(unittest.TestCase):
             decorated_funcs["get_tide_station_codes"](lang="en")
             mock_get_tide_station_codes.assert_called_once_with("en")
 
-    @patch("hkopenai.hk_climate_mcp_server.tools.tides.fetch_json_data")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
     def test_get_hourly_tides_internal(self, mock_fetch_json_data):
         """Test the internal _get_hourly_tides function."""
         example_json = {
@@ -90,7 +119,7 @@ class TestTidesTools(unittest.TestCase):
             encoding="utf-8-sig",
         )
 
-    @patch("hkopenai.hk_climate_mcp_server.tools.tides.fetch_json_data")
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
     def test_get_high_low_tides_internal(self, mock_fetch_json_data):
         """Test the internal _get_high_low_tides function."""
         example_json = {
@@ -117,6 +146,31 @@ class TestTidesTools(unittest.TestCase):
             encoding="utf-8-sig",
         )
 
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
+    def test_invalid_requests_rejected_locally(self, mock_fetch_json_data):
+        """Test that invalid stations and dates never reach the API."""
+        for kwargs in [
+            {"station": "XYZ", "year": 2025},
+            {"station": "", "year": 2025},
+            {"station": "TBT", "year": 2010},
+            {"station": "TBT", "year": 2025, "month": 2, "day": 30},
+            {"station": "TBT", "year": 2025, "month": 6, "day": 1, "hour": 25},
+        ]:
+            self.assertIn("error", _get_hourly_tides(**kwargs), kwargs)
+            self.assertIn("error", _get_high_low_tides(**kwargs), kwargs)
+        mock_fetch_json_data.assert_not_called()
+
+    @patch("hkopenai.hk_climate_mcp_server.tables.fetch_json_data")
+    def test_transient_errors_are_not_cached(self, mock_fetch_json_data):
+        """Test that connection errors are retried rather than cached."""
+        NEGATIVE_CACHE.clear()
+        mock_fetch_json_data.return_value = {"error": "Connection error occurred"}
+
+        _get_hourly_tides(station="CCH", year=2025, month=1)
+        _get_hourly_tides(station="CCH", year=2025, month=1)
+        self.assertEqual(mock_fetch_json_data.call_count, 2)
+        NEGATIVE_CACHE.clear()
+
 
 if __name__ == "__main__":
     unittest.main()
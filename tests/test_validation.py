@@ -0,0 +1,90 @@
+"""
+Unit tests for the local request validation layer.
+
+This module tests dataset parameter checks and the negative cache of
+"no data" answers from the HKO API.
+"""
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.validation import (
+    NegativeCache,
+    get_year_range,
+    is_no_data,
+    validate_request,
+)
+
+
+class TestValidation(unittest.TestCase):
+    """Test case class for request validation."""
+
+    def test_valid_requests(self):
+        """Test that valid requests pass."""
+        self.assertIsNone(validate_request("HHOT", station="CCH", year=2024, month=2, day=29))
+        self.assertIsNone(validate_request("CLMTEMP", station="HKO"))
+        self.assertIsNone(validate_request("LUNAR", year=1901, month=1, day=1))
+        self.assertIsNone(validate_request("SRS", year=2018, lang="sc"))
+
+    def test_invalid_requests(self):
+        """Test that invalid requests return an actionable error."""
+        error = validate_request("HLT", station="HKO", year=2024)
+        self.assertIn("get_tide_station_codes", error["error"])
+        error = validate_request("MRS", year=2017)
+        self.assertIn("2018", error["error"])
+        self.assertIn("error", validate_request("LUNAR", year=2101))
+        self.assertIn("error", validate_request("SRS", year=None))
+        self.assertIn("error", validate_request("SRS", year=2024, day=5))
+        self.assertIn("error", validate_request("SRS", year=2023, month=2, day=29))
+        self.assertIn("error", validate_request("CLMMAXT", station="HKO", lang="de"))
+        self.assertIn("error", validate_request("SRS", year=2024, month=1, hour=3))
+
+    def test_year_range_follows_current_year(self):
+        """Test that open-ended ranges extend with the current year."""
+        self.assertEqual(get_year_range("LUNAR"), (1901, 2100))
+        self.assertEqual(get_year_range("HHOT"), (2022, datetime.now().year + 1))
+        self.assertEqual(get_year_range("RYES"), (None, None))
+
+    def test_is_no_data(self):
+        """Test classification of definitive and transient failures."""
+        self.assertTrue(is_no_data({}))
+        self.assertTrue(is_no_data({"fields": ["Date"], "data": []}))
+        self.assertFalse(is_no_data({"error": "Failed to parse JSON response from API."}))
+        self.assertTrue(
+            is_no_data({"error": "HTTP error occurred: x. Status code: 404. Response: "})
+        )
+        self.assertFalse(
+            is_no_data({"error": "HTTP error occurred: x. Status code: 503. Response: "})
+        )
+        self.assertFalse(is_no_data({"error": "The request timed out: x."}))
+        self.assertFalse(is_no_data({"fields": ["Date"], "data": [["2025"]]}))
+
+    def test_negative_cache_expiry(self):
+        """Test that remembered answers expire after the TTL."""
+        cache = NegativeCache(ttl_seconds=10)
+        params = {"dataType": "HHOT", "year": 2025}
+        with patch("hkopenai.hk_climate_mcp_server.validation.time.monotonic") as clock:
+            clock.return_value = 100.0
+            cache.remember(params, {"data": []})
+            cache.remember({"dataType": "HLT"}, {"data": [[1]]})
+            self.assertEqual(cache.get({"year": "2025", "dataType": "HHOT"}), {"data": []})
+            self.assertIsNone(cache.get({"dataType": "HLT"}))
+            clock.return_value = 111.0
+            self.assertIsNone(cache.get(params))
+
+    def test_negative_cache_fetch(self):
+        """Test that only definitive "no data" answers are fetched once."""
+        cache = NegativeCache()
+        fetch = MagicMock(return_value={"fields": [], "data": []})
+        self.assertEqual(cache.fetch({"year": 2025}, fetch), {"fields": [], "data": []})
+        self.assertEqual(cache.fetch({"year": 2025}, fetch), {"fields": [], "data": []})
+        self.assertEqual(fetch.call_count, 1)
+
+        fetch.return_value = {"error": "Failed to parse JSON response from API."}
+        cache.fetch({"year": 2026}, fetch)
+        cache.fetch({"year": 2026}, fetch)
+        self.assertEqual(fetch.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,13 +7,23 @@ to ensure it correctly fetches and processes visibility data from the HKO API.
 
 import unittest
 from unittest.mock import patch, MagicMock
-from hkopenai.hk_climate_mcp_server.tools.visibility import register, _get_visibility
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
+from hkopenai.hk_climate_mcp_server.history import VISIBILITY_HISTORY
+from hkopenai.hk_climate_mcp_server.tools.visibility import (
+    register,
+    _get_visibility,
+    _get_visibility_history,
+)
 from hkopenai.hk_climate_mcp_server.tools.visibility import fetch_json_data
 
 
 class TestVisibilityTools(unittest.TestCase):
     """Test case class for visibility data tools."""
 
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        VISIBILITY_HISTORY.clear()
+
     @patch("hkopenai.hk_climate_mcp_server.tools.visibility.fetch_json_data")
     def test_get_visibility_internal(self, mock_fetch_json_data):
         """
@@ -45,10 +55,51 @@ class TestVisibilityTools(unittest.TestCase):
         register(mock_mcp)
 
         # Verify that mcp.tool was called with the correct description
-        mock_mcp.tool.assert_called_once_with(
-            description="Get latest 10-minute mean visibility data for Hong Kong"
+        self.assertEqual(mock_mcp.tool.call_count, 2)
+        mock_mcp.tool.assert_any_call(
+            description="Get latest 10-minute mean visibility data for Hong Kong",
+            output_schema=None,
         )
 
+        decorated_funcs = {
+            call.args[0].__name__: call.args[0]
+            for call in mock_mcp.tool.return_value.call_args_list
+        }
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.visibility._get_visibility_history"
+        ) as mock_get_visibility_history:
+            decorated_funcs["get_visibility_history"](station="Central", hours=3)
+            mock_get_visibility_history.assert_called_once_with("Central", 3)
+
+    @patch("hkopenai.hk_climate_mcp_server.history.time.time")
+    @patch("hkopenai.hk_climate_mcp_server.tools.visibility.fetch_json_data")
+    def test_get_visibility_history(self, mock_fetch_json_data, mock_time):
+        """Test the history of a station recorded from successive readings."""
+        fields = ["Date time", "Automatic Weather Station", "10 minute mean visibility"]
+        for time, central in (("202506231300", "40 km"), ("202506231310", "35 km")):
+            VISIBILITY_HISTORY.record(
+                {"fields": fields, "data": [[time, "Central", central]]}
+            )
+        mock_fetch_json_data.return_value = {
+            "fields": fields,
+            "data": [["202506231320", "Central", "20 km"]],
+        }
+        # 2025-06-23 13:30 HKT
+        mock_time.return_value = 1750656600
+
+        result = _get_visibility_history("central", hours=1)
+
+        series = result["series"][0]
+        self.assertEqual(series["name"], "Central")
+        self.assertEqual(series["unit"], "km")
+        self.assertEqual([s["value"] for s in series["samples"]], [40.0, 35.0, 20.0])
+        self.assertEqual(series["max"], {"time": "2025-06-23T13:00:00+08:00", "value": 40.0})
+        self.assertEqual(series["min"]["value"], 20.0)
+        self.assertEqual(series["trend"], {"perHour": -60.0, "direction": "falling"})
+
+        self.assertIn("Known names: Central", _get_visibility_history("Sai Kung")["error"])
+        self.assertIn("error", _get_visibility_history("Central", hours=25))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,82 @@
+"""
+Unit tests for the warning state tracker.
+
+This module tests building warning states, versioning of distinct states and
+the changes returned for version tokens.
+"""
+
+import unittest
+from hkopenai.hk_climate_mcp_server.warning_tracker import (
+    WarningTracker,
+    build_warning_state,
+    diff_warning_states,
+)
+
+RAINSTORM = {"name": "Rainstorm Warning Signal", "code": "WRAINA", "actionCode": "ISSUE"}
+MONSOON = {"name": "Strong Monsoon Signal", "code": "WMSGNL", "actionCode": "ISSUE"}
+
+
+class TestWarningTracker(unittest.TestCase):
+    """Test case class for the warning tracker."""
+
+    def test_build_warning_state(self):
+        """Test that statements are attached and cancelled warnings dropped."""
+        state = build_warning_state(
+            {
+                "WRAIN": RAINSTORM,
+                "WMSGNL": dict(MONSOON, actionCode="CANCEL"),
+            },
+            {"details": [{"warningStatementCode": "WRAIN", "contents": ["Heavy rain."]}]},
+        )
+        self.assertEqual(list(state), ["WRAIN"])
+        self.assertEqual(state["WRAIN"]["statement"], ("Heavy rain.",))
+        with self.assertRaises(TypeError):
+            state["WRAIN"] = {}
+
+    def test_diff_warning_states(self):
+        """Test issued, updated and cancelled warnings between two states."""
+        old = build_warning_state({"WRAIN": RAINSTORM, "WMSGNL": MONSOON}, {})
+        new = build_warning_state(
+            {"WRAIN": dict(RAINSTORM, code="WRAINR"), "WTS": {"name": "Thunderstorm"}},
+            {},
+        )
+        changes = diff_warning_states(old, new)
+        self.assertEqual([w["warningType"] for w in changes["issued"]], ["WTS"])
+        self.assertEqual(changes["updated"][0]["code"], "WRAINR")
+        self.assertEqual(changes["cancelled"], ["WMSGNL"])
+
+    def test_versions_and_tokens(self):
+        """Test that only distinct states get versions and tokens resolve to them."""
+        tracker = WarningTracker("en", max_history=3)
+        self.assertIsNone(tracker.version)
+
+        calm = build_warning_state({}, {})
+        self.assertTrue(tracker.update(calm))
+        calm_version = tracker.version
+        self.assertFalse(tracker.update(build_warning_state({}, {})))
+        self.assertEqual(tracker.version, calm_version)
+        self.assertEqual(
+            tracker.changes_since(calm_version),
+            {"version": calm_version, "changed": False},
+        )
+
+        tracker.update(build_warning_state({"WRAIN": RAINSTORM}, {}))
+        changes = tracker.changes_since(calm_version)
+        self.assertEqual(changes["issued"][0]["warningType"], "WRAIN")
+        self.assertNotIn("reset", changes)
+
+        # A state that returns to an earlier one reports no change
+        tracker.update(calm)
+        self.assertFalse(tracker.changes_since(calm_version)["changed"])
+
+        # Unknown, foreign and expired tokens return the full state
+        for token in (None, "garbage", "00000000-1"):
+            self.assertTrue(tracker.changes_since(token)["reset"])
+        tracker.update(build_warning_state({"WMSGNL": MONSOON}, {}))
+        expired = tracker.changes_since(calm_version)
+        self.assertTrue(expired["reset"])
+        self.assertEqual(expired["active"][0]["warningType"], "WMSGNL")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,11 +7,17 @@ to ensure they correctly fetch and process weather warnings data from the HKO AP
 
 import unittest
 from unittest.mock import patch, MagicMock
+from hkopenai.hk_climate_mcp_server.feeds import FEED_REGISTRY
 from hkopenai.hk_climate_mcp_server.tools.warnings import (
     register,
     _get_weather_warning_summary,
     _get_weather_warning_info,
     _get_special_weather_tips,
+    _get_warning_changes,
+)
+from hkopenai.hk_climate_mcp_server.warning_tracker import (
+    clear_warning_trackers,
+    get_warning_tracker,
 )
 from hkopenai_common.json_utils import fetch_json_data
 
@@ -19,13 +25,17 @@ from hkopenai_common.json_utils import fetch_json_data
 class TestWarningsTools(unittest.TestCase):
     """Test case class for weather warnings data tools."""
 
+    def setUp(self):
+        FEED_REGISTRY.clear()
+        clear_warning_trackers()
+
     def test_register_tool(self):
         """Tests that the warnings tools are correctly registered."""
         mock_mcp = MagicMock()
         register(mock_mcp)
 
         # Verify that mcp.tool was called for each tool function
-        self.assertEqual(mock_mcp.tool.call_count, 3)
+        self.assertEqual(mock_mcp.tool.call_count, 4)
 
         # Get the decorated functions
         decorated_funcs = {
@@ -54,6 +64,13 @@ class TestWarningsTools(unittest.TestCase):
             decorated_funcs["get_special_weather_tips"](lang="en")
             mock_get_special_weather_tips.assert_called_once_with("en")
 
+        # Test get_warning_changes
+        with patch(
+            "hkopenai.hk_climate_mcp_server.tools.warnings._get_warning_changes"
+        ) as mock_get_warning_changes:
+            decorated_funcs["get_warning_changes"](since="abc-1", lang="tc")
+            mock_get_warning_changes.assert_called_once_with("abc-1", "tc")
+
     @patch("hkopenai.hk_climate_mcp_server.tools.warnings.fetch_json_data")
     def test_get_weather_warning_summary_internal(self, mock_fetch_json_data):
         """Test the internal _get_weather_warning_summary function."""
@@ -99,6 +116,60 @@ class TestWarningsTools(unittest.TestCase):
             "https://data.weather.gov.hk/weatherAPI/opendata/weather.php?dataType=swt&lang=en"
         )
 
+    @patch("hkopenai.hk_climate_mcp_server.tools.warnings.fetch_json_data")
+    def test_get_warning_changes(self, mock_fetch_json_data):
+        """Test the warning change feed across an issue and a cancellation."""
+        feeds = {
+            "warnsum": {
+                "WTS": {
+                    "name": "Thunderstorm Warning",
+                    "code": "WTS",
+                    "actionCode": "ISSUE",
+                    "issueTime": "2025-06-07T21:30:00+08:00",
+                }
+            },
+            "warningInfo": {
+                "details": [
+                    {"warningStatementCode": "WTS", "contents": ["Thunderstorms."]}
+                ]
+            },
+        }
+        mock_fetch_json_data.side_effect = lambda url: feeds[
+            url.split("dataType=")[1].split("&")[0]
+        ]
+
+        first = _get_warning_changes(lang="en")
+        self.assertTrue(first["reset"])
+        self.assertEqual(first["active"][0]["warningType"], "WTS")
+        self.assertEqual(first["active"][0]["statement"], ["Thunderstorms."])
+
+        unchanged = _get_warning_changes(since=first["version"], lang="en")
+        self.assertEqual(unchanged, {"version": first["version"], "changed": False})
+
+        FEED_REGISTRY.clear()
+        feeds["warnsum"] = {"WTS": dict(feeds["warnsum"]["WTS"], actionCode="CANCEL")}
+        feeds["warningInfo"] = {}
+        changes = _get_warning_changes(since=first["version"], lang="en")
+        self.assertTrue(changes["changed"])
+        self.assertEqual(changes["cancelled"], ["WTS"])
+        self.assertEqual((changes["issued"], changes["updated"]), ([], []))
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.warnings.fetch_json_data")
+    def test_warning_changes_error(self, mock_fetch_json_data):
+        """Test that an error is returned when warnings were never retrieved."""
+        mock_fetch_json_data.return_value = {"error": "Connection error occurred"}
+        self.assertEqual(
+            _get_warning_changes(lang="en"), {"error": "Connection error occurred"}
+        )
+
+    @patch("hkopenai.hk_climate_mcp_server.tools.warnings.fetch_json_data")
+    def test_warning_changes_invalid_lang(self, mock_fetch_json_data):
+        """Test that unknown languages are rejected before a tracker is made."""
+        self.assertIn("Invalid language", _get_warning_changes(lang="fr")["error"])
+        mock_fetch_json_data.assert_not_called()
+        with self.assertRaises(ValueError):
+            get_warning_tracker("fr")
+
 
 if __name__ == "__main__":
     unittest.main()